@@ -0,0 +1,623 @@
+# backend/async_llm_client.py
+"""
+NovaOS v0.12 — Async LLM Client
+
+Asyncio sibling of LLMClient with the same channels, routing, errors and
+logging: complete, complete_persona, complete_system, stream_complete_persona
+and stream_complete_system (the streaming ones are async generators).
+
+A sync LLMClient call holds its worker thread for up to LLM_CLIENT_TIMEOUT;
+here calls are coroutines, so one event loop can keep many requests in
+flight. Both clients share the process-wide concurrency governor, so
+bursts from either side queue in arrival order against the same per-model
+limits, and identical in-flight requests from the same event loop are
+coalesced into one upstream call. Retries, hedging and circuit breaking
+follow the shared LLMResilience policy, with the losing hedge cancelled
+rather than left running, and every call lands in the shared telemetry
+recorder. Each AsyncLLMClient owns a pooled
+httpx.AsyncClient: create one per event loop, share it, and
+`await client.aclose()` on shutdown.
+
+Usage:
+    client = AsyncLLMClient()
+    result = await client.complete_system(system=..., user=..., command="domain-extract-topics")
+    async for chunk in client.stream_complete_system(...):
+        ...
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncGenerator, AsyncIterator, Callable, Dict, List, Optional
+
+from .llm_cache import LLMResponseCache, get_response_cache, make_cache_key
+from .llm_client import (
+    LLM_CLIENT_TIMEOUT,
+    QUEUE_LOG_THRESHOLD_MS,
+    LLMQueueTimeoutError,
+    LLMTimeoutError,
+    PersonaModeError,
+    StrictModeError,
+    _as_timeout_error,
+    _budget,
+    _cacheable,
+    _chat_kwargs,
+    _circuit_open_error,
+    _fallback_model,
+    _log_hedge,
+    _log_retry,
+    _outcome,
+    _queue_timeout_error,
+    _require_api_key,
+)
+from .llm_transport import (
+    LLMConcurrencyGovernor,
+    LLMQueueTimeout,
+    SingleFlight,
+    get_governor,
+    get_single_flight,
+    make_async_http_client,
+    request_fingerprint,
+)
+from .llm_resilience import MIN_ATTEMPT_TIME, CircuitOpen, LLMResilience, get_resilience
+from .llm_telemetry import OUTCOME_CANCELLED, OUTCOME_OK, LLMCall, LLMTelemetry, get_telemetry
+from .model_router import ModelRouter, ModelRoutingError, RoutingContext, get_router, PERSONA_MODEL
+
+try:
+    from openai import AsyncOpenAI
+    _HAS_ASYNC_OPENAI = True
+except ImportError:
+    _HAS_ASYNC_OPENAI = False
+    AsyncOpenAI = None
+
+
+class AsyncLLMClient:
+    """
+    v0.12 Async LLM Client — LLMClient's channels as coroutines.
+
+    Channels:
+    - PERSONA: Always gpt-5.1, hard error on failure (PersonaModeError)
+    - SYSTEM: Routed by ModelRouter, hard error on failure (StrictModeError);
+      cache=True as in LLMClient.complete_system
+
+    Collaborators and `openai_client` are injectable as in LLMClient
+    (`openai_client.chat.completions.create` must be a coroutine function).
+    """
+
+    def __init__(
+        self,
+        router: Optional[ModelRouter] = None,
+        response_cache: Optional[LLMResponseCache] = None,
+        governor: Optional[LLMConcurrencyGovernor] = None,
+        resilience: Optional[LLMResilience] = None,
+        telemetry: Optional[LLMTelemetry] = None,
+        single_flight: Optional[SingleFlight] = None,
+        openai_client: Optional[Any] = None,
+    ):
+        if openai_client is None:
+            if not _HAS_ASYNC_OPENAI:
+                raise RuntimeError("openai package not installed. Run: pip install openai")
+
+            http_client = make_async_http_client(LLM_CLIENT_TIMEOUT)
+            openai_client = AsyncOpenAI(
+                api_key=_require_api_key(),
+                timeout=LLM_CLIENT_TIMEOUT,
+                max_retries=0,  # LLMResilience is the only retry layer
+                **({"http_client": http_client} if http_client is not None else {}),
+            )
+        self.client = openai_client
+        self.router = router or get_router()
+        self.governor = governor or get_governor()
+        self.single_flight = single_flight or get_single_flight()
+        self.resilience = resilience or get_resilience()
+        self.telemetry = telemetry or get_telemetry()
+        self._response_cache = response_cache
+
+    async def aclose(self) -> None:
+        """Close the connection pool."""
+        await self.client.close()
+
+    # -------------------------------------------------------------------------
+    # Low-level calls
+    # -------------------------------------------------------------------------
+
+    async def _call_api(
+        self,
+        model: str,
+        system_prompt: str,
+        messages: List[Dict[str, str]],
+        channel: str = "unknown",
+        command: str = "unknown",
+        cache_status: Optional[str] = None,
+        **kwargs,
+    ) -> str:
+        """One Chat Completions call (same filtering, coalescing, retries, telemetry and error mapping as LLMClient._call_api)."""
+        hedge = kwargs.pop("hedge", None)
+        filtered_kwargs = _chat_kwargs(model, kwargs)
+        call = self.telemetry.start(channel, command, model, cache=cache_status)
+
+        def on_join() -> None:
+            call.mark_coalesced()
+            print(
+                f"[LLM] coalesced channel={channel} command={command} model={model} "
+                f"(identical request in flight) async=1",
+                flush=True,
+            )
+
+        try:
+            text = await self.single_flight.do_async(
+                request_fingerprint(model, system_prompt, messages, filtered_kwargs),
+                lambda: self._send(model, system_prompt, messages, channel, command, filtered_kwargs, hedge, call),
+                on_join=on_join,
+            )
+        except Exception as e:
+            self.telemetry.finish(call, _outcome(e), e)
+            raise
+        self.telemetry.finish(call)
+        return text
+
+    async def _send(
+        self,
+        model: str,
+        system_prompt: str,
+        messages: List[Dict[str, str]],
+        channel: str,
+        command: str,
+        filtered_kwargs: Dict[str, Any],
+        hedge: Optional[bool] = None,
+        call: Optional[LLMCall] = None,
+    ) -> str:
+        try:
+            self.resilience.admit(model)
+        except CircuitOpen as e:
+            raise _circuit_open_error(e, channel, command) from e
+
+        started = time.monotonic()
+        attempt = lambda: self._attempt(model, system_prompt, messages, channel, command, filtered_kwargs, call, started)
+        tries = 1
+        while True:
+            try:
+                delay = self.resilience.hedge_delay(model, hedge)
+                if delay is None:
+                    return await attempt()
+                return await self.resilience.run_hedged_async(
+                    model,
+                    attempt,
+                    delay,
+                    on_hedge=lambda: _log_hedge(delay, channel, command, model, call, suffix=" async=1"),
+                )
+            except LLMQueueTimeoutError:
+                raise
+            except Exception as e:
+                backoff = self.resilience.retry_delay(model, tries, time.monotonic() - started, e)
+                if backoff is None:
+                    timeout_error = _as_timeout_error(e, channel, command, model)
+                    if timeout_error is None:
+                        raise
+                    raise timeout_error from e
+                _log_retry(tries, self.resilience.max_attempts, backoff, channel, command, model, e)
+                if call is not None:
+                    call.add_retry()
+                await asyncio.sleep(backoff)
+                tries += 1
+
+    async def _attempt(
+        self,
+        model: str,
+        system_prompt: str,
+        messages: List[Dict[str, str]],
+        channel: str,
+        command: str,
+        filtered_kwargs: Dict[str, Any],
+        call: Optional[LLMCall] = None,
+        call_started: Optional[float] = None,
+    ) -> str:
+        async with self._slot(model, channel, command, call, call_started):
+            started = time.monotonic()
+            try:
+                resp = await self.client.chat.completions.create(
+                    model=model,
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        *messages,
+                    ],
+                    timeout=_budget(self.resilience, call_started, LLM_CLIENT_TIMEOUT),
+                    **filtered_kwargs,
+                )
+            except Exception as e:
+                self.resilience.record_failure(model, e)
+                raise
+            self.resilience.record_success(model, time.monotonic() - started)
+            if call is not None:
+                call.add_usage(getattr(resp, "usage", None))
+            return resp.choices[0].message.content or ""
+
+    async def _call_api_streaming(
+        self,
+        model: str,
+        system_prompt: str,
+        messages: List[Dict[str, str]],
+        channel: str = "unknown",
+        command: str = "unknown",
+        **kwargs,
+    ) -> AsyncGenerator[str, None]:
+        """Streaming call; holds a governor slot until the stream ends or is closed. Retries only before the first chunk."""
+        kwargs.pop("hedge", None)
+        filtered_kwargs = _chat_kwargs(model, kwargs, streaming=True)
+        call = self.telemetry.start(channel, command, model, streaming=True)
+
+        chunks = self._stream(model, system_prompt, messages, channel, command, filtered_kwargs, call)
+        outcome, error = OUTCOME_CANCELLED, None
+        try:
+            async for text in chunks:
+                call.first_token()
+                yield text
+            outcome = OUTCOME_OK
+        except Exception as e:
+            outcome, error = _outcome(e), e
+            raise
+        finally:
+            await chunks.aclose()
+            self.telemetry.finish(call, outcome, error)
+
+    async def _stream(
+        self,
+        model: str,
+        system_prompt: str,
+        messages: List[Dict[str, str]],
+        channel: str,
+        command: str,
+        filtered_kwargs: Dict[str, Any],
+        call: LLMCall,
+    ) -> AsyncGenerator[str, None]:
+        try:
+            self.resilience.admit(model)
+        except CircuitOpen as e:
+            raise _circuit_open_error(e, channel, command) from e
+
+        started = time.monotonic()
+        tries = 1
+        while True:
+            yielded = False
+            async with self._slot(model, channel, command, call, started):
+                call_started = time.monotonic()
+                try:
+                    stream = await self.client.chat.completions.create(
+                        model=model,
+                        messages=[
+                            {"role": "system", "content": system_prompt},
+                            *messages,
+                        ],
+                        stream=True,
+                        stream_options={"include_usage": True},
+                        timeout=_budget(self.resilience, started, LLM_CLIENT_TIMEOUT),
+                        **filtered_kwargs,
+                    )
+
+                    try:
+                        async for chunk in stream:
+                            call.add_usage(getattr(chunk, "usage", None))
+                            if chunk.choices and chunk.choices[0].delta.content:
+                                yielded = True
+                                yield chunk.choices[0].delta.content
+                    finally:
+                        # Release the HTTP response now, also when the consumer stopped early
+                        await stream.close()
+                except Exception as e:
+                    self.resilience.record_failure(model, e)
+                    backoff = None
+                    if not yielded:
+                        backoff = self.resilience.retry_delay(model, tries, time.monotonic() - started, e)
+                    if backoff is None:
+                        timeout_error = _as_timeout_error(e, channel, command, model, streaming=True)
+                        if timeout_error is None:
+                            raise
+                        raise timeout_error from e
+                    error = e
+                else:
+                    self.resilience.record_success(model, time.monotonic() - call_started)
+                    return
+            _log_retry(tries, self.resilience.max_attempts, backoff, channel, command, model, error)
+            call.add_retry()
+            await asyncio.sleep(backoff)
+            tries += 1
+
+    @asynccontextmanager
+    async def _slot(
+        self,
+        model: str,
+        channel: str,
+        command: str,
+        call: Optional[LLMCall] = None,
+        call_started: Optional[float] = None,
+    ) -> AsyncIterator[None]:
+        queue_timeout = _budget(self.resilience, call_started, self.governor.queue_timeout, MIN_ATTEMPT_TIME)
+        try:
+            queue_ms = await self.governor.acquire_async(model, queue_timeout)
+        except LLMQueueTimeout as e:
+            raise _queue_timeout_error(e, channel, command, model) from e
+        if call is not None:
+            call.add_queue_ms(queue_ms)
+        if queue_ms >= QUEUE_LOG_THRESHOLD_MS:
+            print(f"[LLM] queued {queue_ms:.0f}ms channel={channel} command={command} model={model}", flush=True)
+        try:
+            yield
+        finally:
+            self.governor.release(model)
+
+    # -------------------------------------------------------------------------
+    # MAIN ENTRY POINT
+    # -------------------------------------------------------------------------
+
+    async def complete(
+        self,
+        system: str,
+        user: str,
+        session_id: Optional[str] = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """LLMClient.complete(): model from kwargs["model"], else PERSONA_MODEL."""
+        model = kwargs.pop("model", None) or PERSONA_MODEL
+        command = kwargs.pop("command", None) or "unknown"
+
+        print(f"[LLM] channel=complete command={command} model={model} async=1", flush=True)
+
+        text = await self._call_api(
+            model=model,
+            system_prompt=system,
+            messages=[{"role": "user", "content": user}],
+            channel="complete",
+            command=command,
+            **kwargs,
+        )
+        return {
+            "text": text,
+            "session_id": session_id,
+            "model": model,
+            "channel": "complete",
+        }
+
+    # -------------------------------------------------------------------------
+    # PERSONA CHANNEL — ALWAYS gpt-5.1, NO FALLBACK
+    # -------------------------------------------------------------------------
+
+    async def complete_persona(
+        self,
+        system: str,
+        user: str,
+        messages: Optional[List[Dict[str, str]]] = None,
+        session_id: Optional[str] = None,
+        model_override: Optional[str] = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """Persona channel; raises PersonaModeError on failure (NO FALLBACK)."""
+        model = model_override or PERSONA_MODEL
+        command = kwargs.pop("command", None) or "persona"
+
+        print(f"[LLM] channel=persona command={command} model={model} async=1", flush=True)
+
+        msg_list = [*(messages or []), {"role": "user", "content": user}]
+        try:
+            text = await self._call_api(
+                model=model,
+                system_prompt=system,
+                messages=msg_list,
+                channel="persona",
+                command=command,
+                **kwargs,
+            )
+        except LLMTimeoutError:
+            raise
+        except Exception as e:
+            raise PersonaModeError(
+                f"Persona LLM call failed with model={model}. Error: {e}. "
+                f"NO FALLBACK — persona mode requires gpt-5.1."
+            ) from e
+
+        return {
+            "text": text,
+            "session_id": session_id,
+            "model": model,
+            "channel": "persona",
+        }
+
+    async def stream_complete_persona(
+        self,
+        system: str,
+        user: str,
+        messages: Optional[List[Dict[str, str]]] = None,
+        session_id: Optional[str] = None,
+        model_override: Optional[str] = None,
+        **kwargs,
+    ) -> AsyncGenerator[str, None]:
+        """Streaming persona channel (async generator)."""
+        model = model_override or PERSONA_MODEL
+        command = kwargs.pop("command", None) or "persona"
+
+        print(f"[LLM] channel=stream_persona command={command} model={model} async=1", flush=True)
+
+        msg_list = [*(messages or []), {"role": "user", "content": user}]
+        chunks = self._call_api_streaming(
+            model=model,
+            system_prompt=system,
+            messages=msg_list,
+            channel="stream_persona",
+            command=command,
+            **kwargs,
+        )
+        try:
+            async for chunk in chunks:
+                yield chunk
+        except LLMTimeoutError:
+            raise
+        except Exception as e:
+            raise PersonaModeError(
+                f"Streaming persona LLM call failed with model={model}. Error: {e}. "
+                f"NO FALLBACK — persona mode requires gpt-5.1."
+            ) from e
+        finally:
+            # Closing this generator does not close the inner one by itself
+            await chunks.aclose()
+
+    # -------------------------------------------------------------------------
+    # SYSTEM CHANNEL — Model routed by ModelRouter
+    # -------------------------------------------------------------------------
+
+    def _route(self, command: Optional[str], user: str, explicit_model: Optional[str], think_mode: bool) -> str:
+        """Routed model, or the light model while its circuit is open (as in LLMClient.complete_system)."""
+        ctx = RoutingContext(
+            command=command,
+            input_length=len(user),
+            explicit_model=explicit_model,
+            think_mode=think_mode,
+        )
+        try:
+            model = self.router.route(ctx)
+        except ModelRoutingError as e:
+            raise StrictModeError(f"Model routing failed: {e}") from e
+        return _fallback_model(self.router, self.resilience, model, command or "unknown", explicit_model)
+
+    async def complete_system(
+        self,
+        system: str,
+        user: str,
+        messages: Optional[List[Dict[str, str]]] = None,
+        session_id: Optional[str] = None,
+        command: Optional[str] = None,
+        explicit_model: Optional[str] = None,
+        think_mode: bool = False,
+        cache: bool = False,
+        cache_ttl: Optional[float] = None,
+        cache_validator: Optional[Callable[[str], Any]] = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """System channel; raises StrictModeError on failure. cache=True / cache_validator: see LLMClient."""
+        model = self._route(command, user, explicit_model, think_mode)
+        cmd_str = command or "unknown"
+        msg_list = [*(messages or []), {"role": "user", "content": user}]
+
+        result = {
+            "session_id": session_id,
+            "model": model,
+            "channel": "system",
+            "command": cmd_str,
+        }
+
+        response_cache = None
+        if cache:
+            # Opening the SQLite file (first use) and all cache I/O stay off the event loop
+            response_cache = await asyncio.to_thread(lambda: self.response_cache)
+        cache_key = None
+        if response_cache is not None:
+            cache_key = make_cache_key("system", model, system, msg_list, kwargs)
+            lookup = self.telemetry.start("system", cmd_str, model, cache="hit")
+            try:
+                # SQLite I/O: keep it off the event loop
+                text = await asyncio.to_thread(response_cache.get, cache_key)
+            except Exception as e:
+                print(f"[LLM] WARNING: response cache read failed: {e}", file=sys.stderr, flush=True)
+                text = None
+            if text is not None:
+                print(f"[LLM] channel=system command={cmd_str} model={model} cache=hit async=1", flush=True)
+                self.telemetry.finish(lookup)
+                return {"text": text, **result, "cached": True}
+
+        print(f"[LLM] channel=system command={cmd_str} model={model} async=1", flush=True)
+
+        try:
+            text = await self._call_api(
+                model=model,
+                system_prompt=system,
+                messages=msg_list,
+                channel="system",
+                command=cmd_str,
+                cache_status="miss" if cache_key is not None else None,
+                **kwargs,
+            )
+        except LLMTimeoutError:
+            raise
+        except Exception as e:
+            raise StrictModeError(
+                f"System LLM call failed for command='{cmd_str}' with model={model}. "
+                f"Error: {e}."
+            ) from e
+
+        if cache_key is not None and _cacheable(text, cache_validator, cmd_str):
+            try:
+                await asyncio.to_thread(response_cache.put, cache_key, text, ttl=cache_ttl)
+            except Exception as e:
+                print(f"[LLM] WARNING: response cache write failed: {e}", file=sys.stderr, flush=True)
+
+        return {"text": text, **result, "cached": False}
+
+    async def stream_complete_system(
+        self,
+        system: str,
+        user: str,
+        messages: Optional[List[Dict[str, str]]] = None,
+        session_id: Optional[str] = None,
+        command: Optional[str] = None,
+        explicit_model: Optional[str] = None,
+        think_mode: bool = False,
+        **kwargs,
+    ) -> AsyncGenerator[str, None]:
+        """Streaming system channel (async generator)."""
+        model = self._route(command, user, explicit_model, think_mode)
+        cmd_str = command or "unknown"
+
+        print(f"[LLM] channel=stream_system command={cmd_str} model={model} async=1", flush=True)
+
+        msg_list = [*(messages or []), {"role": "user", "content": user}]
+        chunks = self._call_api_streaming(
+            model=model,
+            system_prompt=system,
+            messages=msg_list,
+            channel="stream_system",
+            command=cmd_str,
+            **kwargs,
+        )
+        try:
+            async for chunk in chunks:
+                yield chunk
+        except LLMTimeoutError:
+            raise
+        except Exception as e:
+            raise StrictModeError(
+                f"Streaming LLM call failed for command='{cmd_str}' with model={model}. "
+                f"Error: {e}."
+            ) from e
+        finally:
+            # Closing this generator does not close the inner one by itself
+            await chunks.aclose()
+
+    # -------------------------------------------------------------------------
+    # Utility Methods
+    # -------------------------------------------------------------------------
+
+    @property
+    def response_cache(self) -> Optional[LLMResponseCache]:
+        if self._response_cache is None:
+            self._response_cache = get_response_cache()
+        return self._response_cache
+
+    def concurrency_stats(self) -> Dict[str, Any]:
+        """Governor in-flight/queue stats (shared with LLMClient)."""
+        return self.governor.stats()
+
+    def coalescing_stats(self) -> Dict[str, Any]:
+        """Single-flight counters (shared with LLMClient)."""
+        return self.single_flight.stats()
+
+    def resilience_stats(self) -> Dict[str, Any]:
+        """Latency percentiles, breaker state, retries/hedges/fallbacks (shared with LLMClient)."""
+        return self.resilience.stats()
+
+    def telemetry_stats(self, recent: int = 20) -> Dict[str, Any]:
+        """Call totals, rollups and the newest records (shared with LLMClient)."""
+        return {**self.telemetry.stats(), "recent": self.telemetry.recent(recent)}
+
+
+__all__ = ["AsyncLLMClient"]
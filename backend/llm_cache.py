@@ -0,0 +1,274 @@
+# backend/llm_cache.py
+"""
+NovaOS v0.12 — LLM Response Cache
+
+Content-addressed cache for system-channel LLM calls whose output only
+depends on their input: domain/topic extraction, subdomain organization,
+two-pass domain drafts for the same goal text. Identical requests used to
+go to the provider every time.
+
+- Opt-in per call: LLMClient.complete_system(..., cache=True). Persona
+  chat is never cached.
+- Key: sha256 over (channel, model, system prompt, messages, sampling
+  params such as temperature / max_tokens)
+- SQLite file shared by every worker on the host (WAL mode), with a TTL
+  per entry and caps on entry count and total bytes; the least recently
+  used entries go first
+- Counters: hits, misses, expired, writes, evictions
+
+Selected with the NOVA_LLM_CACHE env var: "" (default) = data/llm_cache.db,
+"sqlite:<path>", or "off"; relative paths are resolved against the project
+root, not the working directory. NOVA_LLM_CACHE_TTL (seconds) and
+NOVA_LLM_CACHE_MAX_MB override the defaults.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger("nova.llm_cache")
+
+
+# =============================================================================
+# DEFAULTS
+# =============================================================================
+
+# Project root (this file is backend/llm_cache.py), so the cache file does
+# not depend on the directory the process was started from
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_CACHE_PATH = PROJECT_ROOT / "data" / "llm_cache.db"
+DEFAULT_CACHE_TTL = 7 * 24 * 3600.0     # seconds
+DEFAULT_MAX_ENTRIES = 5000
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Request params that change the completion and so belong in the key
+CACHE_KEY_PARAMS = (
+    "temperature", "max_tokens", "top_p", "frequency_penalty",
+    "presence_penalty", "stop", "n", "seed", "response_format",
+    "tools", "tool_choice", "logprobs", "top_logprobs",
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_cache (
+    key         TEXT PRIMARY KEY,
+    value       TEXT NOT NULL,
+    size        INTEGER NOT NULL,
+    created_at  REAL NOT NULL,
+    expires_at  REAL NOT NULL,
+    last_used   REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_llm_cache_last_used ON llm_cache (last_used);
+"""
+
+
+def make_cache_key(
+    channel: str,
+    model: str,
+    system: str,
+    messages: List[Dict[str, Any]],
+    params: Optional[Dict[str, Any]] = None,
+) -> str:
+    """Stable key for one request; params outside CACHE_KEY_PARAMS are ignored."""
+    params = params or {}
+    payload = {
+        "channel": channel,
+        "model": model,
+        "system": system,
+        "messages": messages,
+        "params": {k: params[k] for k in CACHE_KEY_PARAMS if params.get(k) is not None},
+    }
+    blob = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+# =============================================================================
+# CACHE
+# =============================================================================
+
+class LLMResponseCache:
+    """
+    SQLite-backed response cache with TTL and size caps.
+
+    Args:
+        path: Database file (":memory:" for a process-local cache)
+        ttl: Default seconds an entry stays valid
+        max_entries: Entries kept before the least recently used are evicted
+        max_bytes: Total cached text (UTF-8 bytes) kept before evicting
+    """
+
+    def __init__(
+        self,
+        path: Any = DEFAULT_CACHE_PATH,
+        ttl: float = DEFAULT_CACHE_TTL,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=10.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+        self._lock = threading.Lock()
+        self._stats: Dict[str, int] = {"hits": 0, "misses": 0, "expired": 0, "writes": 0, "evictions": 0}
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached text for `key`, or None."""
+        now = self._clock()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self._stats["misses"] += 1
+                return None
+            value, expires_at = row
+            with self._conn:
+                if expires_at <= now:
+                    self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                    self._stats["expired"] += 1
+                    self._stats["misses"] += 1
+                    return None
+                self._conn.execute("UPDATE llm_cache SET last_used = ? WHERE key = ?", (now, key))
+            self._stats["hits"] += 1
+            return value
+
+    def put(self, key: str, value: str, ttl: Optional[float] = None) -> None:
+        """Store `value` under `key`, then evict down to the size caps."""
+        now = self._clock()
+        size = len(value.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        expires_at = now + (self.ttl if ttl is None else ttl)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, size, created_at, expires_at, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, value, size, now, expires_at, now),
+            )
+            self._stats["writes"] += 1
+            self._conn.execute("DELETE FROM llm_cache WHERE expires_at <= ?", (now,))
+            self._evict()
+
+    def _evict(self) -> None:
+        # Caller holds the lock and the transaction
+        count, total = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_cache").fetchone()
+        if count <= self.max_entries and total <= self.max_bytes:
+            return
+        evicted = 0
+        for key, size in self._conn.execute("SELECT key, size FROM llm_cache ORDER BY last_used").fetchall():
+            if count <= self.max_entries and total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+            count -= 1
+            total -= size
+            evicted += 1
+        self._stats["evictions"] += evicted
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM llm_cache")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            count, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_cache"
+            ).fetchone()
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                "entries": count,
+                "bytes": total,
+                "hit_rate": self._stats["hits"] / lookups if lookups else 0.0,
+                **self._stats,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+# =============================================================================
+# SHARED INSTANCE
+# =============================================================================
+
+_cache_lock = threading.Lock()
+_cache: Optional[LLMResponseCache] = None
+_cache_resolved = False
+
+
+def _cache_from_env() -> Optional[LLMResponseCache]:
+    spec = os.getenv("NOVA_LLM_CACHE", "").strip()
+    if spec.lower() in ("off", "0", "false", "none"):
+        return None
+    kind, _, arg = spec.partition(":")
+    if kind not in ("", "sqlite"):
+        raise ValueError(f"Unknown LLM cache: {spec!r}. Supported: sqlite[:path], off")
+    path = PROJECT_ROOT / arg if arg else DEFAULT_CACHE_PATH  # absolute `arg` wins over the root
+    return LLMResponseCache(
+        path=path,
+        ttl=float(os.getenv("NOVA_LLM_CACHE_TTL", DEFAULT_CACHE_TTL)),
+        max_bytes=int(float(os.getenv("NOVA_LLM_CACHE_MAX_MB", DEFAULT_MAX_BYTES / (1024 * 1024))) * 1024 * 1024),
+    )
+
+
+def get_response_cache() -> Optional[LLMResponseCache]:
+    """The shared cache (created from NOVA_LLM_CACHE on first use); None when off."""
+    global _cache, _cache_resolved
+    if _cache_resolved:
+        return _cache
+    with _cache_lock:
+        if not _cache_resolved:
+            try:
+                _cache = _cache_from_env()
+            except Exception as e:
+                logger.warning("LLM response cache unavailable (%s); caching disabled", e)
+                _cache = None
+            _cache_resolved = True
+        return _cache
+
+
+def configure_response_cache(cache: Optional[LLMResponseCache]) -> None:
+    """Replace the shared cache (None disables caching)."""
+    global _cache, _cache_resolved
+    with _cache_lock:
+        previous, _cache = _cache, cache
+        _cache_resolved = True
+    if previous is not None and previous is not cache:
+        previous.close()
+
+
+def reset_response_cache() -> None:
+    """Drop the shared cache; the next get_response_cache() re-reads the env (for tests)."""
+    global _cache, _cache_resolved
+    with _cache_lock:
+        previous, _cache, _cache_resolved = _cache, None, False
+    if previous is not None:
+        previous.close()
+
+
+__all__ = [
+    "LLMResponseCache",
+    "make_cache_key",
+    "get_response_cache",
+    "configure_response_cache",
+    "reset_response_cache",
+    "CACHE_KEY_PARAMS",
+    "DEFAULT_CACHE_TTL",
+    "DEFAULT_MAX_ENTRIES",
+    "DEFAULT_MAX_BYTES",
+]
@@ -6,12 +6,21 @@ Updated with:
 - Custom LLMTimeoutError exception for timeout/network failures
 - Proper exception handling for APITimeoutError, APIConnectionError
 - v0.10.3: Fixed max_tokens → max_completion_tokens for gpt-5.1/o-series models
+- v0.12: Opt-in response cache for deterministic system-channel calls
+  (complete_system(..., cache=True), see backend/llm_cache.py)
+- v0.12: Retries, optional hedging and per-model circuit breakers
+  (see backend/llm_resilience.py); queue waits and request timeouts are
+  capped at what is left of the per-call budget
+- v0.12: Per-call telemetry: tokens, latency, TTFT, queue time, retries,
+  cache status (see backend/llm_telemetry.py)
 """
 
 import os
 import sys
+import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, Generator, List, Optional
+from typing import Any, Callable, Dict, Generator, Iterator, List, Optional
 
 
 # -----------------------------------------------------------------------------
@@ -104,6 +113,28 @@ from .model_router import (
     HEAVY_LLM_COMMANDS,
     ModelRoutingError,
 )
+from .llm_cache import LLMResponseCache, get_response_cache, make_cache_key
+from .llm_transport import (
+    LLMConcurrencyGovernor,
+    LLMQueueTimeout,
+    SingleFlight,
+    get_governor,
+    get_http_client,
+    get_single_flight,
+    request_fingerprint,
+)
+from .llm_resilience import MIN_ATTEMPT_TIME, CircuitOpen, LLMResilience, get_resilience
+from .llm_telemetry import (
+    OUTCOME_CANCELLED,
+    OUTCOME_CIRCUIT_OPEN,
+    OUTCOME_ERROR,
+    OUTCOME_OK,
+    OUTCOME_QUEUE_TIMEOUT,
+    OUTCOME_TIMEOUT,
+    LLMCall,
+    LLMTelemetry,
+    get_telemetry,
+)
 
 
 # -----------------------------------------------------------------------------
@@ -125,6 +156,27 @@ class LLMTimeoutError(LLMError):
     pass
 
 
+class LLMQueueTimeoutError(LLMTimeoutError):
+    """
+    Raised when a call waits too long for a concurrency-governor slot.
+    
+    v0.12: Subclass of LLMTimeoutError so existing handlers return the
+    same JSON error; the request never reached the provider.
+    """
+    pass
+
+
+class LLMCircuitOpenError(LLMTimeoutError):
+    """
+    Raised without calling the provider while the model's circuit breaker
+    is open (too many recent transient failures).
+    
+    v0.12: Subclass of LLMTimeoutError so existing handlers return the
+    same JSON error.
+    """
+    pass
+
+
 class PersonaModeError(LLMError):
     """Raised when persona mode LLM call fails (NO FALLBACK)."""
     pass
@@ -143,6 +195,224 @@ class StrictModeError(LLMError):
 # Gunicorn should be set to 120s, so we use 90s here
 LLM_CLIENT_TIMEOUT = 90
 
+# Queue waits at least this long (ms) are logged
+QUEUE_LOG_THRESHOLD_MS = 250.0
+
+# v0.9.0: Standard Chat Completions params only; anything else is filtered out
+ALLOWED_CHAT_PARAMS = frozenset({
+    "temperature",
+    "max_tokens",
+    "top_p",
+    "frequency_penalty",
+    "presence_penalty",
+    "stop",
+    "n",
+    "stream",
+    "logprobs",
+    "top_logprobs",
+    "response_format",
+    "seed",
+    "tools",
+    "tool_choice",
+    "user",
+})
+
+
+# -----------------------------------------------------------------------------
+# Request / Error Helpers (shared with AsyncLLMClient)
+# -----------------------------------------------------------------------------
+
+def _chat_kwargs(model: str, kwargs: Dict[str, Any], streaming: bool = False) -> Dict[str, Any]:
+    """Filter kwargs down to Chat Completions params for `model`."""
+    allowed = ALLOWED_CHAT_PARAMS - {"stream"} if streaming else ALLOWED_CHAT_PARAMS
+    filtered_kwargs = {k: v for k, v in kwargs.items() if k in allowed}
+    
+    # v0.10.3: gpt-5.1 and o-series models require max_completion_tokens, not max_tokens
+    if "max_tokens" in filtered_kwargs:
+        if "gpt-5" in model or "o1" in model or "o3" in model:
+            filtered_kwargs["max_completion_tokens"] = filtered_kwargs.pop("max_tokens")
+    
+    # Log any filtered params for debugging
+    removed = set(kwargs.keys()) - allowed
+    if removed and not streaming:
+        print(f"[LLM] WARNING: Filtered incompatible kwargs: {removed}", file=sys.stderr, flush=True)
+    return filtered_kwargs
+
+
+def _as_timeout_error(
+    e: BaseException,
+    channel: str,
+    command: str,
+    model: str,
+    streaming: bool = False,
+) -> Optional[LLMTimeoutError]:
+    """
+    v0.10.2: Map provider timeout / network failures to LLMTimeoutError.
+    
+    Logs the failure either way; returns None for other errors, which
+    callers re-raise as-is.
+    """
+    label_prefix = "STREAMING " if streaming else ""
+    what = "LLM streaming" if streaming else "LLM"
+    where = f"Channel={channel}, command={command}, model={model}"
+    
+    if isinstance(e, APITimeoutError):
+        label = "TIMEOUT"
+        message = f"{what} request timed out after {LLM_CLIENT_TIMEOUT}s. {where}"
+    elif isinstance(e, APIConnectionError):
+        label = "CONNECTION ERROR"
+        message = f"{what} connection failed (network error). {where}. Error: {e}"
+    elif _HAS_HTTPX and isinstance(e, (httpx.TimeoutException, httpx.ConnectError, httpx.ReadTimeout)):
+        # Can happen at lower level
+        label = "HTTPX TIMEOUT"
+        message = f"{what} request failed (httpx network error). {where}. Error: {e}"
+    else:
+        print(
+            f"[LLM] ERROR channel={channel} command={command} model={model} error={e}",
+            file=sys.stderr,
+            flush=True,
+        )
+        return None
+    
+    print(
+        f"[LLM] {label_prefix}{label} channel={channel} command={command} model={model} error={e}",
+        file=sys.stderr,
+        flush=True,
+    )
+    return LLMTimeoutError(message)
+
+
+def _require_api_key() -> str:
+    """OPENAI_API_KEY, logged masked; RuntimeError listing where it was looked for."""
+    api_key = os.getenv("OPENAI_API_KEY", "")
+    if not api_key:
+        project_root = _get_project_root()
+        raise RuntimeError(
+            f"OPENAI_API_KEY not set.\n"
+            f"Checked locations:\n"
+            f"  1. {project_root / '.env'}\n"
+            f"  2. {Path.cwd() / '.env'}\n"
+            f"  3. Environment variable OPENAI_API_KEY\n"
+            f"Please create a .env file with: OPENAI_API_KEY=sk-..."
+        )
+
+    # Log key info (masked)
+    key_preview = f"{api_key[:8]}...{api_key[-4:]}" if len(api_key) > 12 else "***"
+    print(f"[LLM] Initializing client with key: {key_preview}", flush=True)
+    print(f"[LLM] Client timeout: {LLM_CLIENT_TIMEOUT}s", flush=True)
+    return api_key
+
+
+def _log_retry(
+    tries: int,
+    max_attempts: int,
+    backoff: float,
+    channel: str,
+    command: str,
+    model: str,
+    e: BaseException,
+) -> None:
+    print(
+        f"[LLM] RETRY {tries + 1}/{max_attempts} in {backoff:.2f}s channel={channel} "
+        f"command={command} model={model} error={e}",
+        file=sys.stderr,
+        flush=True,
+    )
+
+
+def _log_hedge(delay: float, channel: str, command: str, model: str, call: Optional[LLMCall], suffix: str = "") -> None:
+    if call is not None:
+        call.mark_hedged()
+    print(
+        f"[LLM] HEDGE after {delay * 1000:.0f}ms channel={channel} command={command} model={model}{suffix}",
+        flush=True,
+    )
+
+
+def _queue_timeout_error(e: LLMQueueTimeout, channel: str, command: str, model: str) -> LLMQueueTimeoutError:
+    print(
+        f"[LLM] QUEUE TIMEOUT channel={channel} command={command} model={model} error={e}",
+        file=sys.stderr,
+        flush=True,
+    )
+    return LLMQueueTimeoutError(
+        f"LLM request waited too long for a free slot. "
+        f"Channel={channel}, command={command}, model={model}. {e}"
+    )
+
+
+def _outcome(e: BaseException) -> str:
+    """Telemetry outcome for a failed call."""
+    if isinstance(e, LLMCircuitOpenError):
+        return OUTCOME_CIRCUIT_OPEN
+    if isinstance(e, LLMQueueTimeoutError):
+        return OUTCOME_QUEUE_TIMEOUT
+    if isinstance(e, LLMTimeoutError):
+        return OUTCOME_TIMEOUT
+    return OUTCOME_ERROR
+
+
+def _circuit_open_error(e: CircuitOpen, channel: str, command: str) -> LLMCircuitOpenError:
+    print(
+        f"[LLM] CIRCUIT OPEN channel={channel} command={command} model={e.model} "
+        f"retry_in={e.retry_after:.0f}s",
+        file=sys.stderr,
+        flush=True,
+    )
+    return LLMCircuitOpenError(
+        f"LLM provider is failing for model={e.model}; not calling it for now. "
+        f"Channel={channel}, command={command}. Retry in {e.retry_after:.0f}s."
+    )
+
+
+def _fallback_model(
+    router: ModelRouter,
+    resilience: LLMResilience,
+    model: str,
+    command: str,
+    explicit_model: Optional[str],
+) -> str:
+    """
+    v0.12: System channel only — while `model`'s circuit is open, use the
+    router's light model instead (unless the caller named a model).
+    """
+    light = router.mini.model_id
+    if explicit_model or model == light or resilience.available(model) or not resilience.available(light):
+        return model
+    resilience.note_fallback(model)
+    print(f"[LLM] FALLBACK circuit open for model={model}, using model={light} command={command}", flush=True)
+    return light
+
+
+def _cacheable(text: str, validator: Optional[Callable[[str], Any]], command: str) -> bool:
+    """
+    v0.12: Whether a fresh answer may go into the response cache: it must
+    be non-empty and pass the caller's validator (an exception counts as a
+    failure), so an answer the caller cannot parse is not pinned for the TTL.
+    """
+    if not text:
+        return False
+    if validator is None:
+        return True
+    try:
+        if validator(text):
+            return True
+    except Exception:
+        pass
+    print(f"[LLM] response not cached: failed validation command={command}", flush=True)
+    return False
+
+
+def _budget(resilience: LLMResilience, started: Optional[float], limit: float, reserve: float = 0.0) -> float:
+    """
+    v0.12: `limit` capped at what is left of the call budget (less
+    `reserve`) for a call whose first attempt started at `started`
+    (time.monotonic()); `limit` unchanged when there is no start time.
+    """
+    if started is None:
+        return limit
+    return max(0.0, min(limit, resilience.time_left(time.monotonic() - started) - reserve))
+
 
 # -----------------------------------------------------------------------------
 # LLM Client
@@ -162,35 +432,62 @@ class LLMClient:
     - Added explicit timeout (90s) to all API calls
     - Catches APITimeoutError, APIConnectionError, and httpx.TimeoutException
     - Raises LLMTimeoutError on timeout/network failures for clean JSON error handling
+    
+    v0.12: complete_system(..., cache=True) serves identical requests from
+    the response cache (the shared one from get_response_cache() unless one
+    is passed in). Persona calls are never cached.
+    
+    v0.12: Requests go over the process-wide pooled HTTP client and wait
+    for a slot from the concurrency governor (see backend/llm_transport.py).
+    AsyncLLMClient is the asyncio sibling with the same channels.
+    
+    v0.12: Concurrent identical non-streaming requests are coalesced into
+    one upstream call (single-flight); see coalescing_stats().
+    
+    v0.12: Transient failures are retried with jittered backoff, slow calls
+    can be hedged (hedge=True), and a per-model circuit breaker fails fast
+    while the provider is degraded; see resilience_stats().
+    
+    v0.12: Every call (cache hits included) is recorded by the telemetry
+    recorder with tokens, latency, TTFT and queue time; see telemetry_stats().
+    
+    v0.12: Collaborators default to the process-wide instances; pass
+    `openai_client` (anything with chat.completions.create) to use it
+    instead of building an OpenAI SDK client (no API key needed then).
     """
 
-    def __init__(self, router: Optional[ModelRouter] = None):
-        if not _HAS_OPENAI:
-            raise RuntimeError("openai package not installed. Run: pip install openai")
-        
-        api_key = os.getenv("OPENAI_API_KEY", "")
-        if not api_key:
-            project_root = _get_project_root()
-            raise RuntimeError(
-                f"OPENAI_API_KEY not set.\n"
-                f"Checked locations:\n"
-                f"  1. {project_root / '.env'}\n"
-                f"  2. {Path.cwd() / '.env'}\n"
-                f"  3. Environment variable OPENAI_API_KEY\n"
-                f"Please create a .env file with: OPENAI_API_KEY=sk-..."
+    def __init__(
+        self,
+        router: Optional[ModelRouter] = None,
+        response_cache: Optional[LLMResponseCache] = None,
+        governor: Optional[LLMConcurrencyGovernor] = None,
+        resilience: Optional[LLMResilience] = None,
+        telemetry: Optional[LLMTelemetry] = None,
+        single_flight: Optional[SingleFlight] = None,
+        openai_client: Optional[Any] = None,
+    ):
+        if openai_client is None:
+            if not _HAS_OPENAI:
+                raise RuntimeError("openai package not installed. Run: pip install openai")
+            
+            api_key = _require_api_key()
+            
+            # Initialize OpenAI client with default timeout
+            # v0.12: on the shared connection pool
+            http_client = get_http_client(LLM_CLIENT_TIMEOUT)
+            openai_client = OpenAI(
+                api_key=api_key,
+                timeout=LLM_CLIENT_TIMEOUT,  # v0.10.2: Explicit timeout
+                max_retries=0,  # v0.12: LLMResilience is the only retry layer
+                **({"http_client": http_client} if http_client is not None else {}),
             )
-
-        # Log key info (masked)
-        key_preview = f"{api_key[:8]}...{api_key[-4:]}" if len(api_key) > 12 else "***"
-        print(f"[LLM] Initializing client with key: {key_preview}", flush=True)
-        print(f"[LLM] Client timeout: {LLM_CLIENT_TIMEOUT}s", flush=True)
-        
-        # Initialize OpenAI client with default timeout
-        self.client = OpenAI(
-            api_key=api_key,
-            timeout=LLM_CLIENT_TIMEOUT,  # v0.10.2: Explicit timeout
-        )
+        self.client = openai_client
         self.router = router or get_router()
+        self.governor = governor or get_governor()
+        self.single_flight = single_flight or get_single_flight()
+        self.resilience = resilience or get_resilience()
+        self.telemetry = telemetry or get_telemetry()
+        self._response_cache = response_cache
 
     def _call_api(
         self,
@@ -199,11 +496,27 @@ class LLMClient:
         messages: List[Dict[str, str]],
         channel: str = "unknown",
         command: str = "unknown",
+        cache_status: Optional[str] = None,
         **kwargs,
     ) -> str:
         """
         Make the actual OpenAI API call.
         
+        v0.12: Waits for a slot from the concurrency governor first;
+        raises LLMQueueTimeoutError if none frees up in time.
+        
+        v0.12: A call identical to one already in flight (same model,
+        prompts and params) waits for that call and returns its result or
+        raises its error instead of sending a duplicate request.
+        
+        v0.12: Raises LLMCircuitOpenError right away while the model's
+        circuit breaker is open; transient failures are retried, and
+        hedge=True (or NOVA_LLM_HEDGE) sends a duplicate request once the
+        call runs past the model's p95 latency.
+        
+        v0.12: Recorded by the telemetry recorder; `cache_status` ("miss"
+        when the response cache was consulted) is stored with the record.
+        
         v0.10.2: Added timeout handling and custom exception.
         - Uses explicit timeout (90s) on all calls
         - Catches APITimeoutError, APIConnectionError, httpx.TimeoutException
@@ -212,93 +525,112 @@ class LLMClient:
         v0.9.0: Filters out incompatible kwargs before calling the API.
         Only passes standard Chat Completions parameters.
         """
-        # Filter out any incompatible kwargs that might cause API errors
-        # Standard Chat Completions params only
-        allowed_params = {
-            "temperature",
-            "max_tokens",
-            "top_p",
-            "frequency_penalty",
-            "presence_penalty",
-            "stop",
-            "n",
-            "stream",
-            "logprobs",
-            "top_logprobs",
-            "response_format",
-            "seed",
-            "tools",
-            "tool_choice",
-            "user",
-        }
-        
-        filtered_kwargs = {k: v for k, v in kwargs.items() if k in allowed_params}
+        hedge = kwargs.pop("hedge", None)
+        filtered_kwargs = _chat_kwargs(model, kwargs)
+        call = self.telemetry.start(channel, command, model, cache=cache_status)
         
-        # v0.10.3: gpt-5.1 and o-series models require max_completion_tokens, not max_tokens
-        if "max_tokens" in filtered_kwargs:
-            if "gpt-5" in model or "o1" in model or "o3" in model:
-                filtered_kwargs["max_completion_tokens"] = filtered_kwargs.pop("max_tokens")
-        
-        # Log any filtered params for debugging
-        removed = set(kwargs.keys()) - set(filtered_kwargs.keys())
-        if removed:
-            print(f"[LLM] WARNING: Filtered incompatible kwargs: {removed}", file=sys.stderr, flush=True)
-        
-        try:
-            resp = self.client.chat.completions.create(
-                model=model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    *messages,
-                ],
-                timeout=LLM_CLIENT_TIMEOUT,  # v0.10.2: Explicit timeout per call
-                **filtered_kwargs,
-            )
-            return resp.choices[0].message.content or ""
-        
-        # v0.10.2: Catch timeout and connection errors specifically
-        except APITimeoutError as e:
+        def on_join() -> None:
+            call.mark_coalesced()
             print(
-                f"[LLM] TIMEOUT channel={channel} command={command} model={model} error={e}",
-                file=sys.stderr,
+                f"[LLM] coalesced channel={channel} command={command} model={model} "
+                f"(identical request in flight)",
                 flush=True,
             )
-            raise LLMTimeoutError(
-                f"LLM request timed out after {LLM_CLIENT_TIMEOUT}s. "
-                f"Channel={channel}, command={command}, model={model}"
-            ) from e
         
-        except APIConnectionError as e:
-            print(
-                f"[LLM] CONNECTION ERROR channel={channel} command={command} model={model} error={e}",
-                file=sys.stderr,
-                flush=True,
+        try:
+            text = self.single_flight.do(
+                request_fingerprint(model, system_prompt, messages, filtered_kwargs),
+                lambda: self._send(model, system_prompt, messages, channel, command, filtered_kwargs, hedge, call),
+                on_join=on_join,
             )
-            raise LLMTimeoutError(
-                f"LLM connection failed (network error). "
-                f"Channel={channel}, command={command}, model={model}. Error: {e}"
-            ) from e
-        
         except Exception as e:
-            # Check if it's an httpx timeout (can happen at lower level)
-            if _HAS_HTTPX and isinstance(e, (httpx.TimeoutException, httpx.ConnectError, httpx.ReadTimeout)):
-                print(
-                    f"[LLM] HTTPX TIMEOUT channel={channel} command={command} model={model} error={e}",
-                    file=sys.stderr,
-                    flush=True,
-                )
-                raise LLMTimeoutError(
-                    f"LLM request failed (httpx network error). "
-                    f"Channel={channel}, command={command}, model={model}. Error: {e}"
-                ) from e
-            
-            # Re-raise other exceptions as-is
-            print(
-                f"[LLM] ERROR channel={channel} command={command} model={model} error={e}",
-                file=sys.stderr,
-                flush=True,
-            )
+            self.telemetry.finish(call, _outcome(e), e)
             raise
+        self.telemetry.finish(call)
+        return text
+
+    def _send(
+        self,
+        model: str,
+        system_prompt: str,
+        messages: List[Dict[str, str]],
+        channel: str,
+        command: str,
+        filtered_kwargs: Dict[str, Any],
+        hedge: Optional[bool] = None,
+        call: Optional[LLMCall] = None,
+    ) -> str:
+        """Admit through the circuit breaker, then attempt (hedged if due) and retry transient failures."""
+        try:
+            self.resilience.admit(model)
+        except CircuitOpen as e:
+            raise _circuit_open_error(e, channel, command) from e
+        
+        started = time.monotonic()
+        attempt = lambda: self._attempt(model, system_prompt, messages, channel, command, filtered_kwargs, call, started)
+        tries = 1
+        while True:
+            try:
+                delay = self.resilience.hedge_delay(model, hedge)
+                if delay is None:
+                    return attempt()
+                return self.resilience.run_hedged(
+                    model,
+                    attempt,
+                    delay,
+                    on_hedge=lambda: _log_hedge(delay, channel, command, model, call),
+                )
+            except LLMQueueTimeoutError:
+                raise
+            except Exception as e:
+                backoff = self.resilience.retry_delay(model, tries, time.monotonic() - started, e)
+                if backoff is None:
+                    timeout_error = _as_timeout_error(e, channel, command, model)
+                    if timeout_error is None:
+                        raise
+                    raise timeout_error from e
+                _log_retry(tries, self.resilience.max_attempts, backoff, channel, command, model, e)
+                if call is not None:
+                    call.add_retry()
+                time.sleep(backoff)
+                tries += 1
+
+    def _attempt(
+        self,
+        model: str,
+        system_prompt: str,
+        messages: List[Dict[str, str]],
+        channel: str,
+        command: str,
+        filtered_kwargs: Dict[str, Any],
+        call: Optional[LLMCall] = None,
+        call_started: Optional[float] = None,
+    ) -> str:
+        """
+        One governed Chat Completions request; its outcome feeds the latency
+        window and breaker. Queue wait and request timeout are capped at
+        what is left of the call budget counted from `call_started`.
+        """
+        with self._slot(model, channel, command, call, call_started):
+            started = time.monotonic()
+            try:
+                resp = self.client.chat.completions.create(
+                    model=model,
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        *messages,
+                    ],
+                    # v0.10.2: Explicit timeout per call (v0.12: within the call budget)
+                    timeout=_budget(self.resilience, call_started, LLM_CLIENT_TIMEOUT),
+                    **filtered_kwargs,
+                )
+            except Exception as e:
+                self.resilience.record_failure(model, e)
+                raise
+            self.resilience.record_success(model, time.monotonic() - started)
+            if call is not None:
+                call.add_usage(getattr(resp, "usage", None))
+            return resp.choices[0].message.content or ""
 
     def _call_api_streaming(
         self,
@@ -312,91 +644,119 @@ class LLMClient:
         """
         Make a streaming OpenAI API call.
         
+        v0.12: Holds a governor slot until the stream ends or is closed.
+        v0.12: Fails fast while the model's circuit is open; a transient
+        failure is retried only before the first chunk was yielded.
+        v0.12: Recorded by the telemetry recorder with time-to-first-token;
+        token usage comes from the final chunk (stream_options.include_usage).
         v0.10.2: Added timeout handling for streaming calls.
         v0.10.1: Returns a generator that yields text chunks.
         """
-        allowed_params = {
-            "temperature",
-            "max_tokens",
-            "top_p",
-            "frequency_penalty",
-            "presence_penalty",
-            "stop",
-            "n",
-            "logprobs",
-            "top_logprobs",
-            "response_format",
-            "seed",
-            "tools",
-            "tool_choice",
-            "user",
-        }
-        
-        filtered_kwargs = {k: v for k, v in kwargs.items() if k in allowed_params}
-        
-        # v0.10.3: gpt-5.1 and o-series models require max_completion_tokens, not max_tokens
-        if "max_tokens" in filtered_kwargs:
-            if "gpt-5" in model or "o1" in model or "o3" in model:
-                filtered_kwargs["max_completion_tokens"] = filtered_kwargs.pop("max_tokens")
+        kwargs.pop("hedge", None)
+        filtered_kwargs = _chat_kwargs(model, kwargs, streaming=True)
+        call = self.telemetry.start(channel, command, model, streaming=True)
         
+        chunks = self._stream(model, system_prompt, messages, channel, command, filtered_kwargs, call)
+        outcome, error = OUTCOME_CANCELLED, None
         try:
-            stream = self.client.chat.completions.create(
-                model=model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    *messages,
-                ],
-                stream=True,
-                timeout=LLM_CLIENT_TIMEOUT,  # v0.10.2: Explicit timeout
-                **filtered_kwargs,
-            )
-            
-            for chunk in stream:
-                if chunk.choices and chunk.choices[0].delta.content:
-                    yield chunk.choices[0].delta.content
-        
-        # v0.10.2: Catch timeout and connection errors
-        except APITimeoutError as e:
-            print(
-                f"[LLM] STREAMING TIMEOUT channel={channel} command={command} model={model} error={e}",
-                file=sys.stderr,
-                flush=True,
-            )
-            raise LLMTimeoutError(
-                f"LLM streaming request timed out after {LLM_CLIENT_TIMEOUT}s. "
-                f"Channel={channel}, command={command}, model={model}"
-            ) from e
-        
-        except APIConnectionError as e:
-            print(
-                f"[LLM] STREAMING CONNECTION ERROR channel={channel} command={command} model={model} error={e}",
-                file=sys.stderr,
-                flush=True,
-            )
-            raise LLMTimeoutError(
-                f"LLM streaming connection failed (network error). "
-                f"Channel={channel}, command={command}, model={model}. Error: {e}"
-            ) from e
-                    
+            for text in chunks:
+                call.first_token()
+                yield text
+            outcome = OUTCOME_OK
         except Exception as e:
-            # Check for httpx timeout
-            if _HAS_HTTPX and isinstance(e, (httpx.TimeoutException, httpx.ConnectError, httpx.ReadTimeout)):
-                print(
-                    f"[LLM] STREAMING HTTPX TIMEOUT channel={channel} command={command} model={model} error={e}",
-                    file=sys.stderr,
-                    flush=True,
-                )
-                raise LLMTimeoutError(
-                    f"LLM streaming request failed (httpx network error). "
-                    f"Channel={channel}, command={command}, model={model}. Error: {e}"
-                ) from e
-            
-            print(
-                f"[LLM] ERROR channel={channel} command={command} model={model} error={e}",
-                file=sys.stderr,
-                flush=True,
-            )
+            outcome, error = _outcome(e), e
             raise
+        finally:
+            chunks.close()  # releases the governor slot now if the consumer stopped early
+            self.telemetry.finish(call, outcome, error)
+
+    def _stream(
+        self,
+        model: str,
+        system_prompt: str,
+        messages: List[Dict[str, str]],
+        channel: str,
+        command: str,
+        filtered_kwargs: Dict[str, Any],
+        call: LLMCall,
+    ) -> Generator[str, None, None]:
+        """Governed streaming request with circuit breaker and retries before the first chunk."""
+        try:
+            self.resilience.admit(model)
+        except CircuitOpen as e:
+            raise _circuit_open_error(e, channel, command) from e
+        
+        started = time.monotonic()
+        tries = 1
+        while True:
+            yielded = False
+            with self._slot(model, channel, command, call, started):
+                call_started = time.monotonic()
+                try:
+                    stream = self.client.chat.completions.create(
+                        model=model,
+                        messages=[
+                            {"role": "system", "content": system_prompt},
+                            *messages,
+                        ],
+                        stream=True,
+                        stream_options={"include_usage": True},
+                        # v0.10.2: Explicit timeout (v0.12: within the call budget)
+                        timeout=_budget(self.resilience, started, LLM_CLIENT_TIMEOUT),
+                        **filtered_kwargs,
+                    )
+                    
+                    try:
+                        for chunk in stream:
+                            call.add_usage(getattr(chunk, "usage", None))
+                            if chunk.choices and chunk.choices[0].delta.content:
+                                yielded = True
+                                yield chunk.choices[0].delta.content
+                    finally:
+                        # Release the HTTP response now, also when the consumer stopped early
+                        stream.close()
+                except Exception as e:
+                    self.resilience.record_failure(model, e)
+                    backoff = None
+                    if not yielded:
+                        backoff = self.resilience.retry_delay(model, tries, time.monotonic() - started, e)
+                    if backoff is None:
+                        timeout_error = _as_timeout_error(e, channel, command, model, streaming=True)
+                        if timeout_error is None:
+                            raise
+                        raise timeout_error from e
+                    error = e
+                else:
+                    self.resilience.record_success(model, time.monotonic() - call_started)
+                    return
+            _log_retry(tries, self.resilience.max_attempts, backoff, channel, command, model, error)
+            call.add_retry()
+            time.sleep(backoff)
+            tries += 1
+
+    @contextmanager
+    def _slot(
+        self,
+        model: str,
+        channel: str,
+        command: str,
+        call: Optional[LLMCall] = None,
+        call_started: Optional[float] = None,
+    ) -> Iterator[None]:
+        """Hold a governor slot for one API call, leaving MIN_ATTEMPT_TIME of the call budget for the request."""
+        queue_timeout = _budget(self.resilience, call_started, self.governor.queue_timeout, MIN_ATTEMPT_TIME)
+        try:
+            queue_ms = self.governor.acquire(model, queue_timeout)
+        except LLMQueueTimeout as e:
+            raise _queue_timeout_error(e, channel, command, model) from e
+        if call is not None:
+            call.add_queue_ms(queue_ms)
+        if queue_ms >= QUEUE_LOG_THRESHOLD_MS:
+            print(f"[LLM] queued {queue_ms:.0f}ms channel={channel} command={command} model={model}", flush=True)
+        try:
+            yield
+        finally:
+            self.governor.release(model)
 
     # -------------------------------------------------------------------------
     # MAIN ENTRY POINT - used by _llm_with_policy in syscommands.py
@@ -534,6 +894,47 @@ class LLMClient:
             "channel": "persona",
         }
 
+    def stream_complete_persona(
+        self,
+        system: str,
+        user: str,
+        messages: Optional[List[Dict[str, str]]] = None,
+        session_id: Optional[str] = None,
+        model_override: Optional[str] = None,
+        **kwargs,
+    ) -> Generator[str, None, None]:
+        """
+        Streaming persona channel — same model and NO FALLBACK rule as
+        complete_persona(), on the streaming call stream_complete_system() uses.
+        
+        v0.12: Lets /nova/stream show persona replies as they are generated.
+        """
+        model = model_override or PERSONA_MODEL
+        command = kwargs.pop("command", None) or "persona"
+        
+        print(f"[LLM] channel=stream_persona command={command} model={model}", flush=True)
+        
+        msg_list = messages or []
+        msg_list = [*msg_list, {"role": "user", "content": user}]
+        
+        try:
+            yield from self._call_api_streaming(
+                model=model,
+                system_prompt=system,
+                messages=msg_list,
+                channel="stream_persona",
+                command=command,
+                **kwargs,
+            )
+        except LLMTimeoutError:
+            # Re-raise timeout errors as-is so Flask can handle them
+            raise
+        except Exception as e:
+            raise PersonaModeError(
+                f"Streaming persona LLM call failed with model={model}. Error: {e}. "
+                f"NO FALLBACK — persona mode requires gpt-5.1."
+            ) from e
+
     # -------------------------------------------------------------------------
     # SYSTEM CHANNEL — Model routed by ModelRouter
     # -------------------------------------------------------------------------
@@ -547,6 +948,9 @@ class LLMClient:
         command: Optional[str] = None,
         explicit_model: Optional[str] = None,
         think_mode: bool = False,
+        cache: bool = False,
+        cache_ttl: Optional[float] = None,
+        cache_validator: Optional[Callable[[str], Any]] = None,
         **kwargs,
     ) -> Dict[str, Any]:
         """
@@ -556,6 +960,17 @@ class LLMClient:
         - Heavy commands (quest-compose, generate-steps, etc.) → gpt-5.1
         - Light commands (everything else) → gpt-4.1-mini
         - Think mode → gpt-5.1 (o1-style reasoning)
+        
+        v0.12: While the routed model's circuit breaker is open, the call
+        goes to the router's light model instead (not when explicit_model
+        is given); the result's "model" says which one answered.
+        
+        v0.12: cache=True marks the call as deterministic: an identical
+        request (model, prompts, sampling params) is answered from the
+        response cache, and a fresh non-empty answer is stored for
+        `cache_ttl` seconds (the cache default if None). Results carry
+        "cached": True/False. Pass `cache_validator` (text -> bool, e.g. "parses
+        as the JSON I expect") to store only answers the caller can use.
         """
         ctx = RoutingContext(
             command=command,
@@ -570,11 +985,35 @@ class LLMClient:
             raise StrictModeError(f"Model routing failed: {e}") from e
 
         cmd_str = command or "unknown"
-        print(f"[LLM] channel=system command={cmd_str} model={model}", flush=True)
+        model = _fallback_model(self.router, self.resilience, model, cmd_str, explicit_model)
 
         msg_list = messages or []
         msg_list = [*msg_list, {"role": "user", "content": user}]
 
+        response_cache = self.response_cache if cache else None
+        cache_key = None
+        if response_cache is not None:
+            cache_key = make_cache_key("system", model, system, msg_list, kwargs)
+            lookup = self.telemetry.start("system", cmd_str, model, cache="hit")
+            try:
+                text = response_cache.get(cache_key)
+            except Exception as e:
+                print(f"[LLM] WARNING: response cache read failed: {e}", file=sys.stderr, flush=True)
+                text = None
+            if text is not None:
+                print(f"[LLM] channel=system command={cmd_str} model={model} cache=hit", flush=True)
+                self.telemetry.finish(lookup)
+                return {
+                    "text": text,
+                    "session_id": session_id,
+                    "model": model,
+                    "channel": "system",
+                    "command": cmd_str,
+                    "cached": True,
+                }
+
+        print(f"[LLM] channel=system command={cmd_str} model={model}", flush=True)
+
         try:
             text = self._call_api(
                 model=model,
@@ -582,6 +1021,7 @@ class LLMClient:
                 messages=msg_list,
                 channel="system",
                 command=cmd_str,
+                cache_status="miss" if cache_key is not None else None,
                 **kwargs,
             )
         except LLMTimeoutError:
@@ -593,12 +1033,19 @@ class LLMClient:
                 f"Error: {e}."
             ) from e
 
+        if cache_key is not None and _cacheable(text, cache_validator, cmd_str):
+            try:
+                response_cache.put(cache_key, text, ttl=cache_ttl)
+            except Exception as e:
+                print(f"[LLM] WARNING: response cache write failed: {e}", file=sys.stderr, flush=True)
+
         return {
             "text": text,
             "session_id": session_id,
             "model": model,
             "channel": "system",
             "command": cmd_str,
+            "cached": False,
         }
 
     # -------------------------------------------------------------------------
@@ -639,6 +1086,7 @@ class LLMClient:
             raise StrictModeError(f"Model routing failed: {e}") from e
 
         cmd_str = command or "unknown"
+        model = _fallback_model(self.router, self.resilience, model, cmd_str, explicit_model)
         print(f"[LLM] channel=stream_system command={cmd_str} model={model}", flush=True)
 
         msg_list = messages or []
@@ -666,6 +1114,34 @@ class LLMClient:
     # Utility Methods
     # -------------------------------------------------------------------------
 
+    @property
+    def response_cache(self) -> Optional[LLMResponseCache]:
+        """The cache used for cache=True calls; None when caching is off."""
+        if self._response_cache is None:
+            self._response_cache = get_response_cache()
+        return self._response_cache
+
+    def concurrency_stats(self) -> Dict[str, Any]:
+        """Governor in-flight/queue stats (shared with AsyncLLMClient)."""
+        return self.governor.stats()
+
+    def coalescing_stats(self) -> Dict[str, Any]:
+        """Single-flight counters: upstream calls, coalesced waiters (shared with AsyncLLMClient)."""
+        return self.single_flight.stats()
+
+    def resilience_stats(self) -> Dict[str, Any]:
+        """Per-model latency percentiles, breaker state, retries/hedges/fallbacks (shared with AsyncLLMClient)."""
+        return self.resilience.stats()
+
+    def telemetry_stats(self, recent: int = 20) -> Dict[str, Any]:
+        """Call totals, rollups by channel/model and command, and the newest records (shared with AsyncLLMClient)."""
+        return {**self.telemetry.stats(), "recent": self.telemetry.recent(recent)}
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Response cache counters (empty when caching is off)."""
+        cache = self.response_cache
+        return cache.stats() if cache is not None else {}
+
     def get_model_for_command(self, command: str, think_mode: bool = False) -> str:
         """
         Get the model that would be used for a given command.
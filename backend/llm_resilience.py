@@ -0,0 +1,522 @@
+# backend/llm_resilience.py
+"""
+NovaOS v0.12 — LLM Resilience: Retries, Hedging, Circuit Breaking
+
+LLMClient used to make exactly one attempt per call: a 429 or a 5xx went
+straight back to the user, a slow provider held the request for up to
+LLM_CLIENT_TIMEOUT, and a degraded provider kept getting hit at full
+rate while every caller waited for its own timeout.
+
+- Latency: a rolling window of successful call durations per model
+  (p50/p95/p99 in stats())
+- Retries: transient failures (429, 408/409, 5xx, connection errors and
+  timeouts) are retried with full-jitter exponential backoff, honoring
+  Retry-After
+- Budget: a whole call (queue waits, attempts and backoff) gets
+  CALL_BUDGET seconds, under Gunicorn's 120s worker timeout. Clients cap
+  each attempt's queue wait and request timeout at what is left, and no
+  retry starts with less than MIN_ATTEMPT_TIME left
+- Hedging (opt-in): once a call has run longer than its model's p95, a
+  duplicate request is sent and the first success wins
+- Circuit breaker per model: when at least half of the recent calls
+  failed transiently, calls fail fast (CircuitOpen) for a cooldown, then
+  a single probe decides whether to close it again. The system channel
+  falls back to the router's light model instead; persona keeps its
+  NO FALLBACK rule and fails fast
+
+Tuned with env vars: NOVA_LLM_RETRIES (attempts per call, 1 = no
+retries), NOVA_LLM_HEDGE ("1" to hedge by default), NOVA_LLM_BREAKER_COOLDOWN
+and NOVA_LLM_CALL_BUDGET (seconds).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple, TypeVar
+
+from .llm_transport import LLMQueueTimeout
+
+try:
+    from openai import APIConnectionError as _OpenAIConnectionError
+    _OPENAI_TRANSIENT: Tuple[type, ...] = (_OpenAIConnectionError,)  # includes APITimeoutError
+except ImportError:
+    _OPENAI_TRANSIENT = ()
+
+try:
+    import httpx
+    _HTTPX_TRANSIENT: Tuple[type, ...] = (httpx.TransportError,)
+except ImportError:
+    _HTTPX_TRANSIENT = ()
+
+logger = logging.getLogger("nova.llm_resilience")
+
+T = TypeVar("T")
+
+
+# =============================================================================
+# DEFAULTS
+# =============================================================================
+
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_BACKOFF_BASE = 0.5     # seconds; attempt n waits up to base * 2**(n-1)
+DEFAULT_BACKOFF_MAX = 8.0      # seconds
+RETRY_AFTER_MAX = 20.0         # seconds; longer Retry-After hints are capped
+CALL_BUDGET = 100.0            # seconds for a whole call; must stay under the worker timeout
+MIN_ATTEMPT_TIME = 5.0         # seconds; no retry starts with less budget left
+TRANSIENT_STATUS = frozenset({408, 409, 429, 500, 502, 503, 504})
+
+LATENCY_SAMPLES = 256
+HEDGE_MIN_SAMPLES = 20         # no hedging until the model's p95 means something
+HEDGE_MIN_DELAY = 0.5          # seconds
+HEDGE_WORKERS = 32
+
+BREAKER_WINDOW = 20            # most recent calls per model
+BREAKER_MIN_CALLS = 10
+BREAKER_ERROR_RATE = 0.5
+BREAKER_COOLDOWN = 30.0        # seconds open before a probe is let through
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpen(RuntimeError):
+    """Raised instead of calling a model whose circuit breaker is open."""
+
+    def __init__(self, model: str, retry_after: float):
+        super().__init__(f"circuit open for model={model}; retry in {retry_after:.0f}s")
+        self.model = model
+        self.retry_after = retry_after
+
+
+def _percentile(samples: Deque[float], q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] if ordered else 0.0
+
+
+# =============================================================================
+# CIRCUIT BREAKER
+# =============================================================================
+
+class CircuitBreaker:
+    """
+    Error-rate breaker for one model (not thread-safe; LLMResilience locks).
+
+    closed: calls go through; outcomes fill a rolling window. Once the
+    window holds `min_calls` outcomes and the failure share reaches
+    `error_rate`, it opens.
+    open: calls are rejected until `cooldown` has passed, then one probe
+    is let through (half_open). A probe with no outcome after another
+    cooldown is replaced.
+    half_open: the probe's success closes the breaker, failure reopens it.
+    """
+
+    def __init__(
+        self,
+        window: int = BREAKER_WINDOW,
+        min_calls: int = BREAKER_MIN_CALLS,
+        error_rate: float = BREAKER_ERROR_RATE,
+        cooldown: float = BREAKER_COOLDOWN,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.min_calls = min_calls
+        self.error_rate = error_rate
+        self.cooldown = cooldown
+        self._clock = clock
+        self._outcomes: Deque[bool] = deque(maxlen=window)
+        self.state = CLOSED
+        self._since = 0.0   # when it opened, or when the current probe started
+        self.opened = 0
+
+    def available(self) -> bool:
+        """Would a call be let through right now (without claiming the probe)?"""
+        if self.state == CLOSED:
+            return True
+        return self._clock() - self._since >= self.cooldown
+
+    def allow(self) -> bool:
+        """Let a call through, claiming the probe when not closed."""
+        if not self.available():
+            return False
+        if self.state != CLOSED:
+            self.state = HALF_OPEN
+            self._since = self._clock()
+        return True
+
+    def retry_after(self) -> float:
+        if self.state == CLOSED:
+            return 0.0
+        return max(0.0, self.cooldown - (self._clock() - self._since))
+
+    def record(self, ok: bool) -> None:
+        if self.state == HALF_OPEN:
+            if ok:
+                self.state = CLOSED
+                self._outcomes.clear()
+            else:
+                self._trip()
+            return
+        if self.state == OPEN:
+            return  # late result of a call admitted before it opened
+        self._outcomes.append(ok)
+        failures = self._outcomes.count(False)
+        if len(self._outcomes) >= self.min_calls and failures >= self.error_rate * len(self._outcomes):
+            self._trip()
+
+    def _trip(self) -> None:
+        self.state = OPEN
+        self._since = self._clock()
+        self._outcomes.clear()
+        self.opened += 1
+
+    def error_share(self) -> float:
+        return self._outcomes.count(False) / len(self._outcomes) if self._outcomes else 0.0
+
+
+# =============================================================================
+# RESILIENCE POLICY
+# =============================================================================
+
+_executor_lock = threading.Lock()
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _hedge_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=HEDGE_WORKERS, thread_name_prefix="nova-llm-hedge")
+        return _executor
+
+
+class LLMResilience:
+    """
+    Per-model latency windows, retry policy, hedging and circuit breakers,
+    shared by LLMClient and AsyncLLMClient.
+
+    Args:
+        max_attempts: Attempts per call including the first (1 = no retries)
+        backoff_base / backoff_max: Full-jitter exponential backoff bounds
+        call_budget: Seconds a whole call may take, retries and queue waits included
+        hedge: Hedge calls by default (callers can pass hedge=True/False)
+        breaker_*: CircuitBreaker settings for every model
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        backoff_base: float = DEFAULT_BACKOFF_BASE,
+        backoff_max: float = DEFAULT_BACKOFF_MAX,
+        call_budget: float = CALL_BUDGET,
+        hedge: bool = False,
+        breaker_window: int = BREAKER_WINDOW,
+        breaker_min_calls: int = BREAKER_MIN_CALLS,
+        breaker_error_rate: float = BREAKER_ERROR_RATE,
+        breaker_cooldown: float = BREAKER_COOLDOWN,
+        clock: Callable[[], float] = time.monotonic,
+        rng: Optional[random.Random] = None,
+    ):
+        self.max_attempts = max(1, max_attempts)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.call_budget = call_budget
+        self.hedge = hedge
+        self._breaker_args = dict(
+            window=breaker_window,
+            min_calls=breaker_min_calls,
+            error_rate=breaker_error_rate,
+            cooldown=breaker_cooldown,
+            clock=clock,
+        )
+        self._clock = clock
+        self._rng = rng or random.Random()
+        self._lock = threading.Lock()
+        self._latency: Dict[str, Deque[float]] = {}
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._counts: Dict[str, Dict[str, int]] = {}
+
+    def _count(self, model: str, key: str) -> None:
+        # Caller holds the lock
+        counts = self._counts.setdefault(model, {
+            "calls": 0, "failures": 0, "retries": 0, "hedges": 0,
+            "hedge_wins": 0, "rejected": 0, "fallbacks": 0,
+        })
+        counts[key] += 1
+
+    def _breaker(self, model: str) -> CircuitBreaker:
+        # Caller holds the lock
+        breaker = self._breakers.get(model)
+        if breaker is None:
+            breaker = self._breakers[model] = CircuitBreaker(**self._breaker_args)
+        return breaker
+
+    # -------------------------------------------------------------------------
+    # Circuit breaker
+    # -------------------------------------------------------------------------
+
+    def admit(self, model: str) -> None:
+        """Raise CircuitOpen if `model`'s breaker rejects calls right now."""
+        with self._lock:
+            breaker = self._breaker(model)
+            if breaker.allow():
+                return
+            self._count(model, "rejected")
+            retry_after = breaker.retry_after()
+        raise CircuitOpen(model, retry_after)
+
+    def available(self, model: str) -> bool:
+        """True unless `model`'s breaker is open and still cooling down."""
+        with self._lock:
+            breaker = self._breakers.get(model)
+            return breaker is None or breaker.available()
+
+    def note_fallback(self, model: str) -> None:
+        with self._lock:
+            self._count(model, "fallbacks")
+
+    # -------------------------------------------------------------------------
+    # Outcomes
+    # -------------------------------------------------------------------------
+
+    def record_success(self, model: str, seconds: float) -> None:
+        with self._lock:
+            self._latency.setdefault(model, deque(maxlen=LATENCY_SAMPLES)).append(seconds)
+            self._count(model, "calls")
+            self._breaker(model).record(True)
+
+    def record_failure(self, model: str, error: BaseException) -> None:
+        """Only transient failures count against the breaker; the rest show a reachable provider."""
+        transient = self.is_transient(error)
+        with self._lock:
+            self._count(model, "calls")
+            if transient:
+                self._count(model, "failures")
+            self._breaker(model).record(not transient)
+
+    # -------------------------------------------------------------------------
+    # Retries
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def is_transient(error: BaseException) -> bool:
+        """Rate limits, overload, 5xx and network failures; not caller errors or queue timeouts."""
+        if isinstance(error, (CircuitOpen, LLMQueueTimeout)):
+            return False
+        status = getattr(error, "status_code", None)
+        if isinstance(status, int):
+            return status in TRANSIENT_STATUS
+        return isinstance(error, _OPENAI_TRANSIENT + _HTTPX_TRANSIENT)
+
+    @staticmethod
+    def _retry_after(error: BaseException) -> Optional[float]:
+        response = getattr(error, "response", None)
+        headers = getattr(response, "headers", None)
+        if not headers:
+            return None
+        try:
+            return min(RETRY_AFTER_MAX, max(0.0, float(headers.get("retry-after"))))
+        except (TypeError, ValueError):
+            return None
+
+    def retry_delay(self, model: str, attempt: int, elapsed: float, error: BaseException) -> Optional[float]:
+        """
+        Seconds to wait before attempt `attempt + 1`, or None when `error`
+        is final: not transient, out of attempts, less than
+        MIN_ATTEMPT_TIME of the call budget left after the wait, or the
+        model's breaker has opened meanwhile.
+        """
+        if attempt >= self.max_attempts or not self.is_transient(error):
+            return None
+        delay = self._rng.uniform(0.0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1)))
+        hint = self._retry_after(error)
+        if hint is not None:
+            delay = max(delay, hint)
+        if self.time_left(elapsed + delay) < MIN_ATTEMPT_TIME or not self.available(model):
+            return None
+        with self._lock:
+            self._count(model, "retries")
+        return delay
+
+    def time_left(self, elapsed: float) -> float:
+        """Seconds of the call budget left `elapsed` seconds after the call started."""
+        return max(0.0, self.call_budget - elapsed)
+
+    # -------------------------------------------------------------------------
+    # Hedging
+    # -------------------------------------------------------------------------
+
+    def hedge_delay(self, model: str, hedge: Optional[bool] = None) -> Optional[float]:
+        """Seconds after which to hedge a call to `model`; None when not hedging."""
+        if not (self.hedge if hedge is None else hedge):
+            return None
+        with self._lock:
+            samples = self._latency.get(model)
+            if samples is None or len(samples) < HEDGE_MIN_SAMPLES:
+                return None
+            return max(HEDGE_MIN_DELAY, _percentile(samples, 0.95))
+
+    def _note_hedge(self, model: str, won: bool = False) -> None:
+        with self._lock:
+            self._count(model, "hedge_wins" if won else "hedges")
+
+    def run_hedged(
+        self,
+        model: str,
+        fn: Callable[[], T],
+        delay: float,
+        on_hedge: Optional[Callable[[], None]] = None,
+    ) -> T:
+        """
+        Run `fn` on a worker thread; if it is still running after `delay`
+        seconds, run it again and return the first success. If both fail,
+        the first error is raised. The losing call finishes in the
+        background and its result is dropped.
+        """
+        executor = _hedge_executor()
+        primary = executor.submit(fn)
+        if not wait([primary], timeout=delay).done:
+            self._note_hedge(model)
+            if on_hedge is not None:
+                on_hedge()
+            backup = executor.submit(fn)
+            pending, error = {primary, backup}, None
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future.exception() is None:
+                        if future is backup:
+                            self._note_hedge(model, won=True)
+                        return future.result()
+                    error = error or future.exception()
+            raise error
+        return primary.result()
+
+    async def run_hedged_async(
+        self,
+        model: str,
+        factory: Callable[[], Awaitable[T]],
+        delay: float,
+        on_hedge: Optional[Callable[[], None]] = None,
+    ) -> T:
+        """run_hedged() for coroutines; the losing request is cancelled."""
+        primary = asyncio.ensure_future(factory())
+        tasks = [primary]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done:
+                return primary.result()
+            self._note_hedge(model)
+            if on_hedge is not None:
+                on_hedge()
+            backup = asyncio.ensure_future(factory())
+            tasks.append(backup)
+            pending, error = set(tasks), None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is backup:
+                            self._note_hedge(model, won=True)
+                        return task.result()
+                    error = error or task.exception()
+            raise error
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    # -------------------------------------------------------------------------
+    # Stats
+    # -------------------------------------------------------------------------
+
+    def latency(self, model: str) -> Dict[str, float]:
+        """Rolling p50/p95/p99 of successful calls to `model`, in ms."""
+        with self._lock:
+            samples = self._latency.get(model, deque())
+            return {
+                "samples": len(samples),
+                "p50_ms": _percentile(samples, 0.50) * 1000,
+                "p95_ms": _percentile(samples, 0.95) * 1000,
+                "p99_ms": _percentile(samples, 0.99) * 1000,
+            }
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-model latency percentiles, breaker state and retry/hedge/fallback counters."""
+        with self._lock:
+            models = set(self._counts) | set(self._breakers)
+        result: Dict[str, Any] = {}
+        for model in sorted(models):
+            latency = self.latency(model)
+            with self._lock:
+                breaker = self._breaker(model)
+                result[model] = {
+                    **latency,
+                    **self._counts.get(model, {}),
+                    "breaker": breaker.state,
+                    "breaker_opened": breaker.opened,
+                    "error_share": round(breaker.error_share(), 3),
+                }
+        return {
+            "max_attempts": self.max_attempts,
+            "call_budget": self.call_budget,
+            "hedge": self.hedge,
+            "models": result,
+        }
+
+
+# =============================================================================
+# SHARED INSTANCE
+# =============================================================================
+
+_resilience_lock = threading.Lock()
+_resilience: Optional[LLMResilience] = None
+
+
+def get_resilience() -> LLMResilience:
+    """The process-wide resilience policy (created from NOVA_LLM_* env vars on first use)."""
+    global _resilience
+    resilience = _resilience
+    if resilience is not None:
+        return resilience
+    with _resilience_lock:
+        if _resilience is None:
+            try:
+                _resilience = LLMResilience(
+                    max_attempts=int(os.getenv("NOVA_LLM_RETRIES", DEFAULT_MAX_ATTEMPTS)),
+                    hedge=os.getenv("NOVA_LLM_HEDGE", "").strip().lower() in ("1", "true", "on", "yes"),
+                    breaker_cooldown=float(os.getenv("NOVA_LLM_BREAKER_COOLDOWN", BREAKER_COOLDOWN)),
+                    call_budget=float(os.getenv("NOVA_LLM_CALL_BUDGET", CALL_BUDGET)),
+                )
+            except ValueError as e:
+                logger.warning("Bad NOVA_LLM_* resilience setting (%s); using defaults", e)
+                _resilience = LLMResilience()
+        return _resilience
+
+
+def reset_resilience() -> None:
+    """Drop the shared policy; the next get_resilience() re-reads the env (for tests)."""
+    global _resilience
+    with _resilience_lock:
+        _resilience = None
+
+
+__all__ = [
+    "CircuitBreaker",
+    "CircuitOpen",
+    "LLMResilience",
+    "get_resilience",
+    "reset_resilience",
+    "TRANSIENT_STATUS",
+    "CALL_BUDGET",
+    "MIN_ATTEMPT_TIME",
+    "CLOSED",
+    "OPEN",
+    "HALF_OPEN",
+]
@@ -0,0 +1,368 @@
+# backend/llm_telemetry.py
+"""
+NovaOS v0.12 — LLM Call Telemetry
+
+The only trace of an LLM call used to be a `[LLM] channel=... command=...
+model=...` print line: no duration, no token usage, no outcome.
+
+- One LLMCallRecord per LLMClient / AsyncLLMClient call: channel,
+  command, model, outcome, prompt/completion tokens (from `usage`),
+  total latency, time-to-first-token for streams, governor queue time,
+  retries, hedging, coalescing and response-cache status
+- Records live in a bounded in-memory ring (NOVA_LLM_TELEMETRY_MAX,
+  default 1000); rollups per channel/model and per command keep running
+  totals plus latency / TTFT / queue percentiles over recent calls
+- Queried with the #llm-stats syscommand and GET /nova/llm/telemetry
+
+Process-local: each worker keeps its own ring and rollups.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+logger = logging.getLogger("nova.llm_telemetry")
+
+
+# =============================================================================
+# DEFAULTS
+# =============================================================================
+
+DEFAULT_MAX_RECORDS = 1000
+ROLLUP_SAMPLES = 512   # latency samples kept per rollup for percentiles
+
+# Outcomes (set by the clients)
+OUTCOME_OK = "ok"
+OUTCOME_ERROR = "error"
+OUTCOME_TIMEOUT = "timeout"
+OUTCOME_QUEUE_TIMEOUT = "queue_timeout"
+OUTCOME_CIRCUIT_OPEN = "circuit_open"
+OUTCOME_CANCELLED = "cancelled"   # stream closed by the consumer before the end
+
+
+# =============================================================================
+# RECORDS
+# =============================================================================
+
+@dataclass
+class LLMCallRecord:
+    """One LLM call as seen by the client (retries and hedges included)."""
+    channel: str
+    command: str
+    model: str
+    started_at: float = field(default_factory=time.time)
+    streaming: bool = False
+    outcome: str = OUTCOME_OK
+    error: Optional[str] = None
+    prompt_tokens: Optional[int] = None
+    completion_tokens: Optional[int] = None
+    latency_ms: float = 0.0
+    ttft_ms: Optional[float] = None
+    queue_ms: float = 0.0
+    retries: int = 0
+    hedged: bool = False
+    coalesced: bool = False     # answered by an identical in-flight request
+    cache: Optional[str] = None  # "hit" / "miss"; None when not cacheable
+
+    @property
+    def total_tokens(self) -> Optional[int]:
+        if self.prompt_tokens is None and self.completion_tokens is None:
+            return None
+        return (self.prompt_tokens or 0) + (self.completion_tokens or 0)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["total_tokens"] = self.total_tokens
+        return data
+
+
+class LLMCall:
+    """
+    Mutable in-progress record handed down the client's call path.
+
+    `_slot` adds queue time, `_attempt` adds token usage, the retry loop
+    counts retries; the client passes it to LLMTelemetry.finish() once.
+    Attempts of a hedged call may report from two threads at once.
+    """
+
+    def __init__(
+        self,
+        channel: str,
+        command: str,
+        model: str,
+        streaming: bool = False,
+        cache: Optional[str] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.record = LLMCallRecord(channel=channel, command=command, model=model, streaming=streaming, cache=cache)
+        self._clock = clock
+        self._started = clock()
+        self._lock = threading.Lock()
+
+    def add_queue_ms(self, queue_ms: float) -> None:
+        with self._lock:
+            self.record.queue_ms += queue_ms
+
+    def add_usage(self, usage: Any) -> None:
+        """Add a `usage` object or dict from a Chat Completions response (None is ignored)."""
+        if usage is None:
+            return
+        get = usage.get if isinstance(usage, dict) else lambda key: getattr(usage, key, None)
+        prompt, completion = get("prompt_tokens"), get("completion_tokens")
+        with self._lock:
+            if isinstance(prompt, int):
+                self.record.prompt_tokens = (self.record.prompt_tokens or 0) + prompt
+            if isinstance(completion, int):
+                self.record.completion_tokens = (self.record.completion_tokens or 0) + completion
+
+    def add_retry(self) -> None:
+        with self._lock:
+            self.record.retries += 1
+
+    def mark_hedged(self) -> None:
+        self.record.hedged = True
+
+    def mark_coalesced(self) -> None:
+        self.record.coalesced = True
+
+    def first_token(self) -> None:
+        if self.record.ttft_ms is None:
+            self.record.ttft_ms = (self._clock() - self._started) * 1000
+
+    def elapsed_ms(self) -> float:
+        return (self._clock() - self._started) * 1000
+
+
+# =============================================================================
+# ROLLUPS
+# =============================================================================
+
+def _percentiles(samples: Deque[float]) -> Dict[str, Optional[float]]:
+    ordered = sorted(samples)
+    if not ordered:
+        return {"p50": None, "p95": None, "max": None}
+    return {
+        "p50": round(ordered[len(ordered) // 2], 1),
+        "p95": round(ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))], 1),
+        "max": round(ordered[-1], 1),
+    }
+
+
+class _Rollup:
+    """Running totals for one group of calls plus percentiles over recent ones."""
+
+    def __init__(self):
+        self.calls = 0
+        self.outcomes: Dict[str, int] = {}
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.retries = 0
+        self.hedged = 0
+        self.coalesced = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.latency_ms: Deque[float] = deque(maxlen=ROLLUP_SAMPLES)
+        self.ttft_ms: Deque[float] = deque(maxlen=ROLLUP_SAMPLES)
+        self.queue_ms: Deque[float] = deque(maxlen=ROLLUP_SAMPLES)
+
+    def add(self, record: LLMCallRecord) -> None:
+        self.calls += 1
+        self.outcomes[record.outcome] = self.outcomes.get(record.outcome, 0) + 1
+        self.prompt_tokens += record.prompt_tokens or 0
+        self.completion_tokens += record.completion_tokens or 0
+        self.retries += record.retries
+        self.hedged += record.hedged
+        self.coalesced += record.coalesced
+        self.cache_hits += record.cache == "hit"
+        self.cache_misses += record.cache == "miss"
+        self.latency_ms.append(record.latency_ms)
+        if record.ttft_ms is not None:
+            self.ttft_ms.append(record.ttft_ms)
+        if record.cache != "hit" and not record.coalesced:
+            self.queue_ms.append(record.queue_ms)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "outcomes": dict(self.outcomes),
+            "error_rate": round(1 - self.outcomes.get(OUTCOME_OK, 0) / self.calls, 3) if self.calls else 0.0,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "total_tokens": self.prompt_tokens + self.completion_tokens,
+            "retries": self.retries,
+            "hedged": self.hedged,
+            "coalesced": self.coalesced,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "latency_ms": _percentiles(self.latency_ms),
+            "ttft_ms": _percentiles(self.ttft_ms),
+            "queue_ms": _percentiles(self.queue_ms),
+        }
+
+
+# =============================================================================
+# RECORDER
+# =============================================================================
+
+class LLMTelemetry:
+    """
+    Bounded ring of LLMCallRecords with rollups by "channel/model" and by
+    command.
+
+    Args:
+        max_records: Records kept in the ring; the oldest are dropped
+    """
+
+    def __init__(self, max_records: int = DEFAULT_MAX_RECORDS):
+        self.max_records = max_records
+        self._records: Deque[LLMCallRecord] = deque(maxlen=max_records)
+        self._by_model: Dict[str, _Rollup] = {}
+        self._by_command: Dict[str, _Rollup] = {}
+        self._lock = threading.Lock()
+
+    def start(
+        self,
+        channel: str,
+        command: str,
+        model: str,
+        streaming: bool = False,
+        cache: Optional[str] = None,
+    ) -> LLMCall:
+        return LLMCall(channel, command, model, streaming=streaming, cache=cache)
+
+    def finish(self, call: LLMCall, outcome: str = OUTCOME_OK, error: Optional[BaseException] = None) -> LLMCallRecord:
+        """Stamp latency and outcome on `call` and record it."""
+        record = call.record
+        record.latency_ms = round(call.elapsed_ms(), 1)
+        record.outcome = outcome
+        if error is not None:
+            record.error = f"{type(error).__name__}: {error}"[:300]
+        if record.ttft_ms is not None:
+            record.ttft_ms = round(record.ttft_ms, 1)
+        record.queue_ms = round(record.queue_ms, 1)
+        self.add(record)
+        return record
+
+    def add(self, record: LLMCallRecord) -> None:
+        with self._lock:
+            self._records.append(record)
+            self._by_model.setdefault(f"{record.channel}/{record.model}", _Rollup()).add(record)
+            self._by_command.setdefault(record.command, _Rollup()).add(record)
+        logger.debug(
+            "llm call channel=%s command=%s model=%s outcome=%s latency_ms=%.1f tokens=%s",
+            record.channel, record.command, record.model, record.outcome,
+            record.latency_ms, record.total_tokens,
+        )
+
+    def recent(
+        self,
+        limit: int = 20,
+        channel: Optional[str] = None,
+        model: Optional[str] = None,
+        command: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Newest records first, optionally filtered."""
+        with self._lock:
+            records = list(self._records)
+        out = []
+        for record in reversed(records):
+            if channel and record.channel != channel:
+                continue
+            if model and record.model != model:
+                continue
+            if command and record.command != command:
+                continue
+            out.append(record.to_dict())
+            if len(out) >= limit:
+                break
+        return out
+
+    def rollups(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {
+                "by_model": {key: r.to_dict() for key, r in sorted(self._by_model.items())},
+                "by_command": {key: r.to_dict() for key, r in sorted(self._by_command.items())},
+            }
+
+    def stats(self) -> Dict[str, Any]:
+        """Totals across every recorded call plus the rollups."""
+        rollups = self.rollups()
+        groups = list(rollups["by_model"].values())
+        calls = sum(g["calls"] for g in groups)
+        outcomes: Dict[str, int] = {}
+        for group in groups:
+            for outcome, count in group["outcomes"].items():
+                outcomes[outcome] = outcomes.get(outcome, 0) + count
+        prompt_tokens = sum(g["prompt_tokens"] for g in groups)
+        completion_tokens = sum(g["completion_tokens"] for g in groups)
+        with self._lock:
+            buffered = len(self._records)
+        return {
+            "calls": calls,
+            "outcomes": outcomes,
+            "error_rate": round(1 - outcomes.get(OUTCOME_OK, 0) / calls, 3) if calls else 0.0,
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+            "buffered": buffered,
+            "max_records": self.max_records,
+            **rollups,
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._records.clear()
+            self._by_model.clear()
+            self._by_command.clear()
+
+
+# =============================================================================
+# SHARED INSTANCE
+# =============================================================================
+
+_telemetry_lock = threading.Lock()
+_telemetry: Optional[LLMTelemetry] = None
+
+
+def get_telemetry() -> LLMTelemetry:
+    """The process-wide recorder (sized from NOVA_LLM_TELEMETRY_MAX on first use)."""
+    global _telemetry
+    telemetry = _telemetry
+    if telemetry is not None:
+        return telemetry
+    with _telemetry_lock:
+        if _telemetry is None:
+            try:
+                _telemetry = LLMTelemetry(int(os.getenv("NOVA_LLM_TELEMETRY_MAX", DEFAULT_MAX_RECORDS)))
+            except ValueError as e:
+                logger.warning("Bad NOVA_LLM_TELEMETRY_MAX (%s); using default", e)
+                _telemetry = LLMTelemetry()
+        return _telemetry
+
+
+def reset_telemetry() -> None:
+    """Drop the shared recorder (for tests)."""
+    global _telemetry
+    with _telemetry_lock:
+        _telemetry = None
+
+
+__all__ = [
+    "LLMCall",
+    "LLMCallRecord",
+    "LLMTelemetry",
+    "get_telemetry",
+    "reset_telemetry",
+    "OUTCOME_OK",
+    "OUTCOME_ERROR",
+    "OUTCOME_TIMEOUT",
+    "OUTCOME_QUEUE_TIMEOUT",
+    "OUTCOME_CIRCUIT_OPEN",
+    "OUTCOME_CANCELLED",
+]
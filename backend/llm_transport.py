@@ -0,0 +1,506 @@
+# backend/llm_transport.py
+"""
+NovaOS v0.12 — LLM Transport: Connection Pool + Concurrency Governor
+
+Every LLM call used to open its own way to the provider and block its
+thread for up to LLM_CLIENT_TIMEOUT; a burst of requests piled up
+in-flight calls until they all timed out together.
+
+- Connection pool: one tuned httpx pool (keep-alive, bounded
+  connections) shared by every sync LLMClient in the process; each
+  AsyncLLMClient owns an async pool for its event loop
+- Governor: a process-wide semaphore with a global in-flight limit and
+  per-model limits, shared by LLMClient and AsyncLLMClient. Waiters are
+  granted in arrival order (the oldest one whose model has room), from
+  threads and event loops alike; a waiter that queues longer than the
+  queue timeout gets LLMQueueTimeout instead of joining the pile-up
+- Per-model counters and queue-time p50/p95/max: stats()
+- Single-flight: concurrent callers with an identical request fingerprint
+  (double submits, several sessions composing the same quest step) share
+  one upstream call and all get its result or error; the number of
+  coalesced waiters is tracked
+
+Tuned with env vars: NOVA_LLM_MAX_IN_FLIGHT, NOVA_LLM_MODEL_LIMITS
+("gpt-5.1=6,gpt-4.1-mini=12"), NOVA_LLM_QUEUE_TIMEOUT (seconds),
+NOVA_LLM_POOL_CONNECTIONS.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, Iterator, Optional, Tuple, TypeVar
+
+from .model_router import MODEL_MINI, MODEL_THINKING
+
+try:
+    import httpx
+    _HAS_HTTPX = True
+except ImportError:
+    _HAS_HTTPX = False
+    httpx = None
+
+logger = logging.getLogger("nova.llm_transport")
+
+T = TypeVar("T")
+
+
+# =============================================================================
+# DEFAULTS
+# =============================================================================
+
+DEFAULT_MAX_IN_FLIGHT = 16
+DEFAULT_MODEL_LIMITS = {MODEL_THINKING: 6, MODEL_MINI: 12}
+DEFAULT_QUEUE_TIMEOUT = 30.0  # seconds; queue + call must stay under the worker timeout
+QUEUE_SAMPLES = 256
+
+POOL_MAX_CONNECTIONS = 32
+POOL_MAX_KEEPALIVE = 16
+POOL_KEEPALIVE_EXPIRY = 60.0  # seconds
+POOL_CONNECT_TIMEOUT = 10.0   # seconds
+
+
+class LLMQueueTimeout(TimeoutError):
+    """Raised when a call waits longer than the queue timeout for a slot."""
+    pass
+
+
+# =============================================================================
+# CONNECTION POOL
+# =============================================================================
+
+_pool_lock = threading.Lock()
+_http_client: Any = None
+
+
+def pool_limits() -> Any:
+    """httpx.Limits for LLM connection pools (None without httpx)."""
+    if not _HAS_HTTPX:
+        return None
+    return httpx.Limits(
+        max_connections=int(os.getenv("NOVA_LLM_POOL_CONNECTIONS", POOL_MAX_CONNECTIONS)),
+        max_keepalive_connections=POOL_MAX_KEEPALIVE,
+        keepalive_expiry=POOL_KEEPALIVE_EXPIRY,
+    )
+
+
+def get_http_client(timeout: float) -> Any:
+    """The process-wide pooled httpx.Client (None without httpx)."""
+    global _http_client
+    if not _HAS_HTTPX:
+        return None
+    with _pool_lock:
+        if _http_client is None:
+            _http_client = httpx.Client(
+                limits=pool_limits(),
+                timeout=httpx.Timeout(timeout, connect=POOL_CONNECT_TIMEOUT),
+            )
+        return _http_client
+
+
+def make_async_http_client(timeout: float) -> Any:
+    """A pooled httpx.AsyncClient (None without httpx); use it from one event loop."""
+    if not _HAS_HTTPX:
+        return None
+    return httpx.AsyncClient(
+        limits=pool_limits(),
+        timeout=httpx.Timeout(timeout, connect=POOL_CONNECT_TIMEOUT),
+    )
+
+
+# =============================================================================
+# GOVERNOR
+# =============================================================================
+
+class _Waiter:
+    __slots__ = ("model", "enqueued_at", "grant", "granted")
+
+    def __init__(self, model: str, enqueued_at: float, grant: Callable[[], None]):
+        self.model = model
+        self.enqueued_at = enqueued_at
+        self.grant = grant
+        self.granted = False
+
+
+class LLMConcurrencyGovernor:
+    """
+    Process-wide in-flight limits for LLM calls.
+
+    Args:
+        max_in_flight: Calls in flight across all models
+        model_limits: Per-model in-flight limits
+        default_model_limit: Limit for models not in `model_limits`
+                             (None = only the global limit applies)
+        queue_timeout: Default seconds a call may wait for a slot
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        model_limits: Optional[Dict[str, int]] = None,
+        default_model_limit: Optional[int] = None,
+        queue_timeout: float = DEFAULT_QUEUE_TIMEOUT,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_in_flight = max_in_flight
+        self.model_limits = dict(DEFAULT_MODEL_LIMITS if model_limits is None else model_limits)
+        self.default_model_limit = default_model_limit
+        self.queue_timeout = queue_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._per_model: Dict[str, int] = {}
+        self._waiters: Deque[_Waiter] = deque()
+        self._counts: Dict[str, Dict[str, int]] = {}
+        self._queue_ms: Dict[str, Deque[float]] = {}
+
+    def limit_for(self, model: str) -> int:
+        limit = self.model_limits.get(model, self.default_model_limit)
+        return self.max_in_flight if limit is None else min(limit, self.max_in_flight)
+
+    # -------------------------------------------------------------------------
+    # Sync
+    # -------------------------------------------------------------------------
+
+    def acquire(self, model: str, timeout: Optional[float] = None) -> float:
+        """Take a slot for `model`, waiting in line; returns the queue time in ms."""
+        event = threading.Event()
+        waiter = self._enqueue(model, event.set)
+        if waiter is None:
+            return 0.0
+        if not event.wait(self.queue_timeout if timeout is None else timeout):
+            if not self._abandon(waiter):
+                raise LLMQueueTimeout(f"No LLM slot for model={model} after {self._waited_s(waiter):.1f}s")
+        return self._granted(waiter)
+
+    def release(self, model: str) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            self._per_model[model] -= 1
+            self._dispatch()
+
+    @contextmanager
+    def slot(self, model: str, timeout: Optional[float] = None) -> Iterator[float]:
+        """`with governor.slot(model):` around a sync call."""
+        queue_ms = self.acquire(model, timeout)
+        try:
+            yield queue_ms
+        finally:
+            self.release(model)
+
+    # -------------------------------------------------------------------------
+    # Async
+    # -------------------------------------------------------------------------
+
+    async def acquire_async(self, model: str, timeout: Optional[float] = None) -> float:
+        """acquire() for coroutines: waits without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def resolve() -> None:
+            if not future.done():
+                future.set_result(None)
+
+        waiter = self._enqueue(model, lambda: loop.call_soon_threadsafe(resolve))
+        if waiter is None:
+            return 0.0
+        try:
+            await asyncio.wait_for(future, self.queue_timeout if timeout is None else timeout)
+        except asyncio.TimeoutError:
+            if not self._abandon(waiter):
+                raise LLMQueueTimeout(f"No LLM slot for model={model} after {self._waited_s(waiter):.1f}s") from None
+        except asyncio.CancelledError:
+            if self._abandon(waiter, timed_out=False):
+                self.release(model)
+            raise
+        return self._granted(waiter)
+
+    @asynccontextmanager
+    async def async_slot(self, model: str, timeout: Optional[float] = None) -> AsyncIterator[float]:
+        """`async with governor.async_slot(model):` around an async call."""
+        queue_ms = await self.acquire_async(model, timeout)
+        try:
+            yield queue_ms
+        finally:
+            self.release(model)
+
+    # -------------------------------------------------------------------------
+    # Queue
+    # -------------------------------------------------------------------------
+
+    def _has_room(self, model: str) -> bool:
+        return self._in_flight < self.max_in_flight and self._per_model.get(model, 0) < self.limit_for(model)
+
+    def _take(self, model: str) -> None:
+        self._in_flight += 1
+        self._per_model[model] = self._per_model.get(model, 0) + 1
+        self._counts.setdefault(model, {"acquired": 0, "queued": 0, "timeouts": 0})["acquired"] += 1
+
+    def _enqueue(self, model: str, grant: Callable[[], None]) -> Optional[_Waiter]:
+        """Take a slot now (returns None) or join the queue."""
+        with self._lock:
+            # Every waiter still queued is blocked, so taking free room skips nobody
+            if self._has_room(model):
+                self._take(model)
+                self._record(model, 0.0)
+                return None
+            waiter = _Waiter(model, self._clock(), grant)
+            self._waiters.append(waiter)
+            self._counts.setdefault(model, {"acquired": 0, "queued": 0, "timeouts": 0})["queued"] += 1
+            return waiter
+
+    def _dispatch(self) -> None:
+        # Caller holds the lock: grant the oldest waiters whose model has room
+        if not self._waiters:
+            return
+        remaining: Deque[_Waiter] = deque()
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if self._has_room(waiter.model):
+                self._take(waiter.model)
+                waiter.granted = True
+                waiter.grant()
+            else:
+                remaining.append(waiter)
+        self._waiters = remaining
+
+    def _abandon(self, waiter: _Waiter, timed_out: bool = True) -> bool:
+        """Leave the queue; True if the slot was granted meanwhile."""
+        with self._lock:
+            if waiter.granted:
+                return True
+            self._waiters.remove(waiter)
+            if timed_out:
+                self._counts[waiter.model]["timeouts"] += 1
+            return False
+
+    def _granted(self, waiter: _Waiter) -> float:
+        queue_ms = self._waited_s(waiter) * 1000
+        with self._lock:
+            self._record(waiter.model, queue_ms)
+        return queue_ms
+
+    def _waited_s(self, waiter: _Waiter) -> float:
+        return self._clock() - waiter.enqueued_at
+
+    def _record(self, model: str, queue_ms: float) -> None:
+        samples = self._queue_ms.get(model)
+        if samples is None:
+            samples = self._queue_ms[model] = deque(maxlen=QUEUE_SAMPLES)
+        samples.append(queue_ms)
+
+    def stats(self) -> Dict[str, Any]:
+        """In-flight/waiting totals plus per-model counters and queue-time percentiles."""
+        with self._lock:
+            models = {}
+            for model, counts in self._counts.items():
+                samples = sorted(self._queue_ms.get(model, ())) or [0.0]
+                models[model] = {
+                    "limit": self.limit_for(model),
+                    "in_flight": self._per_model.get(model, 0),
+                    "waiting": sum(1 for w in self._waiters if w.model == model),
+                    **counts,
+                    "p50_queue_ms": samples[len(samples) // 2],
+                    "p95_queue_ms": samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+                    "max_queue_ms": samples[-1],
+                }
+            return {
+                "max_in_flight": self.max_in_flight,
+                "in_flight": self._in_flight,
+                "waiting": len(self._waiters),
+                "models": models,
+            }
+
+
+# =============================================================================
+# SHARED GOVERNOR
+# =============================================================================
+
+_governor_lock = threading.Lock()
+_governor: Optional[LLMConcurrencyGovernor] = None
+
+
+def _parse_model_limits(spec: str) -> Dict[str, int]:
+    limits = dict(DEFAULT_MODEL_LIMITS)
+    for part in spec.split(","):
+        model, sep, value = part.partition("=")
+        if sep and model.strip():
+            limits[model.strip()] = int(value)
+    return limits
+
+
+def get_governor() -> LLMConcurrencyGovernor:
+    """The process-wide governor (created from NOVA_LLM_* env vars on first use)."""
+    global _governor
+    governor = _governor
+    if governor is not None:
+        return governor
+    with _governor_lock:
+        if _governor is None:
+            try:
+                _governor = LLMConcurrencyGovernor(
+                    max_in_flight=int(os.getenv("NOVA_LLM_MAX_IN_FLIGHT", DEFAULT_MAX_IN_FLIGHT)),
+                    model_limits=_parse_model_limits(os.getenv("NOVA_LLM_MODEL_LIMITS", "")),
+                    queue_timeout=float(os.getenv("NOVA_LLM_QUEUE_TIMEOUT", DEFAULT_QUEUE_TIMEOUT)),
+                )
+            except ValueError as e:
+                logger.warning("Bad NOVA_LLM_* governor setting (%s); using defaults", e)
+                _governor = LLMConcurrencyGovernor()
+        return _governor
+
+
+def reset_governor() -> None:
+    """Drop the shared governor; the next get_governor() re-reads the env (for tests)."""
+    global _governor
+    with _governor_lock:
+        _governor = None
+
+
+# =============================================================================
+# SINGLE-FLIGHT
+# =============================================================================
+
+class _Flight:
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class _AsyncFlight:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: "asyncio.Future[Any]"):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical calls into one.
+
+    The first caller for a key (the leader) runs the call; callers that
+    arrive while it is in flight wait for it and get the same result, or
+    the same exception. Nothing is kept once the call finishes.
+    Coroutines coalesce with other coroutines on the same event loop.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights: Dict[str, _Flight] = {}
+        self._tasks: Dict[Tuple[int, str], _AsyncFlight] = {}
+        self._stats: Dict[str, int] = {"calls": 0, "coalesced": 0, "max_waiters": 0}
+
+    def do(self, key: str, fn: Callable[[], T], on_join: Optional[Callable[[], None]] = None) -> T:
+        """Run fn() once for all concurrent callers with `key`; on_join runs for each follower."""
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+                self._stats["calls"] += 1
+            else:
+                self._join(flight)
+        if not leader:
+            if on_join is not None:
+                on_join()
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = fn()
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+    async def do_async(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[T]],
+        on_join: Optional[Callable[[], None]] = None,
+    ) -> T:
+        """
+        do() for coroutines. The shared call runs as its own task, so a
+        caller that is cancelled does not cancel it for the others.
+        """
+        loop_key = (id(asyncio.get_running_loop()), key)
+        with self._lock:
+            flight = self._tasks.get(loop_key)
+            joined = flight is not None
+            if joined:
+                self._join(flight)
+            else:
+                flight = self._tasks[loop_key] = _AsyncFlight(asyncio.ensure_future(fn()))
+                flight.task.add_done_callback(lambda task: self._finish_task(loop_key, task))
+                self._stats["calls"] += 1
+        if joined and on_join is not None:
+            on_join()
+        return await asyncio.shield(flight.task)
+
+    def _join(self, flight: Any) -> None:
+        # Caller holds the lock
+        flight.waiters += 1
+        self._stats["coalesced"] += 1
+        self._stats["max_waiters"] = max(self._stats["max_waiters"], flight.waiters)
+
+    def _finish_task(self, loop_key: Tuple[int, str], task: "asyncio.Future[Any]") -> None:
+        with self._lock:
+            self._tasks.pop(loop_key, None)
+        if not task.cancelled():
+            task.exception()  # retrieved: every caller may have been cancelled
+
+    def stats(self) -> Dict[str, Any]:
+        """calls (upstream), coalesced (callers that shared one), max_waiters, in_flight."""
+        with self._lock:
+            return {"in_flight": len(self._flights) + len(self._tasks), **self._stats}
+
+
+def request_fingerprint(model: str, system_prompt: str, messages: Any, params: Dict[str, Any]) -> str:
+    """Identity of one upstream request: model, prompts and every request param."""
+    blob = json.dumps(
+        {"model": model, "system": system_prompt, "messages": messages, "params": params},
+        sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str,
+    )
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+_single_flight = SingleFlight()
+
+
+def get_single_flight() -> SingleFlight:
+    """The process-wide SingleFlight shared by LLMClient and AsyncLLMClient."""
+    return _single_flight
+
+
+__all__ = [
+    "LLMConcurrencyGovernor",
+    "SingleFlight",
+    "get_single_flight",
+    "request_fingerprint",
+    "LLMQueueTimeout",
+    "get_governor",
+    "reset_governor",
+    "get_http_client",
+    "make_async_http_client",
+    "pool_limits",
+    "DEFAULT_MAX_IN_FLIGHT",
+    "DEFAULT_MODEL_LIMITS",
+    "DEFAULT_QUEUE_TIMEOUT",
+]
@@ -8,11 +8,12 @@ This module provides the dual-mode architecture:
 """
 
 from .nova_state import NovaState
-from .mode_router import handle_user_message, get_or_create_state, get_state, clear_state
+from .mode_router import handle_user_message, stream_user_message, get_or_create_state, get_state, clear_state
 
 __all__ = [
     "NovaState",
     "handle_user_message",
+    "stream_user_message",
     "get_or_create_state",
     "get_state",
     "clear_state",
@@ -38,34 +38,30 @@ This file is the ONLY place that decides which mode handles input.
 from __future__ import annotations
 
 import re
-from typing import TYPE_CHECKING, Any, Dict, Optional
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, Optional, Tuple
 
 from .nova_state import NovaState
+from kernel.utils.session_state_store import SessionStateStore
 
 # Working Memory imports (shared between modes)
+# v0.12: WM update/context and LTM/extraction run in the kernel's ContextAssembler
 from kernel.nova_wm import (
-    wm_update,
     wm_record_response,
-    wm_get_context_string,
-    wm_answer_reference,
     get_wm,
 )
+from kernel.nova_kernel import WM_RECORD_WAIT
 
 # v0.11.0: Memory Helpers (ChatGPT-style memory features)
 try:
-    from kernel.memory_helpers import (
-        handle_remember_intent,
-        build_ltm_context_for_persona,
-        run_auto_extraction,
-    )
+    from kernel.memory_helpers import handle_remember_intent
     _HAS_MEMORY_HELPERS = True
 except ImportError:
     _HAS_MEMORY_HELPERS = False
     def handle_remember_intent(*args, **kwargs): return None
-    def build_ltm_context_for_persona(*args, **kwargs): return ""
-    def run_auto_extraction(*args, **kwargs): return {}
 
 if TYPE_CHECKING:
+    from kernel.context_assembly import AssembledContext
     from kernel.nova_kernel import NovaKernel
     from persona.nova_persona import NovaPersona
 
@@ -365,8 +361,82 @@ def _handle_persona_mode(
     
     v0.11.0: Added memory features (remember this, auto-extraction, LTM injection)
     v0.11.0-fix5: Added #session-end support in persona mode
+    v0.12: stream_user_message() is the streaming variant.
+    """
+    result = _persona_preflight(message, state, kernel, persona)
+    if result is not None:
+        return result
+    
+    assembled, prompt_context = _assemble_persona_turn(message, state, kernel)
+    
+    # Persona chat (normal conversational fallback)
+    response_text = persona.generate_response(
+        text=message,
+        session_id=state.session_id,
+        **prompt_context,
+    )
+    
+    return _finish_persona_turn(state, assembled, response_text)
+
+
+def stream_user_message(
+    message: str,
+    state: NovaState,
+    kernel: "NovaKernel",
+    persona: "NovaPersona",
+) -> Iterator[Tuple[str, Dict[str, Any]]]:
     """
+    Streaming variant of handle_user_message() (v0.12).
     
+    Persona chat turns yield ("token", {"text": chunk}) as the reply is
+    generated (tone + policy rewriting applied over a sliding window),
+    then ("complete", result) with the same result handle_user_message()
+    returns plus meta.ttft_ms / meta.total_ms. Every other input is
+    handled as before and yields only "complete".
+    """
+    if state.novaos_enabled:
+        yield "complete", _handle_novaos_mode_strict(message, state, kernel, persona)
+        return
+    
+    result = _persona_preflight(message, state, kernel, persona)
+    if result is not None:
+        yield "complete", result
+        return
+    
+    started = time.perf_counter()
+    assembled, prompt_context = _assemble_persona_turn(message, state, kernel)
+    
+    ttft_ms = None
+    parts = []
+    for chunk in persona.stream_response(
+        text=message,
+        session_id=state.session_id,
+        post_process=_persona_post_process(state, kernel),
+        **prompt_context,
+    ):
+        if ttft_ms is None:
+            ttft_ms = round((time.perf_counter() - started) * 1000, 1)
+        parts.append(chunk)
+        yield "token", {"text": chunk}
+    
+    result = _finish_persona_turn(state, assembled, "".join(parts))
+    total_ms = round((time.perf_counter() - started) * 1000, 1)
+    result["meta"] = {
+        "ttft_ms": ttft_ms,
+        "total_ms": total_ms,
+        "context_ms": assembled.latency_ms,
+    }
+    print(f"[ModeRouter] Persona stream ttft={ttft_ms}ms total={total_ms}ms", flush=True)
+    yield "complete", result
+
+
+def _persona_preflight(
+    message: str,
+    state: NovaState,
+    kernel: "NovaKernel",
+    persona: "NovaPersona",
+) -> Optional[Dict[str, Any]]:
+    """Persona-mode inputs answered without a chat turn (#shutdown, #session-end, "remember this")."""
     # v0.11.1: Check for #shutdown command (returns to strict mode)
     if _is_shutdown_command(message):
         return _activate_novaos(state, kernel, persona)
@@ -397,57 +467,65 @@ def _handle_persona_mode(
         except Exception as e:
             print(f"[ModeRouter] remember_intent error: {e}", flush=True)
     
+    return None
+
+
+def _assemble_persona_turn(
+    message: str,
+    state: NovaState,
+    kernel: "NovaKernel",
+) -> Tuple["AssembledContext", Dict[str, Any]]:
+    """Gather WM/LTM context; returns (assembled, persona prompt kwargs)."""
     # ─────────────────────────────────────────────────────────────────────
-    # v0.11.0: AUTO-EXTRACTION (profile, procedural, episodic)
-    # v0.11.0-fix1: Removed session_id param (not accepted by function)
+    # v0.12: CONTEXT ASSEMBLY (auto-extraction, WM, LTM run concurrently
+    # on the kernel's pool, each bounded by its own deadline)
     # ─────────────────────────────────────────────────────────────────────
-    if _HAS_MEMORY_HELPERS:
-        try:
-            run_auto_extraction(
-                user_text=message,
-                memory_manager=kernel.memory_manager,
-            )
-        except Exception as e:
-            print(f"[ModeRouter] auto_extraction error: {e}", flush=True)
-    
-    # Working Memory updates
-    direct_answer = wm_answer_reference(state.session_id, message)
-    wm_update(state.session_id, message)
-    wm_context_string = wm_get_context_string(state.session_id)
+    assembled = kernel.assemble_persona_context(state.session_id, message)
+    wm_ctx = assembled.get("wm") or {}
+    ltm_context_string = assembled.get("ltm") or ""
     
-    # ─────────────────────────────────────────────────────────────────────
-    # v0.11.0: BUILD LTM CONTEXT (profile + relevant semantic memories)
-    # v0.11.0-fix1: Fixed parameter name (module_tag, not current_module)
-    # v0.11.0-fix6: Added logging to verify LTM injection
-    # ─────────────────────────────────────────────────────────────────────
-    ltm_context_string = ""
+    # v0.11.0-fix6: Log LTM injection for debugging
     if _HAS_MEMORY_HELPERS:
+        if ltm_context_string:
+            # Count memories injected (rough count by looking for markers)
+            mem_count = ltm_context_string.count("•") or ltm_context_string.count("-")
+            print(f"[ModeRouter] LTM injected: {len(ltm_context_string)} chars, ~{mem_count} memories", flush=True)
+        elif assembled.status.get("ltm") == "ok":
+            print("[ModeRouter] LTM context empty (no memories retrieved)", flush=True)
+        else:
+            print(f"[ModeRouter] LTM context {assembled.status.get('ltm')}; continuing without it", flush=True)
+    
+    return assembled, {
+        "wm_context_string": wm_ctx.get("wm_context", ""),
+        "ltm_context_string": ltm_context_string,  # v0.11.0: LTM injection
+        "direct_answer": wm_ctx.get("direct_answer"),
+    }
+
+
+def _persona_post_process(state: NovaState, kernel: "NovaKernel") -> Optional[Callable[[str], str]]:
+    """PolicyEngine.post_llm bound to this turn, or None without a policy engine."""
+    policy_engine = getattr(kernel, "policy_engine", None)
+    if policy_engine is None:
+        return None
+    policy_meta = {"session_id": state.session_id, "source": "persona_mode"}
+    
+    def post_process(text: str) -> str:
         try:
-            ltm_context_string = build_ltm_context_for_persona(
-                memory_manager=kernel.memory_manager,
-                module_tag=None,      # FIXED: correct parameter name
-                user_text=message,    # Now accepted by patched function
-            )
-            # v0.11.0-fix6: Log LTM injection for debugging
-            if ltm_context_string:
-                # Count memories injected (rough count by looking for markers)
-                mem_count = ltm_context_string.count("•") or ltm_context_string.count("-")
-                print(f"[ModeRouter] LTM injected: {len(ltm_context_string)} chars, ~{mem_count} memories", flush=True)
-            else:
-                print("[ModeRouter] LTM context empty (no memories retrieved)", flush=True)
+            return policy_engine.post_llm(text, policy_meta)
         except Exception as e:
-            print(f"[ModeRouter] LTM context build error: {e}", flush=True)
-    
-    # Persona chat (normal conversational fallback)
-    response_text = persona.generate_response(
-        text=message,
-        session_id=state.session_id,
-        wm_context_string=wm_context_string,
-        ltm_context_string=ltm_context_string,  # v0.11.0: LTM injection
-        direct_answer=direct_answer,
-    )
+            print(f"[ModeRouter] policy.post_llm error (persona): {e}", flush=True)
+            return text
     
-    if response_text:
+    return post_process
+
+
+def _finish_persona_turn(
+    state: NovaState,
+    assembled: "AssembledContext",
+    response_text: str,
+) -> Dict[str, Any]:
+    """Record the reply in WM and build the persona result."""
+    if response_text and assembled.wait("wm", timeout=WM_RECORD_WAIT):
         wm_record_response(state.session_id, response_text)
     
     return {
@@ -711,14 +789,15 @@ def _handle_session_end_in_persona_mode(
 # STATE MANAGEMENT HELPERS
 # ─────────────────────────────────────────────────────────────────────────────
 
-_session_states: Dict[str, NovaState] = {}
+# Mode state outlives the wizards: a week idle before it resets to strict mode
+_session_states: SessionStateStore[NovaState] = SessionStateStore(
+    "nova_state", dump=NovaState.to_dict, load=NovaState.from_dict, ttl=7 * 24 * 3600.0,
+)
 
 
 def get_or_create_state(session_id: str) -> NovaState:
     """Get existing state for session or create a new one."""
-    if session_id not in _session_states:
-        _session_states[session_id] = NovaState(session_id=session_id)
-    return _session_states[session_id]
+    return _session_states.get_or_create(session_id, lambda: NovaState(session_id=session_id))
 
 
 def get_state(session_id: str) -> Optional[NovaState]:
@@ -728,4 +807,4 @@ def get_state(session_id: str) -> Optional[NovaState]:
 
 def clear_state(session_id: str) -> None:
     """Clear state for a session."""
-    _session_states.pop(session_id, None)
+    _session_states.delete(session_id)
@@ -0,0 +1,232 @@
+# kernel/context_assembly.py
+"""
+NovaOS v0.12 — Persona Context Assembly
+
+A persona turn gathers several context pieces before the LLM call (auto
+extraction, working-memory update + context string, LTM context). They
+used to run one after another on the request thread. ContextAssembler
+runs them concurrently, each on its own worker thread for the turn:
+
+- Each provider has its own deadline, measured from the start of the
+  stage; a provider that misses it (or raises) contributes its default
+  and the prompt is built without that section
+- `after` declares ordering between providers (LTM context waits for
+  auto-extraction so facts stored this turn are searchable). A dependent
+  provider is started when its dependencies finish, not parked on a
+  worker; if they finish after its deadline it is skipped
+- `serial` names a key whose providers run one at a time across turns
+  (the kernel keys the WM provider by session, so a late wm_update from
+  the previous turn finishes before the next one starts)
+- Late providers keep running in the background; wait() lets the caller
+  block on one before touching its state again (the kernel waits for the
+  WM provider before recording the reply)
+- Per-provider latency (p50/p95/max) and timeout/error counts: stats()
+
+Turns never queue behind each other's providers: there is no shared
+pool whose size would turn concurrent requests into deadline misses.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import CancelledError, Future, TimeoutError as FutureTimeout
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger("nova.context")
+
+
+# =============================================================================
+# DEFAULTS
+# =============================================================================
+
+DEFAULT_DEADLINE_MS = 1500.0
+LATENCY_SAMPLES = 256
+
+
+@dataclass
+class ContextProvider:
+    """One context source for a persona turn."""
+    name: str
+    fn: Callable[[], Any]
+    default: Any = None
+    deadline_ms: float = DEFAULT_DEADLINE_MS
+    after: Tuple[str, ...] = ()
+    serial: Optional[str] = None
+
+
+@dataclass
+class AssembledContext:
+    """Provider results for one turn (defaults where a provider missed its deadline)."""
+    values: Dict[str, Any] = field(default_factory=dict)
+    latency_ms: Dict[str, float] = field(default_factory=dict)
+    status: Dict[str, str] = field(default_factory=dict)  # ok | timeout | error
+    _futures: Dict[str, Future] = field(default_factory=dict, repr=False)
+
+    def get(self, name: str, default: Any = None) -> Any:
+        return self.values.get(name, default)
+
+    def wait(self, name: str, timeout: Optional[float] = None) -> bool:
+        """Block until provider `name` has finished or was skipped (even if it was late)."""
+        future = self._futures.get(name)
+        if future is None:
+            return True
+        try:
+            future.exception(timeout=timeout)
+            return True
+        except CancelledError:
+            return True
+        except FutureTimeout:
+            return False
+
+
+# =============================================================================
+# ASSEMBLER
+# =============================================================================
+
+class ContextAssembler:
+    """
+    Runs ContextProviders concurrently with per-provider deadlines.
+
+    Every provider of a turn gets its own short-lived daemon thread, so
+    concurrent turns cannot starve each other of workers.
+    """
+
+    def __init__(self):
+        self._stats_lock = threading.Lock()
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._counts: Dict[str, Dict[str, int]] = {}
+        self._serial_lock = threading.Lock()
+        self._serial: Dict[str, Future] = {}  # key -> latest provider future
+
+    def run(self, providers: List[ContextProvider]) -> AssembledContext:
+        """Start every provider (dependents once their dependencies finish), then collect each by its deadline."""
+        started = time.perf_counter()
+        result = AssembledContext()
+        finished: Dict[str, float] = {}
+
+        def launch(provider: ContextProvider, future: Future) -> None:
+            if provider.deadline_ms / 1000.0 <= time.perf_counter() - started:
+                future.cancel()  # dependencies finished too late; the collector has given up on it
+                return
+            if not future.set_running_or_notify_cancel():
+                return
+
+            def work() -> None:
+                try:
+                    value = provider.fn()
+                except BaseException as e:
+                    future.set_exception(e)
+                    return
+                finished[provider.name] = time.perf_counter()
+                future.set_result(value)
+
+            threading.Thread(target=work, name=f"nova-context-{provider.name}", daemon=True).start()
+
+        for provider in providers:
+            future: Future = Future()
+            deps = [result._futures[name] for name in provider.after if name in result._futures]
+            if provider.serial is not None:
+                deps.extend(self._claim_serial(provider.serial, future))
+            result._futures[provider.name] = future
+            self._when_done(deps, lambda provider=provider, future=future: launch(provider, future))
+
+        for provider in providers:
+            future = result._futures[provider.name]
+            remaining = provider.deadline_ms / 1000.0 - (time.perf_counter() - started)
+            try:
+                result.values[provider.name] = future.result(timeout=max(0.0, remaining))
+                result.status[provider.name] = "ok"
+                end = finished.get(provider.name, time.perf_counter())
+            except (FutureTimeout, CancelledError):
+                result.values[provider.name] = provider.default
+                result.status[provider.name] = "timeout"
+                end = time.perf_counter()
+                logger.warning(
+                    "Context provider %s missed its %.0f ms deadline; continuing without it",
+                    provider.name, provider.deadline_ms,
+                )
+            except Exception as e:
+                result.values[provider.name] = provider.default
+                result.status[provider.name] = "error"
+                end = finished.get(provider.name, time.perf_counter())
+                logger.warning("Context provider %s failed: %s", provider.name, e)
+            result.latency_ms[provider.name] = round((end - started) * 1000, 2)
+
+        self._record(result)
+        return result
+
+    @staticmethod
+    def _when_done(deps: List[Future], start: Callable[[], None]) -> None:
+        """Call `start` once every future in `deps` is done (right away if none)."""
+        if not deps:
+            start()
+            return
+        pending = [len(deps)]
+        lock = threading.Lock()
+
+        def on_done(_: Future) -> None:
+            with lock:
+                pending[0] -= 1
+                ready = pending[0] == 0
+            if ready:
+                start()
+
+        for dep in deps:
+            dep.add_done_callback(on_done)
+
+    def _claim_serial(self, key: str, future: Future) -> List[Future]:
+        """Make `future` the latest for `key`; returns the previous one to wait for."""
+        with self._serial_lock:
+            previous = self._serial.get(key)
+            self._serial[key] = future
+
+        def release(done: Future) -> None:
+            with self._serial_lock:
+                if self._serial.get(key) is done:
+                    del self._serial[key]
+
+        future.add_done_callback(release)
+        return [previous] if previous is not None else []
+
+    def record(self, name: str, latency_ms: float, status: str = "ok") -> None:
+        """Record a step that ran outside the assembler (e.g. on the request thread)."""
+        result = AssembledContext(latency_ms={name: latency_ms}, status={name: status})
+        self._record(result)
+
+    def _record(self, result: AssembledContext) -> None:
+        with self._stats_lock:
+            for name, latency in result.latency_ms.items():
+                self._latencies.setdefault(name, deque(maxlen=LATENCY_SAMPLES)).append(latency)
+                counts = self._counts.setdefault(name, {"calls": 0, "timeouts": 0, "errors": 0})
+                counts["calls"] += 1
+                status = result.status.get(name)
+                if status == "timeout":
+                    counts["timeouts"] += 1
+                elif status == "error":
+                    counts["errors"] += 1
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """{provider: calls, timeouts, errors, p50_ms, p95_ms, max_ms}."""
+        with self._stats_lock:
+            snapshot = {name: (sorted(lat), dict(self._counts[name])) for name, lat in self._latencies.items()}
+        stats: Dict[str, Dict[str, Any]] = {}
+        for name, (latencies, counts) in snapshot.items():
+            stats[name] = {
+                **counts,
+                "p50_ms": latencies[len(latencies) // 2],
+                "p95_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+                "max_ms": latencies[-1],
+            }
+        return stats
+
+
+__all__ = [
+    "ContextProvider",
+    "AssembledContext",
+    "ContextAssembler",
+    "DEFAULT_DEADLINE_MS",
+]
@@ -4,10 +4,15 @@ from system.config import Config
 from pathlib import Path
 import json
 
+from kernel.utils.session_state_store import SessionStateStore
+
 class ContextManager:
     def __init__(self, config: Config):
         self.config = config
-        self._sessions: Dict[str, Dict[str, Any]] = {}  # Stores session data
+        # Stores session data (shared across API workers)
+        self._sessions: SessionStateStore[Dict[str, Any]] = SessionStateStore(
+            "kernel_context", dump=lambda ctx: ctx, load=lambda data: data,
+        )
 
         # Path to the modules file
         self.modules_file = Path(self.config.data_dir) / "modules.json"
@@ -27,14 +32,11 @@ class ContextManager:
 
     def get_context(self, session_id: str) -> Dict[str, Any]:
         # Get or create the session context
-        if session_id not in self._sessions:
-            self._sessions[session_id] = {"booted": False, "memory": {}}
-        else:
-            return self._sessions[session_id]
+        return self._sessions.get_or_create(session_id, lambda: {"booted": False, "memory": {}})
 
     def reset_session(self, session_id: str) -> None:
         print(f"[CTX] reset_session({session_id})")
-        self._sessions[session_id] = {"booted": False, "memory": {}}
+        self._sessions.set(session_id, {"booted": False, "memory": {}})
 
     def mark_booted(self, session_id: str) -> None:
         # Mark the session as "booted"
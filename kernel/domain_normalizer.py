@@ -333,6 +333,8 @@ Return JSON with topics array. Remember: extract TOP-LEVEL topics only, put deta
             system=system_prompt.format(max_topics=max_topics),
             user=user_prompt,
             command="domain-extract-topics",
+            cache=True,
+            cache_validator=lambda text: "topics" in (_parse_json_response(text) or {}),
         )
         
         response_text = result.get("text", "").strip()
@@ -446,6 +448,8 @@ Create 4-6 coherent subdomains that cover all these subtopics:"""
             system=system_prompt,
             user=user_prompt,
             command="domain-generate-subdomains",
+            cache=True,
+            cache_validator=lambda text: "subdomains" in (_parse_json_response(text) or {}),
         )
         
         response_text = result.get("text", "").strip()
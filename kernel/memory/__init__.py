@@ -8,10 +8,16 @@ Contains:
 - memory_helpers: ChatGPT-style memory features (auto-extraction, search)
 - memory_syscommands: Memory management command handlers
 - nova_wm: Working Memory engine
+- nova_wm_scanner: Pre-compiled, keyword-pre-filtered pattern scanner for nova_wm
 - nova_wm_behavior: Behavior layer for conversational continuity
 - nova_wm_episodic: Episodic memory bridge (WM ↔ LTM)
 - memory_lifecycle: Decay, drift, and re-confirmation
 - memory_policy: Policy layer for memory operations
+- memory_sqlite: SQLite storage backend (Config.memory_backend = "sqlite")
+- trace_store: Side store for heavy trace fields (WM snapshots, embeddings)
+- session_registry: Bounded per-session state for WM/behavior/episodic (LRU, TTL, spill)
+- extraction_pipeline: Background LLM fact extraction (bounded, per-session ordered)
+- ltm_context_cache: Rendered LTM persona blocks cached against the store version
 
 All symbols are re-exported for backward compatibility.
 """
@@ -27,6 +33,20 @@ from .memory_engine import (
     MemoryIndex,
     LongTermMemory,
 )
+from .trace_store import TraceStore
+from .session_registry import SessionRegistry, configure_session_registries, session_stats
+from .extraction_pipeline import FactExtractionPipeline, get_extraction_pipeline, extraction_stats
+from .ltm_context_cache import LTMContextCache
+
+# SQLite backend - safe import
+try:
+    from .memory_sqlite import (
+        SQLiteLongTermMemory,
+        SQLiteMemoryIndex,
+        migrate_json_store,
+    )
+except ImportError:
+    pass
 
 # Manager facade - always available
 from .memory_manager import MemoryManager
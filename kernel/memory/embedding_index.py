@@ -0,0 +1,358 @@
+# kernel/memory/embedding_index.py
+"""
+v0.12 — Persistent Embedding Index for semantic memory search
+
+Replaces per-query re-encoding + pure-Python cosine loops with:
+- a float32 matrix of L2-normalized vectors (one row per memory)
+- parallel id / type arrays (the id map)
+- top-k from a single matrix-vector product, with filters applied as
+  boolean masks before selection
+
+Persisted next to the memory files, one generation <n> per save:
+- data/memory/embeddings.<n>.npy      (float32, rows x dim, memory-mapped on load)
+- data/memory/embedding_ids.<n>.npy   (int64 memory ids, row-aligned)
+- data/memory/embedding_types.<n>.npy (int8 memory type codes, row-aligned)
+- data/memory/embedding_index.json    (manifest: current generation and row count)
+
+A save writes the new generation's arrays, then commits them by renaming
+the manifest over the old one, so a crash mid-save leaves the previous
+generation intact. Arrays that disagree with each other or with the
+manifest are ignored on load, and the engine's backfill re-embeds every
+memory.
+
+Requires numpy (installed with sentence-transformers). When numpy is
+missing, EMBEDDING_INDEX_AVAILABLE is False and callers fall back to the
+old per-candidate scoring.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+logger = logging.getLogger("nova.memory.embeddings")
+
+try:
+    import numpy as np
+    EMBEDDING_INDEX_AVAILABLE = True
+except ImportError:  # pragma: no cover - numpy ships with sentence-transformers
+    np = None
+    EMBEDDING_INDEX_AVAILABLE = False
+
+
+# all-MiniLM-L6-v2 output size
+DEFAULT_DIM = 384
+
+TYPE_CODES: Dict[str, int] = {"semantic": 0, "procedural": 1, "episodic": 2}
+
+# Array files of one generation: vectors, ids, types
+_ARRAY_STEMS = ("embeddings", "embedding_ids", "embedding_types")
+
+
+class EmbeddingIndex:
+    """
+    Vectorized store of normalized memory embeddings.
+
+    Rows are appended on add(); remove() tombstones a row (id set to -1)
+    and save() drops tombstones. Thread-safe; save() is explicit so the
+    engine can batch it with its other deferred writes. Saves are
+    serialized and commit with a single manifest rename.
+    """
+
+    def __init__(self, memory_dir: Path, dim: int = DEFAULT_DIM):
+        if not EMBEDDING_INDEX_AVAILABLE:
+            raise RuntimeError("numpy is required for EmbeddingIndex")
+
+        self.memory_dir = Path(memory_dir)
+        self.dim = dim
+        self.manifest_file = self.memory_dir / "embedding_index.json"
+
+        self._lock = threading.RLock()
+        self._save_lock = threading.Lock()   # held for a whole save(), file writes included
+        self._generation = 0                 # generation on disk (0: none, or pre-manifest files)
+        self._vectors = np.zeros((0, dim), dtype=np.float32)
+        self._ids = np.zeros(0, dtype=np.int64)
+        self._types = np.zeros(0, dtype=np.int8)
+        self._count = 0                       # rows in use (live + tombstoned)
+        self._row_of: Dict[int, int] = {}     # memory id -> row
+        self._mapped = False                  # rows still backed by the on-disk memmap
+        self._dirty = False
+
+        self._load()
+
+    # ---------- Persistence ----------
+
+    def generation_files(self, generation: int) -> Tuple[Path, Path, Path]:
+        """Vector, id and type files of a saved generation (0: pre-manifest names)."""
+        suffix = f".{generation}" if generation else ""
+        vectors, ids, types = (self.memory_dir / f"{stem}{suffix}.npy" for stem in _ARRAY_STEMS)
+        return vectors, ids, types
+
+    def _load(self) -> None:
+        generation, rows = 0, None
+        if self.manifest_file.exists():
+            try:
+                manifest = json.loads(self.manifest_file.read_text(encoding="utf-8"))
+                generation, rows = int(manifest["generation"]), int(manifest["rows"])
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                logger.warning("Unreadable embedding index manifest (%s); rebuilding the index", e)
+                return
+        vectors_file, ids_file, types_file = self.generation_files(generation)
+        if not (vectors_file.exists() and ids_file.exists() and types_file.exists()):
+            if generation:
+                logger.warning("Embedding index generation %d is missing; rebuilding the index", generation)
+            return
+        try:
+            vectors = np.load(vectors_file, mmap_mode="r")
+            ids = np.load(ids_file)
+            types = np.load(types_file)
+        except Exception as e:
+            logger.warning("Failed to load embedding index (%s); rebuilding the index", e)
+            return
+        if (
+            vectors.ndim != 2 or vectors.shape[1] != self.dim
+            or len(ids) != len(vectors) or len(types) != len(ids)
+            or (rows is not None and len(ids) != rows)
+        ):
+            # Left empty: the engine's backfill re-embeds every memory
+            logger.warning("Embedding index files are inconsistent; rebuilding the index")
+            return
+
+        self._vectors = vectors
+        self._ids = ids.astype(np.int64, copy=False)
+        self._types = types.astype(np.int8, copy=False)
+        self._count = len(ids)
+        self._row_of = {int(item_id): row for row, item_id in enumerate(self._ids) if item_id >= 0}
+        self._mapped = True
+        self._generation = generation
+
+    def save(self) -> bool:
+        """Write the index to disk (dropping tombstones). Returns True if written."""
+        with self._save_lock:
+            with self._lock:
+                if not self._dirty:
+                    return False
+                live = self._ids[: self._count] >= 0
+                vectors = np.ascontiguousarray(self._vectors[: self._count][live])
+                ids = self._ids[: self._count][live].copy()
+                types = self._types[: self._count][live].copy()
+
+                # Compact in place so row numbers match what is on disk
+                self._vectors = vectors
+                self._ids = ids
+                self._types = types
+                self._count = len(ids)
+                self._row_of = {int(item_id): row for row, item_id in enumerate(ids)}
+                self._mapped = False
+                self._dirty = False
+
+            try:
+                self._write_generation(vectors, ids, types)
+            except Exception:
+                with self._lock:
+                    self._dirty = True  # retried on the next save
+                raise
+        return True
+
+    def _write_generation(self, vectors, ids, types) -> None:
+        """Write a new generation and commit it with one manifest rename (under _save_lock)."""
+        self.memory_dir.mkdir(parents=True, exist_ok=True)
+        generation = self._generation + 1
+        for path, array in zip(self.generation_files(generation), (vectors, ids, types)):
+            with open(path, "wb") as f:
+                np.save(f, array)
+                f.flush()
+                os.fsync(f.fileno())
+
+        tmp_manifest = self.manifest_file.with_name(self.manifest_file.name + ".tmp")
+        tmp_manifest.write_text(
+            json.dumps({"generation": generation, "rows": len(ids), "dim": self.dim}),
+            encoding="utf-8",
+        )
+        os.replace(tmp_manifest, self.manifest_file)
+        self._generation = generation
+
+        # Other generations (and pre-manifest files) are garbage now
+        current = set(self.generation_files(generation))
+        for stem in _ARRAY_STEMS:
+            for path in self.memory_dir.glob(f"{stem}*.npy"):
+                if path in current or path.name.split(".")[0] != stem:
+                    continue
+                try:
+                    path.unlink()
+                except OSError:
+                    pass  # still mapped (Windows); removed by a later save
+
+    @property
+    def dirty(self) -> bool:
+        return self._dirty
+
+    # ---------- Mutation ----------
+
+    def _ensure_capacity(self, extra: int) -> None:
+        """Grow backing arrays (copying out of the memmap on first write)."""
+        needed = self._count + extra
+        capacity = len(self._vectors)
+        if needed <= capacity and not self._mapped:
+            return
+        new_capacity = max(needed, capacity * 2 if needed > capacity else capacity, 64)
+
+        vectors = np.zeros((new_capacity, self.dim), dtype=np.float32)
+        vectors[: self._count] = self._vectors[: self._count]
+        ids = np.full(new_capacity, -1, dtype=np.int64)
+        ids[: self._count] = self._ids[: self._count]
+        types = np.zeros(new_capacity, dtype=np.int8)
+        types[: self._count] = self._types[: self._count]
+
+        self._vectors, self._ids, self._types = vectors, ids, types
+        self._mapped = False
+
+    def add_many(self, entries: Iterable[Tuple[int, str, Sequence[float]]]) -> int:
+        """
+        Add or replace vectors.
+
+        Args:
+            entries: (memory_id, memory_type, vector) tuples
+
+        Returns:
+            Count of vectors written
+        """
+        entries = [(int(i), t, v) for i, t, v in entries if v is not None]
+        if not entries:
+            return 0
+
+        matrix = np.asarray([v for _, _, v in entries], dtype=np.float32)
+        if matrix.ndim != 2 or matrix.shape[1] != self.dim:
+            raise ValueError(f"Expected vectors of size {self.dim}, got shape {matrix.shape}")
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        matrix /= norms
+
+        with self._lock:
+            self._ensure_capacity(len(entries))
+            for (item_id, mem_type, _), vector in zip(entries, matrix):
+                row = self._row_of.get(item_id)
+                if row is None:
+                    row = self._count
+                    self._count += 1
+                    self._row_of[item_id] = row
+                self._vectors[row] = vector
+                self._ids[row] = item_id
+                self._types[row] = TYPE_CODES.get(mem_type, 0)
+            self._dirty = True
+        return len(entries)
+
+    def add(self, item_id: int, mem_type: str, vector: Sequence[float]) -> None:
+        self.add_many([(item_id, mem_type, vector)])
+
+    def remove(self, item_ids: Iterable[int]) -> int:
+        """Tombstone rows for deleted memories. Returns count removed."""
+        removed = 0
+        with self._lock:
+            for item_id in item_ids:
+                row = self._row_of.pop(int(item_id), None)
+                if row is None:
+                    continue
+                if self._mapped:
+                    self._ensure_capacity(0)
+                self._ids[row] = -1
+                removed += 1
+            if removed:
+                self._dirty = True
+        return removed
+
+    def clear(self) -> None:
+        with self._lock:
+            self._vectors = np.zeros((0, self.dim), dtype=np.float32)
+            self._ids = np.zeros(0, dtype=np.int64)
+            self._types = np.zeros(0, dtype=np.int8)
+            self._count = 0
+            self._row_of = {}
+            self._mapped = False
+            self._dirty = True
+
+    # ---------- Queries ----------
+
+    def __contains__(self, item_id: int) -> bool:
+        return int(item_id) in self._row_of
+
+    def __len__(self) -> int:
+        return len(self._row_of)
+
+    def indexed_ids(self) -> Set[int]:
+        with self._lock:
+            return set(self._row_of)
+
+    def search(
+        self,
+        query: Sequence[float],
+        k: int = 10,
+        mem_type: Optional[str] = None,
+        allowed_ids: Optional[Iterable[int]] = None,
+        min_score: Optional[float] = None,
+    ) -> List[Tuple[int, float]]:
+        """
+        Top-k cosine search.
+
+        Args:
+            query: Query embedding (normalized here)
+            k: Number of results
+            mem_type: Restrict to one memory type
+            allowed_ids: Restrict to these memory ids (tags/module/status filters)
+            min_score: Drop results below this cosine similarity
+
+        Returns:
+            [(memory_id, score)] sorted by score descending
+        """
+        q = np.asarray(query, dtype=np.float32).reshape(-1)
+        if q.shape[0] != self.dim or k <= 0:
+            return []
+        norm = float(np.linalg.norm(q))
+        if norm == 0:
+            return []
+        q = q / norm
+
+        with self._lock:
+            n = self._count
+            if n == 0:
+                return []
+            ids = self._ids[:n]
+            mask = ids >= 0
+            if mem_type is not None:
+                mask &= self._types[:n] == TYPE_CODES.get(mem_type, -1)
+            if allowed_ids is not None:
+                allowed = np.fromiter((int(i) for i in allowed_ids), dtype=np.int64)
+                mask &= np.isin(ids, allowed)
+            if not mask.any():
+                return []
+
+            scores = self._vectors[:n] @ q
+            ids = ids.copy()
+
+        scores = np.where(mask, scores, -np.inf)
+        if min_score is not None:
+            scores[scores < min_score] = -np.inf
+
+        candidates = int(np.count_nonzero(np.isfinite(scores)))
+        k = min(k, candidates)
+        if k == 0:
+            return []
+
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(int(ids[row]), float(scores[row])) for row in top]
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "vectors": len(self._row_of),
+                "rows": self._count,
+                "dim": self.dim,
+                "memory_mapped": self._mapped,
+                "dirty": self._dirty,
+                "bytes": int(self._count * self.dim * 4),
+            }
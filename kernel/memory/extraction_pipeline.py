@@ -0,0 +1,368 @@
+# kernel/memory/extraction_pipeline.py
+"""
+NovaOS v0.12 — Background Fact Extraction
+
+run_auto_extraction() used to call llm_extract_facts() inline, which put
+a whole extra LLM round trip in front of the persona reply. The LLM
+fallback now runs here, off the chat path:
+
+- Bounded queue (`max_pending` jobs) drained by a few daemon workers
+- Per-session ordering: a session's jobs run one at a time, oldest first
+- Dedupe: a message already queued or extracted for the same session
+  within `dedupe_ttl` seconds is skipped
+- Backpressure: when the queue is full, the lowest-priority job is
+  dropped (the new one, if nothing queued is worth less)
+- settle(session_id) waits briefly for a session's queued work, so facts
+  from one turn are in memory before the next turn builds its LTM context
+
+stats() reports queue depth, the age of the oldest queued job, and
+enqueue-to-stored lag percentiles.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .memory_manager import MemoryManager
+
+logger = logging.getLogger("nova.memory.extraction")
+
+
+# =============================================================================
+# DEFAULTS
+# =============================================================================
+
+DEFAULT_MAX_PENDING = 64
+DEFAULT_WORKERS = 2
+DEFAULT_DEDUPE_WINDOW = 1024        # remembered (session, message) keys
+DEFAULT_DEDUPE_TTL = 600.0          # seconds
+DEFAULT_SETTLE_TIMEOUT = 2.0        # seconds a new turn waits for the previous one
+
+# Job priorities (higher survives backpressure)
+PRIORITY_HIGH = 1.0                 # regex found nothing: LLM is the only extractor
+PRIORITY_LOW = 0.5                  # regex already stored something: LLM adds extras
+
+LAG_SAMPLES = 512
+
+
+@dataclass
+class ExtractionJob:
+    """One queued message awaiting LLM fact extraction."""
+    seq: int
+    session_id: str
+    user_text: str
+    memory_manager: "MemoryManager"
+    module_tag: Optional[str] = None
+    priority: float = PRIORITY_HIGH
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+# =============================================================================
+# PIPELINE
+# =============================================================================
+
+class FactExtractionPipeline:
+    """
+    Bounded, per-session-ordered background queue for llm_extract_facts().
+
+    Args:
+        extract: (user_text, memory_manager, module_tag) -> stored facts;
+            defaults to memory_helpers.llm_extract_facts
+        max_pending: Queued jobs before backpressure drops work
+        workers: Worker threads (started on first submit)
+        dedupe_window: Recent (session, message) keys remembered
+        dedupe_ttl: Seconds a key suppresses a repeat of the same message
+        clock: Monotonic time source (tests)
+    """
+
+    def __init__(
+        self,
+        extract: Optional[Callable[[str, "MemoryManager", Optional[str]], List[Dict[str, Any]]]] = None,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        workers: int = DEFAULT_WORKERS,
+        dedupe_window: int = DEFAULT_DEDUPE_WINDOW,
+        dedupe_ttl: float = DEFAULT_DEDUPE_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._extract = extract
+        self.max_pending = max_pending
+        self.workers = max(1, workers)
+        self.dedupe_window = dedupe_window
+        self.dedupe_ttl = dedupe_ttl
+        self._clock = clock
+
+        self._cond = threading.Condition()
+        # session_id -> its queued jobs, oldest first
+        self._pending: Dict[str, Deque[ExtractionJob]] = {}
+        # sessions with queued jobs and no job running, in arrival order
+        self._ready: Deque[str] = deque()
+        self._running: Dict[str, ExtractionJob] = {}
+        self._depth = 0
+        self._seq = 0
+        self._threads: List[threading.Thread] = []
+        self._recent: "OrderedDict[str, float]" = OrderedDict()
+        self._lags: Deque[float] = deque(maxlen=LAG_SAMPLES)
+
+        self._stats: Dict[str, int] = {
+            "submitted": 0,
+            "processed": 0,
+            "facts_stored": 0,
+            "deduped": 0,
+            "dropped": 0,
+            "failed": 0,
+        }
+
+    # -------------------------------------------------------------------------
+    # Submission
+    # -------------------------------------------------------------------------
+
+    def _dedupe_key(self, session_id: str, user_text: str) -> str:
+        normalized = " ".join(user_text.lower().split())
+        return hashlib.sha1(f"{session_id}\x00{normalized}".encode("utf-8")).hexdigest()
+
+    def _seen_recently(self, key: str, now: float) -> bool:
+        while self._recent:
+            oldest_key, seen_at = next(iter(self._recent.items()))
+            if now - seen_at < self.dedupe_ttl and len(self._recent) <= self.dedupe_window:
+                break
+            self._recent.pop(oldest_key)
+        if key in self._recent:
+            return True
+        self._recent[key] = now
+        return False
+
+    def submit(
+        self,
+        session_id: str,
+        user_text: str,
+        memory_manager: "MemoryManager",
+        module_tag: Optional[str] = None,
+        priority: float = PRIORITY_HIGH,
+    ) -> bool:
+        """
+        Queue a message for extraction.
+
+        Returns:
+            True if queued; False if it was a recent duplicate or was
+            dropped by backpressure
+        """
+        session_id = session_id or "default"
+        now = self._clock()
+        key = self._dedupe_key(session_id, user_text)
+        with self._cond:
+            self._stats["submitted"] += 1
+            if self._seen_recently(key, now):
+                self._stats["deduped"] += 1
+                return False
+
+            if self._depth >= self.max_pending and not self._drop_lowest(priority):
+                self._recent.pop(key, None)  # never extracted, so a resend may retry
+                self._stats["dropped"] += 1
+                logger.debug("Extraction queue full; dropped new job for %s", session_id)
+                return False
+
+            self._seq += 1
+            job = ExtractionJob(
+                seq=self._seq,
+                session_id=session_id,
+                user_text=user_text,
+                memory_manager=memory_manager,
+                module_tag=module_tag,
+                priority=priority,
+                enqueued_at=now,
+            )
+            queue = self._pending.get(session_id)
+            if queue is None:
+                queue = self._pending[session_id] = deque()
+                if session_id not in self._running:
+                    self._ready.append(session_id)
+            queue.append(job)
+            self._depth += 1
+            self._ensure_workers()
+            self._cond.notify()
+        return True
+
+    def _drop_lowest(self, priority: float) -> bool:
+        """Evict the lowest-priority (then newest) queued job if it is worth less than `priority`."""
+        victim: Optional[ExtractionJob] = None
+        for queue in self._pending.values():
+            for job in queue:
+                if victim is None or (job.priority, -job.seq) < (victim.priority, -victim.seq):
+                    victim = job
+        if victim is None or victim.priority >= priority:
+            return False
+        queue = self._pending[victim.session_id]
+        queue.remove(victim)
+        self._depth -= 1
+        self._stats["dropped"] += 1
+        self._recent.pop(self._dedupe_key(victim.session_id, victim.user_text), None)
+        if not queue:
+            del self._pending[victim.session_id]
+            try:
+                self._ready.remove(victim.session_id)
+            except ValueError:
+                pass
+        self._cond.notify_all()
+        logger.debug("Extraction queue full; dropped queued job for %s", victim.session_id)
+        return True
+
+    # -------------------------------------------------------------------------
+    # Workers
+    # -------------------------------------------------------------------------
+
+    def _ensure_workers(self) -> None:
+        self._threads = [t for t in self._threads if t.is_alive()]
+        while len(self._threads) < self.workers:
+            thread = threading.Thread(
+                target=self._run_worker,
+                name=f"nova-fact-extractor-{len(self._threads)}",
+                daemon=True,
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def _next_job(self) -> ExtractionJob:
+        with self._cond:
+            while not self._ready:
+                self._cond.wait()
+            session_id = self._ready.popleft()
+            queue = self._pending[session_id]
+            job = queue.popleft()
+            if not queue:
+                del self._pending[session_id]
+            self._depth -= 1
+            self._running[session_id] = job
+            return job
+
+    def _run_worker(self) -> None:
+        while True:
+            job = self._next_job()
+            stored = 0
+            failed = False
+            try:
+                extract = self._extract
+                if extract is None:
+                    from .memory_helpers import llm_extract_facts as extract
+                stored = len(extract(job.user_text, job.memory_manager, job.module_tag) or [])
+            except Exception as e:
+                failed = True
+                logger.debug("Background fact extraction failed (non-fatal): %s", e)
+            finally:
+                lag = self._clock() - job.enqueued_at
+                with self._cond:
+                    del self._running[job.session_id]
+                    if job.session_id in self._pending:
+                        self._ready.append(job.session_id)
+                    self._stats["processed"] += 1
+                    self._stats["facts_stored"] += stored
+                    if failed:
+                        self._stats["failed"] += 1
+                    self._lags.append(lag)
+                    self._cond.notify_all()
+            if stored:
+                logger.info("Background extraction stored %d facts (lag %.0f ms)", stored, lag * 1000)
+
+    # -------------------------------------------------------------------------
+    # Synchronization / stats
+    # -------------------------------------------------------------------------
+
+    def settle(self, session_id: str, timeout: float = DEFAULT_SETTLE_TIMEOUT) -> bool:
+        """
+        Wait until the session has nothing queued or running.
+
+        Returns:
+            True if settled, False if `timeout` elapsed first
+        """
+        session_id = session_id or "default"
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while session_id in self._pending or session_id in self._running:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued job has run (tests, shutdown)."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._pending or self._running:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth, oldest queued job age and enqueue-to-stored lag (ms)."""
+        now = self._clock()
+        with self._cond:
+            oldest = min(
+                (queue[0].enqueued_at for queue in self._pending.values()),
+                default=None,
+            )
+            lags = sorted(self._lags)
+            stats: Dict[str, Any] = {
+                "queue_depth": self._depth,
+                "running": len(self._running),
+                "max_pending": self.max_pending,
+                "oldest_pending_ms": round((now - oldest) * 1000, 1) if oldest is not None else 0.0,
+                **self._stats,
+            }
+        if lags:
+            stats["lag_ms_p50"] = round(lags[len(lags) // 2] * 1000, 1)
+            stats["lag_ms_p95"] = round(lags[min(len(lags) - 1, int(len(lags) * 0.95))] * 1000, 1)
+            stats["lag_ms_max"] = round(lags[-1] * 1000, 1)
+        return stats
+
+
+# =============================================================================
+# SINGLETON
+# =============================================================================
+
+_pipeline_instance: Optional[FactExtractionPipeline] = None
+_pipeline_lock = threading.Lock()
+
+
+def get_extraction_pipeline() -> FactExtractionPipeline:
+    """Get or create the process-wide extraction pipeline."""
+    global _pipeline_instance
+
+    if _pipeline_instance is not None:
+        return _pipeline_instance
+
+    with _pipeline_lock:
+        if _pipeline_instance is None:
+            _pipeline_instance = FactExtractionPipeline()
+    return _pipeline_instance
+
+
+def reset_extraction_pipeline() -> None:
+    """Reset the singleton (for testing)."""
+    global _pipeline_instance
+    _pipeline_instance = None
+
+
+def extraction_stats() -> Dict[str, Any]:
+    """stats() of the process-wide pipeline."""
+    return get_extraction_pipeline().stats()
+
+
+__all__ = [
+    "FactExtractionPipeline",
+    "ExtractionJob",
+    "get_extraction_pipeline",
+    "reset_extraction_pipeline",
+    "extraction_stats",
+    "PRIORITY_HIGH",
+    "PRIORITY_LOW",
+    "DEFAULT_SETTLE_TIMEOUT",
+]
@@ -0,0 +1,95 @@
+# kernel/memory/ltm_context_cache.py
+"""
+NovaOS v0.12 — LTM Context Cache
+
+build_ltm_context_for_persona() recalls profile and semantic memories and
+renders them into a prompt block on every persona message, although
+long-term memory rarely changes between turns. The rendered block is
+cached here per (session, module, query signature) and stamped with the
+engine's store_version:
+
+- A lookup is a dict hit plus one integer comparison; any store, update,
+  delete, decay write or import bumps the version and the next lookup
+  rebuilds
+- The ids of the memories behind a block are kept so a hit can still
+  touch them (touches keep memories from decaying)
+- LRU-bounded to `max_entries` keys
+- Counters: hits, misses, stale (version changed), evictions
+
+The version is per process: with the SQLite backend shared by several
+workers, a write in one worker is only seen by the others' caches once
+they write themselves or the entry is evicted.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+# (session_id, module_tag, query signature)
+CacheKey = Tuple[str, str, str]
+
+DEFAULT_MAX_ENTRIES = 512
+
+
+@dataclass
+class LTMContextEntry:
+    """One rendered LTM block and the store version it was built from."""
+    version: int
+    context: str
+    memory_ids: List[int] = field(default_factory=list)
+
+
+class LTMContextCache:
+    """
+    Version-stamped LRU cache of rendered LTM persona blocks.
+
+    Args:
+        max_entries: Keys kept before the least recently used is evicted
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[CacheKey, LTMContextEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats: Dict[str, int] = {"hits": 0, "misses": 0, "stale": 0, "evictions": 0}
+
+    def get(self, key: CacheKey, version: int) -> Optional[LTMContextEntry]:
+        """Return the entry for `key` if it was built at `version`."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            if entry.version != version:
+                del self._entries[key]
+                self._stats["stale"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return entry
+
+    def put(self, key: CacheKey, entry: LTMContextEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"entries": len(self._entries), "max_entries": self.max_entries, **self._stats}
+
+
+__all__ = [
+    "LTMContextCache",
+    "LTMContextEntry",
+    "DEFAULT_MAX_ENTRIES",
+]
@@ -13,13 +13,29 @@ Backward-compatible with MemoryManager v0.3 API.
 
 from __future__ import annotations
 
+import atexit
+import bisect
+import heapq
 import json
+import logging
+import math
+import os
+import re
+import sys
+import time
+import weakref
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional, Set, Callable
+from typing import Any, Dict, List, Literal, Optional, Set, Callable, Tuple, Union
 import threading
 
+from .memory_lifecycle import DecayScheduler
+from .trace_store import HEAVY_TRACE_KEYS, SIDE_FIELDS_KEY, TRACE_DB_FILENAME, TraceStore, split_trace
+
+
+logger = logging.getLogger("nova.memory.engine")
+
 
 # -----------------------------------------------------------------------------
 # Type Definitions
@@ -40,12 +56,20 @@ DEFAULT_SALIENCE: Dict[MemoryType, float] = {
 # Memory Item (Enhanced Schema)
 # -----------------------------------------------------------------------------
 
-@dataclass
+def _intern(value: Any) -> Any:
+    """Intern strings that repeat across many items (types, tags, statuses)."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+@dataclass(slots=True)
 class MemoryItem:
     """
     Enhanced memory item with v0.5.4 fields.
     
     Backward-compatible: all new fields have defaults.
+    
+    v0.12: Slotted, and from_dict() interns the low-cardinality strings
+    (type, status, source, tags, module_tag) so 50k items share them.
     """
     id: int
     type: MemoryType
@@ -75,20 +99,20 @@ class MemoryItem:
         """
         # Required fields
         item_id = int(data.get("id", 0))
-        mem_type: MemoryType = data.get("type", "semantic")
-        tags = list(data.get("tags", ["general"]))
+        mem_type: MemoryType = _intern(data.get("type", "semantic"))
+        tags = [_intern(tag) for tag in data.get("tags", ["general"])]
         payload = data.get("payload", "")
         timestamp = data.get("timestamp", datetime.now(timezone.utc).isoformat())
         trace = data.get("trace") or {}
         cluster_id = data.get("cluster_id")
 
         # v0.5.4 fields with defaults
-        source = data.get("source", "user")
+        source = _intern(data.get("source", "user"))
         salience = float(data.get("salience", DEFAULT_SALIENCE.get(mem_type, 0.5)))
-        status: MemoryStatus = data.get("status", "active")
+        status: MemoryStatus = _intern(data.get("status", "active"))
         confidence = float(data.get("confidence", 1.0))
         last_used_at = data.get("last_used_at")
-        module_tag = data.get("module_tag")
+        module_tag = _intern(data.get("module_tag"))
         version = int(data.get("version", 1))
 
         return cls(
@@ -150,6 +174,44 @@ class WorkingMemory:
             self._sessions.clear()
 
 
+# -----------------------------------------------------------------------------
+# Keyword Tokenization
+# -----------------------------------------------------------------------------
+
+STOP_WORDS: Set[str] = {
+    'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
+    'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
+    'should', 'may', 'might', 'must', 'shall', 'can', 'to', 'of', 'in',
+    'for', 'on', 'with', 'at', 'by', 'from', 'as', 'into', 'through',
+    'during', 'before', 'after', 'above', 'below', 'between', 'and', 'or',
+    'but', 'if', 'then', 'else', 'when', 'where', 'why', 'how', 'all',
+    'each', 'every', 'both', 'few', 'more', 'most', 'other', 'some', 'such',
+    'no', 'not', 'only', 'same', 'so', 'than', 'too', 'very', 'just', 'i',
+    'me', 'my', 'myself', 'we', 'our', 'ours', 'you', 'your', 'yours',
+    'he', 'him', 'his', 'she', 'her', 'hers', 'it', 'its', 'they', 'them',
+    'their', 'what', 'which', 'who', 'whom', 'this', 'that', 'these', 'those',
+}
+
+_PUNCT_RE = re.compile(r'[^\w\s]')
+
+
+def tokenize_text(text: str) -> List[str]:
+    """
+    Split text into keyword tokens (used for both payloads and queries).
+    
+    - Lowercase
+    - Remove punctuation
+    - Drop words of 2 chars or less and stop words
+    """
+    words = _PUNCT_RE.sub(' ', (text or '').lower()).split()
+    return [w for w in words if len(w) > 2 and w not in STOP_WORDS]
+
+
+# BM25 parameters for keyword search
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
 # -----------------------------------------------------------------------------
 # Memory Index (Fast Lookups)
 # -----------------------------------------------------------------------------
@@ -162,11 +224,18 @@ class MemoryIndex:
     - by_id: id -> MemoryItem
     - by_type: type -> Set[id]
     - by_tag: tag -> Set[id]
-    - by_salience: sorted list of (salience, id)
+    - by_salience: (status, type) -> sorted list of (-salience, timestamp, id)
     - by_module: module_tag -> Set[id]
     - by_status: status -> Set[id]
+    - postings: payload term -> {id: term frequency} (keyword search)
+    
+    The keys each id was indexed under are remembered, so an item mutated
+    in place and then passed to update() is moved out of its old buckets.
     """
 
+    # Items live in this process (the SQLite index reads them from disk instead)
+    in_memory = True
+
     def __init__(self):
         self.by_id: Dict[int, MemoryItem] = {}
         self.by_type: Dict[MemoryType, Set[int]] = {
@@ -182,14 +251,37 @@ class MemoryIndex:
             "archived": set(),
             "pending_confirmation": set(),
         }
+        self.by_salience: Dict[Tuple[str, str], List[Tuple[float, str, int]]] = {}
+        # id -> (type, tags, module_tag, status, salience key) as indexed
+        self._entries: Dict[int, Tuple[str, Tuple[str, ...], Optional[str], str, Tuple[float, str, int]]] = {}
+        # Inverted keyword index. Terms are remembered per id so an item
+        # mutated in place can still be un-indexed correctly.
+        self.postings: Dict[str, Dict[int, int]] = {}
+        self._doc_terms: Dict[int, Tuple[str, ...]] = {}
+        self._doc_len: Dict[int, int] = {}
+        self._total_len = 0
         self._lock = threading.Lock()
 
     def add(self, item: MemoryItem) -> None:
         with self._lock:
             self._add_unlocked(item)
 
+    def add_many(self, items: List[MemoryItem]) -> None:
+        """Add or re-index several items under one lock."""
+        with self._lock:
+            for item in items:
+                self._add_unlocked(item)
+
+    def update_many(self, items: List[MemoryItem]) -> None:
+        """Update several items under one lock."""
+        # Re-adding drops an item's old entries first
+        self.add_many(items)
+
     def _add_unlocked(self, item: MemoryItem) -> None:
         """Add item without lock (for bulk operations)."""
+        if item.id in self._entries:
+            self._remove_unlocked(item.id)
+        
         self.by_id[item.id] = item
         self.by_type[item.type].add(item.id)
         
@@ -205,41 +297,110 @@ class MemoryIndex:
         
         if item.status in self.by_status:
             self.by_status[item.status].add(item.id)
+        
+        key = (-item.salience, item.timestamp, item.id)
+        bucket = self.by_salience.setdefault((item.status, item.type), [])
+        bisect.insort(bucket, key)
+        self._entries[item.id] = (item.type, tuple(item.tags), item.module_tag, item.status, key)
+        
+        self._index_terms_unlocked(item)
+
+    def _remove_unlocked(self, item_id: int) -> Optional[MemoryItem]:
+        """Remove item without lock, using the keys it was indexed under."""
+        item = self.by_id.pop(item_id, None)
+        entry = self._entries.pop(item_id, None)
+        if entry is None:
+            return item
+        mem_type, tags, module_tag, status, key = entry
+        
+        self.by_type[mem_type].discard(item_id)
+        for tag in tags:
+            if tag in self.by_tag:
+                self.by_tag[tag].discard(item_id)
+        if module_tag and module_tag in self.by_module:
+            self.by_module[module_tag].discard(item_id)
+        if status in self.by_status:
+            self.by_status[status].discard(item_id)
+        
+        bucket = self.by_salience.get((status, mem_type))
+        if bucket:
+            pos = bisect.bisect_left(bucket, key)
+            if pos < len(bucket) and bucket[pos] == key:
+                del bucket[pos]
+        
+        self._unindex_terms_unlocked(item_id)
+        return item
+
+    def _index_terms_unlocked(self, item: MemoryItem) -> None:
+        """Add an item's payload terms to the postings."""
+        self._unindex_terms_unlocked(item.id)
+        tokens = tokenize_text(item.payload)
+        if not tokens:
+            return
+        counts: Dict[str, int] = {}
+        for token in tokens:
+            counts[token] = counts.get(token, 0) + 1
+        for term, tf in counts.items():
+            postings = self.postings.get(term)
+            if postings is None:
+                postings = self.postings[term] = {}
+            postings[item.id] = tf
+        self._doc_terms[item.id] = tuple(counts)
+        self._doc_len[item.id] = len(tokens)
+        self._total_len += len(tokens)
+
+    def _unindex_terms_unlocked(self, item_id: int) -> None:
+        """Drop an item's terms from the postings."""
+        terms = self._doc_terms.pop(item_id, None)
+        if terms is None:
+            return
+        for term in terms:
+            postings = self.postings.get(term)
+            if postings is not None:
+                postings.pop(item_id, None)
+                if not postings:
+                    del self.postings[term]
+        self._total_len -= self._doc_len.pop(item_id, 0)
 
     def remove(self, item_id: int) -> Optional[MemoryItem]:
         with self._lock:
-            item = self.by_id.pop(item_id, None)
-            if item:
-                self.by_type[item.type].discard(item_id)
-                for tag in item.tags:
-                    if tag in self.by_tag:
-                        self.by_tag[tag].discard(item_id)
-                if item.module_tag and item.module_tag in self.by_module:
-                    self.by_module[item.module_tag].discard(item_id)
-                if item.status in self.by_status:
-                    self.by_status[item.status].discard(item_id)
-            return item
+            return self._remove_unlocked(item_id)
+
+    def remove_many(self, item_ids: List[int]) -> List[MemoryItem]:
+        """Remove several items under one lock. Returns the removed items."""
+        with self._lock:
+            removed = [self._remove_unlocked(item_id) for item_id in item_ids]
+        return [item for item in removed if item is not None]
 
     def update(self, item: MemoryItem) -> None:
         """Update an item in the index."""
         with self._lock:
-            # Remove old entry if exists
-            old = self.by_id.get(item.id)
-            if old:
-                self.by_type[old.type].discard(item.id)
-                for tag in old.tags:
-                    if tag in self.by_tag:
-                        self.by_tag[tag].discard(item.id)
-                if old.module_tag and old.module_tag in self.by_module:
-                    self.by_module[old.module_tag].discard(item.id)
-                if old.status in self.by_status:
-                    self.by_status[old.status].discard(item.id)
-            # Add new
+            # Re-adding drops the old entry first
             self._add_unlocked(item)
 
     def get(self, item_id: int) -> Optional[MemoryItem]:
         return self.by_id.get(item_id)
 
+    def ids_by_type(self, mem_type: MemoryType) -> Set[int]:
+        """Return ids of all items of a type."""
+        with self._lock:
+            return set(self.by_type.get(mem_type, set()))
+
+    def ids_by_tag(self, tag: str) -> Set[int]:
+        """Return ids of all items carrying a tag."""
+        with self._lock:
+            return set(self.by_tag.get(tag, set()))
+
+    def ids_by_module(self, module_tag: str) -> Set[int]:
+        """Return ids of all items linked to a module."""
+        with self._lock:
+            return set(self.by_module.get(module_tag, set()))
+
+    def ids_by_status(self, status: MemoryStatus) -> Set[int]:
+        """Return ids of all items with a status."""
+        with self._lock:
+            return set(self.by_status.get(status, set()))
+
     def query(
         self,
         mem_type: Optional[MemoryType] = None,
@@ -251,56 +412,113 @@ class MemoryIndex:
     ) -> List[MemoryItem]:
         """
         Query memories with filters.
-        Returns items sorted by salience (desc), then timestamp (desc).
+        Returns items sorted by salience (desc), then timestamp (asc).
+        
+        Walks the salience-ordered (status, type) buckets and stops once
+        `limit` matches are found (or salience drops below min_salience).
+        Tag/module filters are checked by set membership; when they narrow
+        the candidates far enough, those few ids are sorted directly.
         """
         with self._lock:
-            # Start with all IDs or filtered set
-            candidate_ids: Optional[Set[int]] = None
-
-            if mem_type:
-                candidate_ids = self.by_type.get(mem_type, set()).copy()
-
+            # Tag/module filters restrict ids; type/status pick buckets
+            restrict: Optional[Set[int]] = None
             if tags:
-                tag_ids: Set[int] = set()
+                restrict = set()
                 for tag in tags:
-                    tag_ids |= self.by_tag.get(tag, set())
-                if candidate_ids is None:
-                    candidate_ids = tag_ids
-                else:
-                    candidate_ids &= tag_ids
-
+                    restrict |= self.by_tag.get(tag, set())
             if module_tag:
                 module_ids = self.by_module.get(module_tag, set())
-                if candidate_ids is None:
-                    candidate_ids = module_ids.copy()
-                else:
-                    candidate_ids &= module_ids
+                restrict = set(module_ids) if restrict is None else restrict & module_ids
+
+            buckets = [
+                bucket for (b_status, b_type), bucket in self.by_salience.items()
+                if bucket
+                and (not status or b_status == status)
+                and (not mem_type or b_type == mem_type)
+            ]
+            if not buckets or limit <= 0 or (restrict is not None and not restrict):
+                return []
+
+            if restrict is not None and len(restrict) * 4 < sum(len(b) for b in buckets):
+                keys = sorted(
+                    entry[4] for entry in (self._entries.get(i) for i in restrict)
+                    if entry is not None
+                    and (not status or entry[3] == status)
+                    and (not mem_type or entry[0] == mem_type)
+                )
+                restrict = None
+            elif len(buckets) == 1:
+                keys = buckets[0]
+            else:
+                keys = heapq.merge(*buckets)
 
-            if status:
-                status_ids = self.by_status.get(status, set())
-                if candidate_ids is None:
-                    candidate_ids = status_ids.copy()
-                else:
-                    candidate_ids &= status_ids
-
-            # If no filters, use all
-            if candidate_ids is None:
-                candidate_ids = set(self.by_id.keys())
-
-            # Get items and filter by salience
             items: List[MemoryItem] = []
-            for item_id in candidate_ids:
+            for neg_salience, _, item_id in keys:
+                if min_salience is not None and -neg_salience < min_salience:
+                    break
+                if restrict is not None and item_id not in restrict:
+                    continue
                 item = self.by_id.get(item_id)
-                if item:
-                    if min_salience is not None and item.salience < min_salience:
-                        continue
+                if item is not None:
                     items.append(item)
+                    if len(items) >= limit:
+                        break
 
-            # Sort by salience desc, then timestamp desc
-            items.sort(key=lambda x: (-x.salience, x.timestamp), reverse=False)
-            items.sort(key=lambda x: x.salience, reverse=True)
+            return items
 
-            return items[:limit]
+    def keyword_search(
+        self,
+        terms: List[str],
+        mem_type: Optional[MemoryType] = None,
+        module_tag: Optional[str] = None,
+        status: Optional[MemoryStatus] = None,
+        limit: int = 20,
+    ) -> List[Tuple[MemoryItem, float]]:
+        """
+        Rank items by BM25 over payload terms, plus salience.
+        
+        Only the postings of the query terms are visited, so cost follows
+        the number of matching items rather than the store size.
+        
+        Args:
+            terms: Query tokens (see tokenize_text)
+        
+        Returns:
+            [(MemoryItem, score)] sorted by score descending
+        """
+        with self._lock:
+            n_docs = len(self._doc_len)
+            if not n_docs or limit <= 0:
+                return []
+            avg_len = self._total_len / n_docs
+
+            scores: Dict[int, float] = {}
+            for term in set(terms):
+                postings = self.postings.get(term)
+                if not postings:
+                    continue
+                df = len(postings)
+                idf = math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+                for item_id, tf in postings.items():
+                    if item_id not in scores:
+                        item = self.by_id.get(item_id)
+                        if item is None:
+                            continue
+                        if mem_type and item.type != mem_type:
+                            continue
+                        if module_tag and item.module_tag != module_tag:
+                            continue
+                        if status and item.status != status:
+                            continue
+                        scores[item_id] = 0.0
+                    norm = BM25_K1 * (1 - BM25_B + BM25_B * self._doc_len[item_id] / avg_len)
+                    scores[item_id] += idf * tf * (BM25_K1 + 1) / (tf + norm)
+
+            ranked = heapq.nlargest(
+                limit,
+                ((score + self.by_id[item_id].salience, item_id) for item_id, score in scores.items()),
+            )
+            return [(self.by_id[item_id], score) for score, item_id in ranked]
 
     def rebuild(self, items: List[MemoryItem]) -> None:
         """Rebuild index from scratch."""
@@ -312,6 +530,12 @@ class MemoryIndex:
             self.by_module.clear()
             for s in self.by_status.values():
                 s.clear()
+            self.by_salience.clear()
+            self._entries.clear()
+            self.postings.clear()
+            self._doc_terms.clear()
+            self._doc_len.clear()
+            self._total_len = 0
 
             for item in items:
                 self._add_unlocked(item)
@@ -325,6 +549,7 @@ class MemoryIndex:
                 "by_status": {s: len(ids) for s, ids in self.by_status.items()},
                 "unique_tags": len(self.by_tag),
                 "unique_modules": len(self.by_module),
+                "unique_terms": len(self.postings),
             }
 
 
@@ -332,6 +557,12 @@ class MemoryIndex:
 # Long-Term Memory Store
 # -----------------------------------------------------------------------------
 
+# Journal compaction thresholds — whichever is crossed first triggers a
+# background rewrite of the typed snapshot files.
+JOURNAL_MAX_BYTES = 1024 * 1024          # 1 MB of pending mutations
+JOURNAL_MAX_AGE_SECONDS = 300.0          # 5 minutes since the first pending record
+
+
 class LongTermMemory:
     """
     Persistent memory storage with separate files per type.
@@ -341,12 +572,36 @@ class LongTermMemory:
     - data/memory/procedural_memory.json
     - data/memory/episodic_memory.json
     - data/memory/memory_meta.json (next_id, version)
+    - data/memory/memory_journal.jsonl (append-only mutation log)
     
     Also maintains backward compatibility with data/memory.json
+    
+    v0.12: Mutations (store/update/delete) are appended to the journal as
+    one JSON line each instead of rewriting every snapshot file. The journal
+    is replayed on top of the snapshots in _load(), and compacted into the
+    snapshot files by a background thread once it passes JOURNAL_MAX_BYTES
+    or JOURNAL_MAX_AGE_SECONDS. The age limit is enforced by a timer armed
+    with the first pending record, so an idle process compacts too.
+    
+    v0.12: Heavy trace fields (HEAVY_TRACE_KEYS: WM snapshots, embeddings)
+    live in a TraceStore (data/memory/memory_traces.db) instead of RAM and
+    the snapshot files. Resident items keep a SIDE_FIELDS_KEY marker;
+    load_trace() returns the full trace, export_state() the full items.
+    
+    read_only=True loads without ever writing: no legacy migration write,
+    no trace externalization, no compaction. Mutations raise. Used to
+    export the store (migrate_json_store) while leaving its files as-is.
     """
 
-    def __init__(self, data_dir: Path):
+    def __init__(
+        self,
+        data_dir: Path,
+        journal_max_bytes: int = JOURNAL_MAX_BYTES,
+        journal_max_age: float = JOURNAL_MAX_AGE_SECONDS,
+        read_only: bool = False,
+    ):
         self.data_dir = data_dir
+        self.read_only = read_only
         self.memory_dir = data_dir / "memory"
         self.memory_dir.mkdir(parents=True, exist_ok=True)
 
@@ -358,6 +613,10 @@ class LongTermMemory:
         }
         self.meta_file = self.memory_dir / "memory_meta.json"
         self.legacy_file = data_dir / "memory.json"
+        self.journal_file = self.memory_dir / "memory_journal.jsonl"
+        # Journal segment being folded into the snapshots by a compaction
+        self.compacting_file = self.memory_dir / "memory_journal.compacting.jsonl"
+        self.trace_db_file = self.memory_dir / TRACE_DB_FILENAME
 
         # State
         self._items: Dict[int, MemoryItem] = {}
@@ -365,8 +624,30 @@ class LongTermMemory:
         self._loaded: bool = False
         self._lock = threading.Lock()
 
+        # Journal state
+        self.journal_max_bytes = journal_max_bytes
+        self.journal_max_age = journal_max_age
+        self._journal_fh = None
+        self._journal_bytes: int = 0
+        self._journal_records: int = 0
+        self._journal_started_at: Optional[float] = None  # monotonic time of first pending record
+        self._age_timer: Optional[threading.Timer] = None
+
+        # Compaction state
+        self._compact_lock = threading.Lock()
+        self._compaction_pending: bool = False
+        self._compactions: int = 0
+        self._last_compaction_ms: Optional[float] = None
+        self._last_compacted_at: Optional[str] = None
+        # Snapshot files still hold fields that moved to the trace store
+        self._snapshot_stale: bool = False
+
+        # Side store for heavy trace fields (opened on first use)
+        self._traces: Optional[TraceStore] = None
+        self._traces_lock = threading.Lock()
+
     def _load(self) -> None:
-        """Load all memory files."""
+        """Load snapshot files, then replay the mutation journal."""
         if self._loaded:
             return
 
@@ -399,12 +680,101 @@ class LongTermMemory:
                     except Exception:
                         continue
 
+            # Replay journals: an interrupted compaction segment first, then the live journal
+            if not self.read_only:
+                for path in (self.compacting_file, self.journal_file):
+                    self._trim_torn_tail(path)
+            replayed = self._replay_journal_unlocked(self.compacting_file)
+            replayed += self._replay_journal_unlocked(self.journal_file)
+
             # Migrate from legacy file if typed files are empty
-            if not self._items and self.legacy_file.exists():
+            if not self._items and not replayed and self.legacy_file.exists():
                 self._migrate_legacy()
 
+            # Stores written before v0.12 keep heavy trace fields inline:
+            # move them to the side store and rewrite the snapshot in the background
+            if not self.read_only and self._externalize_unlocked(list(self._items.values())):
+                self._snapshot_stale = True
+                self._schedule_compaction_unlocked()
+
+            if self.journal_file.exists():
+                self._journal_bytes = self.journal_file.stat().st_size
+            self._journal_records = replayed
+            if replayed and not self.read_only:
+                self._journal_started_at = time.monotonic()
+                self._arm_age_timer_unlocked(self.journal_max_age)
+
             self._loaded = True
 
+    @staticmethod
+    def _trim_torn_tail(path: Path) -> None:
+        """
+        Cut a partial last line (crash mid-append) off a journal file, so
+        the next record does not land on the same line and get lost with it.
+        """
+        try:
+            with path.open("rb+") as f:
+                size = f.seek(0, os.SEEK_END)
+                if size == 0:
+                    return
+                f.seek(size - 1)
+                if f.read(1) == b"\n":
+                    return
+                f.seek(0)
+                keep = f.read().rfind(b"\n") + 1
+                f.truncate(keep)
+            logger.warning("Dropped %d bytes of a torn record from %s", size - keep, path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning("Could not trim memory journal %s: %s", path, e)
+
+    def _replay_journal_unlocked(self, path: Path) -> int:
+        """
+        Apply journal records from `path` to the in-memory items.
+        
+        Records are full-item puts or id deletes, so replay is idempotent.
+        A torn final line (crash mid-append) is skipped; _load() trims it
+        off first.
+        
+        Returns:
+            Count of records applied
+        """
+        if not path.exists():
+            return 0
+
+        applied = 0
+        try:
+            with path.open("r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = json.loads(line)
+                        op = record.get("op")
+                        if op in ("put", "update"):
+                            batch = record.get("items") or [record["item"]]
+                            for item_data in batch:
+                                item = MemoryItem.from_dict(item_data)
+                                self._items[item.id] = item
+                                if item.id >= self._next_id:
+                                    self._next_id = item.id + 1
+                        elif op == "delete":
+                            for item_id in record.get("ids", []):
+                                self._items.pop(int(item_id), None)
+                        else:
+                            continue
+                        next_id = record.get("next_id")
+                        if next_id is not None and int(next_id) > self._next_id:
+                            self._next_id = int(next_id)
+                        applied += 1
+                    except Exception:
+                        continue
+        except Exception as e:
+            logger.warning("Failed to replay memory journal %s: %s", path, e)
+        return applied
+
     def _migrate_legacy(self) -> None:
         """Migrate from legacy memory.json to typed files."""
         try:
@@ -421,17 +791,271 @@ class LongTermMemory:
                     continue
 
             # Save to new format
-            self._save_unlocked()
+            if not self.read_only:
+                self._save_unlocked()
         except Exception:
             pass
 
-    def _save(self) -> None:
-        """Save all memory files."""
+    # ---------- Trace side store ----------
+
+    def _trace_store(self) -> TraceStore:
+        if self._traces is None:
+            with self._traces_lock:
+                if self._traces is None:
+                    self._traces = TraceStore(self.trace_db_file)
+        return self._traces
+
+    def _externalize_unlocked(self, items: List[MemoryItem]) -> int:
+        """
+        Move heavy trace fields of `items` to the trace store.
+        
+        Runs before the journal record for the items is appended, so a
+        SIDE_FIELDS_KEY marker never points at a row that was not written.
+        The trace dict is copied first; callers may still hold the original.
+        
+        Returns:
+            Count of items that had heavy fields
+        """
+        moved: Dict[int, Dict[str, Any]] = {}
+        for item in items:
+            trace = item.trace
+            if not trace or not any(key in trace for key in HEAVY_TRACE_KEYS):
+                continue
+            item.trace = dict(trace)
+            moved[item.id] = split_trace(item.trace)
+        if moved:
+            self._trace_store().put_many(moved)
+        return len(moved)
+
+    def _forget_traces_unlocked(self, items: List[MemoryItem]) -> None:
+        """Drop side-store rows of deleted items."""
+        ids = [item.id for item in items if item.trace and item.trace.get(SIDE_FIELDS_KEY)]
+        if ids:
+            self._trace_store().delete_many(ids)
+
+    def load_trace(self, item: MemoryItem) -> Dict[str, Any]:
+        """Return the full trace of `item`, with side-store fields merged back."""
+        return self.load_traces([item])[0]
+
+    def load_traces(self, items: List[MemoryItem]) -> List[Dict[str, Any]]:
+        """Batch load_trace(): one side-store query for all items."""
+        traces = [item.trace or {} for item in items]
+        wanted = [item.id for item, trace in zip(items, traces) if trace.get(SIDE_FIELDS_KEY)]
+        if not wanted:
+            return traces
+        fields = self._trace_store().get_many(wanted)
+        merged: List[Dict[str, Any]] = []
+        for item, trace in zip(items, traces):
+            keys = trace.get(SIDE_FIELDS_KEY)
+            if not keys:
+                merged.append(trace)
+                continue
+            full = {key: value for key, value in trace.items() if key != SIDE_FIELDS_KEY}
+            side = fields.get(item.id, {})
+            full.update((key, side[key]) for key in keys if key in side)
+            merged.append(full)
+        return merged
+
+    def _full_dicts(self, items: List[MemoryItem]) -> List[Dict[str, Any]]:
+        """Item dicts with the full trace (for exports)."""
+        dicts = [item.to_dict() for item in items]
+        for data, trace in zip(dicts, self.load_traces(items)):
+            data["trace"] = trace
+        return dicts
+
+    def trace_stats(self) -> Dict[str, Any]:
+        """Side-store statistics (empty until the store is first used)."""
+        if self._traces is None and not self.trace_db_file.exists():
+            return {"trace_rows": 0, "trace_memories": 0, "trace_reads": 0, "trace_db_bytes": 0}
+        return self._trace_store().stats()
+
+    # ---------- Journal ----------
+
+    def _append_unlocked(self, record: Dict[str, Any]) -> None:
+        """Append one mutation record to the journal (caller holds _lock)."""
+        if self.read_only:
+            raise RuntimeError(f"Memory store {self.memory_dir} is open read-only")
+        if self._journal_fh is None:
+            self._journal_fh = self.journal_file.open("a", encoding="utf-8")
+
+        line = json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+        self._journal_fh.write(line)
+        self._journal_fh.flush()
+
+        self._journal_bytes += len(line.encode("utf-8"))
+        self._journal_records += 1
+        if self._journal_started_at is None:
+            self._journal_started_at = time.monotonic()
+            self._arm_age_timer_unlocked(self.journal_max_age)
+
+        if self._journal_due_unlocked():
+            self._schedule_compaction_unlocked()
+
+    def _journal_due_unlocked(self) -> bool:
+        """True once the journal passed the size or age threshold."""
+        if self._journal_records == 0:
+            return False
+        if self._journal_bytes >= self.journal_max_bytes:
+            return True
+        started = self._journal_started_at
+        return started is not None and time.monotonic() - started >= self.journal_max_age
+
+    def _arm_age_timer_unlocked(self, delay: float) -> None:
+        """Check the age threshold after `delay` seconds (caller holds _lock)."""
+        if self._age_timer is not None:
+            return
+        self._age_timer = threading.Timer(max(delay, 0.0), self._age_check)
+        self._age_timer.daemon = True
+        self._age_timer.start()
+
+    def _age_check(self) -> None:
+        """Timer callback: compact an aged journal even if no append follows."""
         with self._lock:
-            self._save_unlocked()
+            self._age_timer = None
+            if self._journal_due_unlocked():
+                self._schedule_compaction_unlocked()
+            elif self._journal_started_at is not None:
+                # Journal was compacted and restarted since the timer was armed
+                remaining = self.journal_max_age - (time.monotonic() - self._journal_started_at)
+                self._arm_age_timer_unlocked(remaining)
+
+    def _close_journal_unlocked(self) -> None:
+        if self._journal_fh is not None:
+            try:
+                self._journal_fh.close()
+            except Exception:
+                pass
+            self._journal_fh = None
+
+    def _reset_journal_unlocked(self) -> None:
+        """Drop all pending journal records (snapshot files are authoritative)."""
+        self._close_journal_unlocked()
+        for path in (self.journal_file, self.compacting_file):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+        self._journal_bytes = 0
+        self._journal_records = 0
+        self._journal_started_at = None
+
+    def _schedule_compaction_unlocked(self) -> None:
+        """Start a background compaction unless one is already queued."""
+        if self._compaction_pending:
+            return
+        self._compaction_pending = True
+        thread = threading.Thread(
+            target=self._background_compact,
+            name="nova-memory-compactor",
+            daemon=True,
+        )
+        thread.start()
 
-    def _save_unlocked(self) -> None:
-        """Save without lock (for internal use)."""
+    def _background_compact(self) -> None:
+        try:
+            self.compact()
+        except Exception as e:
+            logger.warning("Background memory compaction failed: %s", e, exc_info=True)
+        finally:
+            with self._lock:
+                self._compaction_pending = False
+
+    def compact(self) -> bool:
+        """
+        Fold the journal into the typed snapshot files.
+        
+        The live journal is rotated aside under the lock; the snapshot is
+        written outside it so store/update/delete keep appending to a fresh
+        journal meanwhile. The rotated segment is removed only after the
+        snapshot is on disk, so a crash at any point loses nothing.
+        
+        Returns:
+            True if a compaction ran, False if there was nothing to compact
+            (or the store is read-only)
+        """
+        if self.read_only:
+            return False
+        self._load()
+        with self._compact_lock:
+            started = time.perf_counter()
+
+            with self._lock:
+                if (
+                    self._journal_records == 0
+                    and not self._snapshot_stale
+                    and not self.compacting_file.exists()
+                ):
+                    return False
+
+                snapshot = [item.to_dict() for item in self._items.values()]
+                next_id = self._next_id
+                self._snapshot_stale = False
+
+                self._close_journal_unlocked()
+                if self.journal_file.exists():
+                    if self.compacting_file.exists():
+                        # Leftover from an interrupted compaction: keep both segments
+                        with self.compacting_file.open("a", encoding="utf-8") as dst:
+                            dst.write(self.journal_file.read_text(encoding="utf-8"))
+                        self.journal_file.unlink()
+                    else:
+                        os.replace(self.journal_file, self.compacting_file)
+
+                self._journal_bytes = 0
+                self._journal_records = 0
+                self._journal_started_at = None
+
+            self._write_snapshot(snapshot, next_id)
+
+            try:
+                self.compacting_file.unlink()
+            except FileNotFoundError:
+                pass
+
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            with self._lock:
+                self._compactions += 1
+                self._last_compaction_ms = round(elapsed_ms, 2)
+                self._last_compacted_at = datetime.now(timezone.utc).isoformat()
+
+        logger.debug("Compacted memory journal: %d items in %.1fms", len(snapshot), elapsed_ms)
+        return True
+
+    def shutdown(self) -> None:
+        """Stop the age timer and fold any pending journal into the snapshots."""
+        with self._lock:
+            timer = self._age_timer
+            self._age_timer = None
+        if timer is not None:
+            timer.cancel()
+        # Nothing to fold into if the store was never read or its directory is gone
+        if self._loaded and self.memory_dir.exists():
+            self.compact()
+
+    def storage_stats(self) -> Dict[str, Any]:
+        """Return backend name plus journal and trace-store statistics."""
+        return {"backend": "json", **self.journal_stats(), **self.trace_stats()}
+
+    def journal_stats(self) -> Dict[str, Any]:
+        """Return journal size and compaction statistics."""
+        with self._lock:
+            started = self._journal_started_at
+            return {
+                "journal_bytes": self._journal_bytes,
+                "journal_records": self._journal_records,
+                "journal_age_seconds": round(time.monotonic() - started, 1) if started is not None else 0.0,
+                "journal_max_bytes": self.journal_max_bytes,
+                "journal_max_age_seconds": self.journal_max_age,
+                "compaction_pending": self._compaction_pending,
+                "compactions": self._compactions,
+                "last_compaction_ms": self._last_compaction_ms,
+                "last_compacted_at": self._last_compacted_at,
+            }
+
+    # ---------- Snapshot files ----------
+
+    def _write_snapshot(self, items: List[Dict[str, Any]], next_id: int) -> None:
+        """Write typed files, meta and legacy file from a list of item dicts."""
         # Group items by type
         by_type: Dict[MemoryType, List[Dict[str, Any]]] = {
             "semantic": [],
@@ -439,26 +1063,36 @@ class LongTermMemory:
             "episodic": [],
         }
 
-        for item in self._items.values():
-            by_type[item.type].append(item.to_dict())
+        for item_data in items:
+            by_type.setdefault(item_data.get("type", "semantic"), []).append(item_data)
 
         # Save typed files
-        for mem_type, items in by_type.items():
-            file_path = self.files[mem_type]
-            data = {"version": "0.5.4", "items": items}
-            file_path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+        for mem_type, file_path in self.files.items():
+            data = {"version": "0.5.4", "items": by_type.get(mem_type, [])}
+            _atomic_write_text(file_path, json.dumps(data, indent=2, ensure_ascii=False))
 
         # Save meta
-        meta = {"version": "0.5.4", "next_id": self._next_id}
-        self.meta_file.write_text(json.dumps(meta, indent=2), encoding="utf-8")
+        meta = {"version": "0.5.4", "next_id": next_id}
+        _atomic_write_text(self.meta_file, json.dumps(meta, indent=2))
 
         # Also update legacy file for backward compatibility
         legacy_data = {
             "version": "0.5.4",
-            "next_id": self._next_id,
-            "items": [item.to_dict() for item in self._items.values()],
+            "next_id": next_id,
+            "items": items,
         }
-        self.legacy_file.write_text(json.dumps(legacy_data, indent=2, ensure_ascii=False), encoding="utf-8")
+        _atomic_write_text(self.legacy_file, json.dumps(legacy_data, indent=2, ensure_ascii=False))
+
+    def _save(self) -> None:
+        """Save all memory files."""
+        with self._lock:
+            self._save_unlocked()
+
+    def _save_unlocked(self) -> None:
+        """Write a full snapshot and clear the journal (for internal use)."""
+        self._write_snapshot([item.to_dict() for item in self._items.values()], self._next_id)
+        self._snapshot_stale = False
+        self._reset_journal_unlocked()
 
     def get_next_id(self) -> int:
         """Get and increment the next available ID."""
@@ -468,14 +1102,39 @@ class LongTermMemory:
             self._next_id += 1
             return nid
 
+    def get_next_ids(self, count: int) -> List[int]:
+        """Reserve `count` consecutive IDs."""
+        self._load()
+        with self._lock:
+            start = self._next_id
+            self._next_id += count
+            return list(range(start, start + count))
+
     def store(self, item: MemoryItem) -> MemoryItem:
         """Store a memory item."""
         self._load()
         with self._lock:
+            self._externalize_unlocked([item])
             self._items[item.id] = item
-            self._save_unlocked()
+            self._append_unlocked({"op": "put", "item": item.to_dict(), "next_id": self._next_id})
         return item
 
+    def store_many(self, items: List[MemoryItem]) -> int:
+        """Store multiple memory items with a single journal record."""
+        self._load()
+        if not items:
+            return 0
+        with self._lock:
+            self._externalize_unlocked(items)
+            for item in items:
+                self._items[item.id] = item
+            self._append_unlocked({
+                "op": "put",
+                "items": [item.to_dict() for item in items],
+                "next_id": self._next_id,
+            })
+        return len(items)
+
     def get(self, item_id: int) -> Optional[MemoryItem]:
         """Get a memory item by ID."""
         self._load()
@@ -491,23 +1150,24 @@ class LongTermMemory:
         self._load()
         with self._lock:
             if item_id in self._items:
-                del self._items[item_id]
-                self._save_unlocked()
+                self._append_unlocked({"op": "delete", "ids": [item_id]})
+                self._forget_traces_unlocked([self._items.pop(item_id)])
                 return True
         return False
 
     def delete_many(self, item_ids: List[int]) -> int:
         """Delete multiple memory items. Returns count deleted."""
         self._load()
-        count = 0
+        deleted: List[MemoryItem] = []
         with self._lock:
             for item_id in item_ids:
-                if item_id in self._items:
-                    del self._items[item_id]
-                    count += 1
-            if count > 0:
-                self._save_unlocked()
-        return count
+                item = self._items.pop(item_id, None)
+                if item is not None:
+                    deleted.append(item)
+            if deleted:
+                self._append_unlocked({"op": "delete", "ids": [item.id for item in deleted]})
+                self._forget_traces_unlocked(deleted)
+        return len(deleted)
 
     def update(self, item: MemoryItem) -> bool:
         """Update a memory item."""
@@ -515,25 +1175,70 @@ class LongTermMemory:
         with self._lock:
             if item.id in self._items:
                 item.version = self._items[item.id].version + 1
+                self._externalize_unlocked([item])
                 self._items[item.id] = item
-                self._save_unlocked()
+                self._append_unlocked({"op": "update", "item": item.to_dict()})
                 return True
         return False
 
+    def update_many(self, items: List[MemoryItem]) -> int:
+        """Update multiple memory items with a single journal record. Returns count updated."""
+        self._load()
+        updated: List[MemoryItem] = []
+        with self._lock:
+            for item in items:
+                if item.id in self._items:
+                    item.version = self._items[item.id].version + 1
+                    self._items[item.id] = item
+                    updated.append(item)
+            if updated:
+                self._externalize_unlocked(updated)
+                self._append_unlocked({"op": "update", "items": [item.to_dict() for item in updated]})
+        return len(updated)
+
+    def touch_many(self, stamps: Dict[int, str]) -> int:
+        """
+        Set last_used_at for many items with a single journal record.
+        
+        Args:
+            stamps: {item_id: last_used_at ISO timestamp}
+        
+        Returns:
+            Count of items updated
+        """
+        self._load()
+        touched: List[MemoryItem] = []
+        with self._lock:
+            for item_id, last_used_at in stamps.items():
+                item = self._items.get(item_id)
+                if item is not None:
+                    item.last_used_at = last_used_at
+                    touched.append(item)
+        return self.update_many(touched) if touched else 0
+
     def export_state(self) -> Dict[str, Any]:
-        """Export all memory state for snapshots."""
+        """Export all memory state for snapshots (full traces included)."""
         self._load()
+        with self._lock:
+            items = list(self._items.values())
+            next_id = self._next_id
         return {
             "version": "0.5.4",
-            "next_id": self._next_id,
-            "items": [item.to_dict() for item in self._items.values()],
+            "next_id": next_id,
+            "items": self._full_dicts(items),
         }
 
     def import_state(self, state: Dict[str, Any]) -> None:
         """Import memory state from snapshot."""
-        with self._lock:
+        if self.read_only:
+            raise RuntimeError(f"Memory store {self.memory_dir} is open read-only")
+        # Hold the compaction lock so a running compaction cannot overwrite
+        # the imported snapshot with older state.
+        with self._compact_lock, self._lock:
             self._items.clear()
             self._next_id = int(state.get("next_id", 1))
+            if self._traces is not None or self.trace_db_file.exists():
+                self._trace_store().clear()
             
             for item_data in state.get("items", []):
                 try:
@@ -542,14 +1247,41 @@ class LongTermMemory:
                 except Exception:
                     continue
             
+            self._externalize_unlocked(list(self._items.values()))
             self._loaded = True
             self._save_unlocked()
 
 
+def _atomic_write_text(path: Path, text: str) -> None:
+    """Write text to a temp file and rename it over `path`."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(text, encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
 # -----------------------------------------------------------------------------
 # Memory Engine (Main Coordinator)
 # -----------------------------------------------------------------------------
 
+# Seconds between a deferred touch and the batched write that persists it
+TOUCH_FLUSH_INTERVAL = 5.0
+
+# Accepted values for recall(touch=...): True is an alias for "deferred"
+TouchMode = Union[bool, Literal["deferred", "sync"]]
+
+# Engines still alive at interpreter exit are shut down by one hook; weak
+# references so short-lived engines (tests, tools) are not pinned until exit
+_live_engines: "weakref.WeakSet[MemoryEngine]" = weakref.WeakSet()
+
+
+def _shutdown_live_engines() -> None:
+    for engine in list(_live_engines):
+        engine.shutdown()
+
+
+atexit.register(_shutdown_live_engines)
+
+
 class MemoryEngine:
     """
     v0.5.4 Memory Engine — Main coordinator.
@@ -560,18 +1292,69 @@ class MemoryEngine:
     - MemoryIndex (fast lookups)
     
     Provides the core API for memory operations.
+    
+    v0.12: Access-time touches are buffered. Touched items are updated in
+    the index immediately, collected in a dirty set, and persisted as one
+    batched write on a timer, at interpreter exit, or on flush(). At exit
+    the journal is also compacted (shutdown()).
+    
+    v0.12: Stored memories are embedded (via the shared EmbeddingService)
+    into a persistent EmbeddingIndex (see embedding_index.py);
+    semantic_search() ranks them with one matrix-vector product. The index
+    is saved with the deferred writes. Writes only submit their payloads to
+    the service; vectors are indexed when its batch completes, and memories
+    from before the index existed are backfilled on a background thread.
+    
+    v0.12: Decay runs through a DecayScheduler (memory_lifecycle.py) —
+    a priority queue of when each memory next crosses a salience step or
+    status threshold. run_decay() only processes due memories and writes
+    them back in one batch.
+    
+    v0.12: store_version increases on every store, update, delete, decay
+    write, import and embedding change, so derived views (the rendered
+    LTM persona block) can be cached against it. Touches do not bump it:
+    they never change recall order or payloads.
     """
 
-    def __init__(self, data_dir: Path):
+    def __init__(self, data_dir: Path, backend: str = "json"):
         self.data_dir = data_dir
+        self.backend = backend
         self.working = WorkingMemory()
-        self.long_term = LongTermMemory(data_dir)
-        self.index = MemoryIndex()
+        
+        if backend == "sqlite":
+            from .memory_sqlite import SQLiteLongTermMemory, SQLiteMemoryIndex
+            self.long_term = SQLiteLongTermMemory(data_dir)
+            self.index = SQLiteMemoryIndex(self.long_term)
+        elif backend == "json":
+            self.long_term = LongTermMemory(data_dir)
+            self.index = MemoryIndex()
+        else:
+            raise ValueError(f"Unknown memory backend: {backend!r} (expected 'json' or 'sqlite')")
         
         # Policy hooks (set by MemoryManager)
         self.pre_store_hook: Optional[Callable[[MemoryItem, Dict[str, Any]], bool]] = None
         self.post_recall_hook: Optional[Callable[[MemoryItem], MemoryItem]] = None
         
+        # Touch buffer
+        self._dirty_touches: Dict[int, str] = {}  # id -> last_used_at
+        self._touch_lock = threading.Lock()
+        self._touch_timer: Optional[threading.Timer] = None
+        self._touch_flushes: int = 0
+        _live_engines.add(self)
+        
+        # Embedding index (created on first use; None if numpy is missing)
+        self._embeddings = None
+        self._embeddings_lock = threading.Lock()
+        self._embeddings_backfilled = False
+        
+        # Decay scheduler (built from the store on first use)
+        self._decay = None
+        self._decay_lock = threading.Lock()
+        
+        # Store version (see store_version)
+        self._store_version = 0
+        self._version_lock = threading.Lock()
+        
         self._initialized = False
 
     def initialize(self) -> None:
@@ -580,10 +1363,19 @@ class MemoryEngine:
             return
         
         # Load long-term memory and build index
-        items = self.long_term.get_all()
-        self.index.rebuild(items)
+        if self.index.in_memory:
+            self.index.rebuild(self.long_term.get_all())
         self._initialized = True
 
+    @property
+    def store_version(self) -> int:
+        """Monotonic counter of changes to stored memories (this process)."""
+        return self._store_version
+
+    def _bump_version(self) -> None:
+        with self._version_lock:
+            self._store_version += 1
+
     def store(
         self,
         payload: str,
@@ -603,21 +1395,14 @@ class MemoryEngine:
         """
         self.initialize()
         
-        # Determine salience
-        if salience is None:
-            salience = DEFAULT_SALIENCE.get(mem_type, 0.5)
-        
-        # Build item
-        item = MemoryItem(
-            id=self.long_term.get_next_id(),
-            type=mem_type,
-            tags=tags or ["general"],
-            payload=payload,
-            timestamp=datetime.now(timezone.utc).isoformat(),
-            trace=trace or {},
+        item = self._build_item(
+            self.long_term.get_next_id(),
+            payload,
+            mem_type=mem_type,
+            tags=tags,
+            trace=trace,
             source=source,
             salience=salience,
-            status="active",
             confidence=confidence,
             module_tag=module_tag,
         )
@@ -634,6 +1419,9 @@ class MemoryEngine:
         
         # Update index
         self.index.add(item)
+        self._bump_version()
+        self.embed_items([item], wait=False)
+        self._reschedule_decay([item])
         
         # Add to working memory if session provided
         if session_id:
@@ -641,6 +1429,166 @@ class MemoryEngine:
         
         return item
 
+    @staticmethod
+    def _build_item(
+        item_id: int,
+        payload: str,
+        mem_type: MemoryType = "semantic",
+        tags: Optional[List[str]] = None,
+        trace: Optional[Dict[str, Any]] = None,
+        source: str = "user",
+        salience: Optional[float] = None,
+        confidence: float = 1.0,
+        module_tag: Optional[str] = None,
+        timestamp: Optional[str] = None,
+    ) -> MemoryItem:
+        """Build a new active MemoryItem with store() defaults."""
+        if salience is None:
+            salience = DEFAULT_SALIENCE.get(mem_type, 0.5)
+        return MemoryItem(
+            id=item_id,
+            type=mem_type,
+            tags=tags or ["general"],
+            payload=payload,
+            timestamp=timestamp or datetime.now(timezone.utc).isoformat(),
+            trace=trace or {},
+            source=source,
+            salience=salience,
+            status="active",
+            confidence=confidence,
+            module_tag=module_tag,
+        )
+
+    # ---------- v0.12 Batch Transactions ----------
+
+    # Fields update_many() may change
+    UPDATABLE_FIELDS = (
+        "payload", "tags", "trace", "cluster_id", "source", "salience",
+        "status", "confidence", "last_used_at", "module_tag",
+    )
+
+    def store_many(
+        self,
+        entries: List[Dict[str, Any]],
+        session_id: Optional[str] = None,
+    ) -> List[MemoryItem]:
+        """
+        Store several memories as one transaction.
+        
+        Each entry takes store()'s keyword arguments (payload, mem_type,
+        tags, trace, source, salience, confidence, module_tag). Entries the
+        pre-store hook rejects are skipped. All items are persisted with
+        one write and indexed under one index lock.
+        
+        Returns:
+            The stored items (in entry order)
+        """
+        self.initialize()
+        if not entries:
+            return []
+        
+        timestamp = datetime.now(timezone.utc).isoformat()
+        ids = self.long_term.get_next_ids(len(entries))
+        items: List[MemoryItem] = []
+        for item_id, entry in zip(ids, entries):
+            item = self._build_item(item_id, timestamp=timestamp, **entry)
+            if self.pre_store_hook:
+                meta = {"source": item.source, "session_id": session_id}
+                if not self.pre_store_hook(item, meta):
+                    logger.debug("Memory store rejected by policy: %s", item.payload[:60])
+                    continue
+            items.append(item)
+        
+        if not items:
+            return []
+        
+        self.long_term.store_many(items)
+        self.index.add_many(items)
+        self._bump_version()
+        self.embed_items(items, wait=False)
+        self._reschedule_decay(items)
+        
+        if session_id:
+            for item in items:
+                self.working.add(session_id, item)
+        
+        return items
+
+    def update_many(self, updates: List[Dict[str, Any]]) -> int:
+        """
+        Apply field updates to several memories as one transaction.
+        
+        Args:
+            updates: [{"id": X, "<field>": value, ...}] — fields from
+                UPDATABLE_FIELDS; salience is clamped to [0, 1]
+        
+        Returns:
+            Count of memories changed (unchanged ones are not written)
+        """
+        self.initialize()
+        
+        # Validate every patch before touching the (shared) indexed items
+        for update in updates:
+            unknown = set(update) - {"id"} - set(self.UPDATABLE_FIELDS)
+            if unknown:
+                raise ValueError(f"Cannot update memory field(s): {', '.join(sorted(unknown))}")
+        
+        changed: Dict[int, MemoryItem] = {}
+        reembed: Dict[int, MemoryItem] = {}
+        for update in updates:
+            item_id = update.get("id")
+            item = changed.get(item_id) or (self.index.get(item_id) if item_id is not None else None)
+            if item is None:
+                continue
+            
+            for name, value in update.items():
+                if name == "id":
+                    continue
+                if name == "salience":
+                    value = max(0.0, min(1.0, float(value)))
+                if getattr(item, name) != value:
+                    setattr(item, name, value)
+                    changed[item.id] = item
+                    if name == "payload":
+                        reembed[item.id] = item
+        
+        count = self._commit_items(list(changed.values()))
+        if reembed:
+            self.embed_items(list(reembed.values()), force=True, wait=False)
+        return count
+
+    def delete_many(self, item_ids: List[int]) -> int:
+        """
+        Delete several memories as one transaction.
+        
+        Returns count deleted.
+        """
+        self.initialize()
+        ids = list(dict.fromkeys(int(i) for i in item_ids))
+        if not ids:
+            return 0
+        
+        self.index.remove_many(ids)
+        count = self.long_term.delete_many(ids)
+        self._bump_version()
+        if self._decay is not None:
+            self._decay.discard(ids)
+        if self._embeddings is not None:
+            self._embeddings.remove(ids)
+            with self._touch_lock:
+                self._schedule_flush_unlocked()
+        return count
+
+    def _commit_items(self, items: List[MemoryItem]) -> int:
+        """Persist already-mutated items with one write and re-index them."""
+        if not items:
+            return 0
+        count = self.long_term.update_many(items)
+        self.index.update_many(items)
+        self._bump_version()
+        self._reschedule_decay(items)
+        return count
+
     def recall(
         self,
         mem_type: Optional[MemoryType] = None,
@@ -649,12 +1597,15 @@ class MemoryEngine:
         status: Optional[MemoryStatus] = None,
         min_salience: Optional[float] = None,
         limit: int = 20,
-        touch: bool = True,
+        touch: TouchMode = True,
     ) -> List[MemoryItem]:
         """
         Recall memories matching filters.
         
-        If touch=True, updates last_used_at for returned items.
+        touch controls last_used_at updates for returned items:
+        - True / "deferred": update in memory now, persist in the next batched flush
+        - "sync": update and persist immediately (one batched write)
+        - False: leave last_used_at untouched
         """
         self.initialize()
         
@@ -667,14 +1618,12 @@ class MemoryEngine:
             limit=limit,
         )
         
-        # Touch items and apply post-recall hook
+        if touch and items:
+            self._touch_items(items, touch)
+        
+        # Apply post-recall hook
         result = []
         for item in items:
-            if touch:
-                item.touch()
-                self.long_term.update(item)
-                self.index.update(item)
-            
             if self.post_recall_hook:
                 item = self.post_recall_hook(item)
             
@@ -682,6 +1631,73 @@ class MemoryEngine:
         
         return result
 
+    def touch(self, item_ids: List[int], mode: TouchMode = "deferred") -> int:
+        """
+        Update last_used_at for the given memory ids.
+        
+        Returns count of items touched.
+        """
+        self.initialize()
+        items = [item for item in (self.index.get(i) for i in item_ids) if item]
+        if items:
+            self._touch_items(items, mode)
+        return len(items)
+
+    def _touch_items(self, items: List[MemoryItem], mode: TouchMode) -> None:
+        """Touch items in memory and persist now ("sync") or via the buffer."""
+        for item in items:
+            item.touch()
+        stamps = {item.id: item.last_used_at for item in items}
+        
+        if mode == "sync":
+            self.long_term.touch_many(stamps)
+            with self._touch_lock:
+                for item_id in stamps:
+                    self._dirty_touches.pop(item_id, None)
+            return
+        
+        with self._touch_lock:
+            self._dirty_touches.update(stamps)
+            self._schedule_flush_unlocked()
+
+    def _schedule_flush_unlocked(self) -> None:
+        """Arm the deferred-write timer (caller holds _touch_lock)."""
+        if self._touch_timer is None:
+            self._touch_timer = threading.Timer(TOUCH_FLUSH_INTERVAL, self.flush)
+            self._touch_timer.daemon = True
+            self._touch_timer.start()
+
+    def flush(self) -> int:
+        """
+        Persist all buffered touches in one batched write, and save the
+        embedding index if it changed.
+        
+        Returns count of items written.
+        """
+        with self._touch_lock:
+            dirty = self._dirty_touches
+            self._dirty_touches = {}
+            timer = self._touch_timer
+            self._touch_timer = None
+        
+        if timer is not None:
+            timer.cancel()
+        
+        embeddings = self._embeddings
+        if embeddings is not None and embeddings.dirty:
+            try:
+                embeddings.save()
+            except Exception as e:
+                logger.warning("Failed to save embedding index: %s", e)
+        
+        if not dirty:
+            return 0
+        
+        count = self.long_term.touch_many(dirty)
+        with self._touch_lock:
+            self._touch_flushes += 1
+        return count
+
     def forget(
         self,
         ids: Optional[List[int]] = None,
@@ -702,25 +1718,261 @@ class MemoryEngine:
         
         # By type (if no IDs specified)
         if mem_type and not ids:
-            type_ids = self.index.by_type.get(mem_type, set())
-            to_delete.update(type_ids)
+            to_delete.update(self.index.ids_by_type(mem_type))
         
         # By tags
         if tags:
             for tag in tags:
-                tag_ids = self.index.by_tag.get(tag, set())
+                tag_ids = self.index.ids_by_tag(tag)
                 if ids or mem_type:
                     # Intersect if other filters present
                     to_delete &= tag_ids
                 else:
                     to_delete.update(tag_ids)
         
-        # Delete
-        for item_id in list(to_delete):
-            self.index.remove(item_id)
+        return self.delete_many(sorted(to_delete))
+
+    # ---------- v0.12 Embedding Index ----------
+
+    def get_embedding_index(self):
+        """Return the EmbeddingIndex, creating it on first use (None without numpy)."""
+        if self._embeddings is not None:
+            return self._embeddings
+        with self._embeddings_lock:
+            if self._embeddings is None:
+                from .embedding_index import EmbeddingIndex, EMBEDDING_INDEX_AVAILABLE
+                if not EMBEDDING_INDEX_AVAILABLE:
+                    return None
+                self._embeddings = EmbeddingIndex(self.long_term.memory_dir)
+        return self._embeddings
+
+    def embed_items(self, items: List[MemoryItem], force: bool = False, wait: bool = True) -> int:
+        """
+        Add vectors for items to the embedding index.
         
-        count = self.long_term.delete_many(list(to_delete))
-        return count
+        Uses trace['embedding'] when present, otherwise encodes the payload.
+        Items already indexed are skipped unless force=True. Safe no-op when
+        embeddings are unavailable.
+        
+        With wait=False the payloads are only submitted to the embedding
+        service; the vectors are indexed from its completion callback
+        (skipping memories deleted meanwhile) and 0 is returned at once.
+        
+        Returns:
+            Count of vectors written
+        """
+        if not items:
+            return 0
+        try:
+            from kernel.utils.embedding_service import get_embedding_service
+        except ImportError:
+            return 0
+        service = get_embedding_service(self.data_dir)
+        if not service.is_available():
+            return 0
+        index = self.get_embedding_index()
+        if index is None:
+            return 0
+        
+        pending = [item for item in items if item.payload and (force or item.id not in index)]
+        if not pending:
+            return 0
+        
+        vectors: List[Optional[List[float]]] = [None] * len(pending)
+        to_encode: List[int] = []
+        traces = self.long_term.load_traces(pending) if not force else [{}] * len(pending)
+        for pos, trace in enumerate(traces):
+            cached = trace.get("embedding")
+            if cached and not force and len(cached) == index.dim:
+                vectors[pos] = cached
+            else:
+                to_encode.append(pos)
+        
+        if not to_encode:
+            return self._index_vectors(index, pending, vectors)
+        
+        def finish(future) -> int:
+            try:
+                encoded = future.result()
+            except Exception as e:
+                logger.debug("Failed to embed memories: %s", e)
+                encoded = None
+            if encoded is not None:
+                for pos, vector in zip(to_encode, encoded):
+                    vectors[pos] = vector
+            if not wait:
+                live = [pos for pos, item in enumerate(pending) if self.index.get(item.id) is not None]
+                return self._index_vectors(index, [pending[pos] for pos in live], [vectors[pos] for pos in live])
+            return self._index_vectors(index, pending, vectors)
+        
+        future = service.encode_async([pending[pos].payload for pos in to_encode])
+        if wait:
+            return finish(future)
+        future.add_done_callback(finish)
+        return 0
+
+    def _index_vectors(self, index, items: List[MemoryItem], vectors: List[Optional[List[float]]]) -> int:
+        """Write vectors to the embedding index and schedule its save."""
+        try:
+            written = index.add_many(
+                (item.id, item.type, vector) for item, vector in zip(items, vectors)
+            )
+        except ValueError as e:
+            logger.warning("Skipping embeddings with unexpected shape: %s", e)
+            return 0
+        
+        if written:
+            self._bump_version()
+            with self._touch_lock:
+                self._schedule_flush_unlocked()
+        return written
+
+    def rebuild_embeddings(self) -> Dict[str, Any]:
+        """
+        Re-encode every memory into a fresh embedding index and save it.
+        
+        Returns:
+            {"indexed": N, "total": M, "elapsed_ms": T} or {"error": ...}
+        """
+        self.initialize()
+        index = self.get_embedding_index()
+        if index is None:
+            return {"error": "numpy is not installed"}
+        
+        started = time.perf_counter()
+        items = self.long_term.get_all()
+        index.clear()
+        self._bump_version()
+        indexed = 0
+        for start in range(0, len(items), 256):
+            indexed += self.embed_items(items[start:start + 256], force=True)
+        index.save()
+        self._embeddings_backfilled = True
+        return {
+            "indexed": indexed,
+            "total": len(items),
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+        }
+
+    def _backfill_embeddings(self) -> None:
+        """Start embedding memories stored before the index existed (once per process)."""
+        with self._embeddings_lock:
+            if self._embeddings_backfilled:
+                return
+            self._embeddings_backfilled = True
+        threading.Thread(
+            target=self._run_backfill,
+            name="nova-embedding-backfill",
+            daemon=True,
+        ).start()
+
+    def _run_backfill(self) -> None:
+        """Backfill thread: embed unindexed memories in chunks."""
+        index = self.get_embedding_index()
+        if index is None:
+            return
+        try:
+            missing = [item for item in self.long_term.get_all() if item.id not in index]
+            for start in range(0, len(missing), 256):
+                self.embed_items(missing[start:start + 256])
+        except Exception as e:
+            logger.warning("Embedding backfill failed: %s", e, exc_info=True)
+
+    def semantic_search(
+        self,
+        query_vector: List[float],
+        limit: int = 10,
+        min_similarity: float = 0.0,
+        mem_type: Optional[MemoryType] = None,
+        tags: Optional[List[str]] = None,
+        module_tag: Optional[str] = None,
+        status: Optional[MemoryStatus] = None,
+    ) -> Optional[List[tuple]]:
+        """
+        Top-k cosine search over the embedding index.
+        
+        Filters become boolean masks: mem_type via the index's type column,
+        tags/module/status via id sets from the MemoryIndex. Memories whose
+        vectors are still being encoded (fresh stores, the first-search
+        backfill) are not ranked until they land in the index.
+        
+        Returns:
+            [(MemoryItem, similarity)] sorted descending, or None when the
+            embedding index is unavailable (caller should fall back)
+        """
+        self.initialize()
+        index = self.get_embedding_index()
+        if index is None:
+            return None
+        self._backfill_embeddings()
+        
+        allowed: Optional[Set[int]] = None
+        if tags:
+            allowed = set()
+            for tag in tags:
+                allowed |= self.index.ids_by_tag(tag)
+        if module_tag:
+            module_ids = self.index.ids_by_module(module_tag)
+            allowed = module_ids if allowed is None else allowed & module_ids
+        if status:
+            status_ids = self.index.ids_by_status(status)
+            allowed = status_ids if allowed is None else allowed & status_ids
+        
+        hits = index.search(
+            query_vector,
+            k=limit,
+            mem_type=mem_type,
+            allowed_ids=allowed,
+            min_score=min_similarity,
+        )
+        
+        results = []
+        for item_id, score in hits:
+            item = self.index.get(item_id)
+            if item is None:
+                continue
+            if self.post_recall_hook:
+                item = self.post_recall_hook(item)
+            results.append((item, score))
+        return results
+
+    def keyword_search(
+        self,
+        query: str,
+        mem_type: Optional[MemoryType] = None,
+        module_tag: Optional[str] = None,
+        status: Optional[MemoryStatus] = None,
+        limit: int = 20,
+        touch: TouchMode = True,
+    ) -> List[tuple]:
+        """
+        BM25 keyword search over all memory payloads (plus salience).
+        
+        Returns:
+            [(MemoryItem, score)] sorted by score descending
+        """
+        self.initialize()
+        terms = tokenize_text(query)
+        if not terms:
+            return []
+        
+        hits = self.index.keyword_search(
+            terms,
+            mem_type=mem_type,
+            module_tag=module_tag,
+            status=status,
+            limit=limit,
+        )
+        
+        if touch and hits:
+            self._touch_items([item for item, _ in hits], touch)
+        
+        results = []
+        for item, score in hits:
+            if self.post_recall_hook:
+                item = self.post_recall_hook(item)
+            results.append((item, score))
+        return results
 
     def trace(self, item_id: int) -> Optional[Dict[str, Any]]:
         """Get full trace/metadata for a memory item."""
@@ -735,7 +1987,7 @@ class MemoryEngine:
             "type": item.type,
             "tags": item.tags,
             "timestamp": item.timestamp,
-            "trace": item.trace,
+            "trace": self.long_term.load_trace(item),
             "cluster_id": item.cluster_id,
             "source": item.source,
             "salience": item.salience,
@@ -759,12 +2011,7 @@ class MemoryEngine:
         cluster_id = max(existing_clusters) + 1 if existing_clusters else 1
         
         # Update items
-        for item_id in ids:
-            item = self.index.get(item_id)
-            if item:
-                item.cluster_id = cluster_id
-                self.long_term.update(item)
-                self.index.update(item)
+        self.update_many([{"id": item_id, "cluster_id": cluster_id} for item_id in ids])
         
         return cluster_id
 
@@ -777,8 +2024,7 @@ class MemoryEngine:
             return False
         
         item.salience = max(0.0, min(1.0, salience))
-        self.long_term.update(item)
-        self.index.update(item)
+        self._commit_items([item])
         return True
 
     def update_status(self, item_id: int, status: MemoryStatus) -> bool:
@@ -790,8 +2036,7 @@ class MemoryEngine:
             return False
         
         item.status = status
-        self.long_term.update(item)
-        self.index.update(item)
+        self._commit_items([item])
         return True
 
     def get_health(self) -> Dict[str, Any]:
@@ -811,6 +2056,30 @@ class MemoryEngine:
             "unique_modules": stats["unique_modules"],
         }
 
+    def get_storage_stats(self) -> Dict[str, Any]:
+        """Return persistence statistics (journal size, compaction timing, touch buffer)."""
+        stats = self.long_term.storage_stats()
+        with self._touch_lock:
+            stats["pending_touches"] = len(self._dirty_touches)
+            stats["touch_flushes"] = self._touch_flushes
+        if self._embeddings is not None:
+            stats["embeddings"] = self._embeddings.stats()
+        return stats
+
+    def compact(self) -> bool:
+        """Flush buffered touches, then fold the journal into the snapshot files."""
+        self.flush()
+        return self.long_term.compact()
+
+    def shutdown(self) -> None:
+        """Flush buffered writes and compact the store (runs at interpreter exit)."""
+        _live_engines.discard(self)
+        self.flush()
+        try:
+            self.long_term.shutdown()
+        except Exception as e:
+            logger.warning("Memory store shutdown failed: %s", e)
+
     def get_working_memory(self, session_id: str, limit: int = 10) -> List[MemoryItem]:
         """Get recent working memory for a session."""
         return self.working.get(session_id, limit)
@@ -825,10 +2094,23 @@ class MemoryEngine:
         return self.long_term.export_state()
 
     def import_state(self, state: Dict[str, Any]) -> None:
-        """Import memory state from snapshot."""
+        """
+        Import memory state from snapshot.
+        
+        One snapshot write and one index rebuild; buffered touches, the
+        embedding index and the decay queue belonged to the replaced state
+        and are reset.
+        """
+        with self._touch_lock:
+            self._dirty_touches.clear()
         self.long_term.import_state(state)
-        items = self.long_term.get_all()
-        self.index.rebuild(items)
+        if self.index.in_memory:
+            self.index.rebuild(self.long_term.get_all())
+        if self._embeddings is not None:
+            self._embeddings.clear()
+            self._embeddings_backfilled = False
+        self._decay = None
+        self._bump_version()
         self._initialized = True
 
     # ---------- v0.5.6 Lifecycle Integration ----------
@@ -840,6 +2122,95 @@ class MemoryEngine:
         self.initialize()
         return [item.to_dict() for item in self.long_term.get_all()]
 
+    def get_decay_scheduler(self) -> "DecayScheduler":
+        """Return the DecayScheduler, building its queue from the store on first use."""
+        if self._decay is not None:
+            return self._decay
+        with self._decay_lock:
+            if self._decay is None:
+                self.initialize()
+                scheduler = DecayScheduler()
+                items = self.index.by_id.values() if self.index.in_memory else self.long_term.get_all()
+                scheduler.rebuild(list(items))
+                self._decay = scheduler
+        return self._decay
+
+    def _reschedule_decay(self, items: List[MemoryItem]) -> None:
+        """Recompute decay deadlines after salience/status/usage changes."""
+        if self._decay is not None and items:
+            self._decay.schedule(items)
+
+    def run_decay(self, now: Optional[datetime] = None) -> Dict[str, int]:
+        """
+        Decay the memories whose deadline has passed.
+        
+        Due items are re-checked (a touch since scheduling pushes the
+        deadline back), decayed/transitioned in place, written with one
+        update_many() call and re-queued.
+        
+        Returns:
+            {"due", "decayed_salience", "marked_stale", "archived",
+             "profile_protected", "written"}
+        """
+        scheduler = self.get_decay_scheduler()
+        started = time.perf_counter()
+        now_ts = (now or datetime.now(timezone.utc)).timestamp()
+        
+        results = {
+            "due": 0,
+            "decayed_salience": 0,
+            "marked_stale": 0,
+            "archived": 0,
+            "profile_protected": 0,
+            "written": 0,
+        }
+        event_keys = {
+            "decayed": "decayed_salience",
+            "marked_stale": "marked_stale",
+            "archived": "archived",
+            "profile_protected": "profile_protected",
+        }
+        
+        due_ids = scheduler.pop_due(now_ts)
+        results["due"] = len(due_ids)
+        
+        changed: List[MemoryItem] = []
+        requeue: List[MemoryItem] = []
+        for item_id in due_ids:
+            item = self.index.get(item_id)
+            if item is None:
+                continue
+            due = scheduler.next_due(item, now_ts)
+            if due is None:
+                continue
+            if due > now_ts:
+                requeue.append(item)
+                continue
+            before = (item.salience, item.status)
+            for event in scheduler.apply(item, now_ts):
+                results[event_keys[event]] += 1
+            if (item.salience, item.status) != before:
+                changed.append(item)
+            requeue.append(item)
+        
+        if changed:
+            results["written"] = self.long_term.update_many(changed)
+            self.index.update_many(changed)
+            self._bump_version()
+        scheduler.schedule(requeue, now_ts)
+        
+        scheduler.record_run(
+            due=results["due"],
+            written=results["written"],
+            elapsed_ms=(time.perf_counter() - started) * 1000,
+            now=now_ts,
+        )
+        return results
+
+    def get_decay_stats(self) -> Dict[str, Any]:
+        """Decay queue depth, next due time and last run."""
+        return self.get_decay_scheduler().stats()
+
     def apply_decay_updates(self, updates: List[Dict[str, Any]]) -> int:
         """
         Apply decay updates from lifecycle processing.
@@ -850,37 +2221,18 @@ class MemoryEngine:
         Returns:
             Count of memories updated
         """
-        self.initialize()
-        count = 0
-        
+        batch = []
         for update in updates:
-            item_id = update.get("id")
-            new_salience = update.get("new_salience")
-            new_status = update.get("new_status")
-            
-            if item_id is None:
+            if update.get("id") is None:
                 continue
-            
-            item = self.index.get(item_id)
-            if not item:
-                continue
-            
-            changed = False
-            
-            if new_salience is not None and item.salience != new_salience:
-                item.salience = new_salience
-                changed = True
-            
-            if new_status is not None and item.status != new_status:
-                item.status = new_status
-                changed = True
-            
-            if changed:
-                self.long_term.update(item)
-                self.index.update(item)
-                count += 1
+            change: Dict[str, Any] = {"id": update["id"]}
+            if update.get("new_salience") is not None:
+                change["salience"] = update["new_salience"]
+            if update.get("new_status") is not None:
+                change["status"] = update["new_status"]
+            batch.append(change)
         
-        return count
+        return self.update_many(batch)
 
     def get_stale_memories(self, limit: int = 50) -> List[MemoryItem]:
         """Get memories with stale status."""
@@ -898,18 +2250,7 @@ class MemoryEngine:
         
         Returns count updated.
         """
-        self.initialize()
-        count = 0
-        
-        for item_id in ids:
-            item = self.index.get(item_id)
-            if item and item.status != status:
-                item.status = status
-                self.long_term.update(item)
-                self.index.update(item)
-                count += 1
-        
-        return count
+        return self.update_many([{"id": item_id, "status": status} for item_id in ids])
 
     def reconfirm_memory(self, item_id: int, new_salience: Optional[float] = None) -> bool:
         """
@@ -941,7 +2282,6 @@ class MemoryEngine:
         # Touch the memory
         item.touch()
         
-        self.long_term.update(item)
-        self.index.update(item)
+        self._commit_items([item])
         return True
 
@@ -17,10 +17,15 @@ rather than crashing the system.
 from __future__ import annotations
 
 import re
+import hashlib
 import logging
 from datetime import datetime, timezone, timedelta
 from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 
+from .memory_engine import tokenize_text
+from .extraction_pipeline import PRIORITY_HIGH, PRIORITY_LOW, get_extraction_pipeline
+from .ltm_context_cache import LTMContextEntry
+
 if TYPE_CHECKING:
     from .memory_manager import MemoryManager
     from .nova_wm import NovaWorkingMemory
@@ -851,6 +856,7 @@ def build_ltm_context_for_persona(
     # PATCHED v0.11.0-fix1: Accept both old and new parameter names
     current_module: Optional[str] = None,  # Alias for module_tag (backward compat)
     user_text: Optional[str] = None,       # For future relevance scoring
+    session_id: Optional[str] = None,
 ) -> str:
     """
     Build the full LTM context string for injection into persona prompts.
@@ -864,23 +870,40 @@ def build_ltm_context_for_persona(
     PATCHED v0.11.0-fix6:
     - Touch memories on retrieval (update last_used_at)
     
+    v0.12: The rendered block is cached in memory_manager.ltm_cache per
+    (session, module, query signature) and reused while the store version
+    is unchanged. The query signature is empty unless embedding search is
+    active, since only then does user_text change the result.
+    
     Args:
         memory_manager: MemoryManager instance
         module_tag: Optional current module for scoped retrieval
         current_module: Alias for module_tag (for backward compatibility with callers)
         user_text: Optional user text for relevance scoring (future use)
+        session_id: Optional session the block is cached under
     
     Returns:
         Formatted LTM context string
     """
     # PATCHED: Support both parameter names
     effective_module = module_tag or current_module
+    use_semantic = bool(user_text) and _check_embeddings_available()
+    
+    cache = getattr(memory_manager, "ltm_cache", None)
+    version = getattr(memory_manager, "store_version", None)
+    key = None
+    if cache is not None and isinstance(version, int):
+        key = (session_id or "default", effective_module or "", _ltm_query_signature(user_text) if use_semantic else "")
+        entry = cache.get(key, version)
+        if entry is not None:
+            _touch_memory_ids(memory_manager, entry.memory_ids)
+            return entry.context
     
     try:
         profile_memories = get_profile_memories(memory_manager, limit=10)
         
         # v0.11.0-fix6: Use semantic search if user_text provided and embeddings available
-        if user_text and _check_embeddings_available():
+        if use_semantic:
             semantic_memories = get_relevant_semantic_memories_v2(
                 memory_manager,
                 user_text=user_text,
@@ -904,20 +927,31 @@ def build_ltm_context_for_persona(
             logger.debug(
                 "LTM context: %d profile memories, %d semantic memories (touched, semantic=%s)",
                 len(profile_memories), len(semantic_memories), 
-                user_text is not None and _check_embeddings_available()
+                use_semantic
             )
         
+        if key is not None:
+            memory_ids = [mem_id for mem_id in (getattr(m, 'id', None) for m in all_used_memories) if mem_id is not None]
+            cache.put(key, LTMContextEntry(version, context, memory_ids))
+        
         return context
     except Exception as e:
         logger.warning("Error building LTM context: %s", e, exc_info=True)
         return ""
 
 
+def _ltm_query_signature(user_text: str) -> str:
+    """Cache signature of the text an embedding search is run with."""
+    normalized = " ".join(user_text.lower().split())
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+
+
 def _touch_memories(memory_manager: "MemoryManager", memories: List[Any]) -> int:
     """
     Update last_used_at for retrieved memories.
     
     v0.11.0-fix6: Touching memories prevents them from decaying.
+    v0.12: Touches go through the engine's touch buffer (one batched write).
     
     Args:
         memory_manager: MemoryManager instance
@@ -926,24 +960,20 @@ def _touch_memories(memory_manager: "MemoryManager", memories: List[Any]) -> int
     Returns:
         Number of memories successfully touched
     """
-    touched = 0
-    now = datetime.now(timezone.utc).isoformat()
+    ids = [mem_id for mem_id in (getattr(item, 'id', None) for item in memories) if mem_id is not None]
+    return _touch_memory_ids(memory_manager, ids)
+
+
+def _touch_memory_ids(memory_manager: "MemoryManager", ids: List[int]) -> int:
+    """Touch memories by id (see _touch_memories)."""
+    if not ids:
+        return 0
     
-    for item in memories:
-        try:
-            mem_id = getattr(item, 'id', None)
-            if mem_id is not None:
-                # Try to update via engine directly
-                if hasattr(memory_manager, '_engine'):
-                    engine = memory_manager._engine
-                    engine_item = engine.index.get(mem_id)
-                    if engine_item:
-                        engine_item.last_used_at = now
-                        engine.long_term.update(engine_item)
-                        engine.index.update(engine_item)
-                        touched += 1
-        except Exception as e:
-            logger.debug("Failed to touch memory #%s: %s", getattr(item, 'id', '?'), e)
+    try:
+        touched = memory_manager.touch(ids, mode="deferred")
+    except Exception as e:
+        logger.debug("Failed to touch memories %s: %s", ids, e)
+        return 0
     
     if touched > 0:
         logger.debug("Touched %d memories (updated last_used_at)", touched)
@@ -961,48 +991,11 @@ def _tokenize_query(query: str) -> List[str]:
     
     - Lowercase
     - Remove punctuation
-    - Filter short words
-    """
-    # Remove punctuation and split
-    cleaned = re.sub(r'[^\w\s]', ' ', query.lower())
-    words = cleaned.split()
-    
-    # Filter short words and common stop words
-    stop_words = {'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
-                  'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
-                  'should', 'may', 'might', 'must', 'shall', 'can', 'to', 'of', 'in',
-                  'for', 'on', 'with', 'at', 'by', 'from', 'as', 'into', 'through',
-                  'during', 'before', 'after', 'above', 'below', 'between', 'and', 'or',
-                  'but', 'if', 'then', 'else', 'when', 'where', 'why', 'how', 'all',
-                  'each', 'every', 'both', 'few', 'more', 'most', 'other', 'some', 'such',
-                  'no', 'not', 'only', 'same', 'so', 'than', 'too', 'very', 'just', 'i',
-                  'me', 'my', 'myself', 'we', 'our', 'ours', 'you', 'your', 'yours',
-                  'he', 'him', 'his', 'she', 'her', 'hers', 'it', 'its', 'they', 'them',
-                  'their', 'what', 'which', 'who', 'whom', 'this', 'that', 'these', 'those'}
-    
-    keywords = [w for w in words if len(w) > 2 and w not in stop_words]
-    return keywords
-
-
-def _score_memory(item: Any, keywords: List[str]) -> float:
-    """
-    Score a memory item based on keyword matches.
+    - Filter short words and stop words
     
-    Returns:
-        Score combining match count + salience
+    Same tokenizer the MemoryIndex uses for payloads.
     """
-    payload_lower = item.payload.lower()
-    
-    match_count = 0
-    for keyword in keywords:
-        if keyword in payload_lower:
-            match_count += 1
-    
-    # Combine match count with salience
-    salience = getattr(item, 'salience', 0.5) or 0.5
-    score = match_count + salience
-    
-    return score
+    return tokenize_text(query)
 
 
 def search_by_keywords(
@@ -1014,11 +1007,13 @@ def search_by_keywords(
     limit: int = 20,
 ) -> List[Tuple[Any, float]]:
     """
-    Simple keyword-based retrieval over MemoryItem.payload.
+    Keyword-based retrieval over MemoryItem.payload.
     
     - Tokenize 'query' into keywords (lowercased).
-    - Filter candidates by type/module/status.
-    - Score each candidate: match_count + salience.
+    - Look the keywords up in the memory index's inverted index, so every
+      memory is searchable (not just the most salient ones).
+    - Filter by type/module/status.
+    - Score each match: BM25 relevance + salience.
     - Return top 'limit' items by score.
     
     Args:
@@ -1033,33 +1028,21 @@ def search_by_keywords(
         List of (MemoryItem, score) tuples sorted by score descending
     """
     try:
-        keywords = _tokenize_query(query)
-        
-        if not keywords:
+        if not _tokenize_query(query):
             logger.debug("No valid keywords in query: %s", query)
             return []
         
-        # Get candidate memories
-        candidates = memory_manager.recall(
+        results = memory_manager.keyword_search(
+            query,
             mem_type=mem_type,
             module_tag=module_tag,
             status=status,
-            limit=100,  # Get more candidates for scoring
+            limit=limit,
         )
         
-        # Score each candidate
-        scored = []
-        for item in candidates:
-            score = _score_memory(item, keywords)
-            if score > 0:  # Only include items with at least one match
-                scored.append((item, score))
-        
-        # Sort by score descending
-        scored.sort(key=lambda x: x[1], reverse=True)
+        logger.debug("Keyword search '%s': %d results", query, len(results))
         
-        logger.debug("Keyword search '%s': %d results from %d candidates", query, len(scored[:limit]), len(candidates))
-        
-        return scored[:limit]
+        return results
         
     except Exception as e:
         logger.warning("Error in keyword search: %s", e, exc_info=True)
@@ -1082,6 +1065,11 @@ def run_memory_decay(
     - Protects profile memories (higher min_salience)
     - Different decay rates by memory type (episodic fastest, procedural slowest)
     
+    v0.12: Runs through the engine's DecayScheduler — only memories whose
+    next salience/status threshold has passed are processed, and their
+    changes are written in one batch. Decay is measured from each
+    memory's last decay, so back-to-back runs don't decay twice.
+    
     Args:
         memory_manager: MemoryManager instance
         now: Optional datetime for testing (defaults to now)
@@ -1093,6 +1081,9 @@ def run_memory_decay(
             "archived": Z,
             "profile_protected": P,
             "errors": W,
+            "due": D,
+            "queue_depth": Q,
+            "next_due_at": T,
         }
     
     All errors are logged and swallowed.
@@ -1109,117 +1100,17 @@ def run_memory_decay(
     }
     
     try:
-        # Import MemoryLifecycle
-        try:
-            from kernel.memory_lifecycle import MemoryLifecycle, DecayConfig
-            
-            # Custom config with profile protection
-            config = DecayConfig()
-            lifecycle = MemoryLifecycle(config)
-            use_lifecycle = True
-        except ImportError:
-            logger.warning("MemoryLifecycle not available, using fallback decay")
-            use_lifecycle = False
+        run = memory_manager.run_decay(now=now)
+        results.update(run)
         
-        # Get all memories
-        all_active = memory_manager.recall(status="active", limit=1000)
-        all_stale = memory_manager.recall(status="stale", limit=1000)
-        
-        # Process active memories
-        for item in all_active:
-            try:
-                tags = getattr(item, 'tags', []) or []
-                current_salience = getattr(item, 'salience', 0.5) or 0.5
-                mem_type = getattr(item, 'type', 'semantic')
-                
-                # v0.11.0-fix6: Profile memory protection
-                is_profile = any(t.startswith("profile:") for t in tags)
-                if is_profile:
-                    # Profile memories have higher minimum salience (never go below 0.5)
-                    min_salience_for_item = 0.5
-                    results["profile_protected"] += 1
-                else:
-                    min_salience_for_item = 0.01
-                
-                # Parse timestamps
-                created_at = getattr(item, 'timestamp', None)
-                last_used_at = getattr(item, 'last_used_at', None)
-                
-                if use_lifecycle:
-                    # Use MemoryLifecycle for proper exponential decay
-                    new_salience = lifecycle.calculate_decay(
-                        memory_type=mem_type,
-                        original_salience=current_salience,
-                        last_used_at=last_used_at,
-                        created_at=created_at or now.isoformat(),
-                    )
-                    
-                    # Apply profile protection floor
-                    new_salience = max(new_salience, min_salience_for_item)
-                    
-                    # Get recommended status
-                    if not is_profile:  # Don't change profile memory status
-                        recommended_status = lifecycle.get_recommended_status(new_salience)
-                    else:
-                        recommended_status = "active"  # Profile always stays active
-                    
-                    # Apply salience change
-                    if abs(new_salience - current_salience) > 0.01:
-                        memory_manager.update_salience(item.id, new_salience)
-                        results["decayed_salience"] += 1
-                        logger.debug("Decayed memory #%d: %.2f -> %.2f (%s)", 
-                                     item.id, current_salience, new_salience, mem_type)
-                    
-                    # Apply status change
-                    if recommended_status == "stale" and not is_profile:
-                        memory_manager.update_status(item.id, "stale")
-                        results["marked_stale"] += 1
-                        logger.debug("Marked memory #%d as stale", item.id)
-                else:
-                    # Fallback: Simple decay logic
-                    if created_at:
-                        try:
-                            created_dt = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                            days_old = (now - created_dt).days
-                            if days_old > 60 and not is_profile:
-                                new_salience = max(min_salience_for_item, current_salience * 0.7)
-                                if new_salience != current_salience:
-                                    memory_manager.update_salience(item.id, new_salience)
-                                    results["decayed_salience"] += 1
-                        except ValueError:
-                            pass
-                        
-            except Exception as e:
-                logger.warning("Error processing active memory #%d: %s", item.id, e, exc_info=True)
-                results["errors"] += 1
-        
-        # Process stale memories
-        for item in all_stale:
-            try:
-                tags = getattr(item, 'tags', []) or []
-                current_salience = getattr(item, 'salience', 0.5) or 0.5
-                
-                # Profile memories should never be stale, restore them
-                is_profile = any(t.startswith("profile:") for t in tags)
-                if is_profile:
-                    memory_manager.update_status(item.id, "active")
-                    results["profile_protected"] += 1
-                    continue
-                
-                # Archive very low salience stale memories
-                if current_salience < 0.2:
-                    memory_manager.update_status(item.id, "archived")
-                    results["archived"] += 1
-                    logger.debug("Archived memory #%d (salience %.2f)", item.id, current_salience)
-                    
-            except Exception as e:
-                logger.warning("Error processing stale memory #%d: %s", item.id, e, exc_info=True)
-                results["errors"] += 1
+        queue = memory_manager.get_decay_stats()
+        results["queue_depth"] = queue["queue_depth"]
+        results["next_due_at"] = queue["next_due_at"]
         
         logger.info(
-            "Memory decay complete: decayed=%d, stale=%d, archived=%d, profile_protected=%d, errors=%d",
-            results["decayed_salience"], results["marked_stale"], 
-            results["archived"], results["profile_protected"], results["errors"]
+            "Memory decay complete: due=%d, decayed=%d, stale=%d, archived=%d, profile_protected=%d, queue=%d",
+            results.get("due", 0), results["decayed_salience"], results["marked_stale"],
+            results["archived"], results["profile_protected"], results["queue_depth"],
         )
         
     except Exception as e:
@@ -1435,6 +1326,8 @@ def run_auto_extraction(
     user_text: str,
     memory_manager: "MemoryManager",
     module_tag: Optional[str] = None,
+    session_id: Optional[str] = None,
+    background: bool = True,
 ) -> Dict[str, Any]:
     """
     Run all auto-extraction routines on user text.
@@ -1442,14 +1335,21 @@ def run_auto_extraction(
     This is the main entry point called from the kernel on each message.
     
     v0.11.0-fix6: Added periodic background decay every N calls.
+    v0.12: The LLM fallback runs on the background extraction pipeline
+    (kernel/memory/extraction_pipeline.py); its facts land after the reply.
+    Each call first waits briefly for the session's previous extraction so
+    those facts are visible to this turn.
     
     Args:
         user_text: User's message
         memory_manager: MemoryManager instance
         module_tag: Optional module context
+        session_id: Session the message belongs to (extraction ordering)
+        background: Queue the LLM fallback instead of running it inline
     
     Returns:
-        Dict summarizing what was extracted
+        Dict summarizing what was extracted ("llm_queued" is True when the
+        LLM fallback was handed to the pipeline)
     """
     global _extraction_call_count
     
@@ -1458,9 +1358,16 @@ def run_auto_extraction(
         "procedural": None,
         "episodic": None,
         "llm_extracted": [],
+        "llm_queued": False,
         "decay_ran": False,
     }
     
+    pipeline = None
+    if background:
+        pipeline = get_extraction_pipeline()
+        if not pipeline.settle(session_id):
+            logger.debug("Previous extraction for %s still running; continuing", session_id)
+    
     # Profile extraction (regex-based)
     profile_results = maybe_extract_profile_memory(user_text, memory_manager, module_tag)
     if profile_results:
@@ -1482,6 +1389,7 @@ def run_auto_extraction(
     # 2. Message contains personal indicators but regex only got partial info
     # 3. Message is substantial (>30 chars)
     should_try_llm = False
+    llm_priority = PRIORITY_HIGH
     text_lower = user_text.lower()
     
     # Personal fact indicators - expanded list
@@ -1509,9 +1417,14 @@ def run_auto_extraction(
             multi_fact_indicators = [" and ", " also ", ", i ", " plus ", " as well as "]
             if any(ind in text_lower for ind in multi_fact_indicators):
                 should_try_llm = True
+                llm_priority = PRIORITY_LOW  # regex already got one fact
                 logger.debug("LLM fallback: partial match with multi-fact indicators")
     
-    if should_try_llm:
+    if should_try_llm and pipeline is not None:
+        results["llm_queued"] = pipeline.submit(
+            session_id, user_text, memory_manager, module_tag, priority=llm_priority,
+        )
+    elif should_try_llm:
         try:
             llm_results = llm_extract_facts(user_text, memory_manager, module_tag)
             if llm_results:
@@ -1744,62 +1657,57 @@ JSON response:"""
 # FIX 4: EMBEDDING-BASED SEMANTIC SEARCH
 # =============================================================================
 
-# Cache for embedding model
-_embedding_model_cache = None
-_embeddings_available = None
+# v0.12: The model is owned by the shared EmbeddingService (kernel/utils/embedding_service.py),
+# which batches concurrent requests and caches vectors by normalized-text hash.
+
+def _get_embedding_service():
+    """Get the process-wide embedding service."""
+    from kernel.utils.embedding_service import get_embedding_service
+    return get_embedding_service()
 
 
 def _check_embeddings_available() -> bool:
     """Check if sentence-transformers is available."""
-    global _embeddings_available
-    if _embeddings_available is not None:
-        return _embeddings_available
-    
     try:
-        from sentence_transformers import SentenceTransformer
-        _embeddings_available = True
-        return True
+        return _get_embedding_service().is_available()
     except ImportError:
-        _embeddings_available = False
-        logger.info("sentence-transformers not installed - using keyword search fallback")
         return False
 
 
 def _get_embedding_model():
-    """Get or create embedding model (lazy loading)."""
-    global _embedding_model_cache
-    
+    """Get the shared embedding model (lazy loading)."""
     if not _check_embeddings_available():
         return None
-    
-    if _embedding_model_cache is not None:
-        return _embedding_model_cache
-    
-    try:
-        from sentence_transformers import SentenceTransformer
-        # Use a small, fast model
-        _embedding_model_cache = SentenceTransformer('all-MiniLM-L6-v2')
-        logger.info("Loaded embedding model: all-MiniLM-L6-v2")
-        return _embedding_model_cache
-    except Exception as e:
-        logger.warning("Failed to load embedding model: %s", e)
-        return None
+    return _get_embedding_service()._get_model()
 
 
 def _compute_embedding(text: str) -> Optional[List[float]]:
     """Compute embedding for text."""
-    model = _get_embedding_model()
-    if model is None:
+    if not _check_embeddings_available():
         return None
     
     try:
-        embedding = model.encode(text, convert_to_numpy=True)
-        return embedding.tolist()
+        return _get_embedding_service().encode_one(text)
     except Exception as e:
         logger.debug("Failed to compute embedding: %s", e)
         return None
 
 
+def _encode_texts(texts: List[str]) -> List[Optional[List[float]]]:
+    """Compute embeddings for several texts in one batch (None for failures)."""
+    if not texts or not _check_embeddings_available():
+        return [None] * len(texts)
+    
+    try:
+        matrix = _get_embedding_service().encode(texts)
+    except Exception as e:
+        logger.debug("Failed to compute embeddings: %s", e)
+        matrix = None
+    if matrix is None:
+        return [None] * len(texts)
+    return [row.tolist() for row in matrix]
+
+
 def _cosine_similarity(a: List[float], b: List[float]) -> float:
     """Compute cosine similarity between two vectors."""
     import math
@@ -1826,6 +1734,9 @@ def semantic_search_memories(
     Search memories using semantic similarity (embeddings).
     
     v0.11.0-fix6: Embedding-based search for better retrieval.
+    v0.12: Ranks against the persistent embedding index (one matrix-vector
+    product over stored vectors); the per-candidate loop below is only used
+    when numpy is unavailable.
     
     Falls back to keyword search if sentence-transformers is not available.
     
@@ -1847,6 +1758,21 @@ def semantic_search_memories(
     if _check_embeddings_available():
         query_embedding = _compute_embedding(query)
         
+        if query_embedding is not None and hasattr(memory_manager, "semantic_search"):
+            try:
+                indexed = memory_manager.semantic_search(
+                    query_embedding,
+                    limit=limit,
+                    min_similarity=min_similarity,
+                    mem_type=mem_type,
+                    tags=tags,
+                )
+                if indexed is not None:
+                    logger.debug("Indexed semantic search found %d results for '%s'", len(indexed), query[:30])
+                    return indexed
+            except Exception as e:
+                logger.debug("Embedding index search failed, scanning candidates: %s", e)
+        
         if query_embedding is not None:
             try:
                 # Get all candidate memories
@@ -1891,7 +1817,7 @@ def semantic_search_memories(
                 logger.debug("Semantic search failed, falling back to keywords: %s", e)
     
     # Fallback to keyword search
-    return search_by_keywords(query, memory_manager, limit=limit)
+    return search_by_keywords(memory_manager, query, mem_type=mem_type, limit=limit)
 
 
 def get_relevant_semantic_memories_v2(
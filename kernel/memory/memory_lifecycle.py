@@ -17,14 +17,21 @@ Core Principle: Memory Integrity
 - Stale memories don't disappear, they get flagged
 - User controls what gets archived or re-confirmed
 - High-salience memories decay slower
+
+v0.12: DecayScheduler keeps a priority queue of when each memory next
+crosses a salience step or status threshold, so a decay run only touches
+the memories that are due.
 """
 
 from __future__ import annotations
 
+import heapq
 import math
+import threading
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
-from typing import Any, Dict, List, Optional, Literal, TYPE_CHECKING
+from typing import Any, Dict, Iterable, List, Optional, Literal, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .memory_engine import MemoryEngine, MemoryItem, MemoryType, MemoryStatus
@@ -44,6 +51,8 @@ class DecayConfig:
     archive_threshold: Salience below which memory becomes "archived"
     min_salience: Floor for salience (never decays below this)
     high_salience_protection: Memories above this decay 50% slower
+    salience_step: Smallest salience drop worth writing back
+    profile_min_salience: Floor for profile:* memories (they stay active)
     """
     half_life_days: Dict[str, float] = field(default_factory=lambda: {
         "episodic": 30.0,      # Events fade fastest
@@ -55,6 +64,8 @@ class DecayConfig:
     archive_threshold: float = 0.05    # Below this → archived
     min_salience: float = 0.01         # Floor
     high_salience_protection: float = 0.8  # Above this → slower decay
+    salience_step: float = 0.01        # Decay writes happen per step
+    profile_min_salience: float = 0.5  # Profile memories never go below
     
     # Re-confirmation settings
     reconfirm_after_days: int = 60     # Days without use before flagging
@@ -336,7 +347,7 @@ class MemoryLifecycle:
                 new_status = self.get_recommended_status(new_salience)
                 
                 # Only report if changed significantly
-                if abs(new_salience - salience) > 0.01 or new_status != status:
+                if abs(new_salience - salience) > self.config.salience_step or new_status != status:
                     decay_updates.append({
                         "id": mem_id,
                         "old_salience": salience,
@@ -451,6 +462,231 @@ class MemoryLifecycle:
             "archive_threshold": self.config.archive_threshold,
             "min_salience": self.config.min_salience,
             "high_salience_protection": self.config.high_salience_protection,
+            "salience_step": self.config.salience_step,
+            "profile_min_salience": self.config.profile_min_salience,
             "reconfirm_after_days": self.config.reconfirm_after_days,
             "identity_reconfirm_days": self.config.identity_reconfirm_days,
         }
+
+
+# -----------------------------------------------------------------------------
+# Decay Scheduler
+# -----------------------------------------------------------------------------
+
+def _parse_timestamp(value: Optional[str]) -> Optional[float]:
+    """ISO timestamp -> epoch seconds (None if missing/invalid)."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (ValueError, AttributeError):
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def _is_profile(item: "MemoryItem") -> bool:
+    return any(t.startswith("profile:") for t in (item.tags or []))
+
+
+class DecayScheduler:
+    """
+    Priority queue of memories keyed on their next decay deadline.
+    
+    An active memory is due when its decayed salience next drops by
+    salience_step or reaches the stale threshold; a stale memory is due
+    at once when it should be archived (or restored, for profile memories).
+    Decay is measured from the memory's decay clock — the later of
+    last_used_at and trace["decayed_at"] — so repeated runs never apply
+    the same elapsed time twice.
+    
+    Entries are invalidated lazily: the queue stores (due, id) and only
+    the latest due time per id counts. Due items are re-checked against
+    their current state before anything is written.
+    """
+
+    def __init__(self, lifecycle: Optional[MemoryLifecycle] = None):
+        self.lifecycle = lifecycle or MemoryLifecycle()
+        self.config = self.lifecycle.config
+        self._heap: List[Tuple[float, int]] = []
+        self._due_at: Dict[int, float] = {}
+        self._lock = threading.Lock()
+        self._runs = 0
+        self._last_run: Dict[str, Any] = {}
+
+    # ---------- Deadlines ----------
+
+    def _clock(self, item: "MemoryItem", now: float) -> float:
+        """Time from which the item's current salience decays."""
+        used = _parse_timestamp(item.last_used_at) or _parse_timestamp(item.timestamp)
+        if used is None:
+            used = now - 30 * 86400  # Same default as calculate_decay
+        decayed = _parse_timestamp((item.trace or {}).get("decayed_at"))
+        return max(used, decayed) if decayed is not None else used
+
+    def _half_life_seconds(self, item: "MemoryItem", salience: float) -> float:
+        half_life = self.config.half_life_days.get(item.type, 90.0)
+        if salience >= self.config.high_salience_protection:
+            half_life *= 1.5
+        return half_life * 86400
+
+    def next_due(self, item: "MemoryItem", now: Optional[float] = None) -> Optional[float]:
+        """
+        Epoch seconds when the item next needs decay work, or None if it
+        never will in its current state.
+        """
+        now = time.time() if now is None else now
+        cfg = self.config
+        profile = _is_profile(item)
+        salience = float(item.salience or 0.0)
+
+        if item.status == "stale":
+            return now if profile or salience < cfg.stale_threshold else None
+        if item.status != "active":
+            return None
+
+        floor = cfg.profile_min_salience if profile else cfg.min_salience
+        if profile and salience < floor:
+            return now
+        if not profile and salience <= cfg.stale_threshold:
+            return now
+
+        target = salience - cfg.salience_step
+        if not profile:
+            target = max(target, cfg.stale_threshold)
+        if target <= floor:
+            return None
+
+        elapsed = self._half_life_seconds(item, salience) * math.log2(salience / target)
+        return self._clock(item, now) + elapsed
+
+    def apply(self, item: "MemoryItem", now: Optional[float] = None) -> List[str]:
+        """
+        Decay a due item in place (salience, status, trace["decayed_at"]).
+        
+        Returns:
+            Events: "decayed", "marked_stale", "archived", "profile_protected"
+        """
+        now = time.time() if now is None else now
+        cfg = self.config
+        profile = _is_profile(item)
+        salience = float(item.salience or 0.0)
+        events: List[str] = []
+
+        if item.status == "stale":
+            if profile:
+                item.status = "active"
+                events.append("profile_protected")
+            elif salience < cfg.stale_threshold:
+                item.status = "archived"
+                events.append("archived")
+            return events
+
+        if item.status != "active":
+            return events
+
+        if profile:
+            events.append("profile_protected")
+        floor = cfg.profile_min_salience if profile else cfg.min_salience
+        elapsed = max(0.0, now - self._clock(item, now))
+        new_salience = salience * math.pow(0.5, elapsed / self._half_life_seconds(item, salience))
+        new_salience = round(max(new_salience, floor), 4)
+
+        if new_salience != salience:
+            item.salience = new_salience
+            if item.trace is None:
+                item.trace = {}
+            item.trace["decayed_at"] = datetime.fromtimestamp(now, timezone.utc).isoformat()
+            events.append("decayed")
+
+        if not profile and new_salience <= cfg.stale_threshold:
+            item.status = "stale"
+            events.append("marked_stale")
+        return events
+
+    # ---------- Queue ----------
+
+    def schedule(self, items: Iterable["MemoryItem"], now: Optional[float] = None) -> None:
+        """(Re)compute deadlines for items, replacing earlier entries."""
+        now = time.time() if now is None else now
+        with self._lock:
+            for item in items:
+                due = self.next_due(item, now)
+                if due is None:
+                    self._due_at.pop(item.id, None)
+                    continue
+                self._due_at[item.id] = due
+                heapq.heappush(self._heap, (due, item.id))
+            self._compact_unlocked()
+
+    def discard(self, item_ids: Iterable[int]) -> None:
+        """Drop items from the queue (deleted memories)."""
+        with self._lock:
+            for item_id in item_ids:
+                self._due_at.pop(item_id, None)
+            self._compact_unlocked()
+
+    def rebuild(self, items: Iterable["MemoryItem"], now: Optional[float] = None) -> None:
+        """Rebuild the queue from scratch."""
+        now = time.time() if now is None else now
+        due_at: Dict[int, float] = {}
+        for item in items:
+            due = self.next_due(item, now)
+            if due is not None:
+                due_at[item.id] = due
+        heap = [(due, item_id) for item_id, due in due_at.items()]
+        heapq.heapify(heap)
+        with self._lock:
+            self._due_at = due_at
+            self._heap = heap
+
+    def pop_due(self, now: Optional[float] = None) -> List[int]:
+        """Remove and return ids whose deadline has passed."""
+        now = time.time() if now is None else now
+        due: List[int] = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                when, item_id = heapq.heappop(self._heap)
+                if self._due_at.get(item_id) == when:
+                    del self._due_at[item_id]
+                    due.append(item_id)
+        return due
+
+    def _compact_unlocked(self) -> None:
+        """Drop superseded heap entries once they dominate the heap."""
+        if len(self._heap) > 2 * len(self._due_at) + 64:
+            self._heap = [(due, item_id) for item_id, due in self._due_at.items()]
+            heapq.heapify(self._heap)
+
+    # ---------- Observability ----------
+
+    def record_run(self, due: int, written: int, elapsed_ms: float, now: Optional[float] = None) -> None:
+        now = time.time() if now is None else now
+        self._runs += 1
+        self._last_run = {
+            "at": datetime.fromtimestamp(now, timezone.utc).isoformat(),
+            "due": due,
+            "written": written,
+            "elapsed_ms": round(elapsed_ms, 2),
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth, next due time and the last run."""
+        with self._lock:
+            depth = len(self._due_at)
+            next_due = None
+            while self._heap:
+                when, item_id = self._heap[0]
+                if self._due_at.get(item_id) == when:
+                    next_due = when
+                    break
+                heapq.heappop(self._heap)
+        return {
+            "queue_depth": depth,
+            "next_due_at": (
+                datetime.fromtimestamp(next_due, timezone.utc).isoformat() if next_due is not None else None
+            ),
+            "runs": self._runs,
+            "last_run": dict(self._last_run) or None,
+        }
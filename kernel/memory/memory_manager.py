@@ -26,7 +26,10 @@ from .memory_engine import (
     MemoryType,
     MemoryStatus,
     DEFAULT_SALIENCE,
+    TouchMode,
 )
+from .extraction_pipeline import extraction_stats
+from .ltm_context_cache import LTMContextCache
 
 
 # -----------------------------------------------------------------------------
@@ -116,12 +119,18 @@ class MemoryManager:
         self.memory_file: Path = config.data_dir / "memory.json"
         self.memory_file.parent.mkdir(parents=True, exist_ok=True)
 
-        # Initialize the new engine
-        self._engine = MemoryEngine(config.data_dir)
+        # Initialize the new engine (storage backend chosen by Config.memory_backend)
+        self._engine = MemoryEngine(
+            config.data_dir,
+            backend=getattr(config, "memory_backend", "json"),
+        )
         
         # Policy hooks (can be set by kernel/policy_engine)
         self._pre_store_hook: Optional[Callable[[EngineMemoryItem, Dict[str, Any]], bool]] = None
 
+        # Rendered LTM persona blocks, keyed against store_version
+        self.ltm_cache = LTMContextCache()
+
         # Legacy compatibility: ensure file exists
         self._ensure_file()
 
@@ -235,11 +244,13 @@ class MemoryManager:
         module_tag: Optional[str] = None,
         status: Optional[MemoryStatus] = None,
         min_salience: Optional[float] = None,
+        touch: TouchMode = True,
     ) -> List[MemoryItem]:
         """
         Recall memory items matching filters.
         
         v0.3 compatible + v0.5.4 enhancements.
+        touch: True/"deferred" (buffered), "sync" (persist now) or False.
         """
         engine_items = self._engine.recall(
             mem_type=mem_type,
@@ -248,10 +259,38 @@ class MemoryManager:
             status=status,
             min_salience=min_salience,
             limit=limit,
+            touch=touch,
         )
 
         return [MemoryItem.from_engine_item(item) for item in engine_items]
 
+    def store_many(
+        self,
+        entries: List[Dict[str, Any]],
+        session_id: Optional[str] = None,
+    ) -> List[MemoryItem]:
+        """
+        Store several memories in one transaction.
+        
+        Each entry takes store()'s keyword arguments; entries rejected by
+        the policy hook are skipped.
+        """
+        engine_items = self._engine.store_many(entries, session_id=session_id)
+        return [MemoryItem.from_engine_item(item) for item in engine_items]
+
+    def update_many(self, updates: List[Dict[str, Any]]) -> int:
+        """
+        Update several memories in one transaction.
+        
+        updates: [{"id": X, "payload"/"tags"/"salience"/"status"/...: value}]
+        Returns count changed.
+        """
+        return self._engine.update_many(updates)
+
+    def delete_many(self, ids: List[int]) -> int:
+        """Delete several memories in one transaction. Returns count deleted."""
+        return self._engine.delete_many(ids)
+
     def forget(
         self,
         *,
@@ -301,6 +340,83 @@ class MemoryManager:
         """Update the status of a memory item."""
         return self._engine.update_status(mem_id, status)
 
+    def semantic_search(
+        self,
+        query_vector: List[float],
+        limit: int = 10,
+        min_similarity: float = 0.0,
+        mem_type: Optional[MemoryType] = None,
+        tags: Optional[List[str]] = None,
+        module_tag: Optional[str] = None,
+        status: Optional[MemoryStatus] = None,
+    ) -> Optional[List[tuple]]:
+        """
+        Rank memories by cosine similarity using the embedding index.
+        
+        Returns [(MemoryItem, score)], or None if the index is unavailable.
+        """
+        results = self._engine.semantic_search(
+            query_vector,
+            limit=limit,
+            min_similarity=min_similarity,
+            mem_type=mem_type,
+            tags=tags,
+            module_tag=module_tag,
+            status=status,
+        )
+        if results is None:
+            return None
+        return [(MemoryItem.from_engine_item(item), score) for item, score in results]
+
+    def keyword_search(
+        self,
+        query: str,
+        mem_type: Optional[MemoryType] = None,
+        module_tag: Optional[str] = None,
+        status: Optional[MemoryStatus] = None,
+        limit: int = 20,
+        touch: TouchMode = True,
+    ) -> List[tuple]:
+        """
+        Rank memories by BM25 keyword relevance plus salience.
+        
+        Returns [(MemoryItem, score)] sorted by score descending.
+        """
+        results = self._engine.keyword_search(
+            query,
+            mem_type=mem_type,
+            module_tag=module_tag,
+            status=status,
+            limit=limit,
+            touch=touch,
+        )
+        return [(MemoryItem.from_engine_item(item), score) for item, score in results]
+
+    def rebuild_embeddings(self) -> Dict[str, Any]:
+        """Re-encode all memories into a fresh embedding index."""
+        return self._engine.rebuild_embeddings()
+
+    def run_decay(self, now: Optional[datetime] = None) -> Dict[str, int]:
+        """Decay the memories that are due (see DecayScheduler)."""
+        return self._engine.run_decay(now=now)
+
+    def get_decay_stats(self) -> Dict[str, Any]:
+        """Decay queue depth, next due time and last run."""
+        return self._engine.get_decay_stats()
+
+    def touch(self, ids: List[int], mode: TouchMode = "deferred") -> int:
+        """Update last_used_at for memory ids. Returns count touched."""
+        return self._engine.touch(ids, mode=mode)
+
+    def flush(self) -> int:
+        """Persist buffered touches now. Returns count written."""
+        return self._engine.flush()
+
+    @property
+    def store_version(self) -> int:
+        """Counter bumped by every store/update/delete (see MemoryEngine.store_version)."""
+        return self._engine.store_version
+
     def get_by_module(self, module_tag: str, limit: int = 20) -> List[MemoryItem]:
         """Get memories linked to a specific module."""
         engine_items = self._engine.recall(module_tag=module_tag, limit=limit)
@@ -341,6 +457,10 @@ class MemoryManager:
         health = self._engine.get_health()
         return {
             "health": health,
+            "storage": self._engine.get_storage_stats(),
+            "decay": self._engine.get_decay_stats(),
+            "extraction": extraction_stats(),
+            "ltm_cache": self.ltm_cache.stats(),
             "engine_version": "0.5.4",
             "data_dir": str(self.config.data_dir),
         }
@@ -0,0 +1,651 @@
+# kernel/memory/memory_sqlite.py
+"""
+v0.12 — SQLite storage backend for the Memory Engine
+
+Drop-in alternative to the JSON LongTermMemory + in-RAM MemoryIndex pair:
+- SQLiteLongTermMemory: MemoryItem rows in data/memory/memory.db
+- SQLiteMemoryIndex: MemoryIndex API whose query() runs as indexed SQL,
+  so the process never holds the whole store in Python dicts
+- migrate_json_store(): one-shot import of the data/memory/*.json files
+
+Selected with Config.memory_backend = "sqlite" (data/config.json:
+{"memory_backend": "sqlite"}). The JSON backend remains the default.
+
+Schema:
+- memories: one row per item (tags kept in order as JSON, trace as JSON)
+- memory_tags: (tag, memory_id) join table for tag filters
+- memory_meta: key/value (next_id, migrated_from_json)
+- indexes on type, status, module_tag and salience
+- memories_fts: FTS5 index over payloads (kept in sync by triggers) for
+  BM25 keyword search; falls back to LIKE scans when FTS5 is missing
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from .memory_engine import (
+    LongTermMemory,
+    MemoryItem,
+    MemoryStatus,
+    MemoryType,
+)
+
+logger = logging.getLogger("nova.memory.sqlite")
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS memories (
+    id           INTEGER PRIMARY KEY,
+    type         TEXT    NOT NULL,
+    tags         TEXT    NOT NULL DEFAULT '[]',
+    payload      TEXT    NOT NULL DEFAULT '',
+    timestamp    TEXT    NOT NULL,
+    trace        TEXT    NOT NULL DEFAULT '{}',
+    cluster_id   INTEGER,
+    source       TEXT    NOT NULL DEFAULT 'user',
+    salience     REAL    NOT NULL DEFAULT 0.5,
+    status       TEXT    NOT NULL DEFAULT 'active',
+    confidence   REAL    NOT NULL DEFAULT 1.0,
+    last_used_at TEXT,
+    module_tag   TEXT,
+    version      INTEGER NOT NULL DEFAULT 1
+);
+
+CREATE TABLE IF NOT EXISTS memory_tags (
+    tag       TEXT    NOT NULL,
+    memory_id INTEGER NOT NULL REFERENCES memories(id) ON DELETE CASCADE,
+    PRIMARY KEY (tag, memory_id)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS memory_meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_memories_type     ON memories(type, salience DESC, timestamp);
+CREATE INDEX IF NOT EXISTS idx_memories_status   ON memories(status, salience DESC, timestamp);
+CREATE INDEX IF NOT EXISTS idx_memories_module   ON memories(module_tag, salience DESC, timestamp);
+CREATE INDEX IF NOT EXISTS idx_memories_salience ON memories(salience DESC, timestamp);
+CREATE INDEX IF NOT EXISTS idx_memory_tags_item  ON memory_tags(memory_id);
+"""
+
+# External-content FTS5 table; the triggers keep it in step with memories
+# (REPLACE fires the delete trigger because recursive_triggers is on).
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS memories_fts USING fts5(
+    payload, content='memories', content_rowid='id'
+);
+
+CREATE TRIGGER IF NOT EXISTS memories_fts_insert AFTER INSERT ON memories BEGIN
+    INSERT INTO memories_fts (rowid, payload) VALUES (new.id, new.payload);
+END;
+
+CREATE TRIGGER IF NOT EXISTS memories_fts_delete AFTER DELETE ON memories BEGIN
+    INSERT INTO memories_fts (memories_fts, rowid, payload) VALUES ('delete', old.id, old.payload);
+END;
+
+CREATE TRIGGER IF NOT EXISTS memories_fts_update AFTER UPDATE OF payload ON memories BEGIN
+    INSERT INTO memories_fts (memories_fts, rowid, payload) VALUES ('delete', old.id, old.payload);
+    INSERT INTO memories_fts (rowid, payload) VALUES (new.id, new.payload);
+END;
+"""
+
+_COLUMNS = (
+    "id", "type", "tags", "payload", "timestamp", "trace", "cluster_id", "source",
+    "salience", "status", "confidence", "last_used_at", "module_tag", "version",
+)
+_SELECT_COLUMNS = ", ".join(f"m.{c}" for c in _COLUMNS)
+_SELECT = f"SELECT {_SELECT_COLUMNS} FROM memories m"
+_UPSERT = (
+    "INSERT OR REPLACE INTO memories (" + ", ".join(_COLUMNS) + ") "
+    "VALUES (" + ", ".join("?" for _ in _COLUMNS) + ")"
+)
+
+
+def _row_to_item(row: sqlite3.Row) -> MemoryItem:
+    data = dict(row)
+    data["tags"] = json.loads(data.get("tags") or "[]")
+    data["trace"] = json.loads(data.get("trace") or "{}")
+    return MemoryItem.from_dict(data)
+
+
+def _item_to_row(item: MemoryItem) -> tuple:
+    return (
+        item.id,
+        item.type,
+        json.dumps(list(item.tags), ensure_ascii=False),
+        item.payload,
+        item.timestamp,
+        json.dumps(item.trace or {}, ensure_ascii=False),
+        item.cluster_id,
+        item.source,
+        float(item.salience),
+        item.status,
+        float(item.confidence),
+        item.last_used_at,
+        item.module_tag,
+        int(item.version),
+    )
+
+
+def _filter_clauses(
+    mem_type: Optional[MemoryType],
+    module_tag: Optional[str],
+    status: Optional[MemoryStatus],
+) -> Tuple[List[str], List[Any]]:
+    """WHERE clauses + params for the common type/module/status filters."""
+    clauses: List[str] = []
+    params: List[Any] = []
+    if mem_type:
+        clauses.append("m.type = ?")
+        params.append(mem_type)
+    if module_tag:
+        clauses.append("m.module_tag = ?")
+        params.append(module_tag)
+    if status:
+        clauses.append("m.status = ?")
+        params.append(status)
+    return clauses, params
+
+
+# -----------------------------------------------------------------------------
+# SQLite Long-Term Memory Store
+# -----------------------------------------------------------------------------
+
+class SQLiteLongTermMemory:
+    """
+    LongTermMemory backed by a single SQLite database.
+
+    Same public API as LongTermMemory. Every mutation is one short
+    transaction; nothing is cached in Python beyond the connection.
+    """
+
+    def __init__(self, data_dir: Path, db_path: Optional[Path] = None):
+        self.data_dir = data_dir
+        self.memory_dir = data_dir / "memory"
+        self.memory_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = db_path or (self.memory_dir / "memory.db")
+
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.execute("PRAGMA recursive_triggers=ON")
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+        self.fts_enabled = self._init_fts()
+
+        self._migrate_if_empty()
+
+    # ---------- Internal ----------
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM memory_meta WHERE key = ?", (key,)).fetchone()
+        return row["value"] if row else None
+
+    def _set_meta(self, key: str, value: Any) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO memory_meta (key, value) VALUES (?, ?)", (key, str(value))
+        )
+
+    def _write_items(self, items: Iterable[MemoryItem]) -> int:
+        """Upsert items and their tag rows (caller holds _lock and commits)."""
+        count = 0
+        for item in items:
+            self._conn.execute(_UPSERT, _item_to_row(item))
+            self._conn.execute("DELETE FROM memory_tags WHERE memory_id = ?", (item.id,))
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO memory_tags (tag, memory_id) VALUES (?, ?)",
+                [(tag, item.id) for tag in set(item.tags)],
+            )
+            count += 1
+        return count
+
+    def _init_fts(self) -> bool:
+        """Create the FTS5 keyword index (backfilling existing rows). False if unsupported."""
+        with self._lock:
+            existed = self._conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'memories_fts'"
+            ).fetchone()
+            try:
+                self._conn.executescript(FTS_SCHEMA)
+                if not existed:
+                    self._conn.execute("INSERT INTO memories_fts (memories_fts) VALUES ('rebuild')")
+                self._conn.commit()
+            except sqlite3.OperationalError as e:
+                logger.info("SQLite FTS5 unavailable (%s); keyword search will scan payloads", e)
+                return False
+        return True
+
+    def _migrate_if_empty(self) -> None:
+        """Import existing JSON files the first time an empty database is opened."""
+        with self._lock:
+            if self._get_meta("migrated_from_json") is not None:
+                return
+            has_rows = self._conn.execute("SELECT 1 FROM memories LIMIT 1").fetchone()
+        if not has_rows:
+            migrate_json_store(self.data_dir, store=self)
+        with self._lock:
+            self._set_meta("migrated_from_json", "1")
+            self._conn.commit()
+
+    # ---------- LongTermMemory API ----------
+
+    def get_next_id(self) -> int:
+        """Get and increment the next available ID."""
+        return self.get_next_ids(1)[0]
+
+    def get_next_ids(self, count: int) -> List[int]:
+        """Reserve `count` consecutive IDs."""
+        with self._lock:
+            stored = self._get_meta("next_id")
+            row = self._conn.execute("SELECT COALESCE(MAX(id), 0) + 1 AS nid FROM memories").fetchone()
+            nid = max(int(stored) if stored else 1, row["nid"])
+            self._set_meta("next_id", nid + count)
+            self._conn.commit()
+            return list(range(nid, nid + count))
+
+    def store(self, item: MemoryItem) -> MemoryItem:
+        """Store a memory item."""
+        with self._lock:
+            self._write_items([item])
+            self._conn.commit()
+        return item
+
+    def store_many(self, items: List[MemoryItem]) -> int:
+        """Store multiple memory items in one transaction."""
+        with self._lock:
+            count = self._write_items(items)
+            self._conn.commit()
+        return count
+
+    def get(self, item_id: int) -> Optional[MemoryItem]:
+        """Get a memory item by ID."""
+        with self._lock:
+            row = self._conn.execute(_SELECT + " WHERE m.id = ?", (item_id,)).fetchone()
+        return _row_to_item(row) if row else None
+
+    def get_many(self, item_ids: Iterable[int]) -> List[MemoryItem]:
+        """Get several memory items by ID (missing ids are skipped)."""
+        ids = list(item_ids)
+        if not ids:
+            return []
+        placeholders = ", ".join("?" for _ in ids)
+        with self._lock:
+            rows = self._conn.execute(_SELECT + f" WHERE m.id IN ({placeholders})", ids).fetchall()
+        return [_row_to_item(row) for row in rows]
+
+    def get_all(self) -> List[MemoryItem]:
+        """Get all memory items."""
+        with self._lock:
+            rows = self._conn.execute(_SELECT + " ORDER BY m.id").fetchall()
+        return [_row_to_item(row) for row in rows]
+
+    def delete(self, item_id: int) -> bool:
+        """Delete a memory item."""
+        return self.delete_many([item_id]) > 0
+
+    def delete_many(self, item_ids: List[int]) -> int:
+        """Delete multiple memory items. Returns count deleted."""
+        if not item_ids:
+            return 0
+        with self._lock:
+            cur = self._conn.executemany("DELETE FROM memories WHERE id = ?", [(i,) for i in item_ids])
+            self._conn.commit()
+            return cur.rowcount
+
+    def update(self, item: MemoryItem) -> bool:
+        """Update a memory item."""
+        return self.update_many([item]) > 0
+
+    def update_many(self, items: List[MemoryItem]) -> int:
+        """Update multiple memory items in one transaction. Returns count updated."""
+        if not items:
+            return 0
+        with self._lock:
+            versions = {
+                row["id"]: row["version"]
+                for row in self._conn.execute(
+                    "SELECT id, version FROM memories WHERE id IN (" + ", ".join("?" for _ in items) + ")",
+                    [item.id for item in items],
+                )
+            }
+            present = [item for item in items if item.id in versions]
+            for item in present:
+                item.version = versions[item.id] + 1
+            self._write_items(present)
+            self._conn.commit()
+        return len(present)
+
+    def touch_many(self, stamps: Dict[int, str]) -> int:
+        """Set last_used_at for many items in one transaction."""
+        if not stamps:
+            return 0
+        with self._lock:
+            cur = self._conn.executemany(
+                "UPDATE memories SET last_used_at = ?, version = version + 1 WHERE id = ?",
+                [(ts, item_id) for item_id, ts in stamps.items()],
+            )
+            self._conn.commit()
+            return cur.rowcount
+
+    def load_trace(self, item: MemoryItem) -> Dict[str, Any]:
+        """Traces live in the row already; nothing to merge."""
+        return item.trace or {}
+
+    def load_traces(self, items: List[MemoryItem]) -> List[Dict[str, Any]]:
+        return [item.trace or {} for item in items]
+
+    def export_state(self) -> Dict[str, Any]:
+        """Export all memory state for snapshots."""
+        items = self.get_all()
+        with self._lock:
+            stored = self._get_meta("next_id")
+        next_id = max([int(stored) if stored else 1] + [item.id + 1 for item in items])
+        return {
+            "version": "0.5.4",
+            "next_id": next_id,
+            "items": [item.to_dict() for item in items],
+        }
+
+    def import_state(self, state: Dict[str, Any]) -> None:
+        """Import memory state from snapshot."""
+        items: List[MemoryItem] = []
+        for item_data in state.get("items", []):
+            try:
+                items.append(MemoryItem.from_dict(item_data))
+            except Exception:
+                continue
+        with self._lock:
+            self._conn.execute("DELETE FROM memories")
+            self._conn.execute("DELETE FROM memory_tags")
+            self._write_items(items)
+            self._set_meta("next_id", int(state.get("next_id", 1)))
+            self._conn.commit()
+
+    def compact(self) -> bool:
+        """Checkpoint the WAL into the main database file."""
+        with self._lock:
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        return True
+
+    def shutdown(self) -> None:
+        """Checkpoint the WAL so the database file is self-contained at exit."""
+        self.compact()
+
+    def storage_stats(self) -> Dict[str, Any]:
+        """Return backend name and on-disk sizes."""
+        wal_path = self.db_path.with_name(self.db_path.name + "-wal")
+        return {
+            "backend": "sqlite",
+            "db_path": str(self.db_path),
+            "db_bytes": self.db_path.stat().st_size if self.db_path.exists() else 0,
+            "wal_bytes": wal_path.stat().st_size if wal_path.exists() else 0,
+        }
+
+    # ---------- Queries (used by SQLiteMemoryIndex) ----------
+
+    def query(
+        self,
+        mem_type: Optional[MemoryType] = None,
+        tags: Optional[List[str]] = None,
+        module_tag: Optional[str] = None,
+        status: Optional[MemoryStatus] = None,
+        min_salience: Optional[float] = None,
+        limit: int = 50,
+    ) -> List[MemoryItem]:
+        """
+        Filtered recall as one indexed SELECT.
+        Ordered like MemoryIndex.query: salience desc, then timestamp.
+        """
+        clauses, params = _filter_clauses(mem_type, module_tag, status)
+
+        if min_salience is not None:
+            clauses.append("m.salience >= ?")
+            params.append(float(min_salience))
+        if tags:
+            placeholders = ", ".join("?" for _ in tags)
+            clauses.append(f"m.id IN (SELECT memory_id FROM memory_tags WHERE tag IN ({placeholders}))")
+            params.extend(tags)
+
+        sql = _SELECT
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY m.salience DESC, m.timestamp ASC LIMIT ?"
+        params.append(int(limit))
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [_row_to_item(row) for row in rows]
+
+    def keyword_search(
+        self,
+        terms: List[str],
+        mem_type: Optional[MemoryType] = None,
+        module_tag: Optional[str] = None,
+        status: Optional[MemoryStatus] = None,
+        limit: int = 20,
+    ) -> List[Tuple[MemoryItem, float]]:
+        """
+        Rank rows by FTS5 BM25 over payloads, plus salience.
+        Without FTS5, scores are matched-term counts from LIKE scans.
+        """
+        terms = list(dict.fromkeys(terms))
+        if not terms or limit <= 0:
+            return []
+        clauses, params = _filter_clauses(mem_type, module_tag, status)
+
+        if self.fts_enabled:
+            # bm25() is lower-is-better, so negate it
+            sql = (
+                f"SELECT {_SELECT_COLUMNS}, (m.salience - bm25(memories_fts)) AS score"
+                " FROM memories_fts JOIN memories m ON m.id = memories_fts.rowid"
+                " WHERE memories_fts MATCH ?"
+            )
+            params.insert(0, " OR ".join(f'"{term}"' for term in terms))
+        else:
+            matches = " + ".join("(m.payload LIKE ?)" for _ in terms)
+            sql = (
+                f"SELECT {_SELECT_COLUMNS}, (m.salience + {matches}) AS score FROM memories m"
+                " WHERE (" + " OR ".join("m.payload LIKE ?" for _ in terms) + ")"
+            )
+            like = [f"%{term}%" for term in terms]
+            params = like + like + params
+
+        if clauses:
+            sql += " AND " + " AND ".join(clauses)
+        sql += " ORDER BY score DESC, m.id DESC LIMIT ?"
+        params.append(int(limit))
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [(_row_to_item(row), float(row["score"])) for row in rows]
+
+    def ids_where(self, column: str, value: Any) -> Set[int]:
+        """Ids of rows where an indexed column equals value."""
+        if column not in ("type", "status", "module_tag"):
+            raise ValueError(f"Unsupported column: {column}")
+        with self._lock:
+            rows = self._conn.execute(f"SELECT id FROM memories WHERE {column} = ?", (value,)).fetchall()
+        return {row["id"] for row in rows}
+
+    def ids_by_tag(self, tag: str) -> Set[int]:
+        with self._lock:
+            rows = self._conn.execute("SELECT memory_id FROM memory_tags WHERE tag = ?", (tag,)).fetchall()
+        return {row["memory_id"] for row in rows}
+
+    def counts(self) -> Dict[str, Any]:
+        """Row counts grouped the way MemoryIndex.stats() reports them."""
+        with self._lock:
+            total = self._conn.execute("SELECT COUNT(*) FROM memories").fetchone()[0]
+            by_type = dict(self._conn.execute("SELECT type, COUNT(*) FROM memories GROUP BY type").fetchall())
+            by_status = dict(self._conn.execute("SELECT status, COUNT(*) FROM memories GROUP BY status").fetchall())
+            unique_tags = self._conn.execute("SELECT COUNT(DISTINCT tag) FROM memory_tags").fetchone()[0]
+            unique_modules = self._conn.execute(
+                "SELECT COUNT(DISTINCT module_tag) FROM memories WHERE module_tag IS NOT NULL"
+            ).fetchone()[0]
+        return {
+            "total": total,
+            "by_type": by_type,
+            "by_status": by_status,
+            "unique_tags": unique_tags,
+            "unique_modules": unique_modules,
+        }
+
+
+# -----------------------------------------------------------------------------
+# SQLite Memory Index
+# -----------------------------------------------------------------------------
+
+class SQLiteMemoryIndex:
+    """
+    MemoryIndex API over SQLiteLongTermMemory.
+
+    The database is the index: add/update/remove/rebuild are no-ops because
+    the store already wrote the row, and lookups go straight to SQL.
+    """
+
+    in_memory = False
+
+    def __init__(self, store: SQLiteLongTermMemory):
+        self.store = store
+
+    def add(self, item: MemoryItem) -> None:
+        pass
+
+    def add_many(self, items: List[MemoryItem]) -> None:
+        pass
+
+    def remove(self, item_id: int) -> Optional[MemoryItem]:
+        return self.store.get(item_id)
+
+    def remove_many(self, item_ids: List[int]) -> List[MemoryItem]:
+        return self.store.get_many(item_ids)
+
+    def update(self, item: MemoryItem) -> None:
+        pass
+
+    def update_many(self, items: List[MemoryItem]) -> None:
+        pass
+
+    def rebuild(self, items: List[MemoryItem]) -> None:
+        pass
+
+    def get(self, item_id: int) -> Optional[MemoryItem]:
+        return self.store.get(item_id)
+
+    def ids_by_type(self, mem_type: MemoryType) -> Set[int]:
+        return self.store.ids_where("type", mem_type)
+
+    def ids_by_tag(self, tag: str) -> Set[int]:
+        return self.store.ids_by_tag(tag)
+
+    def ids_by_module(self, module_tag: str) -> Set[int]:
+        return self.store.ids_where("module_tag", module_tag)
+
+    def ids_by_status(self, status: MemoryStatus) -> Set[int]:
+        return self.store.ids_where("status", status)
+
+    def query(
+        self,
+        mem_type: Optional[MemoryType] = None,
+        tags: Optional[List[str]] = None,
+        module_tag: Optional[str] = None,
+        status: Optional[MemoryStatus] = None,
+        min_salience: Optional[float] = None,
+        limit: int = 50,
+    ) -> List[MemoryItem]:
+        return self.store.query(
+            mem_type=mem_type,
+            tags=tags,
+            module_tag=module_tag,
+            status=status,
+            min_salience=min_salience,
+            limit=limit,
+        )
+
+    def keyword_search(
+        self,
+        terms: List[str],
+        mem_type: Optional[MemoryType] = None,
+        module_tag: Optional[str] = None,
+        status: Optional[MemoryStatus] = None,
+        limit: int = 20,
+    ) -> List[Tuple[MemoryItem, float]]:
+        return self.store.keyword_search(
+            terms,
+            mem_type=mem_type,
+            module_tag=module_tag,
+            status=status,
+            limit=limit,
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        counts = self.store.counts()
+        return {
+            "total": counts["total"],
+            "by_type": {t: counts["by_type"].get(t, 0) for t in ("semantic", "procedural", "episodic")},
+            "by_status": {
+                s: counts["by_status"].get(s, 0)
+                for s in ("active", "stale", "archived", "pending_confirmation")
+            },
+            "unique_tags": counts["unique_tags"],
+            "unique_modules": counts["unique_modules"],
+        }
+
+
+# -----------------------------------------------------------------------------
+# One-shot JSON → SQLite migrator
+# -----------------------------------------------------------------------------
+
+def migrate_json_store(
+    data_dir: Path,
+    store: Optional[SQLiteLongTermMemory] = None,
+    force: bool = False,
+) -> int:
+    """
+    Copy every item from the JSON backend (typed files + journal, or the
+    legacy data/memory.json) into the SQLite database.
+
+    The source is opened read-only, so the JSON files (and the trace side
+    store) are left exactly as they were: no compaction, no trace
+    externalization. Switching Config.memory_backend back to "json" still
+    works. A database that already has rows is only overwritten with
+    force=True.
+
+    Returns:
+        Count of items migrated
+    """
+    data_dir = Path(data_dir)
+    source = LongTermMemory(data_dir, read_only=True)
+    state = source.export_state()
+    if not state["items"]:
+        return 0
+
+    target = store or SQLiteLongTermMemory(data_dir)
+    if not force and target.counts()["total"] > 0:
+        logger.info("SQLite memory store %s is not empty; skipping migration", target.db_path)
+        return 0
+
+    target.import_state(state)
+    logger.info("Migrated %d memories from JSON files into %s", len(state["items"]), target.db_path)
+    return len(state["items"])
+
+
+if __name__ == "__main__":
+    # python -m kernel.memory.memory_sqlite [data_dir] [--force]
+    import sys
+
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    target_dir = Path(args[0]) if args else Path("data")
+    db = SQLiteLongTermMemory(target_dir)
+    count = migrate_json_store(target_dir, store=db, force="--force" in sys.argv)
+    print(f"Migrated {count} memories into {db.db_path}")
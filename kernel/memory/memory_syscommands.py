@@ -7,6 +7,7 @@ New commands for ChatGPT-style memory management:
 - #memories — Full memory management UI
 - #search-mem — Keyword-based memory search
 - #memory-maintain — Run decay/archiving
+- #memory-reindex — Rebuild the semantic search embedding index
 - #session-end — End session with WM → LTM promotion
 
 All handlers follow the standard signature:
@@ -268,23 +269,15 @@ def handle_profile(
                 "NOT_PROFILE"
             )
         
-        # Update via engine (need to access internal engine)
+        # Update (re-indexes and re-embeds the payload)
         try:
-            # Get the item from engine
-            engine = mm._engine
-            item = engine.index.get(mem_id)
-            if item:
-                item.payload = new_content.strip()
-                engine.long_term.update(item)
-                engine.index.update(item)
-                logger.info("Edited profile memory #%d", mem_id)
-                return _base_response(
-                    cmd_name, 
-                    f"✓ Profile memory #{mem_id} updated.",
-                    {"id": mem_id, "new_payload": new_content[:80]}
-                )
-            else:
-                return _error_response(cmd_name, f"Memory #{mem_id} not found in index.", "NOT_FOUND")
+            mm.update_many([{"id": mem_id, "payload": new_content.strip()}])
+            logger.info("Edited profile memory #%d", mem_id)
+            return _base_response(
+                cmd_name, 
+                f"✓ Profile memory #{mem_id} updated.",
+                {"id": mem_id, "new_payload": new_content[:80]}
+            )
         except Exception as e:
             logger.warning("Error editing profile memory #%d: %s", mem_id, e, exc_info=True)
             return _error_response(cmd_name, f"Failed to edit memory: {e}", "EDIT_FAILED")
@@ -466,14 +459,10 @@ def handle_memories(
             return _error_response(cmd_name, "Usage: #memories edit id=<id> content=\"...\"", "MISSING_CONTENT")
         
         try:
-            engine = mm._engine
-            item = engine.index.get(mem_id)
-            if not item:
+            if not mm.trace(mem_id):
                 return _error_response(cmd_name, f"Memory #{mem_id} not found.", "NOT_FOUND")
             
-            item.payload = new_content.strip()
-            engine.long_term.update(item)
-            engine.index.update(item)
+            mm.update_many([{"id": mem_id, "payload": new_content.strip()}])
             
             logger.info("Edited memory #%d", mem_id)
             return _base_response(
@@ -681,6 +670,10 @@ def handle_memory_maintain(
             f"✓ Archived: {results.get('archived', 0)} memories",
         ]
         
+        if "queue_depth" in results:
+            next_due = results.get("next_due_at") or "—"
+            lines.append(f"• Decay queue: {results['queue_depth']} memories (next due {next_due})")
+        
         if results.get('errors', 0) > 0:
             lines.append(f"⚠ Errors encountered: {results['errors']}")
         
@@ -693,6 +686,48 @@ def handle_memory_maintain(
         return _error_response(cmd_name, f"Maintenance failed: {e}", "MAINTAIN_ERROR")
 
 
+# =============================================================================
+# #memory-reindex HANDLER
+# =============================================================================
+
+def handle_memory_reindex(
+    cmd_name: str,
+    args: Dict[str, Any],
+    session_id: str,
+    context: Dict[str, Any],
+    kernel: "NovaKernel",
+    meta: Any,
+) -> CommandResponse:
+    """
+    Rebuild the embedding index used by semantic memory search.
+    
+    Usage:
+        #memory-reindex
+    
+    Re-encodes every memory payload and rewrites the embedding index files
+    (data/memory/embeddings.<n>.npy and friends).
+    Only needed after a model change or if the index files were lost.
+    """
+    try:
+        mm = kernel.memory_manager
+        results = mm.rebuild_embeddings()
+        
+        if results.get("error"):
+            return _error_response(cmd_name, f"Reindex unavailable: {results['error']}", "REINDEX_UNAVAILABLE")
+        
+        lines = [
+            "═══ MEMORY REINDEX ═══",
+            "",
+            f"✓ Embedded: {results.get('indexed', 0)} of {results.get('total', 0)} memories",
+            f"✓ Took: {results.get('elapsed_ms', 0):.0f} ms",
+        ]
+        
+        return _base_response(cmd_name, "\n".join(lines), results)
+    except Exception as e:
+        logger.warning("Error in memory-reindex: %s", e, exc_info=True)
+        return _error_response(cmd_name, f"Reindex failed: {e}", "REINDEX_ERROR")
+
+
 # =============================================================================
 # #session-end HANDLER
 # =============================================================================
@@ -809,6 +844,7 @@ MEMORY_SYSCOMMAND_HANDLERS = {
     "handle_memories": handle_memories,
     "handle_search_mem": handle_search_mem,
     "handle_memory_maintain": handle_memory_maintain,
+    "handle_memory_reindex": handle_memory_reindex,
     "handle_session_end": handle_session_end,
 }
 
@@ -827,6 +863,7 @@ __all__ = [
     "handle_memories",
     "handle_search_mem",
     "handle_memory_maintain",
+    "handle_memory_reindex",
     "handle_session_end",
     "get_memory_syscommand_handlers",
     "MEMORY_SYSCOMMAND_HANDLERS",
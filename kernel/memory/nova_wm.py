@@ -76,6 +76,9 @@ from datetime import datetime
 import re
 import json
 
+from .nova_wm_scanner import PatternScanner, ScanRule
+from .session_registry import SessionRegistry, register_session_registry
+
 
 # =============================================================================
 # ENUMS & TYPES
@@ -245,6 +248,26 @@ class WMEntity:
         if self.module:
             result["module"] = self.module
         return result
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "WMEntity":
+        """v0.12: Rebuild from to_dict() output."""
+        return cls(
+            id=data["id"],
+            name=data["name"],
+            entity_type=EntityType(data["type"]),
+            aliases=list(data.get("aliases", [])),
+            pronouns=list(data.get("pronouns", [])),
+            gender_hint=GenderHint(data.get("gender_hint", GenderHint.NEUTRAL.value)),
+            description=data.get("description"),
+            attributes=dict(data.get("attributes", {})),
+            first_mentioned=data.get("first_mentioned", 0),
+            last_mentioned=data.get("last_mentioned", 0),
+            mention_count=data.get("mention_count", 1),
+            confidence=data.get("confidence", 1.0),
+            members=data.get("members"),
+            module=data.get("module"),
+        )
 
 
 @dataclass
@@ -266,6 +289,16 @@ class ReferentCandidate:
             "last_mentioned": self.last_mentioned,
             "gender_match": self.gender_match,
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ReferentCandidate":
+        return cls(
+            entity_id=data["entity_id"],
+            entity_name=data["entity_name"],
+            score=data["score"],
+            last_mentioned=data["last_mentioned"],
+            gender_match=data["gender_match"],
+        )
 
 
 @dataclass
@@ -303,6 +336,14 @@ class PronounGroup:
             "best_match": best.entity_name if best else None,
             "candidates": [c.to_dict() for c in self.candidates],
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PronounGroup":
+        return cls(
+            group_name=data["group"],
+            pronouns=set(data.get("pronouns", [])),
+            candidates=[ReferentCandidate.from_dict(c) for c in data.get("candidates", [])],
+        )
 
 
 @dataclass
@@ -334,6 +375,21 @@ class WMTopic:
         if self.module:
             result["module"] = self.module
         return result
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "WMTopic":
+        return cls(
+            id=data["id"],
+            name=data["name"],
+            description=data.get("description"),
+            status=TopicStatus(data.get("status", TopicStatus.ACTIVE.value)),
+            related_entities=list(data.get("related_entities", [])),
+            parent_topic=data.get("parent_topic"),
+            first_mentioned=data.get("first_mentioned", 0),
+            last_mentioned=data.get("last_mentioned", 0),
+            key_points=list(data.get("key_points", [])),
+            module=data.get("module"),
+        )
 
 
 @dataclass
@@ -361,6 +417,19 @@ class WMGoal:
         if self.module:
             result["module"] = self.module
         return result
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "WMGoal":
+        return cls(
+            id=data["id"],
+            description=data["description"],
+            status=GoalStatus(data.get("status", GoalStatus.ACTIVE.value)),
+            related_entities=list(data.get("related_entities", [])),
+            related_topics=list(data.get("related_topics", [])),
+            created_at=data.get("created_at", 0),
+            resolved_at=data.get("resolved_at"),
+            module=data.get("module"),
+        )
 
 
 @dataclass
@@ -387,6 +456,19 @@ class WMQuestion:
         if self.module:
             result["module"] = self.module
         return result
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "WMQuestion":
+        return cls(
+            id=data["id"],
+            question=data["question"],
+            asker=data.get("asker", "user"),
+            turn_asked=data.get("turn_asked", 0),
+            turn_answered=data.get("turn_answered"),
+            answer=data.get("answer"),
+            related_entities=list(data.get("related_entities", [])),
+            module=data.get("module"),
+        )
 
 
 @dataclass 
@@ -422,6 +504,22 @@ class WMTurnSummary:
         if self.nova_message:
             result["nova_full"] = self.nova_message
         return result
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "WMTurnSummary":
+        """v0.12: Rebuild from to_dict() output (plus optional "timestamp")."""
+        timestamp = data.get("timestamp")
+        return cls(
+            turn_number=data["turn"],
+            user_summary=data.get("user", ""),
+            nova_summary=data.get("nova", ""),
+            entities_mentioned=list(data.get("entities", [])),
+            topics_discussed=list(data.get("topics", [])),
+            emotional_tone=EmotionalTone(data.get("tone", EmotionalTone.NEUTRAL.value)),
+            timestamp=datetime.fromisoformat(timestamp) if timestamp else datetime.now(),
+            user_message=data.get("user_full"),
+            nova_message=data.get("nova_full"),
+        )
 
 
 # Legacy compatibility - keep for API stability
@@ -598,6 +696,169 @@ META_QUESTION_PATTERNS = [
     (r"remind\s+me\s+(?:who|what)\s+(\w+)", "reminder"),
 ]
 
+# Topic phrases ("about X", "regarding X", "discussing X")
+TOPIC_PATTERNS = [
+    r"\babout\s+(.+?)(?:\.|,|$|\?)",
+    r"\bregarding\s+(.+?)(?:\.|,|$|\?)",
+    r"\bdiscuss(?:ing)?\s+(.+?)(?:\.|,|$|\?)",
+]
+
+
+# =============================================================================
+# v0.12 — PRE-FILTERED SCANNERS
+# =============================================================================
+
+_DIGITS = tuple("0123456789")
+
+# Pre-filter keywords per pattern: a pattern can only match if one of its
+# keywords occurs in the lowercased message. Patterns missing here always run.
+SCAN_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+    PERSON_PATTERNS[0][0]: ("talk", "speak", "spoke", "met", "call", "email", "messag", "text", "contact"),
+    PERSON_PATTERNS[1][0]: ("said", "told", "mention", "suggest", "ask", "want", "think", "help", "found"),
+    PERSON_PATTERNS[2][0]: ("is", "was", "are", "were", "seem", "look", "appear"),
+    PERSON_PATTERNS[3][0]: ("my",),
+    PERSON_PATTERNS[4][0]: ("'s",),
+    PERSON_PATTERNS[5][0]: ("with",),
+    RELATIONAL_PERSON_PATTERNS[0][0]: ("my",),
+    RELATIONAL_PERSON_PATTERNS[1][0]: ("the",),
+    RELATIONAL_PERSON_PATTERNS[2][0]: ("this",),
+    PROJECT_PATTERNS[0][0]: ("project",),
+    PROJECT_PATTERNS[1][0]: ("project",),
+    PROJECT_PATTERNS[2][0]: ("hack",),
+    PROJECT_PATTERNS[3][0]: ("nova",),
+    PROJECT_PATTERNS[4][0]: ("side",),
+    PROJECT_PATTERNS[5][0]: ("startup", "company", "business"),
+    TIME_PATTERNS[0]: ("yesterday", "today", "tomorrow", "last", "this", "next"),
+    TIME_PATTERNS[1]: ("day",),
+    TIME_PATTERNS[2]: _DIGITS,
+    TIME_PATTERNS[3]: _DIGITS,
+    TIME_PATTERNS[4]: _DIGITS,
+    TOPIC_PATTERNS[0]: ("about",),
+    TOPIC_PATTERNS[1]: ("regarding",),
+    TOPIC_PATTERNS[2]: ("discuss",),
+    GOAL_PATTERNS[0][0]: ("figure",),
+    GOAL_PATTERNS[1][0]: ("decide",),
+    GOAL_PATTERNS[2][0]: ("trying",),
+    GOAL_PATTERNS[3][0]: ("planning",),
+    EMOTIONAL_PATTERNS[EmotionalTone.STRESSED][0]: ("stressed", "anxious", "worried", "overwhelmed", "freaking"),
+    EMOTIONAL_PATTERNS[EmotionalTone.CONFUSED][0]: ("confused", "lost", "unsure", "understand", "unclear"),
+    EMOTIONAL_PATTERNS[EmotionalTone.FRUSTRATED][0]: ("frustrated", "annoyed", "irritated", "pissed", "angry"),
+    EMOTIONAL_PATTERNS[EmotionalTone.EXCITED][0]: ("excited", "pumped", "stoked", "thrilled", "wait"),
+    EMOTIONAL_PATTERNS[EmotionalTone.POSITIVE][0]: ("happy", "great", "good", "awesome", "fantastic", "wonderful"),
+    EMOTIONAL_PATTERNS[EmotionalTone.NEGATIVE][0]: ("sad", "bad", "terrible", "awful", "horrible", "sucks"),
+    EMOTIONAL_PATTERNS[EmotionalTone.UNCERTAIN][0]: ("maybe", "perhaps", "sure", "might", "possibly", "idk", "dunno"),
+    TANGENT_START_PATTERNS[0][0]: ("side",),
+    TANGENT_START_PATTERNS[1][0]: ("quick",),
+    TANGENT_START_PATTERNS[2][0]: ("small",),
+    TANGENT_START_PATTERNS[3][0]: ("different",),
+    TANGENT_START_PATTERNS[4][0]: ("new",),
+    TANGENT_START_PATTERNS[5][0]: ("another",),
+    TANGENT_START_PATTERNS[6][0]: ("unrelated",),
+    TANGENT_START_PATTERNS[7][0]: ("off",),
+    TANGENT_START_PATTERNS[8][0]: ("random",),
+    TANGENT_START_PATTERNS[9][0]: ("real",),
+    TOPIC_RETURN_PATTERNS[0][0]: ("anyway",),
+    TOPIC_RETURN_PATTERNS[1][0]: ("back",),
+    TOPIC_RETURN_PATTERNS[2][0]: ("where",),
+    TOPIC_RETURN_PATTERNS[3][0]: ("back",),
+    TOPIC_RETURN_PATTERNS[4][0]: ("returning",),
+    TOPIC_RETURN_PATTERNS[5][0]: ("anyway",),
+    TOPIC_RETURN_PATTERNS[6][0]: ("getting",),
+    TOPIC_RETURN_PATTERNS[7][0]: ("saying",),
+    META_QUESTION_PATTERNS[0][0]: ("about",),
+    META_QUESTION_PATTERNS[1][0]: ("saying",),
+    META_QUESTION_PATTERNS[2][0]: ("leave",),
+    META_QUESTION_PATTERNS[3][0]: ("remember",),
+    META_QUESTION_PATTERNS[4][0]: ("tell",),
+    META_QUESTION_PATTERNS[5][0]: ("know",),
+    META_QUESTION_PATTERNS[6][0]: ("discussing",),
+    META_QUESTION_PATTERNS[7][0]: ("they",),
+    META_QUESTION_PATTERNS[8][0]: ("who",),
+    META_QUESTION_PATTERNS[9][0]: ("context",),
+    META_QUESTION_PATTERNS[10][0]: ("catch",),
+    META_QUESTION_PATTERNS[11][0]: ("where",),
+    META_QUESTION_PATTERNS[12][0]: ("did",),
+    META_QUESTION_PATTERNS[13][0]: ("did",),
+    META_QUESTION_PATTERNS[14][0]: ("did",),
+    META_QUESTION_PATTERNS[15][0]: ("did",),
+    META_QUESTION_PATTERNS[16][0]: ("remind",),
+    META_QUESTION_PATTERNS[17][0]: ("remind",),
+}
+
+
+def _rules(family: str, patterns, flags: int = re.IGNORECASE) -> List[ScanRule]:
+    """ScanRules for a pattern table of strings or (pattern, label) pairs."""
+    rules = []
+    for entry in patterns:
+        pattern, label = entry if isinstance(entry, tuple) else (entry, None)
+        rules.append(ScanRule(family, label, pattern, flags, SCAN_KEYWORDS.get(pattern, ())))
+    return rules
+
+
+# Entity/topic/goal patterns run on the raw message
+MESSAGE_SCANNER = PatternScanner(
+    _rules("person", PERSON_PATTERNS)
+    + _rules("relation", RELATIONAL_PERSON_PATTERNS)
+    + _rules("project", PROJECT_PATTERNS)
+    + _rules("time", TIME_PATTERNS)
+    + _rules("topic", TOPIC_PATTERNS)
+    + _rules("goal", GOAL_PATTERNS)
+)
+
+# Tone, tangent/return and meta-question patterns run on message.lower().strip()
+LOWERED_SCANNER = PatternScanner(
+    [
+        ScanRule("tone", tone, pattern, 0, SCAN_KEYWORDS.get(pattern, ()))
+        for tone, patterns in EMOTIONAL_PATTERNS.items()
+        for pattern in patterns
+    ]
+    + _rules("tangent", TANGENT_START_PATTERNS)
+    + _rules("return", TOPIC_RETURN_PATTERNS)
+    + _rules("meta", META_QUESTION_PATTERNS),
+    lowercase=True,
+)
+
+
+# =============================================================================
+# v0.12 — INCREMENTAL PERSONA CONTEXT
+# =============================================================================
+
+# build_persona_context_string() sections, in render order. Each one is
+# rendered once and reused until mark_context_dirty() drops it.
+CONTEXT_SECTIONS = (
+    "head", "topic", "people", "projects", "pronouns",
+    "goals", "questions", "tone", "recent",
+)
+
+# Sections whose text depends on the target module (cached per module)
+MODULE_SCOPED_SECTIONS = frozenset({"head", "people", "projects", "goals", "questions"})
+
+# Sections that read entities / pronoun groups
+ENTITY_SECTIONS = ("people", "projects", "pronouns")
+
+CONTEXT_FOOTER = "\n".join([
+    "─" * 40,
+    "INSTRUCTIONS:",
+    "• You REMEMBER this conversation. Use the context above.",
+    "• When user says 'he/him', resolve to the MASCULINE person listed.",
+    "• When user says 'she/her', resolve to the FEMININE person listed.",
+    "• Do NOT say 'I don't know who you mean' if person is listed above.",
+    "• Reference earlier parts of conversation naturally.",
+    "─" * 40,
+])
+
+# Fragment reuse across all sessions (see wm_context_cache_stats)
+_context_cache_totals: Dict[str, int] = {"hits": 0, "misses": 0}
+
+
+def _cache_ratio(counts: Dict[str, int]) -> Dict[str, Any]:
+    lookups = counts["hits"] + counts["misses"]
+    return {
+        "hits": counts["hits"],
+        "misses": counts["misses"],
+        "hit_ratio": round(counts["hits"] / lookups, 4) if lookups else 0.0,
+    }
+
 
 # =============================================================================
 # WORKING MEMORY CLASS
@@ -668,6 +929,10 @@ class NovaWorkingMemory:
         self._question_counter = 0
         self._group_counter = 0  # v0.7.3
         self._snapshot_counter = 0  # v0.7.6
+
+        # v0.12: Rendered persona-context sections (section → {module: text})
+        self._context_fragments: Dict[str, Dict[Optional[str], str]] = {}
+        self._context_cache: Dict[str, int] = {"hits": 0, "misses": 0}
     
     # =========================================================================
     # ID GENERATION
@@ -701,6 +966,8 @@ class NovaWorkingMemory:
         """
         self.turn_count += 1
         self.last_updated = datetime.now()
+        previous_topic_id = self.active_topic_id
+        self.mark_context_dirty("head", "recent")
         
         # v0.7.9: Track module changes
         if module and module != self.current_module:
@@ -787,15 +1054,21 @@ class NovaWorkingMemory:
                 results["pronouns_resolved"][pronoun] = resolved.name
                 # Update the entity's last_mentioned
                 if resolved.id in self.entities:
+                    if resolved.last_mentioned != self.turn_count:
+                        self.mark_context_dirty("people", "projects")
                     self.entities[resolved.id].last_mentioned = self.turn_count
         
         # 8. Detect emotional tone
         tone = self._detect_emotional_tone(user_message)
+        if tone != self.emotional_tone:
+            self.mark_context_dirty("tone")
         self.emotional_tone = tone
         results["emotional_tone"] = tone.value
         
         # 9. Update active topic
         self._update_active_topic()
+        if self.active_topic_id != previous_topic_id:
+            self.mark_context_dirty("topic")
         
         # 10. Create turn summary
         user_summary = self._summarize_message(user_message)
@@ -837,6 +1110,7 @@ class NovaWorkingMemory:
             self.last_turn_summary.nova_summary = self._summarize_message(response)
             # PATCHED: Store full response for potential future use
             self.last_turn_summary.nova_message = response[:500] if response and len(response) > 500 else response
+            self.mark_context_dirty("recent")
     
     # =========================================================================
     # ENTITY MANAGEMENT
@@ -846,10 +1120,12 @@ class NovaWorkingMemory:
         """Extract entities from text."""
         entities = []
         seen_names = set()
+        scan = MESSAGE_SCANNER.scan(text)
         
         # Extract person names
-        for pattern, context in PERSON_PATTERNS:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
+        for rule, matches in scan.matches("person"):
+            context = rule.label
+            for match in matches:
                 name = match.group(1)
                 name_lower = name.lower()
                 
@@ -874,8 +1150,9 @@ class NovaWorkingMemory:
                 entities.append(entity)
         
         # Extract relational references
-        for pattern, context in RELATIONAL_PERSON_PATTERNS:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
+        for rule, matches in scan.matches("relation"):
+            context = rule.label
+            for match in matches:
                 ref = match.group(1)
                 ref_lower = ref.lower()
                 
@@ -906,8 +1183,9 @@ class NovaWorkingMemory:
         
         # Extract projects
         seen_projects = set()
-        for pattern, context in PROJECT_PATTERNS:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
+        for rule, matches in scan.matches("project"):
+            context = rule.label
+            for match in matches:
                 name = match.group(1).strip()
                 name_lower = name.lower()
                 
@@ -932,8 +1210,8 @@ class NovaWorkingMemory:
                 entities.append(entity)
         
         # Extract time references
-        for pattern in TIME_PATTERNS:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
+        for _, matches in scan.matches("time"):
+            for match in matches:
                 time_ref = match.group(1) if match.lastindex else match.group(0)
                 
                 entity = WMEntity(
@@ -1088,7 +1366,7 @@ class NovaWorkingMemory:
         # Add new entity
         self.entities[entity.id] = entity
         
-        # Add to appropriate pronoun group(s)
+        # Add to appropriate pronoun group(s) (marks the entity sections dirty)
         self._update_pronoun_candidates(entity)
         
         return entity
@@ -1099,7 +1377,12 @@ class NovaWorkingMemory:
         
         This is the KEY FIX: Instead of overwriting all pronouns,
         we add the entity to the appropriate gender-specific group only.
+        
+        v0.12: Every entity add/update/gender change goes through here, so
+        this is where the entity sections of the persona context go stale.
         """
+        self.mark_context_dirty(*ENTITY_SECTIONS)
+        
         if entity.entity_type == EntityType.PERSON:
             # Calculate base score (recency + mention count)
             base_score = entity.mention_count * 0.1 + (self.turn_count - entity.first_mentioned + 1) * 0.05
@@ -1314,14 +1597,8 @@ class NovaWorkingMemory:
         """Extract conversation topics from text."""
         topics = []
         
-        topic_patterns = [
-            r"\babout\s+(.+?)(?:\.|,|$|\?)",
-            r"\bregarding\s+(.+?)(?:\.|,|$|\?)",
-            r"\bdiscuss(?:ing)?\s+(.+?)(?:\.|,|$|\?)",
-        ]
-        
-        for pattern in topic_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
+        for _, matches in MESSAGE_SCANNER.scan(text).matches("topic"):
+            for match in matches:
                 topic_text = match.group(1).strip()
                 if len(topic_text) > 2 and len(topic_text) < 50:
                     topic = WMTopic(
@@ -1396,8 +1673,8 @@ class NovaWorkingMemory:
         goals = []
         seen_goals = set()
         
-        for pattern, _ in GOAL_PATTERNS:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
+        for _, matches in MESSAGE_SCANNER.scan(text).matches("goal"):
+            for match in matches:
                 goal_text = match.group(1).strip()
                 goal_text = re.sub(r'\s+', ' ', goal_text)
                 
@@ -1418,6 +1695,7 @@ class NovaWorkingMemory:
     def _add_goal(self, goal: WMGoal) -> None:
         """Add a new goal."""
         self.goals[goal.id] = goal
+        self.mark_context_dirty("goals")
     
     def get_active_goals(self) -> List[WMGoal]:
         """Get all active goals."""
@@ -1445,6 +1723,7 @@ class NovaWorkingMemory:
     def _add_question(self, question: WMQuestion) -> None:
         """Add a new question."""
         self.questions[question.id] = question
+        self.mark_context_dirty("questions")
     
     def get_unresolved_questions(self) -> List[WMQuestion]:
         """Get all unresolved questions."""
@@ -1468,12 +1747,9 @@ class NovaWorkingMemory:
     
     def _detect_emotional_tone(self, text: str) -> EmotionalTone:
         """Detect the emotional tone of the message."""
-        text_lower = text.lower()
-        
-        for tone, patterns in EMOTIONAL_PATTERNS.items():
-            for pattern in patterns:
-                if re.search(pattern, text_lower):
-                    return tone
+        hit = LOWERED_SCANNER.scan(text).first("tone")
+        if hit:
+            return hit[0].label
         
         return EmotionalTone.NEUTRAL
     
@@ -1674,12 +1950,52 @@ class NovaWorkingMemory:
         Build a formatted context string for injection into persona system prompt.
         
         v0.7.9: Added optional module parameter for module-scoped context.
+        v0.12: Built from per-section fragments; only sections marked dirty
+        since the last build (see mark_context_dirty) are re-rendered.
         """
         target_module = module or self.current_module
-        bundle = self.get_context_bundle(module=target_module)
-        lines = []
+        parts = []
         
-        lines.append("[WORKING MEMORY - CONVERSATION CONTEXT]")
+        for section in CONTEXT_SECTIONS:
+            key = target_module if section in MODULE_SCOPED_SECTIONS else None
+            rendered = self._context_fragments.setdefault(section, {})
+            if key in rendered:
+                self._context_cache["hits"] += 1
+                _context_cache_totals["hits"] += 1
+            else:
+                self._context_cache["misses"] += 1
+                _context_cache_totals["misses"] += 1
+                lines = getattr(self, f"_context_{section}")(target_module)
+                rendered[key] = "\n".join(lines)
+            if rendered[key]:
+                parts.append(rendered[key])
+        
+        # Instructions
+        parts.append(CONTEXT_FOOTER)
+        
+        return "\n".join(parts)
+    
+    def mark_context_dirty(self, *sections: str) -> None:
+        """
+        v0.12: Drop rendered persona-context sections (all if none given).
+        
+        Anything that changes WM state outside update() and the topic/group
+        methods must call this, or the persona keeps seeing the old text.
+        """
+        if not sections:
+            self._context_fragments.clear()
+            return
+        for section in sections:
+            self._context_fragments.pop(section, None)
+    
+    def context_cache_stats(self) -> Dict[str, Any]:
+        """v0.12: Section fragment hits/misses for this session."""
+        return _cache_ratio(self._context_cache)
+    
+    # Section renderers: each returns its lines, including the trailing blank
+    
+    def _context_head(self, target_module: Optional[str]) -> List[str]:
+        lines = ["[WORKING MEMORY - CONVERSATION CONTEXT]"]
         
         # v0.7.9: Show module scope
         if target_module:
@@ -1690,97 +2006,104 @@ class NovaWorkingMemory:
         
         lines.append(f"Turn {self.turn_count} in this conversation.")
         lines.append("")
-        
-        # Active topic
-        if bundle["active_topic"]:
-            topic = bundle["active_topic"]
-            topic_module = f" [{topic.get('module', 'global')}]" if topic.get('module') else ""
-            lines.append(f"CURRENT TOPIC: {topic['name']}{topic_module}")
-            if topic.get("description"):
-                lines.append(f"  → {topic['description']}")
-            lines.append("")
-        
-        # People mentioned - show module tag for clarity
-        people = bundle["entities"]["people"]
-        if people:
-            if target_module:
-                lines.append(f"PEOPLE ({target_module}-relevant):")
-            else:
-                lines.append("PEOPLE IN THIS CONVERSATION:")
-            for p in people:
-                desc = f" ({p['description']})" if p.get('description') else ""
-                gender = f" [{p.get('gender_hint', 'neutral')}]"
-                mod_tag = f" @{p.get('module')}" if p.get('module') else ""
-                lines.append(f"  • {p['name']}{desc}{gender}{mod_tag}")
-            lines.append("")
-        
-        # Projects/things mentioned
-        projects = bundle["entities"]["projects"]
-        if projects:
-            if target_module:
-                lines.append(f"PROJECTS/THINGS ({target_module}-relevant):")
-            else:
-                lines.append("PROJECTS/THINGS MENTIONED:")
-            for p in projects:
-                desc = f" ({p['description']})" if p.get('description') else ""
-                lines.append(f"  • {p['name']}{desc}")
-            lines.append("")
-        
+        return lines
+    
+    def _context_topic(self, target_module: Optional[str]) -> List[str]:
+        topic = self.get_active_topic()
+        if not topic:
+            return []
+        topic_module = f" [{topic.module}]" if topic.module else ""
+        lines = [f"CURRENT TOPIC: {topic.name}{topic_module}"]
+        if topic.description:
+            lines.append(f"  → {topic.description}")
+        lines.append("")
+        return lines
+    
+    def _context_people(self, target_module: Optional[str]) -> List[str]:
+        # Show module tag for clarity
+        people = self._get_entities_for_module(target_module, entity_type=EntityType.PERSON, limit=3)
+        if not people:
+            return []
+        if target_module:
+            lines = [f"PEOPLE ({target_module}-relevant):"]
+        else:
+            lines = ["PEOPLE IN THIS CONVERSATION:"]
+        for p in people:
+            desc = f" ({p.description})" if p.description else ""
+            gender = f" [{p.gender_hint.value}]"
+            mod_tag = f" @{p.module}" if p.module else ""
+            lines.append(f"  • {p.name}{desc}{gender}{mod_tag}")
+        lines.append("")
+        return lines
+    
+    def _context_projects(self, target_module: Optional[str]) -> List[str]:
+        projects = self._get_entities_for_module(target_module, entity_type=EntityType.PROJECT, limit=3)
+        if not projects:
+            return []
+        if target_module:
+            lines = [f"PROJECTS/THINGS ({target_module}-relevant):"]
+        else:
+            lines = ["PROJECTS/THINGS MENTIONED:"]
+        for p in projects:
+            desc = f" ({p.description})" if p.description else ""
+            lines.append(f"  • {p.name}{desc}")
+        lines.append("")
+        return lines
+    
+    def _context_pronouns(self, target_module: Optional[str]) -> List[str]:
         # v0.7.1: Improved pronoun resolution display
-        pronoun_summary = bundle.get("pronoun_groups", {})
-        if pronoun_summary:
-            lines.append("PRONOUN RESOLUTION:")
-            for pronoun_key, data in pronoun_summary.items():
-                best = data.get("best_match")
-                if best:
-                    lines.append(f"  • {pronoun_key} → {best}")
-            lines.append("")
-        
-        # Active goals
-        if bundle["goals"]:
-            lines.append("USER'S CURRENT GOALS:")
-            for g in bundle["goals"]:
-                lines.append(f"  • {g['description']}")
-            lines.append("")
-        
-        # Unresolved questions
-        if bundle["unresolved_questions"]:
-            lines.append("UNRESOLVED QUESTIONS:")
-            for q in bundle["unresolved_questions"]:
-                lines.append(f"  • {q['question'][:80]}")
-            lines.append("")
-        
-        # Emotional tone
-        if bundle["emotional_tone"] != "neutral":
-            lines.append(f"USER'S EMOTIONAL TONE: {bundle['emotional_tone']}")
-            lines.append("")
-        
-        # Recent conversation
-        if bundle["recent_turns"]:
-            lines.append("RECENT CONVERSATION:")
-            for turn in bundle["recent_turns"][-3:]:
-                user_text = turn['user']
-                if len(user_text) > 60:
-                    user_text = user_text[:60] + "..."
-                lines.append(f"  User: \"{user_text}\"")
-                if turn['nova']:
-                    nova_text = turn['nova']
-                    if len(nova_text) > 60:
-                        nova_text = nova_text[:60] + "..."
-                    lines.append(f"  Nova: \"{nova_text}\"")
-            lines.append("")
-        
-        # Instructions
-        lines.append("─" * 40)
-        lines.append("INSTRUCTIONS:")
-        lines.append("• You REMEMBER this conversation. Use the context above.")
-        lines.append("• When user says 'he/him', resolve to the MASCULINE person listed.")
-        lines.append("• When user says 'she/her', resolve to the FEMININE person listed.")
-        lines.append("• Do NOT say 'I don't know who you mean' if person is listed above.")
-        lines.append("• Reference earlier parts of conversation naturally.")
-        lines.append("─" * 40)
-        
-        return "\n".join(lines)
+        pronoun_summary = self.get_pronoun_resolution_summary()
+        if not pronoun_summary:
+            return []
+        lines = ["PRONOUN RESOLUTION:"]
+        for pronoun_key, data in pronoun_summary.items():
+            best = data.get("best_match")
+            if best:
+                lines.append(f"  • {pronoun_key} → {best}")
+        lines.append("")
+        return lines
+    
+    def _context_goals(self, target_module: Optional[str]) -> List[str]:
+        goals = self._get_goals_for_module(target_module)
+        if not goals:
+            return []
+        lines = ["USER'S CURRENT GOALS:"]
+        for g in goals:
+            lines.append(f"  • {g.description}")
+        lines.append("")
+        return lines
+    
+    def _context_questions(self, target_module: Optional[str]) -> List[str]:
+        unresolved = self._get_questions_for_module(target_module)
+        if not unresolved:
+            return []
+        lines = ["UNRESOLVED QUESTIONS:"]
+        for q in unresolved:
+            lines.append(f"  • {q.question[:80]}")
+        lines.append("")
+        return lines
+    
+    def _context_tone(self, target_module: Optional[str]) -> List[str]:
+        if self.emotional_tone == EmotionalTone.NEUTRAL:
+            return []
+        return [f"USER'S EMOTIONAL TONE: {self.emotional_tone.value}", ""]
+    
+    def _context_recent(self, target_module: Optional[str]) -> List[str]:
+        if not self.turn_history:
+            return []
+        lines = ["RECENT CONVERSATION:"]
+        for turn in self.turn_history[-3:]:
+            user_text = turn.user_summary
+            if len(user_text) > 60:
+                user_text = user_text[:60] + "..."
+            lines.append(f"  User: \"{user_text}\"")
+            if turn.nova_summary:
+                nova_text = turn.nova_summary
+                if len(nova_text) > 60:
+                    nova_text = nova_text[:60] + "..."
+                lines.append(f"  Nova: \"{nova_text}\"")
+        lines.append("")
+        return lines
     
     # =========================================================================
     # SPECIAL QUERIES (FOR REFERENCE QUESTIONS)
@@ -1900,6 +2223,7 @@ class NovaWorkingMemory:
         self.emotional_tone = EmotionalTone.NEUTRAL
         self.turn_count = 0
         self.last_updated = datetime.now()
+        self.mark_context_dirty()
     
     # =========================================================================
     # v0.7.3 — TOPIC MANAGEMENT EXTENSIONS
@@ -1926,6 +2250,7 @@ class NovaWorkingMemory:
         ]
         for qid in topic_questions:
             del self.questions[qid]
+        self.mark_context_dirty("topic", "questions")
         
         if old_topic_name:
             return f"Topic '{old_topic_name}' cleared. People and entities remain remembered."
@@ -1941,6 +2266,8 @@ class NovaWorkingMemory:
         Returns:
             The new topic ID
         """
+        self.mark_context_dirty("topic")
+        
         # Push current topic to stack if exists
         if self.active_topic_id:
             self.topic_stack.append(self.active_topic_id)
@@ -1977,6 +2304,7 @@ class NovaWorkingMemory:
         """
         if not self.topic_stack:
             return None
+        self.mark_context_dirty("topic")
         
         # Mark current topic as paused
         if self.active_topic_id and self.active_topic_id in self.topics:
@@ -2031,6 +2359,7 @@ class NovaWorkingMemory:
             self.topics[topic_identifier].status = TopicStatus.ACTIVE
             self.topics[topic_identifier].last_mentioned = self.turn_count
             self.active_topic_id = topic_identifier
+            self.mark_context_dirty("topic")
             return topic_identifier
         
         # Try by name (case-insensitive)
@@ -2042,6 +2371,7 @@ class NovaWorkingMemory:
                 topic.status = TopicStatus.ACTIVE
                 topic.last_mentioned = self.turn_count
                 self.active_topic_id = tid
+                self.mark_context_dirty("topic")
                 return tid
         
         return None
@@ -2091,6 +2421,7 @@ class NovaWorkingMemory:
         
         self.entities[group_id] = group_entity
         self.groups[group_id] = member_ids
+        self.mark_context_dirty(*ENTITY_SECTIONS)
         
         # Add to neutral pronoun group with high priority
         candidate = ReferentCandidate(
@@ -2171,6 +2502,7 @@ class NovaWorkingMemory:
                 last_mentioned=self.turn_count,
             )
             self.entities[entity1.id] = entity1
+            self.mark_context_dirty("people")
         
         if not entity2:
             entity2 = WMEntity(
@@ -2181,6 +2513,7 @@ class NovaWorkingMemory:
                 last_mentioned=self.turn_count,
             )
             self.entities[entity2.id] = entity2
+            self.mark_context_dirty("people")
         
         # Check if this group already exists
         group_name = f"{name1} and {name2}"
@@ -2208,10 +2541,13 @@ class NovaWorkingMemory:
         Returns:
             Dict with tangent info if detected, None otherwise
         """
-        message_lower = message.lower().strip()
+        scan = LOWERED_SCANNER.scan(message)
+        message_lower = scan.text
         
-        for pattern, trigger_name in TANGENT_START_PATTERNS:
-            if re.match(pattern, message_lower, re.IGNORECASE):
+        for rule, matches in scan.matches("tangent"):
+            trigger_name = rule.label
+            match = matches[0]
+            if match.start() == 0:
                 # Push current topic to stack
                 old_topic_id = self.active_topic_id
                 old_topic_name = None
@@ -2225,7 +2561,7 @@ class NovaWorkingMemory:
                     self.topics[old_topic_id].status = TopicStatus.PAUSED
                 
                 # Extract tangent topic from rest of message
-                cleaned = re.sub(pattern, "", message_lower, count=1, flags=re.IGNORECASE).strip()
+                cleaned = (message_lower[:match.start()] + message_lower[match.end():]).strip()
                 tangent_topic = cleaned[:50] if cleaned else "tangent"
                 
                 return {
@@ -2244,11 +2580,10 @@ class NovaWorkingMemory:
         Returns:
             Dict with return info if detected, None otherwise
         """
-        message_lower = message.lower().strip()
-        
-        for pattern, trigger_name in TOPIC_RETURN_PATTERNS:
-            match = re.match(pattern, message_lower, re.IGNORECASE)
-            if match:
+        for rule, matches in LOWERED_SCANNER.scan(message).matches("return"):
+            trigger_name = rule.label
+            match = matches[0]
+            if match.start() == 0:
                 # Check if they mentioned a specific topic
                 target_topic = None
                 if match.lastindex and match.lastindex >= 1:
@@ -2292,23 +2627,21 @@ class NovaWorkingMemory:
         Returns:
             Dict with meta-question type and extracted info, or None
         """
-        message_lower = message.lower().strip()
+        hit = LOWERED_SCANNER.scan(message).first("meta")
+        if not hit:
+            return None
         
-        for pattern, question_type in META_QUESTION_PATTERNS:
-            match = re.search(pattern, message_lower, re.IGNORECASE)
-            if match:
-                result = {
-                    "type": question_type,
-                    "pattern": pattern,
-                }
-                
-                # Extract entity name if captured
-                if match.lastindex and match.lastindex >= 1:
-                    result["entity_mentioned"] = match.group(1)
-                
-                return result
+        rule, match = hit
+        result = {
+            "type": rule.label,
+            "pattern": rule.pattern,
+        }
         
-        return None
+        # Extract entity name if captured
+        if match.lastindex and match.lastindex >= 1:
+            result["entity_mentioned"] = match.group(1)
+        
+        return result
     
     def answer_meta_question(self, meta_info: Dict[str, Any]) -> Optional[str]:
         """
@@ -2690,6 +3023,7 @@ class NovaWorkingMemory:
             elif gender_hint == GenderHint.FEMININE:
                 self.pronoun_groups["feminine"].add_candidate(candidate)
             self.pronoun_groups["neutral"].add_candidate(candidate)
+            self.mark_context_dirty(*ENTITY_SECTIONS)
         
         # Rehydrate groups
         for group_data in snapshot_data.get("groups", []):
@@ -2861,6 +3195,7 @@ class NovaWorkingMemory:
                 topic.status = TopicStatus.ACTIVE
                 topic.last_mentioned = self.turn_count
                 self.active_topic_id = tid
+                self.mark_context_dirty("topic")
                 return tid
         
         # No existing topic, create new
@@ -2870,9 +3205,15 @@ class NovaWorkingMemory:
     # SERIALIZATION
     # =========================================================================
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Serialize full state for debugging."""
-        return {
+    def to_dict(self, full: bool = False) -> Dict[str, Any]:
+        """
+        Serialize state for debugging.
+        
+        v0.12: full=True adds what from_dict() needs to rebuild the instance
+        (turn history, entity events, module tracking, ID counters). The
+        session registry spills evicted sessions this way.
+        """
+        data = {
             "session_id": self.session_id,
             "turn_count": self.turn_count,
             "entities": {k: v.to_dict() for k, v in self.entities.items()},
@@ -2893,6 +3234,85 @@ class NovaWorkingMemory:
             # v0.7.7
             "entity_events_count": {k: len(v) for k, v in self.entity_events.items()},
         }
+        if full:
+            data.update({
+                "max_history": self.max_history,
+                "turn_history": [
+                    dict(t.to_dict(), timestamp=t.timestamp.isoformat()) for t in self.turn_history
+                ],
+                "last_turn": (
+                    dict(self.last_turn_summary.to_dict(), timestamp=self.last_turn_summary.timestamp.isoformat())
+                    if self.last_turn_summary else None
+                ),
+                "entity_events": self.entity_events,
+                "current_module": self.current_module,
+                "module_history": self.module_history,
+                "created_at": self.created_at.isoformat(),
+                "last_updated": self.last_updated.isoformat(),
+                "counters": {
+                    "entity": self._entity_counter,
+                    "topic": self._topic_counter,
+                    "goal": self._goal_counter,
+                    "question": self._question_counter,
+                    "group": self._group_counter,
+                    "snapshot": self._snapshot_counter,
+                },
+            })
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "NovaWorkingMemory":
+        """v0.12: Rebuild an instance from to_dict(full=True) output."""
+        wm = cls(data["session_id"], max_history=data.get("max_history", 30))
+        wm.turn_count = data.get("turn_count", 0)
+        wm.entities = {k: WMEntity.from_dict(v) for k, v in data.get("entities", {}).items()}
+        wm.topics = {k: WMTopic.from_dict(v) for k, v in data.get("topics", {}).items()}
+        wm.goals = {k: WMGoal.from_dict(v) for k, v in data.get("goals", {}).items()}
+        wm.questions = {k: WMQuestion.from_dict(v) for k, v in data.get("questions", {}).items()}
+        for name, group in data.get("pronoun_groups", {}).items():
+            if name in wm.pronoun_groups:
+                # Keep the shared pronoun sets; only candidates are state
+                wm.pronoun_groups[name].candidates = [
+                    ReferentCandidate.from_dict(c) for c in group.get("candidates", [])
+                ]
+            else:
+                wm.pronoun_groups[name] = PronounGroup.from_dict(group)
+        wm.referents = {
+            k: PronounReferent(pronoun=k, entity_id=v["entity"], confidence=v.get("confidence", 1.0))
+            for k, v in data.get("referents", {}).items()
+        }
+        wm.active_topic_id = data.get("active_topic_id")
+        wm.topic_stack = list(data.get("topic_stack", []))
+        wm.groups = {k: list(v) for k, v in data.get("groups", {}).items()}
+        wm.emotional_tone = EmotionalTone(data.get("emotional_tone", EmotionalTone.NEUTRAL.value))
+        wm.snapshots_saved = list(data.get("snapshots_saved", []))
+        wm.snapshots_loaded = list(data.get("snapshots_loaded", []))
+        wm.rehydrated_from = data.get("rehydrated_from")
+        
+        wm.turn_history = [WMTurnSummary.from_dict(t) for t in data.get("turn_history", [])]
+        last_turn = data.get("last_turn")
+        if last_turn:
+            # Keep the identity with the last history entry, as update() leaves it
+            if wm.turn_history and wm.turn_history[-1].turn_number == last_turn["turn"]:
+                wm.last_turn_summary = wm.turn_history[-1]
+            else:
+                wm.last_turn_summary = WMTurnSummary.from_dict(last_turn)
+        wm.entity_events = {k: list(v) for k, v in data.get("entity_events", {}).items()}
+        wm.current_module = data.get("current_module")
+        wm.module_history = list(data.get("module_history", []))
+        if data.get("created_at"):
+            wm.created_at = datetime.fromisoformat(data["created_at"])
+        if data.get("last_updated"):
+            wm.last_updated = datetime.fromisoformat(data["last_updated"])
+        
+        counters = data.get("counters", {})
+        wm._entity_counter = counters.get("entity", 0)
+        wm._topic_counter = counters.get("topic", 0)
+        wm._goal_counter = counters.get("goal", 0)
+        wm._question_counter = counters.get("question", 0)
+        wm._group_counter = counters.get("group", 0)
+        wm._snapshot_counter = counters.get("snapshot", 0)
+        return wm
 
 
 # =============================================================================
@@ -2900,25 +3320,38 @@ class NovaWorkingMemory:
 # =============================================================================
 
 class NovaWMManager:
-    """Global manager for Working Memory instances across sessions."""
+    """
+    Global manager for Working Memory instances across sessions.
+    
+    v0.12: Instances live in a bounded SessionRegistry (LRU + idle TTL +
+    memory budget); evicted sessions spill to disk and come back on access.
+    """
     
     def __init__(self):
-        self._instances: Dict[str, NovaWorkingMemory] = {}
+        self._instances: SessionRegistry[NovaWorkingMemory] = register_session_registry(SessionRegistry(
+            "wm",
+            factory=NovaWorkingMemory,
+            dump=lambda wm: wm.to_dict(full=True),
+            load=NovaWorkingMemory.from_dict,
+        ))
     
     def get(self, session_id: str) -> NovaWorkingMemory:
         """Get or create Working Memory for a session."""
-        if session_id not in self._instances:
-            self._instances[session_id] = NovaWorkingMemory(session_id)
-        return self._instances[session_id]
+        return self._instances.get(session_id)
     
     def clear(self, session_id: str) -> None:
         """Clear Working Memory for a session."""
-        if session_id in self._instances:
-            self._instances[session_id].clear()
+        wm = self._instances.peek(session_id)
+        if wm is not None:
+            wm.clear()
     
     def delete(self, session_id: str) -> None:
         """Delete Working Memory for a session."""
-        self._instances.pop(session_id, None)
+        self._instances.discard(session_id)
+    
+    def stats(self) -> Dict[str, Any]:
+        """v0.12: Live/spilled sessions, evictions, rehydrations."""
+        return self._instances.stats()
 
 
 # Global instance
@@ -2934,6 +3367,11 @@ def get_wm(session_id: str) -> NovaWorkingMemory:
     return _wm_manager.get(session_id)
 
 
+def wm_session_stats() -> Dict[str, Any]:
+    """v0.12: Session registry counters for Working Memory."""
+    return _wm_manager.stats()
+
+
 def wm_update(session_id: str, user_message: str, nova_response: Optional[str] = None, module: Optional[str] = None) -> Dict[str, Any]:
     """
     Update Working Memory with a new turn.
@@ -3046,9 +3484,22 @@ def wm_get_status(session_id: str) -> Dict[str, Any]:
         "snapshots_saved": len(wm.snapshots_saved),
         "snapshots_loaded": len(wm.snapshots_loaded),
         "groups": len(wm.groups),
+        "context_cache": wm.context_cache_stats(),  # v0.12
     }
 
 
+def wm_context_cache_stats(session_id: Optional[str] = None) -> Dict[str, Any]:
+    """
+    v0.12: Persona-context fragment hits/misses and hit ratio.
+    
+    For one session if session_id is given, else across all sessions
+    since process start.
+    """
+    if session_id is not None:
+        return _wm_manager.get(session_id).context_cache_stats()
+    return _cache_ratio(_context_cache_totals)
+
+
 # =============================================================================
 # v0.7.3 PUBLIC API ADDITIONS
 # =============================================================================
@@ -59,12 +59,14 @@ Integration:
 This layer is ADDITIVE — it does not modify v0.7.1 entity/pronoun logic.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, is_dataclass
 from typing import Optional, List, Dict, Any, Set, Tuple
 from enum import Enum
 from datetime import datetime
 import re
 
+from .session_registry import SessionRegistry, register_session_registry
+
 
 # =============================================================================
 # ENUMS
@@ -444,6 +446,38 @@ NOVA_QUESTION_PATTERNS = [
 ]
 
 
+# =============================================================================
+# v0.12 — INCREMENTAL CONTEXT STRING
+# =============================================================================
+
+# build_context_string() sections, in render order. Each one is rendered
+# once and reused until mark_context_dirty() drops it; only "head" depends
+# on the target module.
+BEHAVIOR_CONTEXT_SECTIONS = ("head", "goal", "questions", "state", "thread", "transition")
+
+BEHAVIOR_CONTEXT_FOOTER = "\n".join([
+    "",
+    "─" * 40,
+    "BEHAVIOR INSTRUCTIONS:",
+    "• If user gives short reply (yes/no/idk), map to AWAITING RESPONSE question.",
+    "• Acknowledge user state naturally if stressed/confused/urgent.",
+    "• Keep goal in mind when responding.",
+    "─" * 40,
+])
+
+# Fragment reuse across all sessions (see behavior_context_cache_stats)
+_context_cache_totals: Dict[str, int] = {"hits": 0, "misses": 0}
+
+
+def _cache_ratio(counts: Dict[str, int]) -> Dict[str, Any]:
+    lookups = counts["hits"] + counts["misses"]
+    return {
+        "hits": counts["hits"],
+        "misses": counts["misses"],
+        "hit_ratio": round(counts["hits"] / lookups, 4) if lookups else 0.0,
+    }
+
+
 # =============================================================================
 # BEHAVIOR ENGINE
 # =============================================================================
@@ -498,6 +532,10 @@ class WMBehaviorEngine:
         # v0.7.9: Module awareness
         self.current_module: Optional[str] = None
         self.module_history: List[str] = []
+        
+        # v0.12: Rendered context sections (section → {module: lines})
+        self._context_fragments: Dict[str, Dict[Optional[str], Tuple[str, ...]]] = {}
+        self._context_cache: Dict[str, int] = {"hits": 0, "misses": 0}
     
     # =========================================================================
     # ID GENERATION
@@ -599,6 +637,8 @@ class WMBehaviorEngine:
         for q in questions:
             self.open_questions.append(q)
             result["questions_found"].append(q.to_dict())
+        if questions:
+            self.mark_context_dirty("questions")
         
         # Keep only last 5 open questions
         if len(self.open_questions) > 5:
@@ -690,6 +730,7 @@ class WMBehaviorEngine:
         question.answered = True
         question.answer_turn = self.turn_count
         question.answer_text = answer
+        self.mark_context_dirty("questions")
     
     # =========================================================================
     # TOPIC SWITCHING
@@ -722,6 +763,7 @@ class WMBehaviorEngine:
                 )
                 self.topic_transitions.append(transition)
                 self.current_topic_id = new_topic
+                self.mark_context_dirty("transition")
                 
                 # Close previous topic's goal if any
                 if self.active_goal_id and old_topic:
@@ -809,6 +851,7 @@ class WMBehaviorEngine:
             self.goal_stack.append(self.active_goal_id)
         
         self.active_goal_id = goal.id
+        self.mark_context_dirty("goal")
     
     def _pause_goal(self, goal_id: str) -> None:
         """Pause a goal (when switching topics)."""
@@ -816,6 +859,7 @@ class WMBehaviorEngine:
             # Don't change status, just remove from active
             if self.active_goal_id == goal_id:
                 self.active_goal_id = None
+                self.mark_context_dirty("goal")
     
     def resolve_goal(self, goal_id: str = None, resolution: str = None) -> bool:
         """
@@ -836,6 +880,7 @@ class WMBehaviorEngine:
         goal.status = GoalStatus.RESOLVED
         goal.resolved_at = self.turn_count
         goal.resolution = resolution
+        self.mark_context_dirty("goal")
         
         # Pop from stack if needed
         if self.active_goal_id == target_id:
@@ -918,6 +963,7 @@ class WMBehaviorEngine:
         # Store signals
         self.user_state.signals = signals[:3]  # Keep top 3
         self.user_state.last_updated = self.turn_count
+        self.mark_context_dirty("state")
     
     # =========================================================================
     # NOVA QUESTION EXTRACTION
@@ -964,6 +1010,8 @@ class WMBehaviorEngine:
         """
         Update the thread summary with current state.
         """
+        rendered = (self.thread_summary.participants, self.thread_summary.unresolved_questions)
+        
         # Topic
         if wm_context.get("active_topic"):
             self.thread_summary.topic = wm_context["active_topic"].get("name")
@@ -987,6 +1035,9 @@ class WMBehaviorEngine:
         # Update turn range
         start = self.thread_summary.turn_range[0] or self.turn_count
         self.thread_summary.turn_range = (start, self.turn_count)
+        
+        if rendered != (self.thread_summary.participants, self.thread_summary.unresolved_questions):
+            self.mark_context_dirty("thread")
     
     # =========================================================================
     # CONTEXT GENERATION
@@ -1019,67 +1070,109 @@ class WMBehaviorEngine:
         Build a formatted context string for persona system prompt.
         
         v0.7.9: Added optional module parameter.
+        v0.12: Built from per-section fragments; only sections marked dirty
+        since the last build (see mark_context_dirty) are re-rendered.
         """
         target_module = module or self.current_module
-        ctx = self.get_context(module=target_module)
         lines = []
         
-        lines.append("[BEHAVIOR LAYER - CONVERSATIONAL CONTINUITY]")
+        for section in BEHAVIOR_CONTEXT_SECTIONS:
+            key = target_module if section == "head" else None
+            rendered = self._context_fragments.setdefault(section, {})
+            if key in rendered:
+                self._context_cache["hits"] += 1
+                _context_cache_totals["hits"] += 1
+            else:
+                self._context_cache["misses"] += 1
+                _context_cache_totals["misses"] += 1
+                rendered[key] = tuple(getattr(self, f"_context_{section}")(target_module))
+            lines.extend(rendered[key])
+        
+        if len(lines) <= 3:  # Only header + module
+            return ""  # No behavior context needed
+        
+        lines.append(BEHAVIOR_CONTEXT_FOOTER)
+        
+        return "\n".join(lines)
+    
+    def mark_context_dirty(self, *sections: str) -> None:
+        """
+        v0.12: Drop rendered context sections (all if none given).
+        
+        Code that edits engine state directly (e.g. episodic restore) must
+        call this, or build_context_string() keeps returning the old text.
+        """
+        if not sections:
+            self._context_fragments.clear()
+            return
+        for section in sections:
+            self._context_fragments.pop(section, None)
+    
+    def context_cache_stats(self) -> Dict[str, Any]:
+        """v0.12: Section fragment hits/misses for this session."""
+        return _cache_ratio(self._context_cache)
+    
+    # Section renderers: each returns its lines
+    
+    def _context_head(self, target_module: Optional[str]) -> List[str]:
+        lines = ["[BEHAVIOR LAYER - CONVERSATIONAL CONTINUITY]"]
         
         # v0.7.9: Show module context
         if target_module:
             lines.append(f"ACTIVE MODULE: {target_module}")
         lines.append("")
-        
-        # Active goal
-        if ctx["active_goal"]:
-            lines.append(f"ACTIVE GOAL: {ctx['active_goal']['description']}")
-            lines.append(f"  Type: {ctx['goal_type']}")
-            lines.append("")
-        
+        return lines
+    
+    def _context_goal(self, target_module: Optional[str]) -> List[str]:
+        active_goal = self.get_active_goal()
+        if not active_goal:
+            return []
+        return [
+            f"ACTIVE GOAL: {active_goal.description}",
+            f"  Type: {active_goal.goal_type.value}",
+            "",
+        ]
+    
+    def _context_questions(self, target_module: Optional[str]) -> List[str]:
         # Open questions (questions Nova asked)
-        if ctx["open_questions"]:
-            lines.append("AWAITING USER RESPONSE TO:")
-            for q in ctx["open_questions"][:2]:
-                lines.append(f"  • \"{q['text'][:60]}...\"" if len(q['text']) > 60 else f"  • \"{q['text']}\"")
-            lines.append("")
-        
-        # User state
-        if ctx["user_state_signal"]:
-            lines.append(f"USER STATE: {ctx['user_state_signal']}")
-            state = ctx["user_state"]
-            if state["stress_level"] > 0.5:
-                lines.append(f"  ⚠️ User appears stressed")
-            if state["clarity_level"] < 0.4:
-                lines.append(f"  ⚠️ User may be confused")
-            if state["urgency"] > 0.5:
-                lines.append(f"  ⚠️ User indicates urgency")
-            lines.append("")
-        
-        # Thread summary
-        summary = ctx["thread_summary"]
-        if summary.get("participants"):
-            lines.append(f"PARTICIPANTS: {', '.join(summary['participants'])}")
-        if summary.get("unresolved_questions"):
-            lines.append(f"UNRESOLVED: {len(summary['unresolved_questions'])} questions pending")
-        
-        # Topic transitions
-        if ctx["topic_transitions"]:
-            last_transition = ctx["topic_transitions"][-1]
-            lines.append(f"TOPIC SHIFT: '{last_transition.get('from')}' → '{last_transition.get('to')}'")
-        
-        if len(lines) <= 3:  # Only header + module
-            return ""  # No behavior context needed
-        
+        open_questions = [q for q in self.open_questions if not q.answered]
+        if not open_questions:
+            return []
+        lines = ["AWAITING USER RESPONSE TO:"]
+        for q in open_questions[:2]:
+            lines.append(f"  • \"{q.text[:60]}...\"" if len(q.text) > 60 else f"  • \"{q.text}\"")
         lines.append("")
-        lines.append("─" * 40)
-        lines.append("BEHAVIOR INSTRUCTIONS:")
-        lines.append("• If user gives short reply (yes/no/idk), map to AWAITING RESPONSE question.")
-        lines.append("• Acknowledge user state naturally if stressed/confused/urgent.")
-        lines.append("• Keep goal in mind when responding.")
-        lines.append("─" * 40)
-        
-        return "\n".join(lines)
+        return lines
+    
+    def _context_state(self, target_module: Optional[str]) -> List[str]:
+        signal = self.user_state.get_primary_signal()
+        if not signal:
+            return []
+        lines = [f"USER STATE: {signal}"]
+        state = self.user_state.to_dict()
+        if state["stress_level"] > 0.5:
+            lines.append(f"  ⚠️ User appears stressed")
+        if state["clarity_level"] < 0.4:
+            lines.append(f"  ⚠️ User may be confused")
+        if state["urgency"] > 0.5:
+            lines.append(f"  ⚠️ User indicates urgency")
+        lines.append("")
+        return lines
+    
+    def _context_thread(self, target_module: Optional[str]) -> List[str]:
+        summary = self.thread_summary
+        lines = []
+        if summary.participants:
+            lines.append(f"PARTICIPANTS: {', '.join(summary.participants)}")
+        if summary.unresolved_questions:
+            lines.append(f"UNRESOLVED: {len(summary.unresolved_questions)} questions pending")
+        return lines
+    
+    def _context_transition(self, target_module: Optional[str]) -> List[str]:
+        if not self.topic_transitions:
+            return []
+        last_transition = self.topic_transitions[-1]
+        return [f"TOPIC SHIFT: '{last_transition.from_topic}' → '{last_transition.to_topic}'"]
     
     # =========================================================================
     # ANSWER REFERENCE QUESTIONS
@@ -1136,6 +1229,7 @@ class WMBehaviorEngine:
         self.thread_summary = ThreadSummary()
         self.last_nova_response = None
         self.last_implicit_mapping = None
+        self.mark_context_dirty()
         # v0.7.3: Keep behavior_mode on clear (intentional)
     
     # =========================================================================
@@ -1427,9 +1521,15 @@ class WMBehaviorEngine:
     # SERIALIZATION
     # =========================================================================
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Serialize for debugging."""
-        return {
+    def to_dict(self, full: bool = False) -> Dict[str, Any]:
+        """
+        Serialize for debugging.
+        
+        v0.12: full=True swaps the summarized sub-objects for their complete
+        field values and adds what from_dict() needs to rebuild the engine.
+        The session registry spills evicted sessions this way.
+        """
+        data = {
             "session_id": self.session_id,
             "turn_count": self.turn_count,
             "behavior_mode": self.behavior_mode,  # v0.7.3
@@ -1442,6 +1542,71 @@ class WMBehaviorEngine:
             "topic_transitions": [t.to_dict() for t in self.topic_transitions],
             "thread_summary": self.thread_summary.to_dict(),
         }
+        if full:
+            data.update({
+                "open_questions": [_plain(q) for q in self.open_questions],
+                "goals": {k: _plain(v) for k, v in self.goals.items()},
+                "user_state": _plain(self.user_state),
+                "topic_transitions": [_plain(t) for t in self.topic_transitions],
+                "thread_summary": _plain(self.thread_summary),
+                "last_nova_response": self.last_nova_response,
+                "last_implicit_mapping": self.last_implicit_mapping,
+                "current_module": self.current_module,
+                "module_history": self.module_history,
+                "counters": {"question": self._question_counter, "goal": self._goal_counter},
+            })
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "WMBehaviorEngine":
+        """v0.12: Rebuild an engine from to_dict(full=True) output."""
+        engine = cls(data["session_id"])
+        engine.turn_count = data.get("turn_count", 0)
+        engine.behavior_mode = data.get("behavior_mode", "normal")
+        engine.open_questions = [OpenQuestion(**q) for q in data.get("open_questions", [])]
+        engine.goals = {
+            k: ConversationGoal(**dict(
+                v,
+                goal_type=ConversationGoalType(v["goal_type"]),
+                status=GoalStatus(v["status"]),
+            ))
+            for k, v in data.get("goals", {}).items()
+        }
+        engine.active_goal_id = data.get("active_goal_id")
+        engine.goal_stack = list(data.get("goal_stack", []))
+        if "user_state" in data:
+            state = data["user_state"]
+            engine.user_state = UserState(**dict(
+                state, signals=[UserStateSignal(s) for s in state.get("signals", [])]
+            ))
+        engine.current_topic_id = data.get("current_topic_id")
+        engine.topic_transitions = [TopicTransition(**t) for t in data.get("topic_transitions", [])]
+        if "thread_summary" in data:
+            summary = data["thread_summary"]
+            engine.thread_summary = ThreadSummary(**dict(
+                summary, turn_range=tuple(summary.get("turn_range", (0, 0)))
+            ))
+        engine.last_nova_response = data.get("last_nova_response")
+        engine.last_implicit_mapping = data.get("last_implicit_mapping")
+        engine.current_module = data.get("current_module")
+        engine.module_history = list(data.get("module_history", []))
+        counters = data.get("counters", {})
+        engine._question_counter = counters.get("question", 0)
+        engine._goal_counter = counters.get("goal", 0)
+        return engine
+
+
+def _plain(value: Any) -> Any:
+    """v0.12: Dataclass/enum state -> JSON-safe values (for to_dict(full=True))."""
+    if is_dataclass(value):
+        return {f.name: _plain(getattr(value, f.name)) for f in fields(value)}
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (list, tuple)):
+        return [_plain(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _plain(v) for k, v in value.items()}
+    return value
 
 
 # =============================================================================
@@ -1449,25 +1614,37 @@ class WMBehaviorEngine:
 # =============================================================================
 
 class BehaviorEngineManager:
-    """Global manager for Behavior Engine instances across sessions."""
+    """
+    Global manager for Behavior Engine instances across sessions.
+    
+    v0.12: Instances live in a bounded SessionRegistry (see NovaWMManager).
+    """
     
     def __init__(self):
-        self._instances: Dict[str, WMBehaviorEngine] = {}
+        self._instances: SessionRegistry[WMBehaviorEngine] = register_session_registry(SessionRegistry(
+            "behavior",
+            factory=WMBehaviorEngine,
+            dump=lambda engine: engine.to_dict(full=True),
+            load=WMBehaviorEngine.from_dict,
+        ))
     
     def get(self, session_id: str) -> WMBehaviorEngine:
         """Get or create Behavior Engine for a session."""
-        if session_id not in self._instances:
-            self._instances[session_id] = WMBehaviorEngine(session_id)
-        return self._instances[session_id]
+        return self._instances.get(session_id)
     
     def clear(self, session_id: str) -> None:
         """Clear Behavior Engine for a session."""
-        if session_id in self._instances:
-            self._instances[session_id].clear()
+        engine = self._instances.peek(session_id)
+        if engine is not None:
+            engine.clear()
     
     def delete(self, session_id: str) -> None:
         """Delete Behavior Engine for a session."""
-        self._instances.pop(session_id, None)
+        self._instances.discard(session_id)
+    
+    def stats(self) -> Dict[str, Any]:
+        """v0.12: Live/spilled sessions, evictions, rehydrations."""
+        return self._instances.stats()
 
 
 # Global instance
@@ -1483,6 +1660,23 @@ def get_behavior_engine(session_id: str) -> WMBehaviorEngine:
     return _behavior_manager.get(session_id)
 
 
+def behavior_session_stats() -> Dict[str, Any]:
+    """v0.12: Session registry counters for the Behavior Layer."""
+    return _behavior_manager.stats()
+
+
+def behavior_context_cache_stats(session_id: Optional[str] = None) -> Dict[str, Any]:
+    """
+    v0.12: Context-string fragment hits/misses and hit ratio.
+
+    For one session if session_id is given, else across all sessions
+    since process start.
+    """
+    if session_id is not None:
+        return _behavior_manager.get(session_id).context_cache_stats()
+    return _cache_ratio(_context_cache_totals)
+
+
 def behavior_update(
     session_id: str, 
     user_message: str, 
@@ -14,6 +14,11 @@ Key Capabilities:
 This module sits ABOVE NovaWM and Behavior Layer.
 It does NOT modify their internal logic.
 
+v0.12: Stored snapshots are indexed by topic token, participant and
+module (EpisodicSnapshotIndex, persisted next to the memory store and
+shared by all worker processes). Relevance lookups score index entries
+and only deserialize the final top-k.
+
 Usage:
     from nova_wm_episodic import (
         episodic_snapshot,
@@ -23,12 +28,28 @@ Usage:
     )
 """
 
+from contextlib import contextmanager
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Optional, List, Dict, Any, Set, Tuple
 from datetime import datetime, timedelta
 from enum import Enum
 import json
+import logging
 import re
+import threading
+import weakref
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows: saves are only serialized in-process
+    fcntl = None
+
+from .memory_engine import _atomic_write_text
+from .trace_store import SIDE_FIELDS_KEY
+from .session_registry import SessionRegistry, register_session_registry
+
+logger = logging.getLogger("nova.memory.episodic")
 
 
 # =============================================================================
@@ -46,6 +67,11 @@ MIN_RELEVANCE_SCORE: float = 0.3
 # Auto-rehydration settings
 AUTO_REHYDRATE_ON_MODULE: bool = True
 
+# Snapshot index (v0.12)
+SNAPSHOT_INDEX_FILE: str = "episodic_index.json"
+SNAPSHOT_INDEX_FORMAT: int = 1
+SNAPSHOT_RECONCILE_LIMIT: int = 1_000_000
+
 
 # =============================================================================
 # DATA STRUCTURES
@@ -198,23 +224,410 @@ class EpisodicIndex:
         self.restored_from = None
         self.rehydrated_modules.clear()
         self.context_rehydrated = False
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "session_id": self.session_id,
+            "saved_snapshots": self.saved_snapshots,
+            "restored_from": self.restored_from,
+            "rehydrated_modules": sorted(self.rehydrated_modules),
+            "context_rehydrated": self.context_rehydrated,
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "EpisodicIndex":
+        index = cls(data["session_id"])
+        index.saved_snapshots = dict(data.get("saved_snapshots", {}))
+        index.restored_from = data.get("restored_from")
+        index.rehydrated_modules = set(data.get("rehydrated_modules", []))
+        index.context_rehydrated = data.get("context_rehydrated", False)
+        return index
 
 
-# Global index store
-_episodic_indices: Dict[str, EpisodicIndex] = {}
+# Global index store (v0.12: bounded, spills evicted sessions to disk)
+_episodic_indices: SessionRegistry[EpisodicIndex] = register_session_registry(SessionRegistry(
+    "episodic",
+    factory=EpisodicIndex,
+    dump=EpisodicIndex.to_dict,
+    load=EpisodicIndex.from_dict,
+))
 
 
 def get_episodic_index(session_id: str) -> EpisodicIndex:
     """Get or create episodic index for session."""
-    if session_id not in _episodic_indices:
-        _episodic_indices[session_id] = EpisodicIndex(session_id)
-    return _episodic_indices[session_id]
+    return _episodic_indices.get(session_id)
 
 
 def clear_episodic_index(session_id: str) -> None:
     """Clear episodic index for session."""
-    if session_id in _episodic_indices:
-        _episodic_indices[session_id].clear()
+    index = _episodic_indices.peek(session_id)
+    if index is not None:
+        index.clear()
+
+
+def episodic_session_stats() -> Dict[str, Any]:
+    """v0.12: Session registry counters for episodic indexes."""
+    return _episodic_indices.stats()
+
+
+# =============================================================================
+# SNAPSHOT INDEX (Per-Store, v0.12)
+# =============================================================================
+
+def _participant_name(participant: str) -> str:
+    """'Sarah (feminine)' -> 'sarah'."""
+    return participant.split(" (")[0].lower()
+
+
+_TOPIC_TOKEN_RE = re.compile(r"\w+")
+
+
+def _topic_tokens(topic: str) -> List[str]:
+    """'Trip-planning (Q3)' -> ['trip', 'planning', 'q3']."""
+    return _TOPIC_TOKEN_RE.findall(topic.lower())
+
+
+def _topic_contains(outer: str, inner: str) -> bool:
+    """True if `inner`'s words appear as a run of whole words in `outer`."""
+    inner_words = " ".join(_topic_tokens(inner))
+    return bool(inner_words) and f" {inner_words} " in f" {' '.join(_topic_tokens(outer))} "
+
+
+@contextmanager
+def _file_lock(path: Path):
+    """Exclusive advisory lock on `path` + '.lock' across processes."""
+    if fcntl is None:
+        yield
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path.with_name(path.name + ".lock"), "a") as fh:
+        fcntl.flock(fh, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(fh, fcntl.LOCK_UN)
+
+
+def _parse_timestamp(value: str) -> Optional[float]:
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass
+class SnapshotIndexEntry:
+    """The fields relevance scoring needs, without the snapshot body."""
+    memory_id: int
+    topic: str = ""                     # lowercased
+    module: Optional[str] = None
+    participants: List[str] = field(default_factory=list)  # lowercased names
+    timestamp: Optional[float] = None   # epoch seconds; None if unparseable
+    
+    @classmethod
+    def from_snapshot_dict(cls, memory_id: int, data: Dict[str, Any]) -> "SnapshotIndexEntry":
+        return cls(
+            memory_id=memory_id,
+            topic=(data.get("topic") or "").lower(),
+            module=data.get("module"),
+            participants=[_participant_name(p) for p in data.get("participants", [])],
+            timestamp=_parse_timestamp(data.get("timestamp", "")),
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "topic": self.topic,
+            "module": self.module,
+            "participants": self.participants,
+            "timestamp": self.timestamp,
+        }
+
+
+class EpisodicSnapshotIndex:
+    """
+    Inverted index over stored wm-snapshot episodics.
+    
+    topic token -> ids, participant -> ids and module -> ids let
+    find_relevant_episodics() pick its candidates without touching the
+    snapshot bodies; candidates are scored from their index entries and
+    ranked by score, then recency.
+    
+    Persisted to `path` (JSON), which every worker process shares: save()
+    re-reads the file under an exclusive file lock and writes it back with
+    only this process's adds and discards applied, and rank() reloads the
+    file when another process has replaced it. get_snapshot_index()
+    reconciles it with the store once per process, so snapshots saved
+    without the index are picked up and deleted ones dropped.
+    """
+    
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._entries: Dict[int, SnapshotIndexEntry] = {}
+        self._by_topic: Dict[str, Set[int]] = {}
+        self._by_participant: Dict[str, Set[int]] = {}
+        self._by_module: Dict[str, Set[int]] = {}
+        # Changes not yet merged into the shared file
+        self._pending_add: Dict[int, SnapshotIndexEntry] = {}
+        self._pending_remove: Set[int] = set()
+        self._file_stamp: Optional[Tuple[int, int, int]] = None
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def __contains__(self, memory_id: int) -> bool:
+        return memory_id in self._entries
+    
+    def ids(self) -> Set[int]:
+        with self._lock:
+            return set(self._entries)
+    
+    # ---------- Maintenance ----------
+    
+    def add(self, memory_id: int, snapshot_data: Dict[str, Any], save: bool = True) -> None:
+        """Index a stored snapshot (re-indexes if the id is already present)."""
+        entry = SnapshotIndexEntry.from_snapshot_dict(memory_id, snapshot_data)
+        with self._lock:
+            self._remove_unlocked(memory_id)
+            self._add_unlocked(entry)
+            self._pending_add[memory_id] = entry
+            self._pending_remove.discard(memory_id)
+        if save:
+            self.save()
+    
+    def discard(self, memory_ids: List[int], save: bool = True) -> int:
+        """Drop ids (deleted memories). Returns count removed."""
+        with self._lock:
+            removed = 0
+            for memory_id in memory_ids:
+                if self._remove_unlocked(memory_id):
+                    removed += 1
+                    self._pending_add.pop(memory_id, None)
+                    self._pending_remove.add(memory_id)
+        if removed and save:
+            self.save()
+        return removed
+    
+    def _add_unlocked(self, entry: SnapshotIndexEntry) -> None:
+        self._entries[entry.memory_id] = entry
+        for token in set(_topic_tokens(entry.topic)):
+            self._by_topic.setdefault(token, set()).add(entry.memory_id)
+        for name in entry.participants:
+            self._by_participant.setdefault(name, set()).add(entry.memory_id)
+        if entry.module:
+            self._by_module.setdefault(entry.module, set()).add(entry.memory_id)
+    
+    def _remove_unlocked(self, memory_id: int) -> bool:
+        entry = self._entries.pop(memory_id, None)
+        if entry is None:
+            return False
+        for key, postings in (
+            [(token, self._by_topic) for token in set(_topic_tokens(entry.topic))]
+            + [(name, self._by_participant) for name in entry.participants]
+            + [(entry.module, self._by_module)]
+        ):
+            ids = postings.get(key)
+            if ids is not None:
+                ids.discard(memory_id)
+                if not ids:
+                    del postings[key]
+        return True
+    
+    def _install_unlocked(self, entries: Dict[int, SnapshotIndexEntry]) -> None:
+        """Replace the index with `entries` plus this process's pending changes."""
+        self._entries = {}
+        self._by_topic = {}
+        self._by_participant = {}
+        self._by_module = {}
+        for memory_id, entry in entries.items():
+            if memory_id not in self._pending_remove and memory_id not in self._pending_add:
+                self._add_unlocked(entry)
+        for entry in self._pending_add.values():
+            self._add_unlocked(entry)
+    
+    # ---------- Lookup ----------
+    
+    def rank(
+        self,
+        topic: Optional[str] = None,
+        participants: Optional[List[str]] = None,
+        module: Optional[str] = None,
+        min_score: float = MIN_RELEVANCE_SCORE,
+        not_before: Optional[float] = None,
+    ) -> List[Tuple[SnapshotIndexEntry, float, List[str]]]:
+        """
+        Score every snapshot that shares a module, topic word or
+        participant with the query.
+        
+        Returns:
+            [(entry, score, reasons)] with score >= min_score, best first
+            (newest first among equal scores)
+        """
+        self.refresh()
+        topic_lower = topic.lower() if topic else ""
+        names = [_participant_name(p) for p in participants or []]
+        
+        with self._lock:
+            candidates: Set[int] = set()
+            if module:
+                candidates |= self._by_module.get(module, set())
+            for token in set(_topic_tokens(topic_lower)):
+                candidates |= self._by_topic.get(token, set())
+            for name in names:
+                candidates |= self._by_participant.get(name, set())
+            entries = [self._entries[i] for i in candidates]
+        
+        ranked = []
+        for entry in entries:
+            if not_before is not None and entry.timestamp is not None and entry.timestamp < not_before:
+                continue
+            score, reasons = _score_relevance(
+                entry.topic, entry.module, entry.participants, topic_lower, names, module,
+            )
+            if score >= min_score:
+                ranked.append((entry, score, reasons))
+        
+        ranked.sort(key=lambda r: (r[1], r[0].timestamp or 0.0), reverse=True)
+        return ranked
+    
+    # ---------- Persistence ----------
+    
+    def _stat(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            st = self.path.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+    
+    def _read_file(self) -> Dict[int, SnapshotIndexEntry]:
+        """Entries in the persisted file (missing or unreadable file = none)."""
+        if not self.path.exists():
+            return {}
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable episodic index %s: %s", self.path, e)
+            return {}
+        if data.get("format") != SNAPSHOT_INDEX_FORMAT:
+            return {}
+        return {
+            int(key): SnapshotIndexEntry(
+                memory_id=int(key),
+                topic=raw.get("topic", ""),
+                module=raw.get("module"),
+                participants=list(raw.get("participants", [])),
+                timestamp=raw.get("timestamp"),
+            )
+            for key, raw in data.get("entries", {}).items()
+        }
+    
+    def save(self) -> None:
+        """Merge this process's changes into the shared file."""
+        if self.path is None:
+            return
+        with self._save_lock:
+            try:
+                with _file_lock(self.path):
+                    with self._lock:
+                        added = self._pending_add
+                        removed = self._pending_remove
+                        self._pending_add = {}
+                        self._pending_remove = set()
+                    
+                    entries = self._read_file()
+                    for memory_id in removed:
+                        entries.pop(memory_id, None)
+                    entries.update(added)
+                    data = {
+                        "format": SNAPSHOT_INDEX_FORMAT,
+                        "entries": {str(i): e.to_dict() for i, e in entries.items()},
+                    }
+                    try:
+                        _atomic_write_text(self.path, json.dumps(data))
+                    except OSError:
+                        with self._lock:
+                            # Keep the changes for the next save; newer ones win
+                            for memory_id, entry in added.items():
+                                if memory_id not in self._pending_remove:
+                                    self._pending_add.setdefault(memory_id, entry)
+                            self._pending_remove |= removed - set(self._pending_add)
+                        raise
+                    stamp = self._stat()
+            except OSError as e:
+                logger.warning("Could not save episodic index %s: %s", self.path, e)
+                return
+            
+            with self._lock:
+                self._install_unlocked(entries)
+                self._file_stamp = stamp
+    
+    def load(self) -> None:
+        """Read the persisted index (missing or unreadable file = empty index)."""
+        if self.path is None:
+            return
+        with self._save_lock:
+            stamp = self._stat()
+            entries = self._read_file()
+            with self._lock:
+                self._install_unlocked(entries)
+                self._file_stamp = stamp
+    
+    def refresh(self) -> None:
+        """Reload if another process replaced the file since we last read or wrote it."""
+        if self.path is None or self._stat() == self._file_stamp:
+            return
+        self.load()
+    
+    def reconcile(self, memory_manager) -> None:
+        """Index stored snapshots missing from the index and drop deleted ones."""
+        memories = memory_manager.recall(
+            mem_type="episodic",
+            tags=["wm-snapshot"],
+            limit=SNAPSHOT_RECONCILE_LIMIT,
+            touch=False,
+        )
+        stored = {getattr(memory, 'id', None): memory for memory in memories}
+        indexed = self.ids()
+        
+        changed = self.discard([i for i in indexed if i not in stored], save=False) > 0
+        for memory_id, memory in stored.items():
+            if memory_id is None or memory_id in indexed:
+                continue
+            snapshot_data = _load_snapshot_data(memory_manager, memory)
+            if snapshot_data:
+                self.add(memory_id, snapshot_data, save=False)
+                changed = True
+        if changed:
+            self.save()
+
+
+# One index per memory store, built on first use
+_snapshot_indexes: "weakref.WeakKeyDictionary[Any, EpisodicSnapshotIndex]" = weakref.WeakKeyDictionary()
+_snapshot_indexes_lock = threading.Lock()
+
+
+def get_snapshot_index(memory_manager) -> EpisodicSnapshotIndex:
+    """
+    Get the snapshot index for a memory store, loading and reconciling it
+    on first use.
+    """
+    index = _snapshot_indexes.get(memory_manager)
+    if index is not None:
+        return index
+    
+    with _snapshot_indexes_lock:
+        index = _snapshot_indexes.get(memory_manager)
+        if index is None:
+            data_dir = getattr(getattr(memory_manager, 'config', None), 'data_dir', None)
+            index = EpisodicSnapshotIndex(Path(data_dir) / SNAPSHOT_INDEX_FILE if data_dir else None)
+            index.load()
+            try:
+                index.reconcile(memory_manager)
+            except Exception as e:
+                logger.warning("Episodic index reconcile failed: %s", e)
+            _snapshot_indexes[memory_manager] = index
+    return index
 
 
 # =============================================================================
@@ -392,6 +805,7 @@ def episodic_snapshot(
         # Update index
         index = get_episodic_index(session_id)
         index.mark_saved(snapshot.topic, str(memory_id))
+        get_snapshot_index(memory_manager).add(memory_id, snapshot.to_dict())
         
         return True, f"Snapshot saved as episodic memory #{memory_id}.", memory_id
     
@@ -485,6 +899,7 @@ def episodic_restore(
                 wm.emotional_tone = EmotionalTone(snapshot.tone)
             except ValueError:
                 pass
+            wm.mark_context_dirty()
             
             # Restore behavior state
             if behavior_engine and snapshot.goals:
@@ -563,12 +978,28 @@ def _restore_behavior(behavior_engine, snapshot: EpisodicSnapshot) -> None:
         ]
     if snapshot.unresolved_questions:
         behavior_engine.thread_summary.unresolved_questions = snapshot.unresolved_questions
+    behavior_engine.mark_context_dirty("thread")
 
 
 # =============================================================================
 # RELEVANCE ENGINE
 # =============================================================================
 
+def _load_snapshot_data(memory_manager, memory) -> Optional[Dict[str, Any]]:
+    """
+    Get the wm_snapshot dict of a recalled memory.
+    
+    v0.12: recall() returns items with a light trace; the snapshot itself
+    sits in the trace side store and is fetched through memory_manager.get().
+    """
+    trace_data = getattr(memory, 'trace', {}) or {}
+    snapshot_data = trace_data.get("wm_snapshot")
+    if snapshot_data is None and SIDE_FIELDS_KEY in trace_data:
+        full = memory_manager.get(getattr(memory, 'id', None)) or {}
+        snapshot_data = (full.get("trace") or {}).get("wm_snapshot")
+    return snapshot_data
+
+
 def find_relevant_episodics(
     memory_manager,
     topic: Optional[str] = None,
@@ -579,6 +1010,10 @@ def find_relevant_episodics(
     """
     Find relevant episodic memories based on criteria.
     
+    v0.12: Candidates come from the snapshot index and are scored from
+    their index entries; only the top `max_results` snapshots are loaded
+    and deserialized. Ties go to the most recent snapshot.
+    
     Args:
         memory_manager: MemoryManager instance
         topic: Topic to match
@@ -599,91 +1034,89 @@ def find_relevant_episodics(
     cutoff_date = datetime.now() - timedelta(days=MAX_EPISODIC_AGE_DAYS)
     
     try:
-        # Query all episodic memories with wm-snapshot tag
-        # PATCHED v0.11.0-fix4: Changed type= to mem_type=, access .trace attribute
-        memories = memory_manager.recall(mem_type="episodic", tags=["wm-snapshot"])
+        index = get_snapshot_index(memory_manager)
+        ranked = index.rank(topic, participants, module, not_before=cutoff_date.timestamp())
         
-        for memory in memories:
-            # recall() returns MemoryItem dataclass, use .trace attribute
-            trace_data = getattr(memory, 'trace', {}) or {}
-            snapshot_data = trace_data.get("wm_snapshot")
+        missing = []
+        for entry, score, reasons in ranked:
+            if len(results) >= max_results:
+                break
             
+            memory = memory_manager.get(entry.memory_id)
+            snapshot_data = ((memory or {}).get("trace") or {}).get("wm_snapshot")
             if not snapshot_data:
+                missing.append(entry.memory_id)  # deleted since it was indexed
                 continue
             
-            snapshot = EpisodicSnapshot.from_dict(snapshot_data)
-            
-            # Check age
-            try:
-                snap_time = datetime.fromisoformat(snapshot.timestamp)
-                if snap_time < cutoff_date:
-                    continue
-            except:
-                pass
-            
-            # Calculate relevance score
-            score, reasons = _calculate_relevance(
-                snapshot, topic, participants, module
-            )
-            
-            if score >= MIN_RELEVANCE_SCORE:
-                results.append(RelevanceResult(
-                    memory_id=memory.get("id", 0),
-                    snapshot=snapshot,
-                    score=score,
-                    match_reasons=reasons,
-                ))
+            results.append(RelevanceResult(
+                memory_id=entry.memory_id,
+                snapshot=EpisodicSnapshot.from_dict(snapshot_data),
+                score=score,
+                match_reasons=reasons,
+            ))
+        
+        if missing:
+            index.discard(missing)
     
-    except Exception:
-        pass
+    except Exception as e:
+        logger.debug("Episodic relevance lookup failed: %s", e)
     
-    # Sort by score descending
-    results.sort(key=lambda r: r.score, reverse=True)
-    return results[:max_results]
+    return results
 
 
-def _calculate_relevance(
-    snapshot: EpisodicSnapshot,
-    topic: Optional[str],
-    participants: Optional[List[str]],
+def _score_relevance(
+    snap_topic: str,
+    snap_module: Optional[str],
+    snap_participants: List[str],
+    topic: str,
+    participants: List[str],
     module: Optional[str],
 ) -> Tuple[float, List[str]]:
-    """Calculate relevance score for a snapshot."""
+    """Relevance score from lowercased topics and participant names."""
     score = 0.0
     reasons = []
     
     # Module match (high priority)
-    if module and snapshot.module == module:
+    if module and snap_module == module:
         score += 0.5
         reasons.append(f"module:{module}")
     
-    # Topic similarity
-    if topic and snapshot.topic:
-        topic_lower = topic.lower()
-        snap_topic_lower = snapshot.topic.lower()
-        
-        if topic_lower == snap_topic_lower:
+    # Topic similarity (partial = one topic's words appear in the other)
+    if topic and snap_topic:
+        if topic == snap_topic:
             score += 0.4
             reasons.append("exact topic match")
-        elif topic_lower in snap_topic_lower or snap_topic_lower in topic_lower:
+        elif _topic_contains(snap_topic, topic) or _topic_contains(topic, snap_topic):
             score += 0.25
             reasons.append("partial topic match")
     
     # Participant overlap
-    if participants and snapshot.participants:
-        participant_names = set(p.lower() for p in participants)
-        snap_participants = set(
-            p.split(" (")[0].lower() for p in snapshot.participants
-        )
-        
-        overlap = participant_names & snap_participants
+    if participants and snap_participants:
+        overlap = set(participants) & set(snap_participants)
         if overlap:
             score += 0.15 * len(overlap)
-            reasons.append(f"participants: {', '.join(overlap)}")
+            reasons.append(f"participants: {', '.join(sorted(overlap))}")
     
     return score, reasons
 
 
+def _calculate_relevance(
+    snapshot: EpisodicSnapshot,
+    topic: Optional[str],
+    participants: Optional[List[str]],
+    module: Optional[str],
+) -> Tuple[float, List[str]]:
+    """Calculate relevance score for a snapshot."""
+    return _score_relevance(
+        snapshot.topic.lower(),
+        snapshot.module,
+        [_participant_name(p) for p in snapshot.participants],
+        (topic or "").lower(),
+        [_participant_name(p) for p in participants or []],
+        module,
+    )
+
+
 # =============================================================================
 # MODULE REHYDRATION
 # =============================================================================
@@ -782,8 +1215,7 @@ def episodic_list(
         
         for memory in memories[:limit]:
             # recall() returns MemoryItem dataclass, use attributes not .get()
-            trace_data = getattr(memory, 'trace', {}) or {}
-            snapshot_data = trace_data.get("wm_snapshot", {})
+            snapshot_data = _load_snapshot_data(memory_manager, memory) or {}
             
             results.append({
                 "id": getattr(memory, 'id', None),
@@ -853,4 +1285,4 @@ def episodic_clear(session_id: str) -> None:
 
 def episodic_delete(session_id: str) -> None:
     """Delete episodic index for session."""
-    _episodic_indices.pop(session_id, None)
+    _episodic_indices.discard(session_id)
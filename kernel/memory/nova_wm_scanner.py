@@ -0,0 +1,183 @@
+# kernel/memory/nova_wm_scanner.py
+"""
+NovaOS v0.12 — Working Memory Pattern Scanner
+
+Pre-compiled, pre-filtered extraction for NovaWorkingMemory. The pattern
+tables in nova_wm.py (PERSON_PATTERNS, TIME_PATTERNS, GOAL_PATTERNS,
+EMOTIONAL_PATTERNS, META_QUESTION_PATTERNS, ...) used to be run one
+re.finditer/re.search at a time (re-looked-up in re's pattern cache) on
+every wm_update, even when the message could not possibly match them.
+
+How a scan works:
+- Every rule is compiled once, when the scanner is built.
+- Keyword pre-filter: each rule may list literal keywords, at least one of
+  which must appear in the lowercased message for the rule to be able to
+  match. Keywords are checked per family first (the union of its rules'
+  keywords), then per rule, so short messages skip whole families with a
+  handful of substring tests. Rules without keywords always run.
+  Non-ASCII messages skip the pre-filter (IGNORECASE folds a few
+  non-ASCII letters onto ASCII).
+- Rules are run lazily, the first time a family is asked for, and their
+  hits are kept on the ScanResult. The last scan is memoized so update()
+  and check_meta_question() on the same message share one result.
+
+A single combined alternation of all rules was measured slower than this:
+the tables need every rule's overlapping hits, which forces zero-width
+lookahead matching and re-runs the guard at each hit position.
+
+ScanResult.matches(family) gives per-rule re.Match hits in rule order (the
+order the old per-pattern loops produced), and ScanResult.first(family)
+the first rule with a hit and its leftmost match (the old re.search loops).
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+
+# =============================================================================
+# TYPES
+# =============================================================================
+
+class ScanRule(NamedTuple):
+    """One extraction pattern and what it means."""
+    family: str                       # e.g. "person", "time", "tone", "meta"
+    label: Any                        # context string, trigger name, tone, ...
+    pattern: str                      # original pattern string
+    flags: int = 0                    # re flags
+    keywords: Tuple[str, ...] = ()    # lowercase literals; () = always run
+
+
+class ScanResult:
+    """Hits of one scan, computed per rule on first use."""
+
+    __slots__ = ("text", "_scanner", "_active", "_hits")
+
+    def __init__(self, text: str, scanner: "PatternScanner", active: Optional[frozenset]):
+        self.text = text
+        self._scanner = scanner
+        self._active = active  # rule indexes that passed the pre-filter (None = all)
+        self._hits: Dict[int, List[re.Match]] = {}
+
+    def _rule_hits(self, index: int) -> List[re.Match]:
+        hits = self._hits.get(index)
+        if hits is None:
+            if self._active is not None and index not in self._active:
+                hits = []
+            else:
+                hits = list(self._scanner.compiled[index].finditer(self.text))
+                self._scanner._stats["rules_run"] += 1
+            self._hits[index] = hits
+        return hits
+
+    def matches(self, family: str) -> Iterator[Tuple[ScanRule, List[re.Match]]]:
+        """Yield (rule, hits) for every rule of `family` that matched, in rule order."""
+        rules = self._scanner.rules
+        for index in self._scanner.family_rules(family):
+            hits = self._rule_hits(index)
+            if hits:
+                yield rules[index], hits
+
+    def first(self, family: str) -> Optional[Tuple[ScanRule, re.Match]]:
+        """First rule of `family` (in rule order) that matched, with its leftmost hit."""
+        for rule, hits in self.matches(family):
+            return rule, hits[0]
+        return None
+
+    @property
+    def hit_count(self) -> int:
+        """Total hits over all rules (runs every rule not yet run)."""
+        return sum(len(self._rule_hits(index)) for index in range(len(self._scanner.rules)))
+
+
+# =============================================================================
+# SCANNER
+# =============================================================================
+
+class PatternScanner:
+    """
+    Compiled, keyword-pre-filtered scanner over a fixed list of ScanRules.
+
+    Args:
+        rules: Rules in priority order
+        lowercase: Scan text.lower().strip() instead of the raw text
+    """
+
+    def __init__(self, rules: Sequence[ScanRule], lowercase: bool = False):
+        self.rules: Tuple[ScanRule, ...] = tuple(rules)
+        self.lowercase = lowercase
+        self.compiled: List[re.Pattern] = [re.compile(rule.pattern, rule.flags) for rule in self.rules]
+
+        self._families: Dict[str, List[int]] = {}
+        for index, rule in enumerate(self.rules):
+            self._families.setdefault(rule.family, []).append(index)
+        # family -> union of its rules' keywords (None if a rule always runs)
+        self._family_keywords: Dict[str, Optional[Tuple[str, ...]]] = {}
+        for family, indexes in self._families.items():
+            if any(not self.rules[i].keywords for i in indexes):
+                self._family_keywords[family] = None
+            else:
+                keywords = (kw for i in indexes for kw in self.rules[i].keywords)
+                self._family_keywords[family] = tuple(dict.fromkeys(keywords))
+
+        # Last scan, so update() and check_meta_question() on one message share it
+        self._last: Optional[Tuple[str, ScanResult]] = None
+
+        self._stats: Dict[str, int] = {
+            "scans": 0,
+            "memo_hits": 0,
+            "families_skipped": 0,
+            "rules_skipped": 0,
+            "rules_run": 0,
+        }
+
+    def family_rules(self, family: str) -> List[int]:
+        return self._families.get(family, [])
+
+    def _active(self, probe: str) -> Optional[frozenset]:
+        """Rule indexes whose keywords occur in `probe` (None = run everything)."""
+        if not probe.isascii():
+            return None
+        active = []
+        for family, keywords in self._family_keywords.items():
+            indexes = self._families[family]
+            if keywords is not None and not any(keyword in probe for keyword in keywords):
+                self._stats["families_skipped"] += 1
+                self._stats["rules_skipped"] += len(indexes)
+                continue
+            for index in indexes:
+                rule_keywords = self.rules[index].keywords
+                if not rule_keywords or any(keyword in probe for keyword in rule_keywords):
+                    active.append(index)
+                else:
+                    self._stats["rules_skipped"] += 1
+        return frozenset(active)
+
+    def scan(self, text: str) -> ScanResult:
+        """Pre-filter `text`; rules run as the result is read."""
+        last = self._last
+        if last is not None and last[0] == text:
+            self._stats["memo_hits"] += 1
+            return last[1]
+
+        text = text or ""
+        target = text.lower().strip() if self.lowercase else text
+        self._stats["scans"] += 1
+        result = ScanResult(target, self, self._active(target if self.lowercase else text.lower()))
+        self._last = (text, result)
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "rules": len(self.rules),
+            "families": len(self._families),
+            **self._stats,
+        }
+
+
+__all__ = [
+    "ScanRule",
+    "ScanResult",
+    "PatternScanner",
+]
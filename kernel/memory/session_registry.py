@@ -0,0 +1,374 @@
+# kernel/memory/session_registry.py
+"""
+NovaOS v0.12 — Session Registry
+
+Bounded, evictable per-session object store for working-memory state
+(NovaWMManager, BehaviorEngineManager, the episodic index cache). Each of
+those used to keep one object per session_id forever, so a long-running
+nova_api process grew with every new browser session.
+
+- LRU order with an idle TTL: sessions untouched for `idle_ttl` seconds,
+  the least recently used beyond `max_sessions`, and LRU sessions beyond
+  `memory_budget` bytes (estimated from the serialized size) are evicted
+- Evicted sessions spill to <spill_dir>/<name>/<sha1(session_id)>.json via
+  the owner's to_dict(full=True) and are rebuilt with from_dict() on the
+  next access, so callers never see the eviction
+- Spill files older than `spill_ttl` are purged
+- Counters: live, spilled, created, evictions (by reason), rehydrations
+
+Registries register themselves by name so the kernel can apply Config
+limits to all of them with configure_session_registries().
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Generic, Optional, TypeVar
+
+logger = logging.getLogger("nova.memory.sessions")
+
+T = TypeVar("T")
+
+
+# =============================================================================
+# DEFAULTS
+# =============================================================================
+
+DEFAULT_MAX_SESSIONS = 256
+DEFAULT_IDLE_TTL = 3600.0                    # seconds
+DEFAULT_MEMORY_BUDGET = 64 * 1024 * 1024     # bytes, per registry
+DEFAULT_SPILL_TTL = 7 * 24 * 3600.0          # seconds
+DEFAULT_SPILL_DIR = Path("data") / "sessions"
+
+# Idle/budget sweeps and size re-estimates run at most this often (seconds)
+SWEEP_INTERVAL = 30.0
+
+
+# =============================================================================
+# REGISTRY
+# =============================================================================
+
+class SessionRegistry(Generic[T]):
+    """
+    LRU + idle-TTL session_id -> object map that spills evictions to disk.
+
+    Args:
+        name: Registry name (spill subdirectory, stats key)
+        factory: session_id -> new object
+        dump: object -> JSON-safe dict (usually obj.to_dict(full=True))
+        load: dict -> object (usually Class.from_dict)
+        max_sessions: Live sessions kept in memory
+        idle_ttl: Seconds without access before a session is evicted
+        memory_budget: Bytes of (estimated) live state; None = unbounded
+        spill_dir: Root directory for spill files; None = DEFAULT_SPILL_DIR
+        spill_ttl: Seconds a spill file is kept before it is purged
+        clock: Monotonic time source (tests)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        factory: Callable[[str], T],
+        dump: Callable[[T], Dict[str, Any]],
+        load: Callable[[Dict[str, Any]], T],
+        max_sessions: int = DEFAULT_MAX_SESSIONS,
+        idle_ttl: float = DEFAULT_IDLE_TTL,
+        memory_budget: Optional[int] = DEFAULT_MEMORY_BUDGET,
+        spill_dir: Optional[Path] = None,
+        spill_ttl: float = DEFAULT_SPILL_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self._factory = factory
+        self._dump = dump
+        self._load = load
+        self.max_sessions = max_sessions
+        self.idle_ttl = idle_ttl
+        self.memory_budget = memory_budget
+        self.spill_ttl = spill_ttl
+        self._clock = clock
+        self._spill_root = Path(spill_dir) if spill_dir is not None else DEFAULT_SPILL_DIR
+
+        self._lock = threading.RLock()
+        # session_id -> object, least recently used first
+        self._live: "OrderedDict[str, T]" = OrderedDict()
+        self._touched: Dict[str, float] = {}
+        self._sizes: Dict[str, int] = {}
+        self._resize: set = set()  # accessed since the last size estimate
+        self._last_sweep = clock()
+        self._last_purge = 0.0
+
+        self._stats: Dict[str, int] = {
+            "created": 0,
+            "rehydrations": 0,
+            "evictions": 0,
+            "evicted_idle": 0,
+            "evicted_lru": 0,
+            "evicted_budget": 0,
+            "spill_failures": 0,
+        }
+
+    # -------------------------------------------------------------------------
+    # Configuration
+    # -------------------------------------------------------------------------
+
+    @property
+    def spill_dir(self) -> Path:
+        return self._spill_root / self.name
+
+    def configure(self, **limits: Any) -> None:
+        """Update max_sessions / idle_ttl / memory_budget / spill_ttl / spill_dir."""
+        with self._lock:
+            spill_dir = limits.pop("spill_dir", None)
+            if spill_dir is not None:
+                self._spill_root = Path(spill_dir)
+            for key, value in limits.items():
+                if key not in ("max_sessions", "idle_ttl", "memory_budget", "spill_ttl"):
+                    raise TypeError(f"Unknown session registry limit: {key}")
+                setattr(self, key, value)
+            self._evict_unlocked(self._clock(), force_sweep=True)
+
+    # -------------------------------------------------------------------------
+    # Access
+    # -------------------------------------------------------------------------
+
+    def get(self, session_id: str) -> T:
+        """Get the live object, rehydrate a spilled one, or create a new one."""
+        with self._lock:
+            obj = self._lookup_unlocked(session_id)
+            if obj is None:
+                obj = self._factory(session_id)
+                self._stats["created"] += 1
+                self._admit_unlocked(session_id, obj)
+            return obj
+
+    def peek(self, session_id: str) -> Optional[T]:
+        """Like get(), but never creates a new object."""
+        with self._lock:
+            return self._lookup_unlocked(session_id)
+
+    def discard(self, session_id: str) -> None:
+        """Forget a session entirely (live object and spill file)."""
+        with self._lock:
+            self._live.pop(session_id, None)
+            self._touched.pop(session_id, None)
+            self._sizes.pop(session_id, None)
+            self._remove_spill(session_id)
+
+    def __contains__(self, session_id: str) -> bool:
+        with self._lock:
+            return session_id in self._live or self._spill_path(session_id).exists()
+
+    def __len__(self) -> int:
+        return len(self._live)
+
+    def _lookup_unlocked(self, session_id: str) -> Optional[T]:
+        now = self._clock()
+        obj = self._live.get(session_id)
+        if obj is not None:
+            self._live.move_to_end(session_id)
+            self._touched[session_id] = now
+            self._resize.add(session_id)
+            if now - self._last_sweep >= SWEEP_INTERVAL:
+                self._evict_unlocked(now, force_sweep=True)
+            return obj
+
+        obj = self._rehydrate(session_id)
+        if obj is not None:
+            self._stats["rehydrations"] += 1
+            self._admit_unlocked(session_id, obj)
+        return obj
+
+    def _admit_unlocked(self, session_id: str, obj: T) -> None:
+        now = self._clock()
+        self._live[session_id] = obj
+        self._live.move_to_end(session_id)
+        self._touched[session_id] = now
+        if self.memory_budget is not None:
+            self._sizes[session_id] = self._estimate(obj)
+        self._evict_unlocked(now)
+
+    # -------------------------------------------------------------------------
+    # Eviction
+    # -------------------------------------------------------------------------
+
+    def _evict_unlocked(self, now: float, force_sweep: bool = False) -> None:
+        sweep = force_sweep or now - self._last_sweep >= SWEEP_INTERVAL
+        if sweep:
+            self._last_sweep = now
+            for session_id in [s for s, t in self._touched.items() if now - t >= self.idle_ttl]:
+                self._spill_unlocked(session_id, "evicted_idle")
+            if self.memory_budget is not None:
+                # Sessions grow while in use; refresh the ones accessed since
+                for session_id in self._resize:
+                    obj = self._live.get(session_id)
+                    if obj is not None:
+                        self._sizes[session_id] = self._estimate(obj)
+            self._resize.clear()
+            if now - self._last_purge >= SWEEP_INTERVAL * 120:
+                self._last_purge = now
+                self._purge_spills()
+
+        while len(self._live) > max(self.max_sessions, 1):
+            self._spill_unlocked(next(iter(self._live)), "evicted_lru")
+
+        if self.memory_budget is not None:
+            # Never evict the most recently used session for the budget
+            while len(self._live) > 1 and sum(self._sizes.values()) > self.memory_budget:
+                self._spill_unlocked(next(iter(self._live)), "evicted_budget")
+
+    def _spill_unlocked(self, session_id: str, reason: str) -> None:
+        obj = self._live.pop(session_id, None)
+        self._touched.pop(session_id, None)
+        self._sizes.pop(session_id, None)
+        if obj is None:
+            return
+        self._stats["evictions"] += 1
+        self._stats[reason] += 1
+        path = self._spill_path(session_id)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            text = json.dumps({"session_id": session_id, "state": self._dump(obj)}, ensure_ascii=False, default=str)
+            tmp_path = path.with_name(path.name + ".tmp")
+            tmp_path.write_text(text, encoding="utf-8")
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            self._stats["spill_failures"] += 1
+            logger.warning("Could not spill %s session %s: %s", self.name, session_id, e)
+
+    def _rehydrate(self, session_id: str) -> Optional[T]:
+        path = self._spill_path(session_id)
+        try:
+            raw = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("Unreadable %s spill for session %s: %s", self.name, session_id, e)
+            self._remove_spill(session_id)
+            return None
+        try:
+            obj = self._load(raw["state"])
+        except Exception as e:
+            logger.warning("Could not rehydrate %s session %s: %s", self.name, session_id, e)
+            obj = None
+        # The live object is now the source of truth
+        self._remove_spill(session_id)
+        return obj
+
+    def _spill_path(self, session_id: str) -> Path:
+        digest = hashlib.sha1(session_id.encode("utf-8")).hexdigest()
+        return self.spill_dir / f"{digest}.json"
+
+    def _remove_spill(self, session_id: str) -> None:
+        try:
+            self._spill_path(session_id).unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.debug("Could not remove %s spill for %s: %s", self.name, session_id, e)
+
+    def _purge_spills(self) -> None:
+        cutoff = time.time() - self.spill_ttl
+        try:
+            paths = list(self.spill_dir.glob("*.json"))
+        except OSError:
+            return
+        for path in paths:
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except OSError:
+                continue
+
+    def _estimate(self, obj: T) -> int:
+        try:
+            return len(json.dumps(self._dump(obj), default=str))
+        except (TypeError, ValueError):
+            return 0
+
+    # -------------------------------------------------------------------------
+    # Stats
+    # -------------------------------------------------------------------------
+
+    def stats(self) -> Dict[str, Any]:
+        """Live/spilled session counts and eviction/rehydration counters."""
+        with self._lock:
+            live = len(self._live)
+            estimated = sum(self._sizes.values()) if self.memory_budget is not None else None
+            counters = dict(self._stats)
+        try:
+            spilled = sum(1 for _ in self.spill_dir.glob("*.json"))
+        except OSError:
+            spilled = 0
+        return {
+            "live_sessions": live,
+            "spilled_sessions": spilled,
+            "estimated_bytes": estimated,
+            "max_sessions": self.max_sessions,
+            "idle_ttl": self.idle_ttl,
+            "memory_budget": self.memory_budget,
+            **counters,
+        }
+
+
+# =============================================================================
+# GLOBAL REGISTRATION
+# =============================================================================
+
+_registries: Dict[str, SessionRegistry] = {}
+
+# Limits from the last configure_session_registries() call, applied to
+# registries whose module is imported afterwards
+_configured: Dict[str, Any] = {}
+
+
+def register_session_registry(registry: SessionRegistry) -> SessionRegistry:
+    """Make a registry visible to configure_session_registries()/session_stats()."""
+    if _configured:
+        registry.configure(**_configured)
+    _registries[registry.name] = registry
+    return registry
+
+
+def configure_session_registries(
+    spill_dir: Optional[Path] = None,
+    max_sessions: Optional[int] = None,
+    idle_ttl: Optional[float] = None,
+    memory_budget_mb: Optional[float] = None,
+) -> None:
+    """Apply limits to every registered registry (None = leave as is)."""
+    limits: Dict[str, Any] = {}
+    if spill_dir is not None:
+        limits["spill_dir"] = Path(spill_dir)
+    if max_sessions is not None:
+        limits["max_sessions"] = int(max_sessions)
+    if idle_ttl is not None:
+        limits["idle_ttl"] = float(idle_ttl)
+    if memory_budget_mb is not None:
+        limits["memory_budget"] = int(memory_budget_mb * 1024 * 1024) if memory_budget_mb > 0 else None
+    _configured.update(limits)
+    for registry in list(_registries.values()):
+        registry.configure(**limits)
+
+
+def session_stats() -> Dict[str, Dict[str, Any]]:
+    """{registry name: stats} for every registered registry."""
+    return {name: registry.stats() for name, registry in list(_registries.items())}
+
+
+__all__ = [
+    "SessionRegistry",
+    "register_session_registry",
+    "configure_session_registries",
+    "session_stats",
+    "DEFAULT_MAX_SESSIONS",
+    "DEFAULT_IDLE_TTL",
+    "DEFAULT_MEMORY_BUDGET",
+]
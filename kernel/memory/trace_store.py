@@ -0,0 +1,208 @@
+# kernel/memory/trace_store.py
+"""
+NovaOS Memory Trace Store — v0.12
+
+Side store for the heavy parts of a memory's trace (WM snapshots and
+cached embedding vectors). The JSON backend keeps these out of the
+resident MemoryItem: the item's trace holds only a SIDE_FIELDS_KEY marker
+listing the keys that live here, and LongTermMemory.load_trace() merges
+them back when a caller actually needs the full trace.
+
+- One SQLite file next to the typed snapshots (memory/memory_traces.db)
+- One row per (memory_id, key); values are JSON text
+- Rows are written before the journal record that references them, so a
+  crash never leaves a marker pointing at a missing row
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger("nova.memory.traces")
+
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+TRACE_DB_FILENAME = "memory_traces.db"
+
+# Trace keys moved out of RAM (large, and only read on restore/embedding)
+HEAVY_TRACE_KEYS = ("wm_snapshot", "embedding")
+
+# Marker left in the resident trace: sorted list of keys held in the side store
+SIDE_FIELDS_KEY = "side_fields"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS trace_fields (
+    memory_id  INTEGER NOT NULL,
+    key        TEXT    NOT NULL,
+    value      TEXT    NOT NULL,
+    PRIMARY KEY (memory_id, key)
+) WITHOUT ROWID;
+"""
+
+# SQLite's default limit on bound parameters is 999 on older builds
+_CHUNK = 500
+
+# Writes at least this many rows (migrations, imports) checkpoint the WAL
+# straight away so it doesn't stay as large as the database
+BULK_ROWS = 1000
+
+
+# =============================================================================
+# STORE
+# =============================================================================
+
+class TraceStore:
+    """
+    SQLite-backed (memory_id, key) -> JSON value store for heavy trace fields.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA journal_size_limit=4194304")
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+        self._lock = threading.Lock()
+        self._reads = 0
+
+    def put_many(self, fields: Dict[int, Dict[str, Any]]) -> int:
+        """
+        Upsert heavy fields for many memories in one transaction.
+
+        Args:
+            fields: {memory_id: {key: value}}
+
+        Returns:
+            Count of rows written
+        """
+        rows = [
+            (memory_id, key, json.dumps(value, ensure_ascii=False))
+            for memory_id, values in fields.items()
+            for key, value in values.items()
+        ]
+        if not rows:
+            return 0
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO trace_fields (memory_id, key, value) VALUES (?, ?, ?)",
+                rows,
+            )
+        if len(rows) >= BULK_ROWS:
+            self._checkpoint()
+        return len(rows)
+
+    def _checkpoint(self) -> None:
+        try:
+            with self._lock:
+                self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        except sqlite3.Error as e:
+            logger.debug("Trace store checkpoint failed: %s", e)
+
+    def get(self, memory_id: int, keys: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """Get the heavy fields of one memory (optionally only `keys`)."""
+        return self.get_many([memory_id], keys).get(memory_id, {})
+
+    def get_many(
+        self,
+        memory_ids: List[int],
+        keys: Optional[Iterable[str]] = None,
+    ) -> Dict[int, Dict[str, Any]]:
+        """Get heavy fields for many memories: {memory_id: {key: value}}."""
+        wanted = set(keys) if keys is not None else None
+        found: Dict[int, Dict[str, Any]] = {}
+        ids = list(dict.fromkeys(memory_ids))
+        with self._lock:
+            self._reads += len(ids)
+            for start in range(0, len(ids), _CHUNK):
+                chunk = ids[start:start + _CHUNK]
+                rows = self._conn.execute(
+                    "SELECT memory_id, key, value FROM trace_fields WHERE memory_id IN ("
+                    + ", ".join("?" for _ in chunk) + ")",
+                    chunk,
+                ).fetchall()
+                for memory_id, key, value in rows:
+                    if wanted is not None and key not in wanted:
+                        continue
+                    try:
+                        found.setdefault(memory_id, {})[key] = json.loads(value)
+                    except ValueError:
+                        logger.warning("Corrupt trace field %s for memory #%s", key, memory_id)
+        return found
+
+    def delete_many(self, memory_ids: List[int]) -> int:
+        """Delete all heavy fields of the given memories. Returns rows deleted."""
+        ids = list(dict.fromkeys(memory_ids))
+        if not ids:
+            return 0
+        deleted = 0
+        with self._lock, self._conn:
+            for start in range(0, len(ids), _CHUNK):
+                chunk = ids[start:start + _CHUNK]
+                cur = self._conn.execute(
+                    "DELETE FROM trace_fields WHERE memory_id IN ("
+                    + ", ".join("?" for _ in chunk) + ")",
+                    chunk,
+                )
+                deleted += cur.rowcount
+        return deleted
+
+    def clear(self) -> None:
+        """Delete every row."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM trace_fields")
+
+    def stats(self) -> Dict[str, Any]:
+        """Row counts and file size."""
+        with self._lock:
+            rows, memories = self._conn.execute(
+                "SELECT COUNT(*), COUNT(DISTINCT memory_id) FROM trace_fields"
+            ).fetchone()
+            reads = self._reads
+        try:
+            size = self.path.stat().st_size
+        except OSError:
+            size = 0
+        return {
+            "trace_rows": rows,
+            "trace_memories": memories,
+            "trace_reads": reads,
+            "trace_db_bytes": size,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def split_trace(trace: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Pop heavy keys out of `trace` in place and update its SIDE_FIELDS_KEY marker.
+
+    Returns:
+        The popped {key: value} fields, or None if the trace had none
+    """
+    heavy = {key: trace.pop(key) for key in HEAVY_TRACE_KEYS if key in trace}
+    if not heavy:
+        return None
+    trace[SIDE_FIELDS_KEY] = sorted(set(trace.get(SIDE_FIELDS_KEY) or ()) | set(heavy))
+    return heavy
+
+
+__all__ = [
+    "TraceStore",
+    "split_trace",
+    "HEAVY_TRACE_KEYS",
+    "SIDE_FIELDS_KEY",
+    "TRACE_DB_FILENAME",
+]
@@ -12,6 +12,7 @@ from kernel.memory.memory_syscommands import (
     handle_memories,
     handle_search_mem,
     handle_memory_maintain,
+    handle_memory_reindex,
     handle_session_end,
     # Registry
     get_memory_syscommand_handlers,
@@ -23,6 +24,7 @@ __all__ = [
     "handle_memories",
     "handle_search_mem",
     "handle_memory_maintain",
+    "handle_memory_reindex",
     "handle_session_end",
     "get_memory_syscommand_handlers",
     "MEMORY_SYSCOMMAND_HANDLERS",
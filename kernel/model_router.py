@@ -148,6 +148,7 @@ def _check_quest_mode(
                 ltm_context_string = build_ltm_context_for_persona(
                     user_text=message,
                     memory_manager=kernel.memory_manager,
+                    session_id=session_id,
                 )
             except Exception as e:
                 print(f"[ModeRouter] Quest mode LTM error: {e}", flush=True)
@@ -352,6 +353,7 @@ def _handle_persona_mode(
             ltm_context_string = build_ltm_context_for_persona(
                 user_text=message,
                 memory_manager=kernel.memory_manager,
+                session_id=state.session_id,
             )
         except Exception as e:
             print(f"[ModeRouter] Persona LTM error: {e}", flush=True)
@@ -373,8 +375,8 @@ def _handle_persona_mode(
         try:
             run_auto_extraction(
                 user_text=message,
-                assistant_text=response_text,
                 memory_manager=kernel.memory_manager,
+                session_id=state.session_id,
             )
         except Exception as e:
             print(f"[ModeRouter] Auto-extraction error: {e}", flush=True)
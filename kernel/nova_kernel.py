@@ -19,7 +19,7 @@ v0.9.0 CHANGES:
 - Updated get_model_info() to show heavy/light command sets
 - All model routing now deterministic with NO FALLBACK
 """
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from backend.llm_client import LLMClient
 from backend.model_router import ModelRouter, RoutingContext
@@ -31,6 +31,7 @@ from .syscommand_router import SyscommandRouter
 from .context_manager import ContextManager
 from .memory_manager import MemoryManager
 from .policy_engine import PolicyEngine
+from .context_assembly import AssembledContext, ContextAssembler, ContextProvider
 from .logger import KernelLogger
 from .identity_manager import IdentityManager
 from .memory_policy import MemoryPolicy
@@ -130,6 +131,19 @@ from .message_logger import MessageLogger
 # Legacy NL routing has been fully removed from runtime
 USE_LEGACY_NL = False  # No longer affects runtime behavior
 
+# v0.12: Persona context providers and their deadlines (ms from stage start).
+# Extraction may wait up to 2s for the previous turn's background job.
+PERSONA_CONTEXT_DEADLINES_MS = {
+    "extraction": 2500.0,
+    "wm": 1000.0,
+    "ltm": 3000.0,
+}
+
+# How long a late WM provider may delay recording the reply (seconds)
+WM_RECORD_WAIT = 5.0
+
+_WM_CONTEXT_DEFAULT = {"direct_answer": None, "wm_result": {}, "wm_context": ""}
+
 
 class NovaKernel:
     """
@@ -161,6 +175,9 @@ class NovaKernel:
         self.policy_engine = policy_engine or PolicyEngine(config=config)
         self.logger = logger or KernelLogger(config=config)
 
+        # ---------------- v0.12 Persona context assembly ----------------
+        self.context_assembler = ContextAssembler()
+
         # ---------------- v0.5.3 Model Router ----------------
         self.model_router = model_router or ModelRouter()
 
@@ -254,6 +271,43 @@ class NovaKernel:
                 self.memory_policy.create_post_recall_hook()
             )
 
+        # ---------------- v0.12 Embedding Service warm-up ----------------
+        # Loads the shared sentence-transformers model in the background so
+        # the first persona turn doesn't pay the model-load cost.
+        try:
+            from kernel.utils.embedding_service import get_embedding_service
+            get_embedding_service(self.config.data_dir).warm_up()
+        except Exception as e:
+            print(f"[NovaKernel] Embedding warm-up skipped: {e}", flush=True)
+
+        # ---------------- v0.12 Session registries ----------------
+        # Bounds per-session WM/behavior/episodic state; evicted sessions
+        # spill to data/sessions/ and are rehydrated on their next turn.
+        try:
+            from kernel.memory.session_registry import configure_session_registries
+            configure_session_registries(
+                spill_dir=self.config.data_dir / "sessions",
+                max_sessions=getattr(self.config, "wm_max_sessions", None),
+                idle_ttl=getattr(self.config, "wm_session_idle_ttl", None),
+                memory_budget_mb=getattr(self.config, "wm_memory_budget_mb", None),
+            )
+        except Exception as e:
+            print(f"[NovaKernel] Session registry config skipped: {e}", flush=True)
+
+        # ---------------- v0.12 Session state store ----------------
+        # Wizard / mode / section-menu state; a sqlite or kv backend lets
+        # several API workers serve the same session.
+        try:
+            from kernel.utils.session_state_store import configure_session_state_store
+            backend = configure_session_state_store(
+                getattr(self.config, "session_store", None),
+                data_dir=self.config.data_dir,
+                default_ttl=getattr(self.config, "session_state_ttl", None),
+            )
+            print(f"[NovaKernel] Session state store: {backend.name}", flush=True)
+        except Exception as e:
+            print(f"[NovaKernel] Session state store config skipped: {e}", flush=True)
+
         # v0.11.0: Continuity Helpers removed
         self.continuity = None
 
@@ -581,51 +635,25 @@ class NovaKernel:
                 self.logger.log_input(session_id, f"[Memory] remember_intent error: {e}")
 
         # ─────────────────────────────────────────────────────────────────
-        # v0.11.0: AUTO-EXTRACTION (profile, procedural, episodic)
+        # v0.12: CONTEXT ASSEMBLY (auto-extraction, WM, LTM run concurrently)
         # ─────────────────────────────────────────────────────────────────
-        if _HAS_MEMORY_HELPERS:
-            try:
-                extraction_result = run_auto_extraction(
-                    user_text=stripped,
-                    memory_manager=self.memory_manager,
-                )
-                if extraction_result.get("profile") or extraction_result.get("procedural") or extraction_result.get("episodic"):
-                    self.logger.log_input(session_id, f"[Memory] Auto-extracted: {extraction_result}")
-            except Exception as e:
-                self.logger.log_input(session_id, f"[Memory] auto_extraction error: {e}")
+        # Get current module from context manager (on this thread: session
+        # state reads belong to the request)
+        current_module = None
+        try:
+            if self.context_manager:
+                ctx = self.context_manager.get_context(session_id)
+                current_module = ctx.get("current_module") if ctx else None
+        except Exception:
+            pass
+
+        assembled = self.assemble_persona_context(session_id, stripped, current_module=current_module)
+        wm_ctx = assembled.get("wm") or _WM_CONTEXT_DEFAULT
+        direct_answer = wm_ctx["direct_answer"]
+        wm_result = wm_ctx["wm_result"]
+        wm_context_string = wm_ctx["wm_context"]
+        ltm_context_string = assembled.get("ltm") or ""
 
-        # v0.7: Check if Working Memory can answer directly (reference questions)
-        direct_answer = wm_answer_reference(session_id, stripped)
-        
-        # v0.7: Update Working Memory with user message
-        wm_result = wm_update(session_id, stripped)
-        
-        # v0.7: Get formatted context string for persona system prompt
-        wm_context_string = wm_get_context_string(session_id)
-        
-        # ─────────────────────────────────────────────────────────────────
-        # v0.11.0: BUILD LTM CONTEXT (profile + relevant semantic memories)
-        # ─────────────────────────────────────────────────────────────────
-        ltm_context_string = ""
-        if _HAS_MEMORY_HELPERS:
-            try:
-                # Get current module from context manager
-                current_module = None
-                try:
-                    if self.context_manager:
-                        ctx = self.context_manager.get_context(session_id)
-                        current_module = ctx.get("current_module") if ctx else None
-                except Exception:
-                    pass
-                
-                ltm_context_string = build_ltm_context_for_persona(
-                    memory_manager=self.memory_manager,
-                    current_module=current_module,
-                    user_text=stripped,
-                )
-            except Exception as e:
-                self.logger.log_error(session_id, f"[Memory] LTM context build error: {e}")
-        
         policy_meta = {
             "session_id": session_id,
             "source": "persona_fallback",
@@ -650,8 +678,9 @@ class NovaKernel:
             direct_answer=direct_answer,
         )
 
-        # v0.7: Record Nova's response in Working Memory
-        if reply:
+        # v0.7: Record Nova's response in Working Memory (after a late WM
+        # provider has finished with it)
+        if reply and assembled.wait("wm", timeout=WM_RECORD_WAIT):
             wm_record_response(session_id, reply)
 
         # Post-LLM correction/stabilization
@@ -685,6 +714,7 @@ class NovaKernel:
             },
             "meta": {
                 "source": "persona_fallback",
+                "context_ms": assembled.latency_ms,
                 "wm": {
                     "turn": wm_result.get("turn", 0),
                     "entities": wm_result.get("entities_extracted", []),
@@ -697,6 +727,84 @@ class NovaKernel:
         self.logger.log_response(session_id, "persona", response_dict)
         return response_dict
 
+    # ------------------------------------------------------------------
+    # v0.12: Persona Context Assembly
+    # ------------------------------------------------------------------
+
+    def assemble_persona_context(
+        self,
+        session_id: str,
+        text: str,
+        current_module: Optional[str] = None,
+    ) -> AssembledContext:
+        """
+        Gather a persona turn's context concurrently, each piece by its deadline.
+
+        Providers (see PERSONA_CONTEXT_DEADLINES_MS):
+            extraction: run_auto_extraction (regex facts; LLM fallback is queued)
+            wm:         wm_answer_reference -> wm_update -> wm_get_context_string
+                        -> {"direct_answer", "wm_result", "wm_context"};
+                        serialized per session, so a late wm_update from the
+                        previous turn finishes before this one starts
+            ltm:        build_ltm_context_for_persona, after extraction so this
+                        turn's facts are searchable
+
+        A late or failing provider yields its default (no section). The
+        "remember this" check stays ahead of this stage because it can end
+        the turn and reads WM history from before wm_update.
+        """
+        def extraction() -> Optional[Dict[str, Any]]:
+            result = run_auto_extraction(
+                user_text=text,
+                memory_manager=self.memory_manager,
+                session_id=session_id,
+            )
+            if result.get("profile") or result.get("procedural") or result.get("episodic"):
+                self.logger.log_input(session_id, f"[Memory] Auto-extracted: {result}")
+            return result
+
+        def working_memory() -> Dict[str, Any]:
+            # v0.7: Reference answer reads WM before this message updates it
+            direct_answer = wm_answer_reference(session_id, text)
+            wm_result = wm_update(session_id, text)
+            return {
+                "direct_answer": direct_answer,
+                "wm_result": wm_result,
+                "wm_context": wm_get_context_string(session_id),
+            }
+
+        def ltm() -> str:
+            return build_ltm_context_for_persona(
+                memory_manager=self.memory_manager,
+                current_module=current_module,
+                user_text=text,
+                session_id=session_id,
+            )
+
+        deadlines = PERSONA_CONTEXT_DEADLINES_MS
+        providers = [
+            ContextProvider("wm", working_memory, _WM_CONTEXT_DEFAULT, deadlines["wm"], serial=f"wm:{session_id}"),
+        ]
+        if _HAS_MEMORY_HELPERS:
+            providers = [
+                ContextProvider("extraction", extraction, None, deadlines["extraction"]),
+                *providers,
+                ContextProvider("ltm", ltm, "", deadlines["ltm"], after=("extraction",)),
+            ]
+
+        assembled = self.context_assembler.run(providers)
+        for name, status in assembled.status.items():
+            if status != "ok":
+                self.logger.log_error(
+                    session_id,
+                    f"[Context] {name} {status} after {assembled.latency_ms[name]:.0f} ms; prompt built without it",
+                )
+        return assembled
+
+    def context_assembly_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-provider latency percentiles and timeout/error counts."""
+        return self.context_assembler.stats()
+
     # ------------------------------------------------------------------
     # v0.8.2: Message Logging Helper
     # ------------------------------------------------------------------
@@ -18,8 +18,10 @@ from kernel.memory.nova_wm_episodic import (
     EpisodicSnapshot,
     RelevanceResult,
     EpisodicIndex,
+    EpisodicSnapshotIndex,
     # Public API functions
     get_episodic_index,
+    get_snapshot_index,
     clear_episodic_index,
     create_snapshot_from_wm,
     episodic_snapshot,
@@ -47,8 +49,10 @@ __all__ = [
     "EpisodicSnapshot",
     "RelevanceResult",
     "EpisodicIndex",
+    "EpisodicSnapshotIndex",
     # Public API functions
     "get_episodic_index",
+    "get_snapshot_index",
     "clear_episodic_index",
     "create_snapshot_from_wm",
     "episodic_snapshot",
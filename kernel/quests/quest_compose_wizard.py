@@ -29,6 +29,7 @@ from datetime import datetime, timezone
 from typing import Any, Dict, Generator, List, Optional, Tuple
 
 from ..command_types import CommandResponse
+from ..utils.session_state_store import SessionStateStore, dataclass_codec
 
 # Gemini helper for domain extraction only (NOT for step generation)
 try:
@@ -140,8 +141,10 @@ class QuestComposeSession:
         ])
 
 
-# Global session storage (per session_id)
-_compose_sessions: Dict[str, QuestComposeSession] = {}
+# Session storage (per session_id, shared across API workers)
+_compose_sessions: SessionStateStore[QuestComposeSession] = SessionStateStore(
+    "quest_compose", *dataclass_codec(QuestComposeSession),
+)
 
 
 def get_compose_session(session_id: str) -> Optional[QuestComposeSession]:
@@ -151,12 +154,12 @@ def get_compose_session(session_id: str) -> Optional[QuestComposeSession]:
 
 def set_compose_session(session_id: str, session: QuestComposeSession) -> None:
     """Set compose session for a user session."""
-    _compose_sessions[session_id] = session
+    _compose_sessions.set(session_id, session)
 
 
 def clear_compose_session(session_id: str) -> None:
     """Clear compose session for a user session."""
-    _compose_sessions.pop(session_id, None)
+    _compose_sessions.delete(session_id)
 
 
 def has_active_compose_session(session_id: str) -> bool:
@@ -21,6 +21,7 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
 from ..command_types import CommandResponse
+from ..utils.session_state_store import SessionStateStore, dataclass_codec
 
 
 # =============================================================================
@@ -44,8 +45,10 @@ class QuestDeleteSession:
     quest_count: int = 0  # For "delete all" confirmation
 
 
-# Global session storage (per session_id)
-_delete_sessions: Dict[str, QuestDeleteSession] = {}
+# Session storage (per session_id, shared across API workers)
+_delete_sessions: SessionStateStore[QuestDeleteSession] = SessionStateStore(
+    "quest_delete", *dataclass_codec(QuestDeleteSession),
+)
 
 
 def get_delete_session(session_id: str) -> Optional[QuestDeleteSession]:
@@ -55,12 +58,12 @@ def get_delete_session(session_id: str) -> Optional[QuestDeleteSession]:
 
 def set_delete_session(session_id: str, session: QuestDeleteSession) -> None:
     """Set delete session for a user session."""
-    _delete_sessions[session_id] = session
+    _delete_sessions.set(session_id, session)
 
 
 def clear_delete_session(session_id: str) -> None:
     """Clear delete session for a user session."""
-    _delete_sessions.pop(session_id, None)
+    _delete_sessions.delete(session_id)
 
 
 def has_active_delete_session(session_id: str) -> bool:
@@ -20,6 +20,8 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, TYPE_CHECKING
 
+from ..utils.session_state_store import SessionStateStore
+
 if TYPE_CHECKING:
     from kernel.nova_kernel import NovaKernel
     from persona.nova_persona import NovaPersona
@@ -80,8 +82,10 @@ class QuestLockState:
         )
 
 
-# Global state storage (per session_id)
-_quest_lock_states: Dict[str, QuestLockState] = {}
+# State storage (per session_id, shared across API workers)
+_quest_lock_states: SessionStateStore[QuestLockState] = SessionStateStore(
+    "quest_lock", dump=QuestLockState.to_dict, load=QuestLockState.from_dict,
+)
 
 
 # =============================================================================
@@ -90,19 +94,17 @@ _quest_lock_states: Dict[str, QuestLockState] = {}
 
 def get_quest_lock_state(session_id: str) -> QuestLockState:
     """Get or create quest lock state for a session."""
-    if session_id not in _quest_lock_states:
-        _quest_lock_states[session_id] = QuestLockState()
-    return _quest_lock_states[session_id]
+    return _quest_lock_states.get_or_create(session_id, QuestLockState)
 
 
 def set_quest_lock_state(session_id: str, state: QuestLockState) -> None:
     """Set quest lock state for a session."""
-    _quest_lock_states[session_id] = state
+    _quest_lock_states.set(session_id, state)
 
 
 def clear_quest_lock_state(session_id: str) -> None:
     """Clear quest lock state for a session."""
-    _quest_lock_states.pop(session_id, None)
+    _quest_lock_states.delete(session_id)
 
 
 def is_quest_active(session_id: str) -> bool:
@@ -143,7 +145,7 @@ def activate_quest_lock(
         run_id=run_id,
         started_at=datetime.now(timezone.utc).isoformat(),
     )
-    _quest_lock_states[session_id] = state
+    _quest_lock_states.set(session_id, state)
     return state
 
 
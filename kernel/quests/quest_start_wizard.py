@@ -21,6 +21,7 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, TYPE_CHECKING
 
 from ..command_types import CommandResponse
+from ..utils.session_state_store import SessionStateStore, dataclass_codec
 from .quest_lock_mode import (
     activate_quest_lock,
     is_quest_active,
@@ -61,8 +62,10 @@ class QuestStartWizardSession:
     next_incomplete_index: int = 0
 
 
-# Global session storage
-_wizard_sessions: Dict[str, QuestStartWizardSession] = {}
+# Session storage (shared across API workers)
+_wizard_sessions: SessionStateStore[QuestStartWizardSession] = SessionStateStore(
+    "quest_start", *dataclass_codec(QuestStartWizardSession),
+)
 
 
 def get_wizard_session(session_id: str) -> Optional[QuestStartWizardSession]:
@@ -72,12 +75,12 @@ def get_wizard_session(session_id: str) -> Optional[QuestStartWizardSession]:
 
 def set_wizard_session(session_id: str, session: QuestStartWizardSession) -> None:
     """Set wizard session."""
-    _wizard_sessions[session_id] = session
+    _wizard_sessions.set(session_id, session)
 
 
 def clear_wizard_session(session_id: str) -> None:
     """Clear wizard session."""
-    _wizard_sessions.pop(session_id, None)
+    _wizard_sessions.delete(session_id)
 
 
 def has_active_wizard_session(session_id: str) -> bool:
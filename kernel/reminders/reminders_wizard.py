@@ -24,6 +24,7 @@ from typing import Any, Dict, List, Optional
 from zoneinfo import ZoneInfo
 
 from ..command_types import CommandResponse
+from ..utils.session_state_store import SessionStateStore, dataclass_codec
 from .reminders_manager import RemindersManager, Reminder, DEFAULT_TIMEZONE
 
 
@@ -40,8 +41,10 @@ class RemindersWizardSession:
     collected: Dict[str, Any] = field(default_factory=dict)
 
 
-# Session storage: session_id -> RemindersWizardSession
-_wizard_sessions: Dict[str, RemindersWizardSession] = {}
+# Session storage: session_id -> RemindersWizardSession (shared across API workers)
+_wizard_sessions: SessionStateStore[RemindersWizardSession] = SessionStateStore(
+    "reminders_wizard", *dataclass_codec(RemindersWizardSession),
+)
 
 
 def get_wizard_session(session_id: str) -> Optional[RemindersWizardSession]:
@@ -49,11 +52,11 @@ def get_wizard_session(session_id: str) -> Optional[RemindersWizardSession]:
 
 
 def set_wizard_session(session_id: str, session: RemindersWizardSession) -> None:
-    _wizard_sessions[session_id] = session
+    _wizard_sessions.set(session_id, session)
 
 
 def clear_wizard_session(session_id: str) -> None:
-    _wizard_sessions.pop(session_id, None)
+    _wizard_sessions.delete(session_id)
 
 
 def has_active_wizard(session_id: str) -> bool:
@@ -93,6 +93,7 @@ SECTION_DEFS: Dict[str, Section] = {
             CommandInfo("memories", "Full memory management UI (list/view/edit/delete)", "#memories"),
             CommandInfo("search-mem", "Search memories by keywords", "#search-mem query=\"Steven project\""),
             CommandInfo("memory-maintain", "Run decay/archiving maintenance", "#memory-maintain"),
+            CommandInfo("memory-reindex", "Rebuild the semantic search embedding index", "#memory-reindex"),
             CommandInfo("session-end", "End session: save WM to LTM and clear", "#session-end"),
         ]
     ),
@@ -179,6 +180,7 @@ SECTION_DEFS: Dict[str, Section] = {
             CommandInfo("wm-clear", "Clear working memory for this session", "#wm-clear"),
             CommandInfo("behavior-debug", "Show Behavior Layer state", "#behavior-debug"),
             CommandInfo("self-test", "Run internal diagnostics", "#self-test"),
+            CommandInfo("llm-stats", "Show LLM call telemetry (tokens, latency, queue)", "#llm-stats limit=10"),
             CommandInfo("quest-debug", "Show raw quest engine state", "#quest-debug"),
         ]
     ),
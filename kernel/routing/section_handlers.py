@@ -25,6 +25,7 @@ from .section_defs import (
 )
 from ..command_types import CommandRequest
 from ..formatting import OutputFormatter as F
+from ..utils.session_state_store import SessionStateStore
 
 
 # Type alias for kernel response
@@ -122,17 +123,22 @@ class SectionMenuState:
     
     This allows follow-up inputs to be interpreted as command selections.
     """
-    def __init__(self):
-        self._active_section: Dict[str, Optional[str]] = {}  # session_id -> section_key
+    def __init__(self, namespace: str = "section_menu"):
+        # session_id -> section_key
+        self._active_section: SessionStateStore[str] = SessionStateStore(
+            namespace,
+            dump=lambda section_key: {"section": section_key},
+            load=lambda data: data["section"],
+        )
     
     def set_active(self, session_id: str, section_key: str) -> None:
-        self._active_section[session_id] = section_key
+        self._active_section.set(session_id, section_key)
     
     def get_active(self, session_id: str) -> Optional[str]:
         return self._active_section.get(session_id)
     
     def clear(self, session_id: str) -> None:
-        self._active_section.pop(session_id, None)
+        self._active_section.delete(session_id)
 
 
 # Global section menu state
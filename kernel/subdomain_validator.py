@@ -30,15 +30,12 @@ import re
 from typing import Any, Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass, field
 
-# Try to import sentence-transformers for Layer 2
-_HAS_EMBEDDINGS = False
-_embedding_model = None
-
+# Layer 2 uses the shared embedding service (sentence-transformers, optional)
 try:
-    from sentence_transformers import SentenceTransformer, util
-    _HAS_EMBEDDINGS = True
+    from kernel.utils.embedding_service import get_embedding_service, is_embedding_available
+    _HAS_EMBEDDINGS = is_embedding_available()
 except ImportError:
-    pass
+    _HAS_EMBEDDINGS = False
 
 
 # =============================================================================
@@ -440,15 +437,15 @@ def _remove_word_overlap_duplicates(
 # =============================================================================
 
 def _get_embedding_model():
-    """Get or initialize the embedding model."""
-    global _embedding_model
-    
-    if _embedding_model is None and _HAS_EMBEDDINGS:
-        print("[SubdomainValidator] Loading embedding model...", flush=True)
-        # Use a small, fast model
-        _embedding_model = SentenceTransformer('all-MiniLM-L6-v2')
-    
-    return _embedding_model
+    """Get the shared embedding service (None if embeddings are unavailable)."""
+    if not _HAS_EMBEDDINGS:
+        return None
+    return get_embedding_service()
+
+
+def _cos_sim(embeddings, i: int, j: int) -> float:
+    """Cosine similarity of two rows (service vectors are L2-normalized)."""
+    return float(embeddings[i] @ embeddings[j])
 
 
 def _remove_semantic_duplicates_cross_domain(
@@ -476,7 +473,9 @@ def _remove_semantic_duplicates_cross_domain(
     
     # Compute embeddings
     texts = [sub for sub, _ in all_subs]
-    embeddings = model.encode(texts, convert_to_tensor=True)
+    embeddings = model.encode(texts)
+    if embeddings is None:
+        return domains, []
     
     # Find duplicates
     to_remove: Set[Tuple[str, str]] = set()
@@ -499,7 +498,7 @@ def _remove_semantic_duplicates_cross_domain(
                 continue
             
             # Calculate similarity
-            sim = util.cos_sim(embeddings[i], embeddings[j]).item()
+            sim = _cos_sim(embeddings, i, j)
             
             if sim >= threshold:
                 # Keep the more specific one
@@ -542,7 +541,10 @@ def _remove_semantic_duplicates_intra_domain(
             continue
         
         # Compute embeddings for this domain
-        embeddings = model.encode(subs, convert_to_tensor=True)
+        embeddings = model.encode(subs)
+        if embeddings is None:
+            result[domain] = subs
+            continue
         
         to_remove: Set[int] = set()
         
@@ -554,7 +556,7 @@ def _remove_semantic_duplicates_intra_domain(
                 if j in to_remove:
                     continue
                 
-                sim = util.cos_sim(embeddings[i], embeddings[j]).item()
+                sim = _cos_sim(embeddings, i, j)
                 
                 if sim >= threshold:
                     # Keep the more specific one
@@ -599,7 +601,9 @@ def _detect_concept_overlap(
     
     # Compute embeddings
     texts = [sub for sub, _ in all_subs]
-    embeddings = model.encode(texts, convert_to_tensor=True)
+    embeddings = model.encode(texts)
+    if embeddings is None:
+        return []
     
     overlaps = []
     
@@ -613,7 +617,7 @@ def _detect_concept_overlap(
             if domain_a == domain_b:
                 continue
             
-            sim = util.cos_sim(embeddings[i], embeddings[j]).item()
+            sim = _cos_sim(embeddings, i, j)
             
             # Flag moderate similarity as potential overlap (but not high enough to auto-remove)
             if threshold <= sim < SEMANTIC_SIMILARITY_THRESHOLD:
@@ -21,6 +21,7 @@ from typing import Any, Callable, Dict, List, Optional
 
 from .command_types import CommandRequest, CommandResponse
 from .formatting import OutputFormatter as F
+from .utils.session_state_store import SessionStateStore
 from .section_defs import SECTION_DEFS, get_section
 
 # v0.7: Working Memory imports
@@ -170,7 +171,12 @@ def _error_response(
 # SECTION MENU STATE
 # =============================================================================
 
-_section_menu_state: Dict[str, str] = {}  # session_id -> active_section
+# session_id -> active_section (shared across API workers)
+_section_menu_state: SessionStateStore[str] = SessionStateStore(
+    "syscommand_section_menu",
+    dump=lambda section_key: {"section": section_key},
+    load=lambda data: data["section"],
+)
 
 
 def get_active_section(session_id: str) -> Optional[str]:
@@ -180,7 +186,7 @@ def get_active_section(session_id: str) -> Optional[str]:
 
 def clear_active_section(session_id: str) -> None:
     """Clear the active section menu for a session."""
-    _section_menu_state.pop(session_id, None)
+    _section_menu_state.delete(session_id)
 
 
 def get_section_command_names(section_key: str) -> List[str]:
@@ -526,12 +532,12 @@ def handle_forget(cmd_name, args, session_id, context, kernel, meta) -> CommandR
         positional = args.get("_", [])
         if positional and str(positional[0]).lower() == "all":
             # Get all memories
-            all_memories = mm.recall(limit=10000)
+            all_memories = mm.recall(limit=10000, touch=False)
             if not all_memories:
                 return _base_response(cmd_name, "No memories to forget.", {"removed": 0})
             
             all_ids = [m.id for m in all_memories]
-            removed = mm.forget(ids=all_ids)
+            removed = mm.delete_many(all_ids)
             return _base_response(
                 cmd_name, 
                 f"⚠ Forgot ALL {removed} memory item(s). Memory store is now empty.",
@@ -913,6 +919,68 @@ def handle_diagnostics(cmd_name, args, session_id, context, kernel, meta) -> Com
     return handle_self_test("self-test", args, session_id, context, kernel, meta)
 
 
+# =============================================================================
+# LLM TELEMETRY (v0.12)
+# =============================================================================
+
+def _ms(value) -> str:
+    return "—" if value is None else f"{value:.0f}ms"
+
+
+def handle_llm_stats(cmd_name, args, session_id, context, kernel, meta) -> CommandResponse:
+    """
+    Show per-call LLM telemetry for this worker: totals, rollups by
+    channel/model, and the most recent calls.
+
+    Args (optional): limit=<recent calls>, channel=, model=, command= (filter recent calls)
+    """
+    from datetime import datetime
+    from backend.llm_telemetry import get_telemetry
+
+    limit = 10
+    filters = {}
+    if isinstance(args, dict):
+        raw_limit = args.get("limit")
+        if isinstance(raw_limit, int):
+            limit = raw_limit
+        elif isinstance(raw_limit, str) and raw_limit.isdigit():
+            limit = int(raw_limit)
+        filters = {k: args[k] for k in ("channel", "model", "command") if isinstance(args.get(k), str)}
+
+    telemetry = get_telemetry()
+    stats = telemetry.stats()
+    recent = telemetry.recent(limit, **filters)
+
+    if not stats["calls"]:
+        return _base_response(cmd_name, F.header("No LLM calls recorded yet."), {**stats, "recent": []})
+
+    lines = [
+        F.header("LLM Telemetry"),
+        F.key_value("Calls", stats["calls"]),
+        F.key_value("Error rate", f"{stats['error_rate']:.1%}"),
+        F.key_value("Tokens", f"{stats['total_tokens']} ({stats['prompt_tokens']} prompt / {stats['completion_tokens']} completion)"),
+        F.subheader("By channel/model"),
+    ]
+    for key, r in stats["by_model"].items():
+        lines.append(
+            f"• {key} — {r['calls']} calls, latency p50 {_ms(r['latency_ms']['p50'])} / p95 {_ms(r['latency_ms']['p95'])}, "
+            f"ttft p50 {_ms(r['ttft_ms']['p50'])}, queue p95 {_ms(r['queue_ms']['p95'])}, "
+            f"{r['total_tokens']} tokens, {r['retries']} retries, {r['cache_hits']} cache hits"
+        )
+
+    lines.append(F.subheader("Recent calls"))
+    for rec in recent:
+        when = datetime.fromtimestamp(rec["started_at"]).strftime("%H:%M:%S")
+        tokens = "—" if rec["total_tokens"] is None else rec["total_tokens"]
+        extra = " cached" if rec["cache"] == "hit" else ""
+        lines.append(
+            f"• {when} {rec['channel']}/{rec['command']} {rec['model']} {rec['outcome']}{extra} "
+            f"{_ms(rec['latency_ms'])} tokens={tokens}"
+        )
+
+    return _base_response(cmd_name, "\n".join(lines), {**stats, "recent": recent})
+
+
 # =============================================================================
 # SECTION MENU HANDLERS
 # =============================================================================
@@ -924,7 +992,7 @@ def _handle_section_menu(section_key, cmd_name, args, session_id, context, kerne
         return _base_response(cmd_name, f"Unknown section '{section_key}'.", {"ok": False})
 
     # Set active section
-    _section_menu_state[session_id] = section_key
+    _section_menu_state.set(session_id, section_key)
 
     lines = [
         f"╔══ {section.title} ══╗",
@@ -1336,6 +1404,7 @@ SYS_HANDLERS: Dict[str, Callable[..., CommandResponse]] = {
     # Self-Test
     "handle_self_test": handle_self_test,
     "handle_diagnostics": handle_diagnostics,
+    "handle_llm_stats": handle_llm_stats,  # v0.12
     
     # Section Menus (v0.11.0: removed continuity, inbox; v3.0.0: removed human_state; v2.1.1: removed commands)
     "handle_section_core": handle_section_core,
@@ -20,6 +20,8 @@ from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Literal
 
+from ..utils.session_state_store import SessionStateStore
+
 logger = logging.getLogger("nova.timerhythm")
 
 Phase = Literal["morning", "evening", "night"]
@@ -97,7 +99,11 @@ class DailyReviewWizardSession:
         return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
 
 
-_wizard_sessions: Dict[str, DailyReviewWizardSession] = {}
+_wizard_sessions: SessionStateStore[DailyReviewWizardSession] = SessionStateStore(
+    "daily_review_wizard",
+    dump=DailyReviewWizardSession.to_dict,
+    load=DailyReviewWizardSession.from_dict,
+)
 
 
 def get_daily_review_wizard_session(session_id: str) -> Optional[DailyReviewWizardSession]:
@@ -113,12 +119,12 @@ def create_daily_review_wizard_session(session_id: str, phase: Phase) -> DailyRe
         session_id=session_id, phase=phase, step=0,
         started_at=datetime.now(timezone.utc).isoformat(),
     )
-    _wizard_sessions[session_id] = session
+    _wizard_sessions.set(session_id, session)
     return session
 
 
 def clear_daily_review_wizard_session(session_id: str) -> None:
-    _wizard_sessions.pop(session_id, None)
+    _wizard_sessions.delete(session_id)
 
 
 # =============================================================================
@@ -9,6 +9,8 @@ Contains shared utilities used across the kernel:
 - kv_store: KV store protocol/interface
 - kv_factory: KV store factory
 - job_queue: Async job management
+- embedding_service: Shared sentence-transformers model (batching + cache)
+- session_state_store: Per-session wizard/mode state (memory, SQLite or KV)
 
 All symbols are re-exported for backward compatibility.
 """
@@ -56,3 +58,21 @@ try:
     )
 except ImportError:
     pass
+
+# Session State Store - always available (KV backend imported on demand)
+from .session_state_store import (
+    SessionStateStore,
+    configure_session_state_store,
+    flush_session_states,
+    session_state_scope,
+)
+
+# Embedding Service - safe import (optional SDK)
+try:
+    from .embedding_service import (
+        EmbeddingService,
+        get_embedding_service,
+        is_embedding_available,
+    )
+except ImportError:
+    pass
@@ -0,0 +1,480 @@
+# kernel/utils/embedding_service.py
+"""
+NovaOS Embedding Service — v0.12
+
+One process-wide sentence-transformers model shared by memory search
+(kernel/memory/memory_helpers.py) and subdomain validation
+(kernel/subdomain_validator.py).
+
+- Micro-batching: concurrent encode() calls are queued and encoded together
+  by one worker thread (up to MAX_BATCH texts or BATCH_WINDOW_MS of waiting);
+  encode_async() queues without waiting and returns a Future
+- Caching: LRU in RAM plus an on-disk SQLite cache, keyed by a hash of the
+  normalized text (and the model name)
+- Warm-up: warm_up() loads the model in a background thread at startup so
+  the first persona turn doesn't pay the model-load cost
+- Shutdown: shutdown() (run at interpreter exit for the shared service)
+  finishes queued requests, stops the worker and closes the disk cache
+
+All vectors are returned L2-normalized (float32), so cosine similarity is
+a plain dot product.
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import logging
+import queue
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger("nova.embeddings")
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy ships with sentence-transformers
+    np = None
+
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+MODEL_NAME = "all-MiniLM-L6-v2"
+LRU_SIZE = 4096
+MAX_BATCH = 64
+BATCH_WINDOW_MS = 5.0
+CACHE_FILENAME = "embedding_cache.sqlite"
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text for cache keys (the model is uncased)."""
+    text = unicodedata.normalize("NFKC", text or "")
+    return _WHITESPACE_RE.sub(" ", text).strip().lower()
+
+
+def is_embedding_available() -> bool:
+    """Check if sentence-transformers (and numpy) can be imported."""
+    if np is None:
+        return False
+    try:
+        import sentence_transformers  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+# =============================================================================
+# SERVICE
+# =============================================================================
+
+class EmbeddingService:
+    """
+    Shared, batching, caching wrapper around a SentenceTransformer model.
+    """
+
+    def __init__(
+        self,
+        model_name: str = MODEL_NAME,
+        cache_dir: Optional[Path] = None,
+        lru_size: int = LRU_SIZE,
+        max_batch: int = MAX_BATCH,
+        batch_window_ms: float = BATCH_WINDOW_MS,
+    ):
+        self.model_name = model_name
+        self.lru_size = lru_size
+        self.max_batch = max_batch
+        self.batch_window = batch_window_ms / 1000.0
+
+        self._model = None
+        self._model_lock = threading.Lock()
+        self._available: Optional[bool] = None
+
+        # RAM cache
+        self._lru: "OrderedDict[str, Any]" = OrderedDict()
+        self._lru_lock = threading.Lock()
+
+        # Disk cache
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        if cache_dir is not None:
+            self._open_disk_cache(Path(cache_dir) / CACHE_FILENAME)
+
+        # Micro-batching worker
+        self._requests: "queue.Queue[Optional[Tuple[List[str], List[str], Future]]]" = queue.Queue()  # None stops the worker
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+
+        # Stats
+        self._stats: Dict[str, float] = {
+            "requests": 0,
+            "texts": 0,
+            "lru_hits": 0,
+            "disk_hits": 0,
+            "encoded": 0,
+            "batches": 0,
+            "model_load_ms": 0.0,
+        }
+
+    # ---------- Availability / model ----------
+
+    def is_available(self) -> bool:
+        if self._available is None:
+            self._available = is_embedding_available()
+            if not self._available:
+                logger.info("sentence-transformers not installed - embeddings disabled")
+        return self._available
+
+    def _get_model(self):
+        if self._model is not None or not self.is_available():
+            return self._model
+        with self._model_lock:
+            if self._model is None:
+                started = time.perf_counter()
+                try:
+                    from sentence_transformers import SentenceTransformer
+                    self._model = SentenceTransformer(self.model_name)
+                except Exception as e:
+                    logger.warning("Failed to load embedding model %s: %s", self.model_name, e)
+                    self._available = False
+                    return None
+                self._stats["model_load_ms"] = round((time.perf_counter() - started) * 1000, 1)
+                logger.info("Loaded embedding model: %s (%.0f ms)", self.model_name, self._stats["model_load_ms"])
+        return self._model
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._model is not None
+
+    @property
+    def dim(self) -> Optional[int]:
+        model = self._model
+        if model is None:
+            return None
+        return int(model.get_sentence_embedding_dimension())
+
+    def warm_up(self, background: bool = True) -> None:
+        """Load the model (in a daemon thread by default)."""
+        if self.is_loaded or not self.is_available():
+            return
+        if background:
+            threading.Thread(target=self._warm, name="nova-embedding-warmup", daemon=True).start()
+        else:
+            self._warm()
+
+    def _warm(self) -> None:
+        model = self._get_model()
+        if model is not None:
+            try:
+                model.encode(["warm up"], convert_to_numpy=True)
+            except Exception:
+                pass
+
+    # ---------- Caches ----------
+
+    def _key(self, normalized: str) -> str:
+        return hashlib.sha256(f"{self.model_name}\x00{normalized}".encode("utf-8")).hexdigest()
+
+    def _open_disk_cache(self, path: Path) -> None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(path), check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+            )
+            self._db.commit()
+        except Exception as e:
+            logger.warning("Embedding disk cache unavailable (%s): %s", path, e)
+            self._db = None
+
+    def _lru_get(self, key: str):
+        with self._lru_lock:
+            vector = self._lru.get(key)
+            if vector is not None:
+                self._lru.move_to_end(key)
+            return vector
+
+    def _lru_put(self, key: str, vector) -> None:
+        with self._lru_lock:
+            self._lru[key] = vector
+            self._lru.move_to_end(key)
+            while len(self._lru) > self.lru_size:
+                self._lru.popitem(last=False)
+
+    def _disk_get_many(self, keys: List[str]) -> Dict[str, Any]:
+        if self._db is None or not keys:
+            return {}
+        found: Dict[str, Any] = {}
+        with self._db_lock:
+            if self._db is None:
+                return {}
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                rows = self._db.execute(
+                    "SELECT key, vector FROM embeddings WHERE key IN (" + ", ".join("?" for _ in chunk) + ")",
+                    chunk,
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = np.frombuffer(blob, dtype=np.float32)
+        return found
+
+    def _disk_put_many(self, entries: Dict[str, Any]) -> None:
+        if self._db is None or not entries:
+            return
+        try:
+            with self._db_lock:
+                if self._db is None:
+                    return
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                    [(key, vector.astype(np.float32).tobytes()) for key, vector in entries.items()],
+                )
+                self._db.commit()
+        except Exception as e:
+            logger.debug("Failed to write embedding cache: %s", e)
+
+    # ---------- Encoding ----------
+
+    def encode(self, texts: Sequence[str]):
+        """
+        Encode texts into an (n, dim) float32 matrix of normalized vectors.
+
+        Cached vectors are served from RAM/disk; the rest are queued for the
+        batching worker. Blocks until all vectors are ready.
+
+        Returns:
+            numpy array, or None if embeddings are unavailable
+        """
+        return self.encode_async(texts).result()
+
+    def encode_async(self, texts: Sequence[str]) -> Future:
+        """
+        Non-blocking encode(): queue the uncached texts and return at once.
+
+        Returns:
+            Future resolving to what encode() would return; callbacks added
+            to it run on the batching worker thread
+        """
+        result: Future = Future()
+        if not self.is_available():
+            result.set_result(None)
+            return result
+        texts = list(texts)
+        if not texts:
+            result.set_result(np.zeros((0, self.dim or 0), dtype=np.float32))
+            return result
+
+        normalized = [normalize_text(t) for t in texts]
+        keys = [self._key(n) for n in normalized]
+        self._stats["requests"] += 1
+        self._stats["texts"] += len(texts)
+
+        vectors: Dict[str, Any] = {}
+        for key in keys:
+            vector = self._lru_get(key)
+            if vector is not None:
+                vectors[key] = vector
+        self._stats["lru_hits"] += len(vectors)
+
+        missing = [k for k in dict.fromkeys(keys) if k not in vectors]
+        if missing:
+            from_disk = self._disk_get_many(missing)
+            for key, vector in from_disk.items():
+                vectors[key] = vector
+                self._lru_put(key, vector)
+            self._stats["disk_hits"] += len(from_disk)
+
+        to_encode: Dict[str, str] = {}
+        for key, norm_text in zip(keys, normalized):
+            if key not in vectors:
+                to_encode[key] = norm_text
+
+        if not to_encode:
+            result.set_result(np.stack([vectors[key] for key in keys]))
+            return result
+
+        def finish(batch: Future) -> None:
+            try:
+                encoded = batch.result()
+            except Exception as e:
+                result.set_exception(e)
+                return
+            if encoded is None:
+                result.set_result(None)
+                return
+            vectors.update(encoded)
+            result.set_result(np.stack([vectors[key] for key in keys]))
+
+        batch: Future = Future()
+        batch.add_done_callback(finish)
+        self._ensure_worker()
+        self._requests.put((list(to_encode.keys()), list(to_encode.values()), batch))
+        return result
+
+    def encode_one(self, text: str) -> Optional[List[float]]:
+        """Encode a single text; returns a list of floats or None."""
+        matrix = self.encode([text])
+        if matrix is None or len(matrix) == 0:
+            return None
+        return matrix[0].tolist()
+
+    def _ensure_worker(self) -> None:
+        if self._worker is not None and self._worker.is_alive():
+            return
+        with self._worker_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run_worker, name="nova-embedding-batcher", daemon=True)
+                self._worker.start()
+
+    def _run_worker(self) -> None:
+        while True:
+            request = self._requests.get()
+            if request is None:  # shutdown()
+                return
+            batch = [request]
+            size = len(request[0])
+            stopping = False
+            deadline = time.monotonic() + self.batch_window
+            while size < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    request = self._requests.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if request is None:
+                    stopping = True
+                    break
+                batch.append(request)
+                size += len(request[0])
+            self._encode_batch(batch)
+            if stopping:
+                return
+
+    def shutdown(self, timeout: Optional[float] = 5.0) -> None:
+        """
+        Encode the requests already queued, stop the worker and close the
+        disk cache. A later encode() starts a new worker (RAM cache only).
+        """
+        with self._worker_lock:
+            worker, self._worker = self._worker, None
+            if worker is not None and worker.is_alive():
+                self._requests.put(None)
+        if worker is not None:
+            worker.join(timeout)
+        with self._db_lock:
+            if self._db is not None:
+                try:
+                    self._db.close()
+                except Exception:
+                    pass
+                self._db = None
+
+    def _encode_batch(self, batch: List[Tuple[List[str], List[str], Future]]) -> None:
+        # Deduplicate across requests in the batch
+        unique: Dict[str, str] = {}
+        for keys, texts, _ in batch:
+            for key, text in zip(keys, texts):
+                unique.setdefault(key, text)
+
+        try:
+            model = self._get_model()
+            if model is None:
+                for _, _, future in batch:
+                    future.set_result(None)
+                return
+            matrix = model.encode(
+                list(unique.values()),
+                batch_size=self.max_batch,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+            ).astype(np.float32)
+        except Exception as e:
+            logger.debug("Embedding batch failed: %s", e)
+            for _, _, future in batch:
+                future.set_exception(e)
+            return
+
+        encoded = dict(zip(unique.keys(), matrix))
+        for key, vector in encoded.items():
+            self._lru_put(key, vector)
+        self._disk_put_many(encoded)
+        self._stats["encoded"] += len(encoded)
+        self._stats["batches"] += 1
+
+        for keys, _, future in batch:
+            future.set_result({key: encoded[key] for key in keys})
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lru_lock:
+            lru_entries = len(self._lru)
+        return {
+            "model": self.model_name,
+            "loaded": self.is_loaded,
+            "lru_entries": lru_entries,
+            "disk_cache": self._db is not None,
+            "pending": self._requests.qsize(),
+            **self._stats,
+        }
+
+
+# =============================================================================
+# SINGLETON
+# =============================================================================
+
+_service_instance: Optional[EmbeddingService] = None
+_service_lock = threading.Lock()
+
+
+def get_embedding_service(data_dir: Optional[Path] = None) -> EmbeddingService:
+    """
+    Get or create the process-wide embedding service.
+
+    Args:
+        data_dir: Data directory for the on-disk cache (first call wins;
+            defaults to the Config data dir)
+    """
+    global _service_instance
+
+    if _service_instance is not None:
+        return _service_instance
+
+    with _service_lock:
+        if _service_instance is None:
+            if data_dir is None:
+                from system.config import CONFIG_DIR
+                data_dir = CONFIG_DIR
+            _service_instance = EmbeddingService(cache_dir=Path(data_dir) / "memory")
+            # atexit runs hooks last-in first-out and memory_engine registers
+            # its exit hook on import, so queued memory vectors are encoded
+            # and indexed before that hook saves the index
+            atexit.register(_service_instance.shutdown)
+    return _service_instance
+
+
+def reset_embedding_service() -> None:
+    """Reset the singleton (for testing)."""
+    global _service_instance
+    _service_instance = None
+
+
+__all__ = [
+    "EmbeddingService",
+    "get_embedding_service",
+    "reset_embedding_service",
+    "is_embedding_available",
+    "normalize_text",
+    "MODEL_NAME",
+]
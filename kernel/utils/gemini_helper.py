@@ -13,13 +13,18 @@ If Gemini draft is unusable, GPT regenerates from scratch.
 User never sees "fallback" or "polish" - just clean results.
 
 SCOPED TO #quest-compose ONLY - does not affect other commands.
+
+v0.12: Domain drafts and polish passes for the same objectives text are
+served from the LLM response cache (backend/llm_cache.py).
 """
 
 import json
 import os
 import re
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from backend.llm_cache import get_response_cache, make_cache_key
 
 # Gemini SDK import
 try:
@@ -117,8 +122,47 @@ def _init_gemini() -> bool:
         return False
 
 
-def _call_gemini(prompt: str, system: str, max_tokens: int) -> Optional[str]:
-    """Call Gemini API for draft generation."""
+def _call_gemini(
+    prompt: str,
+    system: str,
+    max_tokens: int,
+    cache: bool = False,
+    cache_validator: Optional[Callable[[str], Any]] = None,
+) -> Optional[str]:
+    """
+    Call Gemini API for draft generation.
+    
+    v0.12: cache=True reuses the draft of an identical earlier request;
+    only drafts passing `cache_validator` (if given) are stored.
+    """
+    response_cache = get_response_cache() if cache and CONFIG.gemini_enabled else None
+    if response_cache is None:
+        return _generate_gemini_draft(prompt, system, max_tokens)
+    
+    cache_key = make_cache_key(
+        "gemini", CONFIG.gemini_model, system,
+        [{"role": "user", "content": prompt}],
+        {"temperature": CONFIG.gemini_temperature, "max_tokens": max_tokens},
+    )
+    try:
+        text = response_cache.get(cache_key)
+    except Exception as e:
+        print(f"[TwoPass] Draft cache read failed: {e}", flush=True)
+        text = None
+    if text is not None:
+        print(f"[TwoPass] Gemini draft (cached): {len(text)} chars", flush=True)
+        return text
+    
+    text = _generate_gemini_draft(prompt, system, max_tokens)
+    if text and (cache_validator is None or cache_validator(text)):
+        try:
+            response_cache.put(cache_key, text)
+        except Exception as e:
+            print(f"[TwoPass] Draft cache write failed: {e}", flush=True)
+    return text
+
+
+def _generate_gemini_draft(prompt: str, system: str, max_tokens: int) -> Optional[str]:
     if not CONFIG.gemini_enabled:
         print("[TwoPass] Gemini disabled", flush=True)
         return None
@@ -230,8 +274,15 @@ def _call_gemini(prompt: str, system: str, max_tokens: int) -> Optional[str]:
 # GPT CLIENT (via llm_client)
 # =============================================================================
 
-def _call_gpt(prompt: str, system: str, max_tokens: int, llm_client: Any) -> Optional[str]:
-    """Call GPT-5.1 for polish/verify pass."""
+def _call_gpt(
+    prompt: str,
+    system: str,
+    max_tokens: int,
+    llm_client: Any,
+    cache: bool = False,
+    cache_validator: Optional[Callable[[str], Any]] = None,
+) -> Optional[str]:
+    """Call GPT-5.1 for polish/verify pass (cache=True / cache_validator: see complete_system)."""
     if not llm_client:
         print("[TwoPass] No llm_client for GPT", flush=True)
         return None
@@ -244,6 +295,8 @@ def _call_gpt(prompt: str, system: str, max_tokens: int, llm_client: Any) -> Opt
             user=prompt,
             command="quest-compose-steps",  # Routes to gpt-5.1
             think_mode=True,
+            cache=cache,
+            cache_validator=cache_validator,
         )
         
         text = result.get("text", "").strip() if result else ""
@@ -537,7 +590,10 @@ def generate_domains_two_pass(
 
 Return ONLY valid JSON."""
         
-        raw = _call_gemini(prompt, GEMINI_DOMAIN_SYSTEM, CONFIG.gemini_max_tokens_domains)
+        raw = _call_gemini(
+            prompt, GEMINI_DOMAIN_SYSTEM, CONFIG.gemini_max_tokens_domains,
+            cache=True, cache_validator=lambda text: _parse_json(text) is not None,
+        )
         inspection = inspect_gemini_draft(raw)
         gemini_draft = raw
     else:
@@ -567,7 +623,10 @@ GEMINI DRAFT: (none - generate fresh)
 {draft_section}
 Output ONLY valid JSON matching the schema."""
     
-    gpt_raw = _call_gpt(polish_prompt, GPT_DOMAIN_POLISH_SYSTEM, CONFIG.gpt_max_tokens_domains, llm_client)
+    gpt_raw = _call_gpt(
+        polish_prompt, GPT_DOMAIN_POLISH_SYSTEM, CONFIG.gpt_max_tokens_domains, llm_client,
+        cache=True, cache_validator=lambda text: _parse_json(text) is not None,
+    )
     
     if not gpt_raw:
         print("[TwoPass] GPT polish failed", flush=True)
@@ -0,0 +1,503 @@
+# kernel/utils/session_state_store.py
+"""
+NovaOS Session State Store — v0.12
+
+One home for the per-session interactive state that used to live in
+module-level dicts (mode router NovaState, quest wizards, quest lock,
+section menus, ContextManager sessions). With those dicts a second
+gunicorn worker never saw the wizard a user had started on the first one;
+with a shared backend every worker reads and writes the same state.
+
+Backends:
+- memory: process-local, holds the live objects (the old behavior)
+- sqlite: one file shared by every worker on the host (WAL mode)
+- kv:     the configured KVStore (Upstash / Redis Cloud) via get_json/set_json
+
+Every key has an idle TTL: it expires `ttl` seconds after it was last
+read or written.
+
+Shared backends serialize through each registry's to_dict/from_dict. The
+objects callers get back are mutated in place (wizard code does
+`session.stage = ...` without calling set again), so reads go through a
+per-thread identity map: the same object is returned for the rest of the
+scope, and flush_session_states() writes back whatever changed.
+nova_api opens a session_state_scope() around each request and stream.
+Outside a scope, reads go straight to the backend and nothing is kept,
+so in-place changes there must be saved with set().
+
+Selected with configure_session_state_store() (the kernel applies
+Config.session_store at startup) or the NOVA_SESSION_STORE env var:
+"memory", "sqlite" / "sqlite:<path>", or "kv".
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from dataclasses import asdict, fields
+from pathlib import Path
+from typing import Any, Callable, Dict, Generic, Iterator, Optional, Tuple, TypeVar
+
+logger = logging.getLogger("nova.session_state")
+
+T = TypeVar("T")
+
+
+# =============================================================================
+# DEFAULTS
+# =============================================================================
+
+DEFAULT_SESSION_STATE_TTL = 24 * 3600.0   # seconds, idle
+DEFAULT_SQLITE_FILENAME = "session_state.db"
+KV_KEY_PREFIX = "session"
+
+# Expired SQLite rows are purged at most this often (seconds)
+PURGE_INTERVAL = 300.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS session_state (
+    namespace   TEXT NOT NULL,
+    key         TEXT NOT NULL,
+    value       TEXT NOT NULL,
+    expires_at  REAL,
+    PRIMARY KEY (namespace, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_session_state_expires ON session_state (expires_at);
+"""
+
+
+# =============================================================================
+# BACKENDS
+# =============================================================================
+
+class SessionStateBackend(ABC):
+    """
+    (namespace, key) -> value storage with a per-key TTL.
+
+    `shared` backends are visible to other processes and store JSON-safe
+    dicts; the memory backend stores the objects themselves.
+    """
+
+    name: str = "abstract"
+    shared: bool = True
+
+    @abstractmethod
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        """Value for key, or None if missing or expired."""
+
+    @abstractmethod
+    def set(self, namespace: str, key: str, value: Any, ttl: Optional[float]) -> None:
+        """Store value; it expires `ttl` seconds from now (None = never)."""
+
+    @abstractmethod
+    def delete(self, namespace: str, key: str) -> bool:
+        """Remove key. Returns True if it existed."""
+
+    def touch(self, namespace: str, key: str, value: Any, ttl: Optional[float]) -> None:
+        """Restart the TTL of an unchanged value (default: rewrite it)."""
+        self.set(namespace, key, value, ttl)
+
+    def close(self) -> None:
+        pass
+
+
+class MemoryStateBackend(SessionStateBackend):
+    """Process-local backend holding live objects; reads slide the TTL."""
+
+    name = "memory"
+    shared = False
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._lock = threading.Lock()
+        # (namespace, key) -> (value, ttl, expires_at)
+        self._data: Dict[Tuple[str, str], Tuple[Any, Optional[float], Optional[float]]] = {}
+        self._last_purge = clock()
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        now = self._clock()
+        with self._lock:
+            entry = self._data.get((namespace, key))
+            if entry is None:
+                return None
+            value, ttl, expires_at = entry
+            if expires_at is not None and expires_at <= now:
+                del self._data[(namespace, key)]
+                return None
+            if ttl is not None:
+                self._data[(namespace, key)] = (value, ttl, now + ttl)
+            return value
+
+    def set(self, namespace: str, key: str, value: Any, ttl: Optional[float]) -> None:
+        now = self._clock()
+        with self._lock:
+            self._data[(namespace, key)] = (value, ttl, now + ttl if ttl is not None else None)
+            if now - self._last_purge >= PURGE_INTERVAL:
+                self._last_purge = now
+                expired = [k for k, (_, _, exp) in self._data.items() if exp is not None and exp <= now]
+                for k in expired:
+                    del self._data[k]
+
+    def delete(self, namespace: str, key: str) -> bool:
+        with self._lock:
+            return self._data.pop((namespace, key), None) is not None
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SQLiteStateBackend(SessionStateBackend):
+    """
+    Single-file backend for several workers on one host.
+
+    Values are JSON text; expiry uses wall-clock time so every process
+    agrees on it.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, path: Path, clock: Callable[[], float] = time.time):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._clock = clock
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=10.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+        self._lock = threading.Lock()
+        self._last_purge = 0.0
+
+    def get(self, namespace: str, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM session_state WHERE namespace = ? AND key = ?",
+                (namespace, key),
+            ).fetchone()
+        if row is None:
+            return None
+        value, expires_at = row
+        if expires_at is not None and expires_at <= self._clock():
+            self.delete(namespace, key)
+            return None
+        try:
+            return json.loads(value)
+        except ValueError:
+            logger.warning("Corrupt session state %s/%s; dropping it", namespace, key)
+            self.delete(namespace, key)
+            return None
+
+    def set(self, namespace: str, key: str, value: Dict[str, Any], ttl: Optional[float]) -> None:
+        now = self._clock()
+        text = json.dumps(value, ensure_ascii=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO session_state (namespace, key, value, expires_at) "
+                "VALUES (?, ?, ?, ?)",
+                (namespace, key, text, now + ttl if ttl is not None else None),
+            )
+            if now - self._last_purge >= PURGE_INTERVAL:
+                self._last_purge = now
+                self._conn.execute(
+                    "DELETE FROM session_state WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                    (now,),
+                )
+
+    def touch(self, namespace: str, key: str, value: Any, ttl: Optional[float]) -> None:
+        if ttl is None:
+            return
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE session_state SET expires_at = ? WHERE namespace = ? AND key = ?",
+                (self._clock() + ttl, namespace, key),
+            )
+
+    def delete(self, namespace: str, key: str) -> bool:
+        with self._lock, self._conn:
+            cur = self._conn.execute(
+                "DELETE FROM session_state WHERE namespace = ? AND key = ?",
+                (namespace, key),
+            )
+        return cur.rowcount > 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class KVStateBackend(SessionStateBackend):
+    """Backend on the shared KVStore; TTLs map to the store's key expiry."""
+
+    name = "kv"
+
+    def __init__(self, kv: Any):
+        self.kv = kv
+
+    @staticmethod
+    def _key(namespace: str, key: str) -> str:
+        return f"{KV_KEY_PREFIX}:{namespace}:{key}"
+
+    def get(self, namespace: str, key: str) -> Optional[Dict[str, Any]]:
+        return self.kv.get_json(self._key(namespace, key))
+
+    def set(self, namespace: str, key: str, value: Dict[str, Any], ttl: Optional[float]) -> None:
+        # KV TTLs are whole seconds; None would fall back to the store's job TTL
+        seconds = int(math.ceil(ttl if ttl is not None else DEFAULT_SESSION_STATE_TTL))
+        if not self.kv.set_json(self._key(namespace, key), value, ttl_seconds=max(1, seconds)):
+            logger.warning("KV write failed for session state %s/%s", namespace, key)
+
+    def delete(self, namespace: str, key: str) -> bool:
+        return bool(self.kv.delete(self._key(namespace, key)))
+
+
+# =============================================================================
+# ACTIVE BACKEND
+# =============================================================================
+
+_backend_lock = threading.Lock()
+_backend: Optional[SessionStateBackend] = None
+_default_ttl: float = DEFAULT_SESSION_STATE_TTL
+
+
+def _backend_from_spec(spec: str, data_dir: Optional[Path]) -> SessionStateBackend:
+    kind, _, arg = spec.partition(":")
+    kind = kind.strip().lower()
+    if kind in ("", "memory"):
+        return MemoryStateBackend()
+    if kind == "sqlite":
+        path = Path(arg) if arg else Path(data_dir or "data") / DEFAULT_SQLITE_FILENAME
+        return SQLiteStateBackend(path)
+    if kind == "kv":
+        from .kv_factory import get_kv_store
+        return KVStateBackend(get_kv_store())
+    raise ValueError(f"Unknown session store: {spec!r}. Supported: memory, sqlite[:path], kv")
+
+
+def get_session_state_backend() -> SessionStateBackend:
+    """The active backend (created from NOVA_SESSION_STORE on first use)."""
+    global _backend
+    backend = _backend
+    if backend is not None:
+        return backend
+    with _backend_lock:
+        if _backend is None:
+            spec = os.getenv("NOVA_SESSION_STORE", "memory")
+            try:
+                _backend = _backend_from_spec(spec, None)
+            except Exception as e:
+                logger.warning("Session store %r unavailable (%s); using memory", spec, e)
+                _backend = MemoryStateBackend()
+        return _backend
+
+
+def configure_session_state_store(
+    backend: Any = None,
+    data_dir: Optional[Path] = None,
+    default_ttl: Optional[float] = None,
+) -> SessionStateBackend:
+    """
+    Select the backend shared by every SessionStateStore.
+
+    Args:
+        backend: A SessionStateBackend, or a spec string ("memory",
+                 "sqlite", "sqlite:<path>", "kv"); None/"" = the
+                 NOVA_SESSION_STORE env var, else memory
+        data_dir: Where the default SQLite file goes
+        default_ttl: Idle TTL (seconds) for stores without their own
+
+    State held by the previous backend is not carried over, so call this
+    at startup, before any session exists.
+    """
+    global _backend, _default_ttl
+    if not isinstance(backend, SessionStateBackend):
+        backend = _backend_from_spec(backend or os.getenv("NOVA_SESSION_STORE", "memory"), data_dir)
+    with _backend_lock:
+        previous, _backend = _backend, backend
+        if default_ttl is not None:
+            _default_ttl = float(default_ttl) if default_ttl > 0 else None
+    if previous is not None and previous is not backend:
+        previous.close()
+    _scope.entries = {}
+    return backend
+
+
+# =============================================================================
+# IDENTITY MAP / SCOPES
+# =============================================================================
+
+class _Scope(threading.local):
+    def __init__(self):
+        self.depth = 0
+        # (namespace, key) -> [store, object or None, JSON snapshot or None]
+        self.entries: Dict[Tuple[str, str], list] = {}
+
+
+_scope = _Scope()
+
+
+def _snapshot(data: Dict[str, Any]) -> str:
+    return json.dumps(data, sort_keys=True, default=str)
+
+
+def flush_session_states() -> int:
+    """
+    Write back objects read through shared stores on this thread.
+
+    Changed objects are saved, unchanged ones get their TTL restarted.
+    Clears the identity map. Returns the number of objects written.
+    """
+    entries, _scope.entries = _scope.entries, {}
+    backend = get_session_state_backend()
+    if not backend.shared:
+        return 0
+    written = 0
+    for (namespace, key), (store, obj, snapshot) in entries.items():
+        if obj is None:
+            continue
+        try:
+            data = store.dump(obj)
+            current = _snapshot(data)
+            if current != snapshot:
+                backend.set(namespace, key, data, store.ttl)
+                written += 1
+            else:
+                backend.touch(namespace, key, data, store.ttl)
+        except Exception as e:
+            logger.warning("Session state write-back failed for %s/%s: %s", namespace, key, e)
+    return written
+
+
+@contextmanager
+def session_state_scope() -> Iterator[None]:
+    """
+    Unit of work for one request: reads inside it share objects, and
+    changes are flushed when the outermost scope exits.
+    """
+    if _scope.depth == 0:
+        _scope.entries = {}
+    _scope.depth += 1
+    try:
+        yield
+    finally:
+        _scope.depth -= 1
+        if _scope.depth == 0:
+            flush_session_states()
+
+
+# =============================================================================
+# STORE
+# =============================================================================
+
+class SessionStateStore(Generic[T]):
+    """
+    session_id -> object registry on the active backend.
+
+    Args:
+        namespace: Unique name for this registry (part of every key)
+        dump: object -> JSON-safe dict (usually obj.to_dict())
+        load: dict -> object (usually Class.from_dict)
+        ttl: Idle TTL in seconds; None = the configured default
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        dump: Callable[[T], Dict[str, Any]],
+        load: Callable[[Dict[str, Any]], T],
+        ttl: Optional[float] = None,
+    ):
+        self.namespace = namespace
+        self.dump = dump
+        self.load = load
+        self._ttl = ttl
+
+    @property
+    def ttl(self) -> Optional[float]:
+        return self._ttl if self._ttl is not None else _default_ttl
+
+    def get(self, session_id: str) -> Optional[T]:
+        """The session's object, or None."""
+        backend = get_session_state_backend()
+        if not backend.shared:
+            return backend.get(self.namespace, session_id)
+
+        ident = (self.namespace, session_id)
+        entry = _scope.entries.get(ident)
+        if entry is not None:
+            return entry[1]
+        obj, snapshot = None, None
+        data = backend.get(self.namespace, session_id)
+        if data is not None:
+            try:
+                obj = self.load(data)
+                snapshot = _snapshot(data)
+            except Exception as e:
+                logger.warning("Unreadable session state %s/%s: %s", self.namespace, session_id, e)
+                obj = None
+        # Misses are cached too: wizards probe several registries per turn.
+        # Outside a scope nothing is cached (it would never be flushed and
+        # would keep serving state other workers have since written).
+        if _scope.depth:
+            _scope.entries[ident] = [self, obj, snapshot]
+        return obj
+
+    def set(self, session_id: str, obj: T) -> None:
+        """Store obj for the session (written through immediately)."""
+        backend = get_session_state_backend()
+        if not backend.shared:
+            backend.set(self.namespace, session_id, obj, self.ttl)
+            return
+        data = self.dump(obj)
+        backend.set(self.namespace, session_id, data, self.ttl)
+        if _scope.depth:
+            _scope.entries[(self.namespace, session_id)] = [self, obj, _snapshot(data)]
+
+    def get_or_create(self, session_id: str, factory: Callable[[], T]) -> T:
+        """The session's object, creating and storing it if missing."""
+        obj = self.get(session_id)
+        if obj is None:
+            obj = factory()
+            self.set(session_id, obj)
+        return obj
+
+    def delete(self, session_id: str) -> None:
+        """Drop the session's object."""
+        backend = get_session_state_backend()
+        if backend.shared and _scope.depth:
+            _scope.entries[(self.namespace, session_id)] = [self, None, None]
+        backend.delete(self.namespace, session_id)
+
+    def __contains__(self, session_id: str) -> bool:
+        return self.get(session_id) is not None
+
+
+def dataclass_codec(cls: Any) -> Tuple[Callable[[Any], Dict[str, Any]], Callable[[Dict[str, Any]], Any]]:
+    """(dump, load) for a dataclass of JSON-safe fields; unknown keys are ignored on load."""
+    names = {f.name for f in fields(cls)}
+
+    def load(data: Dict[str, Any]) -> Any:
+        return cls(**{k: v for k, v in data.items() if k in names})
+
+    return asdict, load
+
+
+__all__ = [
+    "SessionStateBackend",
+    "MemoryStateBackend",
+    "SQLiteStateBackend",
+    "KVStateBackend",
+    "SessionStateStore",
+    "configure_session_state_store",
+    "get_session_state_backend",
+    "flush_session_states",
+    "session_state_scope",
+    "dataclass_codec",
+    "DEFAULT_SESSION_STATE_TTL",
+]
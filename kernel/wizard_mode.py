@@ -29,6 +29,8 @@ Wizard logic remains INSIDE handlers; UI does NOT change.
 from typing import Dict, Any, Optional, List, Callable
 from dataclasses import dataclass, field
 
+from kernel.utils.session_state_store import SessionStateStore, dataclass_codec
+
 
 # -----------------------------------------------------------------------------
 # Wizard State Management
@@ -76,12 +78,16 @@ class WizardManager:
     """
     
     def __init__(self):
-        self._sessions: Dict[str, WizardSession] = {}  # session_id -> WizardSession
+        # session_id -> WizardSession (shared across API workers)
+        self._sessions: SessionStateStore[WizardSession] = SessionStateStore(
+            "wizard_mode", *dataclass_codec(WizardSession),
+        )
     
     def start(self, session_id: str, command: str) -> WizardSession:
         """Start a new wizard session."""
-        self._sessions[session_id] = WizardSession(command=command, current_step=0)
-        return self._sessions[session_id]
+        session = WizardSession(command=command, current_step=0)
+        self._sessions.set(session_id, session)
+        return session
     
     def get(self, session_id: str) -> Optional[WizardSession]:
         """Get active wizard session."""
@@ -89,7 +95,7 @@ class WizardManager:
     
     def clear(self, session_id: str) -> None:
         """Clear active wizard session."""
-        self._sessions.pop(session_id, None)
+        self._sessions.delete(session_id)
     
     def advance(self, session_id: str, value: str) -> Optional[WizardSession]:
         """Record a value and advance to next step."""
@@ -59,15 +59,19 @@ _ensure_env_loaded()
 # Now safe to import modules that use API keys
 # -----------------------------------------------------------------------------
 
-from flask import Flask, request, jsonify, send_from_directory, Response
+from flask import Flask, request, jsonify, send_from_directory, Response, g
 
 from system.config import Config
 from kernel.nova_kernel import NovaKernel
 from backend.llm_client import LLMClient, LLMTimeoutError, LLMError, PersonaModeError, StrictModeError
+from backend.llm_telemetry import get_telemetry
 from persona.nova_persona import NovaPersona
 
 # v0.9.0: Import mode router
-from core.mode_router import handle_user_message, get_or_create_state
+from core.mode_router import handle_user_message, stream_user_message, get_or_create_state
+
+# v0.12: Session state (wizards, mode, menus) shared across workers
+from kernel.utils.session_state_store import session_state_scope
 
 # v0.12.0: Dashboard auto-show on launch
 from kernel.dashboard_handlers import get_auto_dashboard_on_launch
@@ -155,6 +159,29 @@ if _HAS_JOBS_API:
     register_jobs_routes(app)
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# v0.12: SESSION STATE WRITE-BACK
+# ─────────────────────────────────────────────────────────────────────────────
+# With a shared session store (NOVA_SESSION_STORE=sqlite|kv) wizard/mode
+# objects read during a request are written back when it ends, so the next
+# request can land on any worker. Streams flush from inside their generator.
+
+@app.before_request
+def _open_session_state_scope():
+    g.session_state_scope = session_state_scope()
+    g.session_state_scope.__enter__()
+
+
+@app.teardown_request
+def _close_session_state_scope(exc):
+    scope = g.pop("session_state_scope", None)
+    if scope is not None:
+        try:
+            scope.__exit__(None, None, None)
+        except Exception as e:
+            print(f"[NovaAPI] Session state flush failed: {e}", file=sys.stderr, flush=True)
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # v0.10.2: GLOBAL ERROR HANDLERS — Ensure JSON responses, never HTML
 # ─────────────────────────────────────────────────────────────────────────────
@@ -350,16 +377,19 @@ def nova_stream_endpoint():
     Server-Sent Events streaming endpoint for long-running operations.
     
     v0.10.3: Enhanced to support QuestCompose wizard streaming with progress events.
+    v0.12: Persona-mode chat streams the reply as it is generated.
     
     Body: { "text": "generate", "session_id": "...", "stream_mode": "quest_compose" }
     
     Returns: SSE stream with events:
         - event: progress      - Progress updates { message, percent }
+        - event: token         - Persona reply text { session_id, text } (append in order)
         - event: wizard_log    - QuestCompose log messages { session_id, message }
         - event: wizard_update - Partial content updates { session_id, content }
         - event: wizard_complete - Final result { session_id, result }
         - event: wizard_error  - Error occurred { session_id, error, message }
-        - event: complete      - Generic completion (non-wizard)
+        - event: complete      - Generic completion (non-wizard); persona turns
+                                 carry meta.ttft_ms / meta.total_ms
         - event: error         - Generic error
     
     Usage (JavaScript):
@@ -387,6 +417,11 @@ def nova_stream_endpoint():
 
     def generate():
         """Generator for SSE events."""
+        # Runs after the request scope has closed; state is flushed per stream
+        with session_state_scope():
+            yield from _generate()
+
+    def _generate():
         try:
             # Send initial progress
             yield _sse_event("progress", {"message": "Starting...", "percent": 0})
@@ -405,17 +440,18 @@ def nova_stream_endpoint():
                 # Use streaming quest compose
                 yield from _stream_quest_compose(text, session_id, state)
             else:
-                # For non-streaming commands, just do normal processing
+                # Persona turns stream tokens; everything else completes in one event
                 yield _sse_event("progress", {"message": "Processing...", "percent": 50})
                 
-                result = handle_user_message(
+                for event, payload in stream_user_message(
                     message=text,
                     state=state,
                     kernel=kernel,
                     persona=persona,
-                )
-                
-                yield _sse_event("complete", result)
+                ):
+                    if event == "token":
+                        payload = {"session_id": session_id, **payload}
+                    yield _sse_event(event, payload)
         
         # v0.10.2: Catch LLM timeout errors in streaming
         except LLMTimeoutError as e:
@@ -825,6 +861,41 @@ def health_endpoint():
     })
 
 
+@app.get("/nova/llm/telemetry")
+def llm_telemetry_endpoint():
+    """
+    v0.12: Per-call LLM telemetry for this worker.
+    
+    Query params (all optional):
+        limit: Number of recent calls to return (default 50)
+        channel, model, command: Filter the recent calls
+    
+    Returns: {
+        "ok": true,
+        "calls", "outcomes", "error_rate", "prompt_tokens", "completion_tokens", "total_tokens",
+        "by_model": {"<channel>/<model>": rollup},
+        "by_command": {"<command>": rollup},
+        "recent": [record, ...]
+    }
+    """
+    try:
+        limit = int(request.args.get("limit", 50))
+    except ValueError:
+        return jsonify({"ok": False, "error": "limit must be an integer"}), 400
+    
+    telemetry = get_telemetry()
+    return jsonify({
+        "ok": True,
+        **telemetry.stats(),
+        "recent": telemetry.recent(
+            limit,
+            channel=request.args.get("channel"),
+            model=request.args.get("model"),
+            command=request.args.get("command"),
+        ),
+    })
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # v2.0.0: REMINDER API ROUTES (for in-app notifications)
 # ─────────────────────────────────────────────────────────────────────────────
@@ -26,7 +26,7 @@
 
 from __future__ import annotations
 import json, re, warnings
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum
 from pathlib import Path
 from typing import Any, TYPE_CHECKING
@@ -1135,6 +1135,93 @@ INTENT_PATTERNS = {
     ],
 }
 
+# =============================================================================
+# PROMPT COMPILER — Precomputed Style Variants
+# =============================================================================
+# compute_style() only looks at the primary intent and whether structure was
+# requested, so the style space is small and discrete: one ResponseStyle and
+# one system prompt per (intent, wants_structure) signature. They are built
+# once per trait/preference basis instead of on every message.
+# =============================================================================
+
+PRIMARY_INTENTS = (
+    "distress", "action", "help", "emotional",
+    "tired", "technical", "connection", "general",
+)
+
+PROMPT_CACHE_MAX_ENTRIES = 256  # prompts for styles outside the precompiled set
+
+
+@dataclass(frozen=True, slots=True)
+class PromptVariant:
+    """The precompiled style and system prompt for one style signature."""
+    intent: str
+    wants_structure: bool
+    style: ResponseStyle
+    system_prompt: str
+
+
+class PersonaPromptCompiler:
+    """
+    Precomputes and caches PersonaEngine style variants and system prompts.
+    
+    Variants are keyed by (primary_intent, wants_structure) and rebuilt
+    together whenever the engine's style basis (baseline traits and
+    preferences) changes, so config overrides take effect on the next turn.
+    Prompts for other styles are rendered on first use and kept, keyed by
+    the style fields the prompt actually renders.
+    """
+    __slots__ = ("_engine", "_basis", "_variants", "_prompts", "_stats")
+    
+    def __init__(self, engine):
+        self._engine = engine
+        self._basis = None
+        self._variants = {}
+        self._prompts = {}
+        self._stats = {"hits": 0, "compiles": 0, "renders": 0}
+    
+    def variant(self, intent, wants_structure):
+        """Return the PromptVariant for a style signature."""
+        basis = self._engine.style_basis()
+        if basis != self._basis:
+            self.compile(basis)
+        self._stats["hits"] += 1
+        return self._variants[(intent, bool(wants_structure))]
+    
+    def compile(self, basis=None):
+        """Build every variant for the current (or given) style basis."""
+        engine = self._engine
+        basis = engine.style_basis() if basis is None else basis
+        self._prompts = {}
+        variants = {}
+        for intent in PRIMARY_INTENTS:
+            for wants_structure in (False, True):
+                style = engine._derive_style(basis, intent, wants_structure)
+                variants[(intent, wants_structure)] = PromptVariant(
+                    intent, wants_structure, style, self.prompt_for(style),
+                )
+        self._variants = variants
+        self._basis = basis
+        self._stats["compiles"] += 1
+    
+    def prompt_for(self, style):
+        """Return the system prompt for a style, rendering it on first use."""
+        key = (
+            self._engine.core.identity.name, style.warmth, style.analytical_depth,
+            style.structure_use, style.response_length, style.question_tendency,
+        )
+        prompt = self._prompts.get(key)
+        if prompt is None:
+            if len(self._prompts) >= PROMPT_CACHE_MAX_ENTRIES:
+                self._prompts.clear()
+            prompt = self._prompts[key] = self._engine._render_system_prompt(style)
+            self._stats["renders"] += 1
+        return prompt
+    
+    def stats(self):
+        return {"variants": len(self._variants), "prompts": len(self._prompts), **self._stats}
+
+
 # =============================================================================
 # SECTION 7: PERSONA ENGINE — The Heart of Nova's Consistency
 # =============================================================================
@@ -1188,10 +1275,13 @@ class PersonaEngine:
         self.preferences = preferences
         self.skills = skills
         # Pre-compile intent patterns for efficiency
+        # v0.12: one alternation per intent instead of one search per pattern
         self._compiled = {
-            intent: [re.compile(p, re.I) for p in patterns] 
+            intent: re.compile("|".join(f"(?:{p})" for p in patterns), re.I)
             for intent, patterns in INTENT_PATTERNS.items()
         }
+        self._last_analysis = None  # (text, analysis) — callers analyze the same message twice
+        self.prompts = PersonaPromptCompiler(self)
     
     def analyze_message(self, text):
         """
@@ -1207,9 +1297,13 @@ class PersonaEngine:
         
         Returns a dict with detected patterns and primary intent.
         """
+        last = self._last_analysis
+        if last is not None and last[0] == text:
+            return dict(last[1])
+        
         detected = {
-            f"has_{intent}": any(p.search(text) for p in patterns) 
-            for intent, patterns in self._compiled.items()
+            f"has_{intent}": pattern.search(text) is not None
+            for intent, pattern in self._compiled.items()
         }
         
         # Determine primary intent with priority ordering
@@ -1233,7 +1327,8 @@ class PersonaEngine:
         
         detected["primary_intent"] = intent
         detected["wants_structure"] = detected.get("has_structure_request", False)
-        return detected
+        self._last_analysis = (text, detected)
+        return dict(detected)
     
     def compute_style(self, user_message, context=None):
         """
@@ -1254,20 +1349,33 @@ class PersonaEngine:
         - Emotional intensity decreases (Nova grounds, not amplifies)
         
         The bounds ensure Nova always feels like Nova, regardless of input.
+        
+        v0.12: The style depends only on the primary intent, whether
+        structure was requested, and the baseline traits, so it is served
+        from the precompiled variants in self.prompts.
         """
         analysis = self.analyze_message(user_message)
-        intent = analysis["primary_intent"]
-        
-        # Start with baseline trait values
-        warmth = self.traits.get_score(TraitAxis.WARMTH, 0.8)
-        formality = self.traits.get_score(TraitAxis.FORMALITY, 0.45)
-        directness = self.traits.get_score(TraitAxis.DIRECTNESS, 0.65)
-        playfulness = self.traits.get_score(TraitAxis.PLAYFULNESS, 0.35)
-        emotional_intensity = self.traits.get_score(TraitAxis.EMOTIONAL_INTENSITY, 0.5)
-        analytical_depth = self.traits.get_score(TraitAxis.ANALYTICAL_DEPTH, 0.75)
-        detail_level = self.preferences.get_score("style.detail_level", 0.7)
-        structure_use = self.preferences.get_score("style.structure_use", 0.35)  # Low default — prose first
-        question_tendency = self.preferences.get_score("style.question_tendency", 0.25)  # Low default — no auto-questions
+        variant = self.prompts.variant(analysis["primary_intent"], analysis["wants_structure"])
+        return replace(variant.style)
+    
+    def style_basis(self):
+        """The baseline trait/preference values compute_style() starts from."""
+        return (
+            self.traits.get_score(TraitAxis.WARMTH, 0.8),
+            self.traits.get_score(TraitAxis.FORMALITY, 0.45),
+            self.traits.get_score(TraitAxis.DIRECTNESS, 0.65),
+            self.traits.get_score(TraitAxis.PLAYFULNESS, 0.35),
+            self.traits.get_score(TraitAxis.EMOTIONAL_INTENSITY, 0.5),
+            self.traits.get_score(TraitAxis.ANALYTICAL_DEPTH, 0.75),
+            self.preferences.get_score("style.detail_level", 0.7),
+            self.preferences.get_score("style.structure_use", 0.35),  # Low default — prose first
+            self.preferences.get_score("style.question_tendency", 0.25),  # Low default — no auto-questions
+        )
+    
+    def _derive_style(self, basis, intent, wants_structure):
+        """Apply the intent adjustments and character bounds to a style basis."""
+        (warmth, formality, directness, playfulness, emotional_intensity,
+         analytical_depth, detail_level, structure_use, question_tendency) = basis
         
         length = "medium"
         
@@ -1315,7 +1423,7 @@ class PersonaEngine:
             question_tendency = min(question_tendency + 0.1, 0.4)
         
         # Handle explicit structure requests
-        if analysis.get("wants_structure"):
+        if wants_structure:
             structure_use = min(structure_use + 0.25, 0.9)
         
         # Enforce absolute bounds — these protect Nova's character
@@ -1357,7 +1465,19 @@ class PersonaEngine:
         
         This is a production-grade persona spec designed to keep Nova
         consistent across thousands of interactions.
+        
+        v0.12: The prompt for a style is rendered once and reused from
+        self.prompts. The recent-context section is volatile, so it is
+        appended after the footer; everything before it is byte-identical
+        across turns with the same style.
         """
+        prompt = self.prompts.prompt_for(style)
+        if recent_summary: 
+            prompt = prompt + "\n" + f"\n[RECENT CONTEXT]\n{recent_summary}"
+        return prompt
+    
+    def _render_system_prompt(self, style):
+        """Render the full system prompt for a style (uncached)."""
         parts = [
             f"You are {self.core.identity.name}.",
             PROMPT_IDENTITY,
@@ -1382,10 +1502,6 @@ For this specific response, calibrate to these parameters:
 {"End with a statement, not a question — unless you genuinely need clarification." if style.question_tendency < 0.35 else "A follow-up question may be appropriate if it would genuinely help."}
 """)
         
-        # Add context if provided
-        if recent_summary: 
-            parts.append(f"\n[RECENT CONTEXT]\n{recent_summary}")
-        
         parts.append(PROMPT_FOOTER)
         return "\n".join(parts)
     
@@ -1875,6 +1991,56 @@ class ToneEnforcer:
         self._total = 0
 
 
+STREAM_REWRITE_WINDOW = 160  # chars; longer than any tone/policy pattern match
+
+_WHITESPACE = re.compile(r"\s")
+
+
+class StreamingRewriter:
+    """
+    Applies a whole-text rewrite (tone cleanup, policy post_llm) to a token
+    stream over a sliding window.
+    
+    Text is released only up to the last whitespace at least `window`
+    characters before the end of what has arrived, so a pattern shorter
+    than the window is always rewritten whole even when it arrives split
+    across chunks. The held tail is rewritten again as text arrives, so
+    the rewrite must be idempotent; finish() releases the rest.
+    """
+    __slots__ = ("_rewrite", "window", "_pending", "_raw")
+    
+    def __init__(self, rewrite, window=STREAM_REWRITE_WINDOW):
+        self._rewrite = rewrite
+        self.window = window
+        self._pending = ""
+        self._raw = []
+    
+    def feed(self, chunk):
+        """Add a chunk; return the rewritten text that is now safe to emit."""
+        self._raw.append(chunk)
+        self._pending = self._rewrite(self._pending + chunk)
+        limit = len(self._pending) - self.window
+        if limit <= 0:
+            return ""
+        cut = -1
+        for m in _WHITESPACE.finditer(self._pending, 0, limit + 1):
+            cut = m.start()
+        if cut < 0:
+            return ""
+        out, self._pending = self._pending[:cut + 1], self._pending[cut + 1:]
+        return out
+    
+    def finish(self):
+        """Release the held tail."""
+        out, self._pending = self._rewrite(self._pending), ""
+        return out
+    
+    @property
+    def raw_text(self):
+        """Everything fed so far, before rewriting."""
+        return "".join(self._raw)
+
+
 # =============================================================================
 # SECTION 10: LEGACY API & ADAPTERS
 # =============================================================================
@@ -1970,20 +2136,8 @@ class NovaPersona:
             print(f"[Persona] response_type=direct_answer (no LLM call)", flush=True)
             return cleaned
         
-        # Build system prompt
-        system = self.build_system_prompt(assistant_mode=assistant_mode, user_text=text)
-        if wm_context_string:
-            system = system + "\n\n" + wm_context_string
-        
-        # v0.11.0: Append LTM context (profile memories + relevant semantic memories)
-        if ltm_context_string:
-            system = system + "\n\n" + ltm_context_string
-        
-        # v0.9.0: Import PERSONA_MODEL and log model usage
-        try:
-            from backend.model_router import PERSONA_MODEL
-        except ImportError:
-            PERSONA_MODEL = "gpt-5.1"  # Fallback constant if import fails
+        system = self._build_turn_prompt(text, wm_context_string, ltm_context_string, assistant_mode)
+        PERSONA_MODEL = _persona_model()
         
         print(f"[Persona] calling LLM model={PERSONA_MODEL} session={session_id}", flush=True)
         
@@ -2013,6 +2167,63 @@ class NovaPersona:
         cleaned, _ = self._tone_enforcer.check(reply)
         return cleaned
     
+    def stream_response(self, text, session_id, wm_context_string=None, ltm_context_string=None, direct_answer=None, assistant_mode=None, post_process=None):
+        """
+        Streaming generate_response(): yields reply text as it is generated.
+        
+        v0.12: Uses the LLM client's streaming persona channel. Tone cleanup
+        and `post_process` (e.g. PolicyEngine.post_llm) run over a sliding
+        window (StreamingRewriter), so the joined chunks equal what
+        generate_response() + post_process would return for the same text.
+        Clients without stream_complete_persona get one chunk.
+        """
+        rewrite = (lambda t: post_process(enforce_tone(t)[0])) if post_process else (lambda t: enforce_tone(t)[0])
+        
+        if direct_answer:
+            self._tone_enforcer.check(direct_answer)
+            print(f"[Persona] response_type=direct_answer (no LLM call)", flush=True)
+            yield rewrite(direct_answer)
+            return
+        
+        system = self._build_turn_prompt(text, wm_context_string, ltm_context_string, assistant_mode)
+        PERSONA_MODEL = _persona_model()
+        
+        stream = getattr(self.llm_client, "stream_complete_persona", None)
+        if stream is None:
+            reply = self.generate_response(text, session_id, wm_context_string=wm_context_string, ltm_context_string=ltm_context_string, assistant_mode=assistant_mode)
+            yield post_process(reply) if post_process else reply
+            return
+        
+        print(f"[Persona] streaming LLM model={PERSONA_MODEL} session={session_id}", flush=True)
+        rewriter = StreamingRewriter(rewrite)
+        started = False
+        for chunk in stream(system=system, user=text, session_id=session_id, model_override=PERSONA_MODEL, command="persona_chat"):
+            if not started:
+                chunk = chunk.lstrip()
+                started = bool(chunk)
+            out = rewriter.feed(chunk)
+            if out:
+                yield out
+        tail = rewriter.finish().rstrip()
+        
+        raw = rewriter.raw_text.strip()
+        if not raw:
+            print(f"[Persona] WARNING: LLM returned empty string", flush=True)
+            yield f"(persona-empty) I heard: {text}"
+            return
+        self._tone_enforcer.check(raw)  # violation stats
+        if tail:
+            yield tail
+    
+    def _build_turn_prompt(self, text, wm_context_string=None, ltm_context_string=None, assistant_mode=None):
+        """System prompt plus WM and (v0.11.0) LTM context for one turn."""
+        system = self.build_system_prompt(assistant_mode=assistant_mode, user_text=text)
+        if wm_context_string:
+            system = system + "\n\n" + wm_context_string
+        if ltm_context_string:
+            system = system + "\n\n" + ltm_context_string
+        return system
+    
     def get_last_input_profile(self): return self._last_input_profile
     def get_current_style_profile(self): return self._last_style.to_dict() if self._last_style else self.get_style_profile(self._current_mode)
     def get_tone_stats(self): return self._tone_enforcer.get_stats()
@@ -2025,6 +2236,15 @@ class NovaPersona:
     def config(self): return _LegacyConfigAdapter(self.engine)
 
 
+def _persona_model():
+    """v0.9.0: PERSONA_MODEL from the model router (always gpt-5.1)."""
+    try:
+        from backend.model_router import PERSONA_MODEL
+    except ImportError:
+        PERSONA_MODEL = "gpt-5.1"  # Fallback constant if import fails
+    return PERSONA_MODEL
+
+
 class _LegacyConfigAdapter:
     __slots__ = ("_engine",)
     def __init__(self, engine): self._engine = engine
@@ -2111,6 +2331,7 @@ __all__ = [
     
     # Engine
     "ResponseStyle", "PersonaEngine", "INTENT_PATTERNS",
+    "PersonaPromptCompiler", "PromptVariant", "PRIMARY_INTENTS",
     
     # Factory functions
     "make_default_nova_core",
@@ -2125,6 +2346,7 @@ __all__ = [
     
     # Tone enforcement
     "ToneEnforcer", "enforce_tone", "check_tone_violations", "FORBIDDEN_PATTERNS",
+    "StreamingRewriter",
     
     # Legacy API
     "NovaPersona", "BASE_SYSTEM_PROMPT",
@@ -10,6 +10,14 @@ class Config:
     data_dir: Path
     env: str = "dev"
     debug: bool = True
+    memory_backend: str = "json"  # "json" (default) or "sqlite"
+    # v0.12: per-session WM/behavior/episodic state (kernel/memory/session_registry.py)
+    wm_max_sessions: int = 256
+    wm_session_idle_ttl: float = 3600.0  # seconds
+    wm_memory_budget_mb: float = 64.0    # per registry; 0 = unbounded
+    # v0.12: wizard/mode/menu session state (kernel/utils/session_state_store.py)
+    session_store: str = ""              # "memory", "sqlite[:path]" or "kv"; "" = $NOVA_SESSION_STORE or memory
+    session_state_ttl: float = 86400.0   # idle seconds before a wizard/menu state expires
 
     @classmethod
     def load(cls) -> "Config":
@@ -209,6 +209,14 @@ BUILTIN_COMMANDS: Dict[str, Dict[str, Any]] = {
         "description": "Alias for #self-test",
         "args": [],
     },
+    # v0.12: LLM telemetry
+    "llm-stats": {
+        "handler": "handle_llm_stats",
+        "category": "debug",
+        "section": "debug",
+        "description": "Show LLM call telemetry: tokens, latency, TTFT, queue time, retries, cache hits",
+        "args": ["limit", "channel", "model", "command"],
+    },
     # v0.7.9: Module-Aware Working Memory
     "wm-status": {
         "handler": "handle_wm_status",
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# tests/bench_memory_embeddings.py
+"""
+Embedding Index — Benchmark
+
+Compares the old per-candidate pure-Python cosine scan used by
+semantic_search_memories with EmbeddingIndex top-k search, at 10k and
+100k memories (random 384-d vectors, so no model download is needed).
+
+Run standalone: python tests/bench_memory_embeddings.py [sizes...]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+
+from kernel.memory.embedding_index import EmbeddingIndex, DEFAULT_DIM
+from kernel.memory.memory_helpers import _cosine_similarity
+
+TYPES = ("semantic", "procedural", "episodic")
+QUERIES = 20
+
+
+def _timed(fn, repeat: int) -> float:
+    """Average milliseconds per call."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def bench(n: int) -> None:
+    rng = np.random.default_rng(42)
+    vectors = rng.standard_normal((n, DEFAULT_DIM)).astype(np.float32)
+    queries = rng.standard_normal((QUERIES, DEFAULT_DIM)).astype(np.float32)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        index = EmbeddingIndex(Path(tmp))
+        start = time.perf_counter()
+        index.add_many((i, TYPES[i % 3], vectors[i]) for i in range(n))
+        build_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        index.save()
+        save_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        reloaded = EmbeddingIndex(Path(tmp))
+        load_ms = (time.perf_counter() - start) * 1000
+
+        allowed = set(range(0, n, 7))
+        q_iter = iter(range(10 ** 9))
+
+        def indexed():
+            reloaded.search(queries[next(q_iter) % QUERIES], k=10)
+
+        def indexed_masked():
+            reloaded.search(queries[next(q_iter) % QUERIES], k=10, mem_type="semantic", allowed_ids=allowed)
+
+        as_lists = vectors.tolist()
+        query_list = queries[0].tolist()
+
+        def python_scan():
+            scored = [(i, _cosine_similarity(query_list, v)) for i, v in enumerate(as_lists)]
+            scored.sort(key=lambda x: x[1], reverse=True)
+            return scored[:10]
+
+        indexed_ms = _timed(indexed, QUERIES)
+        masked_ms = _timed(indexed_masked, QUERIES)
+        scan_ms = _timed(python_scan, 1)
+
+    print(f"\n== {n:,} memories ==")
+    print(f"  build index          {build_ms:10.1f} ms")
+    print(f"  save (.npy)          {save_ms:10.1f} ms")
+    print(f"  load (memory-mapped) {load_ms:10.1f} ms")
+    print(f"  python cosine scan   {scan_ms:10.2f} ms/query")
+    print(f"  index top-10         {indexed_ms:10.2f} ms/query  ({scan_ms / indexed_ms:,.0f}x)")
+    print(f"  index top-10 masked  {masked_ms:10.2f} ms/query  (type + id filter)")
+
+
+if __name__ == "__main__":
+    sizes = [int(a) for a in sys.argv[1:]] or [10_000, 100_000]
+    for size in sizes:
+        bench(size)
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# tests/bench_memory_footprint.py
+"""
+Memory Store Footprint — Benchmark
+
+Builds a synthetic JSON-backend store (default 50k memories: 20% episodic
+with a wm_snapshot in trace, 30% with a 384-float trace embedding, the
+rest plain), then measures a cold load in a fresh process:
+
+- Python heap held by LongTermMemory + MemoryIndex (tracemalloc)
+- resident set size delta (psutil, or /proc/self/statm on Linux)
+- load time and on-disk size of the snapshot files
+
+Run standalone: python tests/bench_memory_footprint.py [count]
+"""
+
+import json
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+DEFAULT_COUNT = 50_000
+
+
+def _snapshot(i: int, rng: random.Random) -> dict:
+    return {
+        "id": f"snap-{i}",
+        "topic": f"topic {i % 300}",
+        "participants": [f"person{rng.randint(0, 500)}" for _ in range(3)],
+        "goals": [{"text": f"goal {j} for topic {i}", "status": "open"} for j in range(2)],
+        "unresolved_questions": [f"what about item {j}?" for j in range(2)],
+        "tone": "neutral",
+        "summary": "Discussed plans, blockers and next steps. " * 3,
+        "turn_summaries": [f"turn {j}: user asked about thing {j}, assistant answered." for j in range(8)],
+        "entities": [
+            {"name": f"entity{rng.randint(0, 2000)}", "type": "person", "mentions": rng.randint(1, 9)}
+            for _ in range(6)
+        ],
+        "pronoun_map": {"he": "entity1", "she": "entity2", "it": "project"},
+        "module": "work",
+        "tags": ["wm-snapshot", "module:work"],
+        "timestamp": "2026-01-01T00:00:00",
+        "session_id": "bench",
+    }
+
+
+def build_store(data_dir: Path, count: int) -> None:
+    from kernel.memory.memory_engine import LongTermMemory
+
+    rng = random.Random(7)
+    items = []
+    for i in range(1, count + 1):
+        roll = rng.random()
+        trace = {}
+        mem_type = "semantic"
+        tags = ["general"]
+        if roll < 0.2:
+            mem_type = "episodic"
+            tags = ["wm-snapshot", "module:work"]
+            trace = {"wm_snapshot": _snapshot(i, rng), "snapshot_version": "0.7.3"}
+        elif roll < 0.5:
+            trace = {"embedding": [round(rng.uniform(-1, 1), 6) for _ in range(384)]}
+        items.append({
+            "id": i,
+            "type": mem_type,
+            "tags": tags,
+            "payload": f"memory {i}: user mentioned something worth remembering about topic {i % 300}",
+            "timestamp": "2026-01-01T00:00:00+00:00",
+            "trace": trace,
+            "source": "user",
+            "salience": round(rng.random(), 3),
+            "status": "active",
+        })
+    LongTermMemory(data_dir).import_state({"next_id": count + 1, "items": items})
+
+
+MEASURE = r"""
+import gc, json, sys, time, tracemalloc
+from pathlib import Path
+sys.path.insert(0, {root!r})
+from kernel.memory.memory_engine import LongTermMemory, MemoryIndex
+
+
+def rss():
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+    try:
+        import os  # Linux: current RSS in pages
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+gc.collect()
+if {trace_heap!r}:
+    tracemalloc.start()
+rss_before = rss()
+started = time.perf_counter()
+ltm = LongTermMemory(Path({data_dir!r}))
+index = MemoryIndex()
+index.rebuild(ltm.get_all())
+load_ms = (time.perf_counter() - started) * 1000
+gc.collect()
+rss_after = rss()
+heap = tracemalloc.get_traced_memory()[0] if {trace_heap!r} else None
+print(json.dumps({{
+    "heap": heap,
+    "rss": rss_after - rss_before if rss_before is not None else None,
+    "load_ms": load_ms,
+}}))
+"""
+
+
+def measure(data_dir: Path, trace_heap: bool) -> dict:
+    root = str(Path(__file__).parent.parent)
+    code = MEASURE.format(root=root, data_dir=str(data_dir), trace_heap=trace_heap)
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main(count: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = Path(tmp)
+        start = time.perf_counter()
+        build_store(data_dir, count)
+        build_s = time.perf_counter() - start
+        disk = sum(p.stat().st_size for p in (data_dir / "memory").iterdir() if p.is_file())
+        # Separate processes: tracemalloc slows loading and inflates RSS
+        timing = measure(data_dir, trace_heap=False)
+        heap = measure(data_dir, trace_heap=True)["heap"]
+
+    mb = 1024 * 1024
+    print(f"\n== {count:,} memories ==")
+    print(f"  build store          {build_s:10.1f} s")
+    print(f"  on disk (memory/)    {disk / mb:10.1f} MB")
+    print(f"  cold load + index    {timing['load_ms']:10.0f} ms")
+    print(f"  python heap          {heap / mb:10.1f} MB")
+    if timing["rss"] is not None:
+        print(f"  resident set delta   {timing['rss'] / mb:10.1f} MB")
+    else:
+        print("  resident set delta          n/a  (pip install psutil)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COUNT)
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# tests/bench_persona_prompt.py
+"""
+Persona Prompt Building — Benchmark
+
+Per-turn cost of analyze -> style -> system prompt (what NovaPersona does
+before every persona LLM call): the pre-v0.12 path (one regex search per
+intent pattern, style arithmetic and a fresh prompt render every turn)
+versus the precompiled PersonaPromptCompiler variants.
+
+Run standalone: python tests/bench_persona_prompt.py [rounds]
+"""
+
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from persona import nova_persona as P
+
+MESSAGES = [
+    "hey, how are you?",
+    "I feel a bit off today, not sure why.",
+    "Can you help me refactor this class? The api keeps timing out.",
+    "Should I take the job offer or stay where I am?",
+    "I'm exhausted, long day.",
+    "Break down the steps to set up a budget.",
+    "I'm panicking, I can't cope with all of this, help me please",
+    "What do you think about the new plan?",
+    "tell me something interesting",
+    "ok",
+]
+
+DEFAULT_ROUNDS = 500
+
+LEGACY_PATTERNS = {
+    intent: [re.compile(p, re.I) for p in patterns]
+    for intent, patterns in P.INTENT_PATTERNS.items()
+}
+
+
+def legacy_turn(engine, text):
+    """The pre-v0.12 path: per-pattern analysis, style arithmetic, full render."""
+    detected = {i: any(p.search(text) for p in ps) for i, ps in LEGACY_PATTERNS.items()}
+    intent = next((name for name, hit in (
+        ("distress", detected["distress"]),
+        ("action", detected["goal"] or detected["decision"]),
+        ("help", detected["confusion"]),
+        ("emotional", detected["emotional"]),
+        ("tired", detected["tired"]),
+        ("technical", detected["technical"]),
+        ("connection", detected["casual"]),
+    ) if hit), "general")
+    style = engine._derive_style(engine.style_basis(), intent, detected["structure_request"])
+    return engine._render_system_prompt(style)
+
+
+def compiled_turn(engine, text):
+    return engine.build_system_prompt(engine.compute_style(text))
+
+
+def _latencies(fn, engine, rounds):
+    samples = []
+    for _ in range(rounds):
+        for message in MESSAGES:
+            start = time.perf_counter()
+            fn(engine, message)
+            samples.append((time.perf_counter() - start) * 1e6)
+    return samples
+
+
+def _report(label, samples):
+    samples = sorted(samples)
+    p95 = samples[int(len(samples) * 0.95) - 1]
+    print(f"  {label:<26} p50 {statistics.median(samples):7.1f} us   p95 {p95:7.1f} us")
+
+
+def main(rounds):
+    engine = P.make_default_nova_persona_engine()
+    prompt_kb = len(compiled_turn(engine, MESSAGES[0])) / 1024
+    print(f"\n== {len(MESSAGES)} messages x {rounds} rounds (system prompt ~{prompt_kb:.1f} KB) ==")
+    _report("per-turn render", _latencies(legacy_turn, engine, rounds))
+    _report("precompiled variants", _latencies(compiled_turn, engine, rounds))
+    print(f"  compiler stats: {engine.prompts.stats()}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROUNDS)
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# tests/bench_wm_extraction.py
+"""
+NovaWM Extraction — Benchmark
+
+Per-message latency of the old per-pattern extraction loops (one
+re.finditer/re.search per pattern, as nova_wm ran them before v0.12)
+versus the pre-compiled, keyword-pre-filtered MESSAGE_SCANNER and
+LOWERED_SCANNER, over a mix of chat-style messages. Also reports full
+NovaWorkingMemory.update() time.
+
+Run standalone: python tests/bench_wm_extraction.py [rounds]
+"""
+
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from kernel.memory import nova_wm as W
+
+MESSAGES = [
+    "I talked to Sarah yesterday about the Nova project and she seemed stressed.",
+    "Side note: my brother Steven wants to start a side business next month.",
+    "What were we talking about?",
+    "I need to figure out how to pay rent by Friday at 5pm.",
+    "Steven and Sarah both think the startup is doing great, but I'm not sure.",
+    "back to the house hacking plan",
+    "ok",
+    "thanks!",
+    "Can you remind me what Tom said about the budget in 2024?",
+    "I'm trying to decide whether to move in 3 weeks. This is frustrating.",
+    "honestly this guy at work keeps emailing me about project Falcon, so annoying",
+    "can you summarize the article I pasted earlier into three bullet points",
+    "how do I center a div",
+    "Planning to run a half marathon in 12 weeks, what should my long runs look like?",
+]
+
+DEFAULT_ROUNDS = 300
+
+
+def legacy_extract(text: str) -> int:
+    """The pre-v0.12 pattern loops (hit count only)."""
+    hits = 0
+    for pattern, _ in W.PERSON_PATTERNS + W.RELATIONAL_PERSON_PATTERNS + W.PROJECT_PATTERNS:
+        hits += sum(1 for _ in re.finditer(pattern, text, re.IGNORECASE))
+    for pattern in W.TIME_PATTERNS + W.TOPIC_PATTERNS:
+        hits += sum(1 for _ in re.finditer(pattern, text, re.IGNORECASE))
+    for pattern, _ in W.GOAL_PATTERNS:
+        hits += sum(1 for _ in re.finditer(pattern, text, re.IGNORECASE))
+
+    text_lower = text.lower()
+    for patterns in W.EMOTIONAL_PATTERNS.values():
+        if any(re.search(pattern, text_lower) for pattern in patterns):
+            hits += 1
+            break
+
+    message_lower = text_lower.strip()
+    for pattern, _ in W.TANGENT_START_PATTERNS + W.TOPIC_RETURN_PATTERNS:
+        if re.match(pattern, message_lower, re.IGNORECASE):
+            hits += 1
+            break
+    for pattern, _ in W.META_QUESTION_PATTERNS:
+        if re.search(pattern, message_lower, re.IGNORECASE):
+            hits += 1
+            break
+    return hits
+
+
+def scanner_extract(text: str) -> int:
+    """Both v0.12 scanners (hit count only; runs every rule that passes the pre-filter)."""
+    return W.MESSAGE_SCANNER.scan(text).hit_count + W.LOWERED_SCANNER.scan(text).hit_count
+
+
+def _latencies(fn, rounds: int) -> list:
+    samples = []
+    for _ in range(rounds):
+        for message in MESSAGES:
+            start = time.perf_counter()
+            fn(message)
+            samples.append((time.perf_counter() - start) * 1e6)
+    return samples
+
+
+def _report(label: str, samples: list) -> None:
+    samples = sorted(samples)
+    p95 = samples[int(len(samples) * 0.95) - 1]
+    print(f"  {label:<26} p50 {statistics.median(samples):7.1f} us   p95 {p95:7.1f} us")
+
+
+def main(rounds: int) -> None:
+    print(f"\n== {len(MESSAGES)} messages x {rounds} rounds ==")
+    _report("per-pattern loops", _latencies(legacy_extract, rounds))
+    _report("pre-filtered scanners", _latencies(scanner_extract, rounds))
+
+    wm = W.NovaWorkingMemory("bench")
+    _report("NovaWorkingMemory.update", _latencies(lambda m: wm.update(m), max(1, rounds // 10)))
+
+    for name, scanner in (("MESSAGE_SCANNER", W.MESSAGE_SCANNER), ("LOWERED_SCANNER", W.LOWERED_SCANNER)):
+        stats = scanner.stats()
+        considered = stats["rules_run"] + stats["rules_skipped"]
+        print(f"  {name:<26} {stats['rules_skipped'] / max(1, considered):6.1%} of rule runs skipped")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROUNDS)
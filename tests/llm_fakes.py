@@ -0,0 +1,63 @@
+# tests/llm_fakes.py
+"""
+Shared helpers for the LLM client test suites.
+
+make_client() builds an LLMClient / AsyncLLMClient through its constructor
+around a fake `chat.completions` object, with fresh collaborators so tests
+never share governor slots, breaker state or telemetry. FakeStream /
+AsyncFakeStream stand in for the SDK's Stream / AsyncStream and record
+whether they were closed.
+"""
+
+from types import SimpleNamespace
+
+from backend.llm_resilience import LLMResilience
+from backend.llm_telemetry import LLMTelemetry
+from backend.llm_transport import LLMConcurrencyGovernor, SingleFlight
+from backend.model_router import ModelRouter
+
+
+def make_client(cls, completions, **overrides):
+    """`cls` (LLMClient or AsyncLLMClient) whose requests go to `completions.create`."""
+    kwargs = dict(
+        router=ModelRouter(),
+        governor=LLMConcurrencyGovernor(),
+        single_flight=SingleFlight(),
+        resilience=LLMResilience(),
+        telemetry=LLMTelemetry(),
+    )
+    kwargs.update(overrides)
+    return cls(openai_client=SimpleNamespace(chat=SimpleNamespace(completions=completions)), **kwargs)
+
+
+class FakeStream:
+    """Iterates `chunks` like openai.Stream; close() marks it closed."""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self.closed = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self._chunks)
+
+    def close(self):
+        self.closed = True
+
+
+class AsyncFakeStream(FakeStream):
+    """Async-iterates `chunks` like openai.AsyncStream."""
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._chunks)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+    async def close(self):
+        self.closed = True
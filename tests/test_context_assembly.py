@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# tests/test_context_assembly.py
+"""
+Persona Context Assembly — Test Suite
+
+ContextAssembler runs providers concurrently, substitutes defaults for
+providers that miss their deadline or raise, honors `after` ordering
+without parking a worker, serializes providers sharing a `serial` key
+across turns, keeps concurrent turns independent and records
+per-provider latency.
+
+Run with: python -m pytest tests/test_context_assembly.py -v
+Or standalone: python tests/test_context_assembly.py
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import unittest
+
+from kernel.context_assembly import ContextAssembler, ContextProvider
+
+
+def sleeper(value, seconds):
+    def run():
+        time.sleep(seconds)
+        return value
+    return run
+
+
+class TestContextAssembler(unittest.TestCase):
+
+    def setUp(self):
+        self.assembler = ContextAssembler()
+
+    def test_providers_run_concurrently(self):
+        started = time.perf_counter()
+        result = self.assembler.run([
+            ContextProvider("a", sleeper("A", 0.1), deadline_ms=2000),
+            ContextProvider("b", sleeper("B", 0.1), deadline_ms=2000),
+            ContextProvider("c", sleeper("C", 0.1), deadline_ms=2000),
+        ])
+        elapsed = time.perf_counter() - started
+        self.assertEqual(result.values, {"a": "A", "b": "B", "c": "C"})
+        self.assertLess(elapsed, 0.25)
+        self.assertEqual(set(result.status.values()), {"ok"})
+
+    def test_late_provider_degrades_to_default(self):
+        gate = threading.Event()
+
+        def slow():
+            gate.wait(5)
+            return "late"
+
+        started = time.perf_counter()
+        result = self.assembler.run([
+            ContextProvider("fast", sleeper("fast", 0), deadline_ms=500),
+            ContextProvider("slow", slow, default="", deadline_ms=50),
+        ])
+        self.assertLess(time.perf_counter() - started, 1.0)
+        self.assertEqual(result.get("slow"), "")
+        self.assertEqual(result.status["slow"], "timeout")
+        self.assertEqual(result.get("fast"), "fast")
+
+        self.assertFalse(result.wait("slow", timeout=0.01))
+        gate.set()
+        self.assertTrue(result.wait("slow", timeout=5))
+        self.assertEqual(self.assembler.stats()["slow"]["timeouts"], 1)
+
+    def test_error_uses_default(self):
+        def boom():
+            raise RuntimeError("no memories")
+
+        result = self.assembler.run([ContextProvider("ltm", boom, default="", deadline_ms=500)])
+        self.assertEqual(result.get("ltm"), "")
+        self.assertEqual(result.status["ltm"], "error")
+        self.assertEqual(self.assembler.stats()["ltm"]["errors"], 1)
+
+    def test_after_orders_providers(self):
+        order = []
+
+        def first():
+            time.sleep(0.05)
+            order.append("extraction")
+
+        def second():
+            order.append("ltm")
+            return "ctx"
+
+        result = self.assembler.run([
+            ContextProvider("extraction", first, deadline_ms=1000),
+            ContextProvider("ltm", second, default="", deadline_ms=1000, after=("extraction",)),
+        ])
+        self.assertEqual(order, ["extraction", "ltm"])
+        self.assertEqual(result.get("ltm"), "ctx")
+        self.assertGreaterEqual(result.latency_ms["ltm"], result.latency_ms["extraction"])
+
+    def test_dependent_skipped_when_dependency_finishes_past_its_deadline(self):
+        gate = threading.Event()
+        ran = []
+
+        def slow():
+            gate.wait(5)
+
+        result = self.assembler.run([
+            ContextProvider("extraction", slow, deadline_ms=50),
+            ContextProvider("ltm", lambda: ran.append("ltm"), default="", deadline_ms=100, after=("extraction",)),
+        ])
+        self.assertEqual(result.status["ltm"], "timeout")
+        gate.set()
+        self.assertTrue(result.wait("ltm", timeout=5))
+        self.assertEqual(ran, [])
+
+    def test_concurrent_turns_do_not_queue(self):
+        results = []
+
+        def turn():
+            results.append(self.assembler.run([
+                ContextProvider("extraction", sleeper(None, 0.1), deadline_ms=500),
+                ContextProvider("wm", sleeper({}, 0.1), deadline_ms=500),
+                ContextProvider("ltm", sleeper("", 0.1), deadline_ms=500, after=("extraction",)),
+            ]))
+
+        threads = [threading.Thread(target=turn) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+        self.assertEqual(len(results), 8)
+        self.assertEqual({status for result in results for status in result.status.values()}, {"ok"})
+
+    def test_serial_key_orders_late_work_across_turns(self):
+        gate = threading.Event()
+        events = []
+
+        def late_update():
+            events.append("start 1")
+            gate.wait(5)
+            events.append("end 1")
+
+        def update():
+            events.append("start 2")
+            return "wm 2"
+
+        first = self.assembler.run([ContextProvider("wm", late_update, deadline_ms=50, serial="wm:s1")])
+        self.assertEqual(first.status["wm"], "timeout")
+        other = self.assembler.run([ContextProvider("wm", sleeper("other", 0), deadline_ms=500, serial="wm:s2")])
+        self.assertEqual(other.get("wm"), "other")  # other sessions are not held up
+
+        threading.Timer(0.05, gate.set).start()
+        second = self.assembler.run([ContextProvider("wm", update, deadline_ms=2000, serial="wm:s1")])
+        self.assertEqual(second.get("wm"), "wm 2")
+        self.assertEqual(events, ["start 1", "end 1", "start 2"])
+        deadline = time.monotonic() + 2
+        while self.assembler._serial and time.monotonic() < deadline:
+            time.sleep(0.005)  # done-callbacks run just after the result is set
+        self.assertEqual(self.assembler._serial, {})
+
+    def test_stats_percentiles(self):
+        for _ in range(5):
+            self.assembler.run([ContextProvider("wm", sleeper({}, 0), deadline_ms=500)])
+        stats = self.assembler.stats()["wm"]
+        self.assertEqual(stats["calls"], 5)
+        self.assertLessEqual(stats["p50_ms"], stats["p95_ms"])
+        self.assertLessEqual(stats["p95_ms"], stats["max_ms"])
+
+
+if __name__ == "__main__":
+    unittest.main()
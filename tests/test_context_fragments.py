@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# tests/test_context_fragments.py
+"""
+Incremental Context Strings — Test Suite
+
+NovaWorkingMemory.build_persona_context_string() and
+WMBehaviorEngine.build_context_string() reuse rendered sections until
+they are marked dirty. The incremental string must always equal a full
+re-render (everything marked dirty first).
+
+Run with: python -m pytest tests/test_context_fragments.py -v
+Or standalone: python tests/test_context_fragments.py
+"""
+
+import sys
+import random
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import unittest
+
+
+MESSAGES = [
+    "I talked to Sarah yesterday about the Nova project and she seemed stressed.",
+    "Side note: my brother Steven wants to start a side business next month.",
+    "back to the Nova project",
+    "I need to figure out how to pay rent by Friday. Should I ask him?",
+    "What did Sarah say?",
+    "He seemed interested.",
+    "Mark and Lisa both agreed",
+    "I'm so frustrated and confused, help me decide",
+    "can you help me plan my week?",
+    "yes",
+    "ok",
+    "my sister Anna is working on the Orion app",
+]
+
+RESPONSES = [
+    "Do you want to talk to Steven about it? Should we plan it?",
+    "Sure.",
+    "Would you like me to draft it?",
+]
+
+MODULES = [None, "work", "business"]
+
+
+def _full_wm(wm, module=None):
+    wm.mark_context_dirty()
+    return wm.build_persona_context_string(module)
+
+
+def _full_behavior(engine, module=None):
+    engine.mark_context_dirty()
+    return engine.build_context_string(module)
+
+
+class TestWorkingMemoryFragments(unittest.TestCase):
+    """build_persona_context_string() reuse and invalidation."""
+
+    def test_incremental_matches_full_render(self):
+        from kernel.memory.nova_wm import NovaWorkingMemory
+
+        rng = random.Random(13)
+        wm = NovaWorkingMemory("fragments")
+        for turn in range(60):
+            module = rng.choice(MODULES)
+            wm.update(rng.choice(MESSAGES), module=module)
+            if turn % 7 == 3:
+                wm.push_topic("Budget")
+            if turn % 11 == 5:
+                wm.pop_topic()
+            if turn % 13 == 8:
+                wm.register_group("Sarah and Steven", ["Sarah", "Steven"])
+            for target in (None, module, "work"):
+                incremental = wm.build_persona_context_string(target)
+                self.assertEqual(incremental, _full_wm(wm, target))
+            wm.record_nova_response(rng.choice(RESPONSES))
+            self.assertEqual(wm.build_persona_context_string(), _full_wm(wm))
+
+    def test_unchanged_state_is_all_hits(self):
+        from kernel.memory.nova_wm import NovaWorkingMemory, CONTEXT_SECTIONS
+
+        wm = NovaWorkingMemory("fragments")
+        wm.update(MESSAGES[0], module="work")
+        first = wm.build_persona_context_string()
+        before = wm.context_cache_stats()
+        self.assertEqual(wm.build_persona_context_string(), first)
+        after = wm.context_cache_stats()
+        self.assertEqual(after["hits"] - before["hits"], len(CONTEXT_SECTIONS))
+        self.assertEqual(after["misses"], before["misses"])
+
+    def test_response_only_rerenders_recent(self):
+        from kernel.memory.nova_wm import NovaWorkingMemory
+
+        wm = NovaWorkingMemory("fragments")
+        wm.update(MESSAGES[0])
+        wm.build_persona_context_string()
+        misses = wm.context_cache_stats()["misses"]
+        wm.record_nova_response("Do you want to talk to her?")
+        text = wm.build_persona_context_string()
+        self.assertIn("Nova: \"Do you want to talk to her?\"", text)
+        self.assertEqual(wm.context_cache_stats()["misses"], misses + 1)
+
+    def test_clear_drops_fragments(self):
+        from kernel.memory.nova_wm import NovaWorkingMemory
+
+        wm = NovaWorkingMemory("fragments")
+        wm.update(MESSAGES[0])
+        self.assertIn("Sarah", wm.build_persona_context_string())
+        wm.clear()
+        self.assertNotIn("Sarah", wm.build_persona_context_string())
+
+    def test_session_and_global_stats(self):
+        from kernel.memory.nova_wm import wm_update, wm_get_context_string, wm_context_cache_stats, wm_delete
+
+        try:
+            wm_update("fragments-api", MESSAGES[0])
+            wm_get_context_string("fragments-api")
+            wm_get_context_string("fragments-api")
+            stats = wm_context_cache_stats("fragments-api")
+            self.assertGreater(stats["hit_ratio"], 0.0)
+            self.assertGreaterEqual(wm_context_cache_stats()["hits"], stats["hits"])
+        finally:
+            wm_delete("fragments-api")
+
+
+class TestBehaviorFragments(unittest.TestCase):
+    """WMBehaviorEngine.build_context_string() reuse and invalidation."""
+
+    def test_incremental_matches_full_render(self):
+        from kernel.memory.nova_wm import NovaWorkingMemory
+        from kernel.memory.nova_wm_behavior import WMBehaviorEngine
+
+        rng = random.Random(31)
+        wm = NovaWorkingMemory("fragments")
+        engine = WMBehaviorEngine("fragments")
+        for turn in range(60):
+            module = rng.choice(MODULES)
+            message = rng.choice(MESSAGES)
+            wm.update(message, module=module)
+            engine.update(message, wm.get_context_bundle(), module=module)
+            if turn % 9 == 4:
+                engine.resolve_goal()
+            for target in (None, module):
+                incremental = engine.build_context_string(target)
+                self.assertEqual(incremental, _full_behavior(engine, target))
+            engine.after_response(rng.choice(RESPONSES))
+            self.assertEqual(engine.build_context_string(), _full_behavior(engine))
+
+    def test_header_only_is_empty(self):
+        from kernel.memory.nova_wm_behavior import WMBehaviorEngine
+
+        engine = WMBehaviorEngine("fragments")
+        self.assertEqual(engine.build_context_string(), "")
+        engine.after_response("Do you want to talk to Steven about it?")
+        self.assertIn("AWAITING USER RESPONSE TO:", engine.build_context_string())
+        engine.clear()
+        self.assertEqual(engine.build_context_string(), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# tests/test_decay_scheduler.py
+"""
+Decay Scheduler — Test Suite
+
+DecayScheduler keeps a heap of (next decay deadline, id): pop_due()
+returns ids in deadline order and only once their deadline has passed,
+rescheduling or discarding an id invalidates its older heap entries, and
+apply() measures decay from the memory's decay clock so a repeated run
+never applies the same elapsed time twice. MemoryEngine.run_decay() only
+touches (and writes) the memories that are due.
+
+Run with: python -m pytest tests/test_decay_scheduler.py -v
+Or standalone: python tests/test_decay_scheduler.py
+"""
+
+import math
+import sys
+import tempfile
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import unittest
+
+from kernel.memory.memory_engine import MemoryEngine, MemoryItem
+from kernel.memory.memory_lifecycle import DecayScheduler
+
+DAY = 86400
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+T0 = START.timestamp()
+
+
+def item(item_id, mem_type="semantic", salience=0.5, status="active", tags=("general",), **fields):
+    return MemoryItem(id=item_id, type=mem_type, tags=list(tags), payload=f"memory {item_id}",
+                      timestamp=START.isoformat(), salience=salience, status=status, **fields)
+
+
+class TestDeadlines(unittest.TestCase):
+
+    def setUp(self):
+        self.scheduler = DecayScheduler()
+
+    def test_deadline_is_one_salience_step_away(self):
+        semantic = self.scheduler.next_due(item(1), T0)
+        self.assertAlmostEqual((semantic - T0) / DAY, 90 * math.log2(0.5 / 0.49), places=6)
+        episodic = self.scheduler.next_due(item(2, mem_type="episodic"), T0)
+        procedural = self.scheduler.next_due(item(3, mem_type="procedural"), T0)
+        self.assertLess(episodic, semantic)
+        self.assertLess(semantic, procedural)
+
+    def test_state_transitions_and_floors(self):
+        self.assertEqual(self.scheduler.next_due(item(1, salience=0.2), T0), T0)  # marks stale now
+        self.assertEqual(self.scheduler.next_due(item(2, salience=0.1, status="stale"), T0), T0)  # archives now
+        self.assertIsNone(self.scheduler.next_due(item(3, salience=0.3, status="stale"), T0))
+        self.assertIsNone(self.scheduler.next_due(item(4, status="archived"), T0))
+        profile = item(5, salience=0.505, tags=["profile:name"])
+        self.assertIsNone(self.scheduler.next_due(profile, T0))  # next step would pass its floor
+
+    def test_apply_never_counts_elapsed_time_twice(self):
+        memory = item(1)
+        later = T0 + 90 * DAY
+        self.assertEqual(self.scheduler.apply(memory, later), ["decayed"])
+        self.assertAlmostEqual(memory.salience, 0.25, places=4)
+        self.assertEqual(self.scheduler.apply(memory, later), [])
+        self.assertEqual(self.scheduler._clock(memory, later), later)
+        self.assertGreater(self.scheduler.next_due(memory, later), later)
+
+    def test_apply_marks_stale_then_archives(self):
+        memory = item(1, mem_type="episodic", salience=0.3)
+        self.assertEqual(self.scheduler.apply(memory, T0 + 30 * DAY), ["decayed", "marked_stale"])
+        self.assertEqual(memory.status, "stale")
+        self.assertEqual(self.scheduler.apply(memory, T0 + 30 * DAY), ["archived"])
+        self.assertEqual(memory.status, "archived")
+
+
+class TestQueueOrdering(unittest.TestCase):
+
+    def setUp(self):
+        self.scheduler = DecayScheduler()
+        self.items = [
+            item(1, mem_type="procedural"),
+            item(2, mem_type="episodic"),
+            item(3),
+            item(4, salience=0.9, mem_type="episodic"),
+            item(5, status="archived"),
+        ]
+        self.scheduler.rebuild(self.items, T0)
+        self.deadlines = {i.id: self.scheduler.next_due(i, T0) for i in self.items if i.id != 5}
+
+    def test_pop_due_returns_deadline_order(self):
+        self.assertEqual(self.scheduler.pop_due(T0), [])
+        self.assertEqual(self.scheduler.stats()["queue_depth"], 4)
+
+        expected = sorted(self.deadlines, key=self.deadlines.get)
+        self.assertEqual(self.scheduler.pop_due(T0 + 365 * DAY), expected)
+        self.assertEqual(self.scheduler.pop_due(T0 + 365 * DAY), [])
+        self.assertIsNone(self.scheduler.stats()["next_due_at"])
+
+    def test_pop_due_stops_at_now(self):
+        first, second = sorted(self.deadlines.values())[:2]
+        self.assertEqual(self.scheduler.pop_due((first + second) / 2), [min(self.deadlines, key=self.deadlines.get)])
+        self.assertEqual(self.scheduler.stats()["queue_depth"], 3)
+
+    def test_reschedule_supersedes_the_old_entry(self):
+        touched = self.items[1]
+        touched.last_used_at = datetime.fromtimestamp(T0 + 10 * DAY, timezone.utc).isoformat()
+        self.scheduler.schedule([touched], T0 + 10 * DAY)
+
+        self.assertNotIn(2, self.scheduler.pop_due(self.deadlines[2]))  # old entry skipped
+        self.assertIn(2, self.scheduler._due_at)
+        self.assertIn(2, self.scheduler.pop_due(T0 + 11 * DAY))
+
+    def test_discard_and_compaction(self):
+        self.scheduler.discard([2, 3])
+        self.assertEqual(self.scheduler.pop_due(T0 + 365 * DAY), [4, 1])
+
+        for _ in range(100):
+            self.scheduler.schedule(self.items[:1], T0)
+        self.assertLessEqual(len(self.scheduler._heap), 2 * len(self.scheduler._due_at) + 64)
+        self.assertEqual(self.scheduler.pop_due(T0 + 365 * DAY), [1])
+
+
+class TestEngineRunDecay(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.engine = MemoryEngine(Path(self.tmp.name))
+        self.episodic = self.engine.store("Went to the conference", mem_type="episodic", salience=0.5)
+        self.semantic = self.engine.store("Docker uses layers", mem_type="semantic", salience=0.5)
+        self.procedural = self.engine.store("Deploy with helm", mem_type="procedural", salience=0.5)
+
+    def tearDown(self):
+        self.engine.flush()
+        self.tmp.cleanup()
+
+    def test_only_due_memories_are_decayed_and_written(self):
+        results = self.engine.run_decay(datetime.now(timezone.utc) + timedelta(days=2))
+        self.assertEqual((results["due"], results["decayed_salience"], results["written"]), (1, 1, 1))
+        self.assertLess(self.engine.index.get(self.episodic.id).salience, 0.5)
+        self.assertEqual(self.engine.index.get(self.semantic.id).salience, 0.5)
+        self.assertEqual(self.engine.get_decay_stats()["queue_depth"], 3)  # re-queued
+
+        results = self.engine.run_decay(datetime.now(timezone.utc) + timedelta(days=2))
+        self.assertEqual(results["due"], 0)
+
+    def test_deleted_memory_leaves_the_queue(self):
+        self.engine.get_decay_scheduler()
+        self.engine.delete_many([self.episodic.id])
+        results = self.engine.run_decay(datetime.now(timezone.utc) + timedelta(days=2))
+        self.assertEqual(results["due"], 0)
+        self.assertEqual(self.engine.get_decay_stats()["queue_depth"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
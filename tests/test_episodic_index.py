@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# tests/test_episodic_index.py
+"""
+Episodic Snapshot Index — Test Suite
+
+find_relevant_episodics() picks candidates from the topic/participant/
+module index, ranks them by score then recency, and deserializes only the
+snapshots it returns. Topics are matched through a word index. The index
+persists next to the store, is reconciled with it on first use, and is
+shared by worker processes: saves merge into the file instead of
+overwriting it.
+
+Run with: python -m pytest tests/test_episodic_index.py -v
+Or standalone: python tests/test_episodic_index.py
+"""
+
+import sys
+import tempfile
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest import mock
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import unittest
+
+from system.config import Config
+from kernel.memory import nova_wm_episodic as ep
+from kernel.memory.memory_manager import MemoryManager
+
+
+def store_snapshot(manager, topic, module=None, participants=(), age_days=0):
+    snapshot = ep.EpisodicSnapshot(
+        topic=topic,
+        module=module,
+        participants=list(participants),
+        timestamp=(datetime.now() - timedelta(days=age_days)).isoformat(),
+    )
+    item = manager.store(
+        mem_type="episodic",
+        payload=snapshot.to_payload_string(),
+        tags=["wm-snapshot"],
+        trace={"wm_snapshot": snapshot.to_dict()},
+    )
+    return item.id, snapshot
+
+
+class TestEpisodicIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.config = Config(data_dir=Path(self.tmp.name))
+        self.manager = MemoryManager(self.config)
+
+    def tearDown(self):
+        self.manager.flush()
+        self.tmp.cleanup()
+
+    def test_reconcile_indexes_existing_snapshots(self):
+        old_id, _ = store_snapshot(self.manager, "Quarterly plan", module="business")
+        cyber_id, _ = store_snapshot(self.manager, "Port scan", module="cyber")
+
+        results = ep.find_relevant_episodics(self.manager, module="business")
+        self.assertEqual([r.memory_id for r in results], [old_id])
+        self.assertEqual(results[0].snapshot.topic, "Quarterly plan")
+        self.assertEqual(len(ep.get_snapshot_index(self.manager)), 2)
+        self.assertTrue((Path(self.tmp.name) / ep.SNAPSHOT_INDEX_FILE).exists())
+
+    def test_only_top_k_deserialized(self):
+        index = ep.get_snapshot_index(self.manager)
+        for i in range(10):
+            memory_id, snapshot = store_snapshot(self.manager, f"project alpha {i}", module="work")
+            index.add(memory_id, snapshot.to_dict())
+
+        with mock.patch.object(ep.EpisodicSnapshot, "from_dict", wraps=ep.EpisodicSnapshot.from_dict) as loads:
+            results = ep.find_relevant_episodics(self.manager, topic="project alpha", module="work", max_results=2)
+        self.assertEqual(len(results), 2)
+        self.assertEqual(loads.call_count, 2)
+        # Equal scores: newest first
+        self.assertEqual(results[0].snapshot.topic, "project alpha 9")
+
+    def test_ranking_and_age_cutoff(self):
+        index = ep.get_snapshot_index(self.manager)
+        for topic, participants, age in (
+            ("Trip planning", ("Sarah",), 0),
+            ("trip", ("Sarah (feminine)",), 0),
+            ("Trip", (), ep.MAX_EPISODIC_AGE_DAYS + 1),
+        ):
+            memory_id, snapshot = store_snapshot(self.manager, topic, participants=participants, age_days=age)
+            index.add(memory_id, snapshot.to_dict())
+
+        results = ep.find_relevant_episodics(self.manager, topic="Trip", participants=["Sarah"])
+        self.assertEqual([r.snapshot.topic for r in results], ["trip", "Trip planning"])
+        self.assertIn("exact topic match", results[0].match_reasons)
+        self.assertAlmostEqual(results[0].score, 0.55)
+
+    def test_persisted_index_and_deleted_snapshots(self):
+        keep_id, keep = store_snapshot(self.manager, "Launch", module="business")
+        gone_id, gone = store_snapshot(self.manager, "Launch review", module="business")
+        ep.get_snapshot_index(self.manager)
+
+        reloaded = ep.EpisodicSnapshotIndex(Path(self.tmp.name) / ep.SNAPSHOT_INDEX_FILE)
+        reloaded.load()
+        self.assertEqual(reloaded.ids(), {keep_id, gone_id})
+
+        self.manager.delete_many([gone_id])
+        results = ep.find_relevant_episodics(self.manager, module="business")
+        self.assertEqual([r.memory_id for r in results], [keep_id])
+        self.assertNotIn(gone_id, ep.get_snapshot_index(self.manager))
+
+    def test_partial_topic_match_uses_whole_words(self):
+        index = ep.get_snapshot_index(self.manager)
+        for topic in ("Trip planning", "Party ideas", "Q3 trip"):
+            memory_id, snapshot = store_snapshot(self.manager, topic)
+            index.add(memory_id, snapshot.to_dict())
+
+        ranked = index.rank(topic="trip", min_score=0.2)
+        self.assertEqual(sorted(entry.topic for entry, _, _ in ranked), ["q3 trip", "trip planning"])
+        self.assertEqual(index.rank(topic="art", min_score=0.2), [])  # no longer a substring hit on "party"
+        ranked = index.rank(topic="Trip planning for Q3", min_score=0.2)
+        self.assertEqual([entry.topic for entry, _, _ in ranked], ["trip planning"])
+
+
+class TestSharedIndexFile(unittest.TestCase):
+    """Two EpisodicSnapshotIndex objects on one file stand in for two workers."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / ep.SNAPSHOT_INDEX_FILE
+        self.a = ep.EpisodicSnapshotIndex(self.path)
+        self.b = ep.EpisodicSnapshotIndex(self.path)
+        self.a.load()
+        self.b.load()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def snapshot(self, topic, module="work"):
+        return {"topic": topic, "module": module, "timestamp": datetime.now().isoformat()}
+
+    def on_disk(self):
+        reloaded = ep.EpisodicSnapshotIndex(self.path)
+        reloaded.load()
+        return reloaded.ids()
+
+    def test_saves_merge_instead_of_overwriting(self):
+        self.a.add(1, self.snapshot("alpha"))
+        self.b.add(2, self.snapshot("beta"))
+        self.assertEqual(self.on_disk(), {1, 2})
+        self.assertEqual(self.b.ids(), {1, 2})
+
+        self.b.discard([1])
+        self.a.add(3, self.snapshot("gamma"))  # A still holds 1 in memory
+        self.assertEqual(self.on_disk(), {2, 3})
+        self.assertEqual(self.a.ids(), {2, 3})
+
+    def test_concurrent_saves_lose_nothing(self):
+        def worker(index, first):
+            for memory_id in range(first, first + 20):
+                index.add(memory_id, self.snapshot(f"topic {memory_id}"))
+
+        threads = [threading.Thread(target=worker, args=(self.a, 0)), threading.Thread(target=worker, args=(self.b, 100))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+        self.assertEqual(self.on_disk(), set(range(20)) | set(range(100, 120)))
+
+    def test_rank_sees_other_workers_snapshots(self):
+        self.assertEqual(self.b.rank(module="work"), [])
+        self.a.add(1, self.snapshot("alpha"))
+        self.assertEqual([entry.memory_id for entry, _, _ in self.b.rank(module="work")], [1])
+
+        self.a.discard([1])
+        self.assertEqual(self.b.rank(module="work"), [])
+
+    def test_unsaved_changes_survive_a_reload(self):
+        self.a.add(1, self.snapshot("alpha"), save=False)
+        self.b.add(2, self.snapshot("beta"))
+        self.a.refresh()
+        self.assertEqual(self.a.ids(), {1, 2})
+        self.a.save()
+        self.assertEqual(self.on_disk(), {1, 2})
+
+
+if __name__ == "__main__":
+    unittest.main()
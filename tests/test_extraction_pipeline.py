@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# tests/test_extraction_pipeline.py
+"""
+Background Fact Extraction — Test Suite
+
+Per-session ordering, dedupe, priority backpressure and settle() on
+FactExtractionPipeline, plus run_auto_extraction() handing its LLM
+fallback to the pipeline instead of calling it inline.
+
+Run with: python -m pytest tests/test_extraction_pipeline.py -v
+Or standalone: python tests/test_extraction_pipeline.py
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import unittest
+
+from kernel.memory import extraction_pipeline as ep
+
+
+class RecordingExtractor:
+    """Stand-in for llm_extract_facts: records calls, optionally blocks."""
+
+    def __init__(self, gate=None):
+        self.calls = []
+        self.gate = gate
+        self.lock = threading.Lock()
+
+    def __call__(self, user_text, memory_manager, module_tag):
+        if self.gate is not None:
+            self.gate.wait(5)
+        with self.lock:
+            self.calls.append(user_text)
+        return [{"fact": user_text}]
+
+
+class TestPipeline(unittest.TestCase):
+
+    def test_per_session_order(self):
+        extractor = RecordingExtractor()
+        pipeline = ep.FactExtractionPipeline(extract=extractor, workers=4)
+        for i in range(20):
+            self.assertTrue(pipeline.submit("s1", f"message {i}", None))
+        self.assertTrue(pipeline.join(5))
+        self.assertEqual(extractor.calls, [f"message {i}" for i in range(20)])
+        stats = pipeline.stats()
+        self.assertEqual(stats["processed"], 20)
+        self.assertEqual(stats["facts_stored"], 20)
+        self.assertEqual(stats["queue_depth"], 0)
+        self.assertIn("lag_ms_p95", stats)
+
+    def test_dedupe_recent_messages(self):
+        extractor = RecordingExtractor()
+        pipeline = ep.FactExtractionPipeline(extract=extractor)
+        self.assertTrue(pipeline.submit("s1", "I work at Acme", None))
+        self.assertFalse(pipeline.submit("s1", "i  work at acme", None))
+        self.assertTrue(pipeline.submit("s2", "I work at Acme", None))
+        pipeline.join(5)
+        self.assertEqual(pipeline.stats()["deduped"], 1)
+        self.assertEqual(len(extractor.calls), 2)
+
+    def test_backpressure_drops_low_priority_first(self):
+        gate = threading.Event()
+        extractor = RecordingExtractor(gate)
+        pipeline = ep.FactExtractionPipeline(extract=extractor, max_pending=2, workers=1)
+        pipeline.submit("busy", "occupies the worker", None)
+        # Wait for the worker to pick it up so the queue is empty
+        for _ in range(100):
+            if pipeline.stats()["running"]:
+                break
+            threading.Event().wait(0.01)
+
+        self.assertTrue(pipeline.submit("a", "low value", None, priority=ep.PRIORITY_LOW))
+        self.assertTrue(pipeline.submit("b", "high value 1", None, priority=ep.PRIORITY_HIGH))
+        # Full: a high-priority job evicts the low one, a low one is refused
+        self.assertTrue(pipeline.submit("c", "high value 2", None, priority=ep.PRIORITY_HIGH))
+        self.assertFalse(pipeline.submit("d", "low value 2", None, priority=ep.PRIORITY_LOW))
+        self.assertEqual(pipeline.stats()["queue_depth"], 2)
+
+        gate.set()
+        pipeline.join(5)
+        self.assertNotIn("low value", extractor.calls)
+        self.assertIn("high value 2", extractor.calls)
+        self.assertEqual(pipeline.stats()["dropped"], 2)
+
+    def test_settle_waits_for_session(self):
+        gate = threading.Event()
+        pipeline = ep.FactExtractionPipeline(extract=RecordingExtractor(gate))
+        pipeline.submit("s1", "slow message", None)
+        self.assertFalse(pipeline.settle("s1", timeout=0.05))
+        self.assertTrue(pipeline.settle("other", timeout=0.05))
+        gate.set()
+        self.assertTrue(pipeline.settle("s1", timeout=5))
+
+    def test_failures_are_counted(self):
+        def boom(*args):
+            raise RuntimeError("llm down")
+
+        pipeline = ep.FactExtractionPipeline(extract=boom)
+        pipeline.submit("s1", "anything", None)
+        pipeline.join(5)
+        self.assertEqual(pipeline.stats()["failed"], 1)
+
+
+class TestRunAutoExtraction(unittest.TestCase):
+
+    def setUp(self):
+        self.extractor = RecordingExtractor()
+        ep._pipeline_instance = ep.FactExtractionPipeline(extract=self.extractor)
+
+    def tearDown(self):
+        ep.reset_extraction_pipeline()
+
+    def test_llm_fallback_is_queued(self):
+        from kernel.memory.memory_helpers import run_auto_extraction
+
+        class NoopMemory:
+            def store(self, **kwargs):
+                raise AssertionError("regex extraction should not match")
+
+        text = "honestly i enjoy long walks when the weather is nice outside"
+        result = run_auto_extraction(text, NoopMemory(), session_id="s1")
+        self.assertTrue(result["llm_queued"])
+        self.assertEqual(result["llm_extracted"], [])
+        self.assertTrue(ep.get_extraction_pipeline().settle("s1", timeout=5))
+        self.assertEqual(self.extractor.calls, [text])
+
+
+if __name__ == "__main__":
+    unittest.main()
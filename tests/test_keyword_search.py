@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# tests/test_keyword_search.py
+"""
+Keyword Search — Test Suite
+
+MemoryIndex keeps an inverted index of payload terms and ranks keyword
+hits by BM25 + salience, visiting only the query terms' postings. Compared
+with the pre-v0.12 scorer (substring match count + salience over the top
+100 recalled items) it returns the same matches on whole-word queries,
+also finds memories outside that top 100, and ranks rare terms above
+common ones. The postings follow adds, updates, deletes and rebuilds.
+
+Run with: python -m pytest tests/test_keyword_search.py -v
+Or standalone: python tests/test_keyword_search.py
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import unittest
+
+from system.config import Config
+from kernel.memory.memory_engine import MemoryIndex, MemoryItem, tokenize_text
+from kernel.memory.memory_helpers import search_by_keywords
+from kernel.memory.memory_manager import MemoryManager
+
+
+def item(item_id, payload, salience=0.5, mem_type="semantic", **fields):
+    return MemoryItem(id=item_id, type=mem_type, tags=["general"], payload=payload,
+                      timestamp="2026-01-01T00:00:00+00:00", salience=salience, **fields)
+
+
+def old_search(index, query, limit=20):
+    """The pre-v0.12 scorer: substring matches + salience over the top 100 recalled items."""
+    keywords = tokenize_text(query)
+    scored = []
+    for candidate in index.query(status="active", limit=100):
+        matches = sum(1 for keyword in keywords if keyword in candidate.payload.lower())
+        if matches:
+            scored.append((candidate, matches + (candidate.salience or 0.5)))
+    scored.sort(key=lambda hit: hit[1], reverse=True)
+    return scored[:limit]
+
+
+class TestBM25AgainstOldScorer(unittest.TestCase):
+
+    def setUp(self):
+        self.index = MemoryIndex()
+        self.index.rebuild([
+            item(1, "Docker images are built from layers", salience=0.6),
+            item(2, "Docker compose starts several docker containers", salience=0.5),
+            item(3, "Kubernetes schedules containers onto nodes", salience=0.7),
+            item(4, "Bake sourdough bread at a high temperature", salience=0.4),
+            item(5, "Helm packages kubernetes manifests as charts", salience=0.5),
+        ])
+
+    def ids(self, hits):
+        return [hit.id for hit, _ in hits]
+
+    def new_search(self, query, **filters):
+        return self.index.keyword_search(tokenize_text(query), status="active", **filters)
+
+    def test_same_matches_on_whole_word_queries(self):
+        for query in ("docker", "containers", "kubernetes charts", "sourdough bread", "terraform"):
+            with self.subTest(query=query):
+                self.assertEqual(set(self.ids(self.new_search(query))), set(self.ids(old_search(self.index, query))))
+
+    def test_rare_terms_outrank_common_ones(self):
+        # One match each: the old scorer lets salience decide
+        self.assertEqual(self.ids(old_search(self.index, "docker charts"))[0], 1)
+        self.assertEqual(self.ids(self.new_search("docker charts"))[0], 5)  # "charts" is rarer
+        self.assertEqual(self.ids(self.new_search("docker layers"))[0], 1)
+        self.assertEqual(self.ids(self.new_search("docker"))[0], 2)  # term frequency counts
+
+    def test_finds_memories_outside_the_top_100(self):
+        self.index.rebuild(
+            [item(i, f"routine note number {i}", salience=0.9) for i in range(1, 201)]
+            + [item(500, "the vpn certificate expires in march", salience=0.1)]
+        )
+        self.assertEqual(old_search(self.index, "vpn certificate"), [])
+        self.assertEqual(self.ids(self.new_search("vpn certificate")), [500])
+
+    def test_filters_and_limit(self):
+        self.index.add(item(6, "docker layer caching", mem_type="procedural", module_tag="ci"))
+        self.index.add(item(7, "docker swarm is retired", status="archived"))
+        self.assertEqual(self.ids(self.new_search("docker", mem_type="procedural")), [6])
+        self.assertEqual(self.ids(self.new_search("docker", module_tag="ci")), [6])
+        self.assertNotIn(7, self.ids(self.new_search("docker")))
+        self.assertEqual(len(self.new_search("docker", limit=2)), 2)
+        self.assertEqual(self.new_search("docker", limit=0), [])
+
+
+class TestPostings(unittest.TestCase):
+
+    def setUp(self):
+        self.index = MemoryIndex()
+        self.index.rebuild([item(1, "docker containers"), item(2, "kubernetes containers")])
+
+    def search(self, query):
+        return [hit.id for hit, _ in self.index.keyword_search(tokenize_text(query))]
+
+    def test_update_reindexes_an_item_mutated_in_place(self):
+        stored = self.index.get(1)
+        stored.payload = "podman containers"
+        self.index.update(stored)
+        self.assertEqual(self.search("docker"), [])
+        self.assertEqual(self.search("podman"), [1])
+        self.assertNotIn("docker", self.index.postings)
+
+    def test_remove_and_rebuild_drop_postings(self):
+        self.index.remove(1)
+        self.assertEqual(self.search("containers"), [2])
+        self.assertEqual(self.index.postings["containers"], {2: 1})
+        self.index.rebuild([])
+        self.assertEqual(self.index.postings, {})
+        self.assertEqual(self.search("kubernetes"), [])
+        self.assertEqual(self.index.stats()["unique_terms"], 0)
+
+
+class TestSearchByKeywords(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.manager = MemoryManager(Config(data_dir=Path(self.tmp.name)))
+
+    def tearDown(self):
+        self.manager.flush()
+        self.tmp.cleanup()
+
+    def test_goes_through_the_inverted_index(self):
+        docker = self.manager.store(payload="Docker images are built from layers", tags=["docker"])
+        self.manager.store(payload="Kubernetes schedules pods", tags=["k8s"])
+
+        hits = search_by_keywords(self.manager, "How are docker images built?")
+        self.assertEqual([hit.id for hit, _ in hits], [docker.id])
+        self.assertEqual(search_by_keywords(self.manager, "is it the"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+# tests/test_llm_cache.py
+"""
+LLM Response Cache — Test Suite
+
+LLMResponseCache keys on (channel, model, prompts, sampling params),
+expires entries after their TTL and evicts least recently used entries
+past its size caps; LLMClient.complete_system(cache=True) serves repeats
+from it while uncached and persona calls always reach the API.
+
+Run with: python -m pytest tests/test_llm_cache.py -v
+Or standalone: python tests/test_llm_cache.py
+"""
+
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from unittest import mock
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import unittest
+
+from backend.async_llm_client import AsyncLLMClient
+from backend.llm_cache import LLMResponseCache, make_cache_key
+from backend.llm_client import LLMClient
+from tests.llm_fakes import make_client
+
+MESSAGES = [{"role": "user", "content": "Learn Docker and Kubernetes"}]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestResponseCache(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cache = LLMResponseCache(":memory:", ttl=60, max_entries=3, clock=self.clock)
+
+    def tearDown(self):
+        self.cache.close()
+
+    def test_key_covers_request(self):
+        base = make_cache_key("system", "gpt-4.1-mini", "sys", MESSAGES, {"temperature": 0.2})
+        self.assertEqual(base, make_cache_key("system", "gpt-4.1-mini", "sys", list(MESSAGES), {"temperature": 0.2, "command": "x"}))
+        for other in (
+            make_cache_key("system", "gpt-4.1-mini", "sys", MESSAGES, {"temperature": 0.7}),
+            make_cache_key("system", "gpt-4.1-mini", "sys", MESSAGES, {"temperature": 0.2, "max_tokens": 100}),
+            make_cache_key("system", "gpt-5.1", "sys", MESSAGES, {"temperature": 0.2}),
+            make_cache_key("gemini", "gpt-4.1-mini", "sys", MESSAGES, {"temperature": 0.2}),
+            make_cache_key("system", "gpt-4.1-mini", "other", MESSAGES, {"temperature": 0.2}),
+        ):
+            self.assertNotEqual(base, other)
+
+    def test_ttl(self):
+        self.cache.put("a", "alpha")
+        self.cache.put("b", "beta", ttl=10)
+        self.clock.now += 30
+        self.assertEqual(self.cache.get("a"), "alpha")
+        self.assertIsNone(self.cache.get("b"))
+        stats = self.cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["expired"]), (1, 1, 1))
+
+    def test_lru_eviction(self):
+        for key in ("a", "b", "c"):
+            self.clock.now += 1
+            self.cache.put(key, key * 10)
+        self.clock.now += 1
+        self.cache.get("a")
+        self.cache.put("d", "dddd")
+        self.assertIsNone(self.cache.get("b"))
+        self.assertEqual(self.cache.get("a"), "a" * 10)
+        self.assertEqual(self.cache.stats()["evictions"], 1)
+
+    def test_byte_cap(self):
+        cache = LLMResponseCache(":memory:", max_bytes=10, clock=self.clock)
+        cache.put("a", "x" * 6)
+        self.clock.now += 1
+        cache.put("b", "y" * 6)
+        cache.put("huge", "z" * 11)
+        self.assertIsNone(cache.get("a"))
+        self.assertIsNone(cache.get("huge"))
+        self.assertEqual(cache.stats()["bytes"], 6)
+        cache.close()
+
+    def test_env_paths_resolve_against_project_root(self):
+        from backend import llm_cache
+
+        with tempfile.TemporaryDirectory() as tmp, mock.patch.object(llm_cache, "PROJECT_ROOT", Path(tmp)):
+            with mock.patch.dict(os.environ, {"NOVA_LLM_CACHE": "sqlite:cache/llm.db"}):
+                cache = llm_cache._cache_from_env()
+            self.assertEqual(cache.path, str(Path(tmp) / "cache" / "llm.db"))
+            cache.close()
+        self.assertTrue(llm_cache.DEFAULT_CACHE_PATH.is_absolute())
+
+
+class TestClientCaching(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = LLMResponseCache(":memory:")
+        self.client = make_client(LLMClient, completions=None, response_cache=self.cache)
+        self.calls = []
+
+        def fake_call_api(**kwargs):
+            self.calls.append(kwargs)
+            return f"answer {len(self.calls)}"
+
+        self.client._call_api = fake_call_api
+
+    def tearDown(self):
+        self.cache.close()
+
+    def system(self, **kwargs):
+        return self.client.complete_system(system="sys", user="Learn Docker", command="domain-extract-topics", **kwargs)
+
+    def test_repeat_served_from_cache(self):
+        first = self.system(cache=True)
+        second = self.system(cache=True)
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual(second["text"], first["text"])
+        self.assertEqual((first["cached"], second["cached"]), (False, True))
+
+        self.system(cache=True, temperature=0.9)
+        self.assertEqual(len(self.calls), 2)
+        self.assertNotIn("cache", self.calls[-1])
+        self.assertEqual(self.client.cache_stats()["hits"], 1)
+
+    def test_uncached_calls_reach_api(self):
+        self.system(cache=True)
+        self.assertFalse(self.system()["cached"])
+        self.client.complete_persona(system="sys", user="Learn Docker")
+        self.client.complete_persona(system="sys", user="Learn Docker")
+        self.assertEqual(len(self.calls), 4)
+
+    def test_answers_failing_validation_not_stored(self):
+        self.client._call_api = lambda **kwargs: self.calls.append(kwargs) or "not json"
+        is_json = lambda text: json.loads(text) is not None
+        self.assertFalse(self.system(cache=True, cache_validator=is_json)["cached"])
+        self.assertFalse(self.system(cache=True, cache_validator=is_json)["cached"])
+        self.assertEqual(len(self.calls), 2)
+
+        self.client._call_api = lambda **kwargs: self.calls.append(kwargs) or '{"topics": []}'
+        self.system(cache=True, cache_validator=is_json)
+        self.assertTrue(self.system(cache=True, cache_validator=is_json)["cached"])
+        self.assertEqual(len(self.calls), 3)
+
+    def test_empty_answers_not_stored(self):
+        self.client._call_api = lambda **kwargs: self.calls.append(kwargs) or ""
+        self.system(cache=True)
+        self.system(cache=True)
+        self.assertEqual(len(self.calls), 2)
+
+
+class TestAsyncClientCaching(unittest.TestCase):
+
+    def test_cache_io_runs_off_the_event_loop(self):
+        cache = LLMResponseCache(":memory:")
+        threads = []
+        for name in ("get", "put"):
+            real = getattr(cache, name)
+            setattr(cache, name, lambda *a, _real=real, **kw: threads.append(threading.get_ident()) or _real(*a, **kw))
+        client = make_client(AsyncLLMClient, completions=None, response_cache=cache)
+
+        async def fake_call_api(**kwargs):
+            return "answer"
+
+        client._call_api = fake_call_api
+
+        async def main():
+            first = await client.complete_system(system="sys", user="Learn Docker", cache=True)
+            second = await client.complete_system(system="sys", user="Learn Docker", cache=True)
+            return first, second, threading.get_ident()
+
+        first, second, loop_thread = asyncio.run(main())
+        self.assertEqual((first["cached"], second["cached"]), (False, True))
+        self.assertEqual(len(threads), 3)
+        self.assertNotIn(loop_thread, threads)
+        cache.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+# tests/test_llm_governor.py
+"""
+LLM Concurrency Governor — Test Suite
+
+LLMConcurrencyGovernor enforces the global and per-model in-flight
+limits, grants waiters in arrival order across threads and event loops,
+times out waiters that queue too long and records queue times; LLMClient
+and AsyncLLMClient hold a slot for each call, and a stream the consumer
+abandons gives back its slot and closes the upstream response.
+
+Run with: python -m pytest tests/test_llm_governor.py -v
+Or standalone: python tests/test_llm_governor.py
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import unittest
+
+from backend.async_llm_client import AsyncLLMClient
+from backend.llm_client import LLMClient, LLMQueueTimeoutError, LLMTimeoutError
+from backend.llm_transport import LLMConcurrencyGovernor, LLMQueueTimeout
+from tests.llm_fakes import AsyncFakeStream, FakeStream, make_client
+
+
+def start_waiter(governor, model, log, name):
+    def run():
+        governor.acquire(model, timeout=5)
+        log.append(name)
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread
+
+
+def wait_for_queue(governor, waiting):
+    deadline = time.monotonic() + 2
+    while governor.stats()["waiting"] < waiting and time.monotonic() < deadline:
+        time.sleep(0.005)
+
+
+class TestGovernor(unittest.TestCase):
+
+    def test_model_and_global_limits(self):
+        governor = LLMConcurrencyGovernor(max_in_flight=2, model_limits={"big": 1})
+        governor.acquire("big")
+        governor.acquire("small")
+        with self.assertRaises(LLMQueueTimeout):
+            governor.acquire("small", timeout=0.05)
+        governor.release("small")
+        with self.assertRaises(LLMQueueTimeout):
+            governor.acquire("big", timeout=0.05)
+        self.assertEqual(governor.acquire("small", timeout=0.05), 0.0)
+
+        stats = governor.stats()
+        self.assertEqual(stats["in_flight"], 2)
+        self.assertEqual(stats["models"]["big"]["timeouts"], 1)
+        self.assertEqual(stats["models"]["small"]["acquired"], 2)
+
+    def test_waiters_granted_in_arrival_order(self):
+        governor = LLMConcurrencyGovernor(max_in_flight=1, model_limits={})
+        governor.acquire("m")
+        order, threads = [], []
+        for name in ("first", "second", "third"):
+            threads.append(start_waiter(governor, "m", order, name))
+            wait_for_queue(governor, len(threads))
+        for _ in threads:
+            time.sleep(0.02)
+            governor.release("m")
+            deadline = time.monotonic() + 2
+            while governor.stats()["in_flight"] == 0 and time.monotonic() < deadline:
+                time.sleep(0.005)
+        for thread in threads:
+            thread.join(2)
+        self.assertEqual(order, ["first", "second", "third"])
+        self.assertGreater(governor.stats()["models"]["m"]["max_queue_ms"], 0)
+
+    def test_blocked_model_does_not_hold_up_others(self):
+        governor = LLMConcurrencyGovernor(max_in_flight=2, model_limits={"big": 1})
+        governor.acquire("big")
+        governor.acquire("small")
+        log = []
+        big = start_waiter(governor, "big", log, "big")
+        wait_for_queue(governor, 1)
+        small = start_waiter(governor, "small", log, "small")
+        wait_for_queue(governor, 2)
+        governor.release("small")
+        small.join(2)
+        self.assertEqual(log, ["small"])
+        governor.release("big")
+        big.join(2)
+        self.assertEqual(log, ["small", "big"])
+
+    def test_async_waiters_share_limits_with_threads(self):
+        governor = LLMConcurrencyGovernor(max_in_flight=2, model_limits={})
+        peak, active = [0], [0]
+
+        async def call():
+            async with governor.async_slot("m"):
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+                await asyncio.sleep(0.05)  # outlasts the thread's hold, so two calls overlap
+                active[0] -= 1
+
+        async def main():
+            governor.acquire("m")  # held by a "thread" until released from another one
+            threading.Timer(0.02, governor.release, args=("m",)).start()
+            await asyncio.gather(*(call() for _ in range(6)))
+
+        asyncio.run(main())
+        self.assertEqual(peak[0], 2)
+        stats = governor.stats()
+        self.assertEqual((stats["in_flight"], stats["waiting"]), (0, 0))
+        self.assertEqual(stats["models"]["m"]["acquired"], 7)
+
+    def test_cancelled_async_waiter_leaves_queue(self):
+        governor = LLMConcurrencyGovernor(max_in_flight=1, model_limits={})
+
+        async def main():
+            governor.acquire("m")
+            task = asyncio.ensure_future(governor.acquire_async("m"))
+            await asyncio.sleep(0.01)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            governor.release("m")
+
+        asyncio.run(main())
+        stats = governor.stats()
+        self.assertEqual((stats["in_flight"], stats["waiting"]), (0, 0))
+        self.assertEqual(stats["models"]["m"]["timeouts"], 0)
+
+
+class FakeCompletions:
+    def __init__(self, gate=None):
+        self.gate = gate
+
+    def create(self, **kwargs):
+        if self.gate:
+            self.gate.wait(2)
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="ok"))])
+
+
+class FakeAsyncCompletions:
+    async def create(self, **kwargs):
+        await asyncio.sleep(0)
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="ok"))])
+
+
+def chunks(*parts):
+    return [SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=part))], usage=None) for part in parts]
+
+
+class StreamingCompletions:
+    """Hands out FakeStreams and keeps them for inspection."""
+
+    stream_class = FakeStream
+
+    def __init__(self):
+        self.streams = []
+
+    def create(self, **kwargs):
+        self.streams.append(self.stream_class(chunks("one", "two", "three")))
+        return self.streams[-1]
+
+
+class AsyncStreamingCompletions(StreamingCompletions):
+    stream_class = AsyncFakeStream
+
+    async def create(self, **kwargs):
+        return StreamingCompletions.create(self, **kwargs)
+
+
+class TestClientsUseGovernor(unittest.TestCase):
+
+    def test_sync_queue_timeout_is_llm_timeout(self):
+        gate = threading.Event()
+        governor = LLMConcurrencyGovernor(max_in_flight=1, model_limits={}, queue_timeout=0.05)
+        client = make_client(LLMClient, FakeCompletions(gate), governor=governor)
+
+        first = threading.Thread(target=client.complete_system, kwargs={"system": "s", "user": "first"})
+        first.start()
+        deadline = time.monotonic() + 2
+        while governor.stats()["in_flight"] == 0 and time.monotonic() < deadline:
+            time.sleep(0.005)
+        with self.assertRaises(LLMQueueTimeoutError) as ctx:
+            client.complete_system(system="s", user="u")
+        self.assertIsInstance(ctx.exception, LLMTimeoutError)
+        gate.set()
+        first.join(2)
+        self.assertEqual(client.complete_system(system="s", user="u")["text"], "ok")
+        self.assertEqual(client.concurrency_stats()["in_flight"], 0)
+
+    def test_async_client_channels(self):
+        governor = LLMConcurrencyGovernor(max_in_flight=2, model_limits={})
+        client = make_client(AsyncLLMClient, FakeAsyncCompletions(), governor=governor)
+
+        async def main():
+            return await asyncio.gather(
+                client.complete_system(system="s", user="u", command="domain-extract-topics"),
+                client.complete_persona(system="s", user="persona"),
+                client.complete(system="s", user="plain"),
+            )
+
+        system, persona, plain = asyncio.run(main())
+        self.assertEqual((system["channel"], system["cached"], persona["channel"], plain["text"]),
+                         ("system", False, "persona", "ok"))
+        self.assertEqual(governor.stats()["in_flight"], 0)
+        self.assertEqual(sum(m["acquired"] for m in governor.stats()["models"].values()), 3)
+
+    def test_abandoned_stream_is_closed(self):
+        completions = StreamingCompletions()
+        client = make_client(LLMClient, completions)
+        for stream in (client.stream_complete_system, client.stream_complete_persona):
+            with self.subTest(stream=stream.__name__):
+                for text in stream(system="s", user="u"):
+                    break  # client disconnected after the first chunk
+                self.assertEqual(text, "one")
+                self.assertTrue(completions.streams[-1].closed)
+                self.assertEqual(client.concurrency_stats()["in_flight"], 0)
+
+        self.assertEqual(list(client.stream_complete_system(system="s", user="u")), ["one", "two", "three"])
+        self.assertTrue(completions.streams[-1].closed)
+
+    def test_abandoned_async_stream_is_closed(self):
+        completions = AsyncStreamingCompletions()
+        client = make_client(AsyncLLMClient, completions)
+
+        async def first_chunk(stream):
+            replies = stream(system="s", user="u")
+            async for text in replies:
+                break
+            await replies.aclose()
+            # Closed before the event loop gets another turn
+            return text, completions.streams[-1].closed, client.concurrency_stats()["in_flight"]
+
+        async def main():
+            return [await first_chunk(client.stream_complete_system), await first_chunk(client.stream_complete_persona)]
+
+        self.assertEqual(asyncio.run(main()), [("one", True, 0), ("one", True, 0)])
+
+
+if __name__ == "__main__":
+    unittest.main()
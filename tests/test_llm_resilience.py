@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+# tests/test_llm_resilience.py
+"""
+LLM Resilience — Test Suite
+
+CircuitBreaker opens on a high transient error rate and closes after a
+successful probe; LLMResilience retries only transient failures within
+its attempt and time budget; LLMClient / AsyncLLMClient retry 429/5xx,
+hedge slow calls past the model's p95, fail fast on persona and fall back
+to the light model on the system channel while a circuit is open.
+
+Run with: python -m pytest tests/test_llm_resilience.py -v
+Or standalone: python tests/test_llm_resilience.py
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import unittest
+
+from backend import llm_resilience
+from backend.async_llm_client import AsyncLLMClient
+from backend.llm_client import LLMClient, LLMCircuitOpenError
+from backend.llm_resilience import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpen, LLMResilience
+from backend.model_router import MODEL_MINI, MODEL_THINKING
+from tests.llm_fakes import FakeStream, make_client
+
+
+class StatusError(Exception):
+    def __init__(self, status_code, retry_after=None):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.response = SimpleNamespace(headers={"retry-after": retry_after} if retry_after else {})
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def reply(text):
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=text))])
+
+
+def chunk(text):
+    return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=text))])
+
+
+class ScriptedCompletions:
+    """Each request takes the next outcome: an exception to raise or a reply text."""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = []
+
+    def create(self, **kwargs):
+        self.calls.append(kwargs)
+        outcome = self.outcomes.pop(0) if self.outcomes else "ok"
+        if isinstance(outcome, Exception):
+            raise outcome
+        if kwargs.get("stream"):
+            return FakeStream([chunk(part) for part in outcome.split("|")])
+        return reply(outcome)
+
+
+
+def trip(resilience, model):
+    for _ in range(llm_resilience.BREAKER_MIN_CALLS):
+        resilience.record_failure(model, StatusError(503))
+
+
+class TestCircuitBreaker(unittest.TestCase):
+
+    def test_opens_probes_and_closes(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(window=10, min_calls=4, error_rate=0.5, cooldown=30, clock=clock)
+        for ok in (True, False, True):
+            breaker.record(ok)
+        self.assertEqual(breaker.state, CLOSED)
+        breaker.record(False)
+        self.assertEqual(breaker.state, OPEN)
+        self.assertFalse(breaker.allow())
+        self.assertEqual(breaker.retry_after(), 30)
+
+        clock.now = 31
+        self.assertTrue(breaker.allow())
+        self.assertEqual(breaker.state, HALF_OPEN)
+        self.assertFalse(breaker.allow())  # one probe at a time
+        breaker.record(False)
+        self.assertEqual(breaker.state, OPEN)
+
+        clock.now = 62
+        self.assertTrue(breaker.allow())
+        breaker.record(True)
+        self.assertEqual(breaker.state, CLOSED)
+        self.assertEqual(breaker.opened, 2)
+
+
+class TestRetryPolicy(unittest.TestCase):
+
+    def test_only_transient_failures_are_retried(self):
+        resilience = LLMResilience(max_attempts=3, backoff_base=1.0)
+        self.assertIsNotNone(resilience.retry_delay("m", 1, 0.0, StatusError(429)))
+        self.assertLessEqual(resilience.retry_delay("m", 2, 0.0, StatusError(502)), 2.0)
+        self.assertIsNone(resilience.retry_delay("m", 3, 0.0, StatusError(503)))  # out of attempts
+        self.assertIsNone(resilience.retry_delay("m", 1, 0.0, StatusError(400)))
+        self.assertIsNone(resilience.retry_delay("m", 1, 0.0, RuntimeError("bug")))
+        self.assertIsNone(resilience.retry_delay("m", 1, llm_resilience.CALL_BUDGET, StatusError(503)))
+        # no retry once less than MIN_ATTEMPT_TIME of the budget would be left
+        late = llm_resilience.CALL_BUDGET - llm_resilience.MIN_ATTEMPT_TIME
+        self.assertIsNone(resilience.retry_delay("m", 1, late, StatusError(503)))
+
+    def test_retry_after_is_honored(self):
+        resilience = LLMResilience(backoff_base=0.01)
+        self.assertEqual(resilience.retry_delay("m", 1, 0.0, StatusError(429, retry_after="3")), 3.0)
+
+    def test_caller_errors_do_not_trip_the_breaker(self):
+        resilience = LLMResilience()
+        for _ in range(20):
+            resilience.record_failure("m", StatusError(400))
+        resilience.admit("m")
+        trip(resilience, "m")
+        with self.assertRaises(CircuitOpen):
+            resilience.admit("m")
+
+
+class TestClientResilience(unittest.TestCase):
+
+    def test_transient_errors_retried_until_success(self):
+        completions = ScriptedCompletions(StatusError(503), StatusError(429), "recovered")
+        resilience = LLMResilience(backoff_base=0.001)
+        client = make_client(LLMClient, completions, resilience=resilience)
+
+        result = client.complete_system(system="Extract topics", user="Learn Docker")
+        self.assertEqual(result["text"], "recovered")
+        self.assertEqual(len(completions.calls), 3)
+        stats = client.resilience_stats()["models"][result["model"]]
+        self.assertEqual(stats["retries"], 2)
+        self.assertEqual(stats["failures"], 2)
+        self.assertEqual(stats["samples"], 1)
+
+    def test_attempts_are_capped_at_the_call_budget(self):
+        completions = ScriptedCompletions("ok")
+        client = make_client(LLMClient, completions, resilience=LLMResilience(call_budget=20.0))
+        with mock.patch.object(client.governor, "acquire", wraps=client.governor.acquire) as acquire:
+            client._attempt(MODEL_MINI, "s", [], "system", "cmd", {}, None, time.monotonic() - 12.0)
+        # 8s of the budget left: the queue wait leaves MIN_ATTEMPT_TIME for the request
+        self.assertAlmostEqual(acquire.call_args[0][1], 8.0 - llm_resilience.MIN_ATTEMPT_TIME, delta=0.5)
+        self.assertAlmostEqual(completions.calls[0]["timeout"], 8.0, delta=0.5)
+
+    def test_stream_retried_before_first_chunk(self):
+        completions = ScriptedCompletions(StatusError(500), "Hel|lo")
+        client = make_client(LLMClient, completions, resilience=LLMResilience(backoff_base=0.001))
+        chunks = list(client.stream_complete_system(system="s", user="u"))
+        self.assertEqual(chunks, ["Hel", "lo"])
+        self.assertEqual(len(completions.calls), 2)
+
+    def test_open_circuit_persona_fails_fast_system_falls_back(self):
+        completions = ScriptedCompletions()
+        resilience = LLMResilience()
+        trip(resilience, MODEL_THINKING)
+        client = make_client(LLMClient, completions, resilience=resilience)
+
+        with self.assertRaises(LLMCircuitOpenError):
+            client.complete_persona(system="You are Nova", user="hi")
+        self.assertEqual(completions.calls, [])
+
+        result = client.complete_system(system="s", user="u", think_mode=True)
+        self.assertEqual(result["model"], MODEL_MINI)
+        self.assertEqual([c["model"] for c in completions.calls], [MODEL_MINI])
+        with self.assertRaises(LLMCircuitOpenError):
+            client.complete_system(system="s", user="u", explicit_model=MODEL_THINKING)
+        self.assertEqual(resilience.stats()["models"][MODEL_THINKING]["fallbacks"], 1)
+
+    def test_slow_call_is_hedged(self):
+        gate = threading.Event()
+
+        class SlowFirst(ScriptedCompletions):
+            def create(self, **kwargs):
+                self.calls.append(kwargs)
+                if len(self.calls) == 1:
+                    gate.wait(2)
+                    return reply("slow")
+                return reply("fast")
+
+        completions = SlowFirst()
+        resilience = LLMResilience(hedge=True)
+        for _ in range(llm_resilience.HEDGE_MIN_SAMPLES):
+            resilience.record_success(MODEL_MINI, 0.01)
+        client = make_client(LLMClient, completions, resilience=resilience)
+
+        with mock.patch.object(llm_resilience, "HEDGE_MIN_DELAY", 0.01):
+            result = client.complete_system(system="s", user="u")
+        gate.set()
+        self.assertEqual(result["text"], "fast")
+        stats = resilience.stats()["models"][MODEL_MINI]
+        self.assertEqual((stats["hedges"], stats["hedge_wins"]), (1, 1))
+
+        # hedge=False per call overrides the default
+        self.assertIsNone(resilience.hedge_delay(MODEL_MINI, hedge=False))
+
+
+class TestAsyncClientResilience(unittest.TestCase):
+
+    def test_retry_and_hedge_cancels_loser(self):
+        cancelled = []
+
+        class AsyncCompletions:
+            def __init__(self):
+                self.calls = 0
+
+            async def create(self, **kwargs):
+                self.calls += 1
+                if self.calls == 1:
+                    raise StatusError(502)
+                if self.calls == 2:
+                    try:
+                        await asyncio.sleep(5)
+                    except asyncio.CancelledError:
+                        cancelled.append(True)
+                        raise
+                return reply("fast")
+
+        completions = AsyncCompletions()
+        resilience = LLMResilience(hedge=True, backoff_base=0.001)
+        for _ in range(llm_resilience.HEDGE_MIN_SAMPLES):
+            resilience.record_success(MODEL_MINI, 0.01)
+        client = make_client(AsyncLLMClient, completions, resilience=resilience)
+
+        async def run():
+            result = await client.complete_system(system="s", user="u")
+            await asyncio.sleep(0)
+            return result
+
+        with mock.patch.object(llm_resilience, "HEDGE_MIN_DELAY", 0.01):
+            result = asyncio.run(run())
+        self.assertEqual(result["text"], "fast")
+        self.assertEqual(completions.calls, 3)
+        self.assertEqual(cancelled, [True])
+        stats = resilience.stats()["models"][MODEL_MINI]
+        self.assertEqual((stats["retries"], stats["hedge_wins"]), (1, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# tests/test_llm_singleflight.py
+"""
+LLM Request Coalescing — Test Suite
+
+Concurrent identical requests through LLMClient / AsyncLLMClient share one
+upstream call and all receive its result or error; requests that differ
+in model, prompts or params are sent separately.
+
+Run with: python -m pytest tests/test_llm_singleflight.py -v
+Or standalone: python tests/test_llm_singleflight.py
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import unittest
+
+from backend.async_llm_client import AsyncLLMClient
+from backend.llm_client import LLMClient, LLMError
+from tests.llm_fakes import make_client
+
+
+def reply(text):
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=text))])
+
+
+class GatedCompletions:
+    """Blocks every request until the gate opens; counts upstream requests."""
+
+    def __init__(self, error=None):
+        self.gate = threading.Event()
+        self.calls = []
+        self.error = error
+
+    def create(self, **kwargs):
+        self.calls.append(kwargs)
+        self.gate.wait(2)
+        if self.error:
+            raise self.error
+        return reply(f"answer {len(self.calls)}")
+
+
+class AsyncGatedCompletions:
+    def __init__(self):
+        self.gate = asyncio.Event()
+        self.calls = []
+
+    async def create(self, **kwargs):
+        self.calls.append(kwargs)
+        await self.gate.wait()
+        return reply(f"answer {len(self.calls)}")
+
+
+
+def run_threads(client, count, **kwargs):
+    results = [None] * count
+
+    def call(i):
+        try:
+            results[i] = client.complete_system(system="Extract topics", user="Learn Docker", **kwargs)["text"]
+        except Exception as e:
+            results[i] = e
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads, results
+
+
+def wait_for_waiters(client, count):
+    deadline = time.monotonic() + 2
+    while client.coalescing_stats()["coalesced"] < count and time.monotonic() < deadline:
+        time.sleep(0.005)
+
+
+class TestSyncCoalescing(unittest.TestCase):
+
+    def test_identical_requests_share_one_call(self):
+        completions = GatedCompletions()
+        client = make_client(LLMClient, completions)
+        threads, results = run_threads(client, 5)
+        wait_for_waiters(client, 4)
+        completions.gate.set()
+        for thread in threads:
+            thread.join(2)
+
+        self.assertEqual(len(completions.calls), 1)
+        self.assertEqual(results, ["answer 1"] * 5)
+        stats = client.coalescing_stats()
+        self.assertEqual((stats["calls"], stats["coalesced"], stats["max_waiters"], stats["in_flight"]), (1, 4, 4, 0))
+
+        # Nothing is kept once the call is done
+        completions.gate.set()
+        self.assertEqual(client.complete_system(system="Extract topics", user="Learn Docker")["text"], "answer 2")
+
+    def test_error_reaches_every_waiter(self):
+        completions = GatedCompletions(error=RuntimeError("bad request"))
+        client = make_client(LLMClient, completions)
+        threads, results = run_threads(client, 3)
+        wait_for_waiters(client, 2)
+        completions.gate.set()
+        for thread in threads:
+            thread.join(2)
+
+        self.assertEqual(len(completions.calls), 1)
+        self.assertIsInstance(results[0], LLMError)
+        for result in results[1:]:
+            self.assertIs(type(result), type(results[0]))
+            self.assertIs(result.__cause__, results[0].__cause__)
+
+    def test_different_params_not_coalesced(self):
+        completions = GatedCompletions()
+        completions.gate.set()
+        client = make_client(LLMClient, completions)
+        first, _ = run_threads(client, 1, temperature=0.2)
+        second, _ = run_threads(client, 1, temperature=0.9)
+        for thread in first + second:
+            thread.join(2)
+        self.assertEqual(len(completions.calls), 2)
+        self.assertEqual(client.coalescing_stats()["coalesced"], 0)
+
+
+class TestAsyncCoalescing(unittest.TestCase):
+
+    def test_identical_coroutines_share_one_call(self):
+        async def main():
+            completions = AsyncGatedCompletions()
+            client = make_client(AsyncLLMClient, completions)
+            calls = [
+                asyncio.ensure_future(client.complete_system(system="Extract topics", user="Learn Docker"))
+                for _ in range(4)
+            ]
+            await asyncio.sleep(0.01)
+            calls[0].cancel()  # the caller that started the call gives up
+            await asyncio.sleep(0.01)
+            completions.gate.set()
+            results = await asyncio.gather(*calls, return_exceptions=True)
+            return completions, client, results
+
+        completions, client, results = asyncio.run(main())
+        self.assertEqual(len(completions.calls), 1)
+        self.assertIsInstance(results[0], asyncio.CancelledError)
+        self.assertEqual([r["text"] for r in results[1:]], ["answer 1"] * 3)
+        self.assertEqual(client.coalescing_stats()["coalesced"], 3)
+        self.assertEqual(client.governor.stats()["in_flight"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
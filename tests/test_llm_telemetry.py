@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# tests/test_llm_telemetry.py
+"""
+LLM Call Telemetry — Test Suite
+
+LLMTelemetry keeps a bounded ring of call records with rollups by
+channel/model and command; LLMClient / AsyncLLMClient record tokens,
+latency, TTFT, retries, coalescing and cache status for every call; the
+#llm-stats syscommand reports them.
+
+Run with: python -m pytest tests/test_llm_telemetry.py -v
+Or standalone: python tests/test_llm_telemetry.py
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import unittest
+
+from backend.async_llm_client import AsyncLLMClient
+from backend.llm_cache import LLMResponseCache
+from backend.llm_client import LLMClient, LLMCircuitOpenError
+from backend.llm_resilience import LLMResilience
+from backend.llm_telemetry import LLMCallRecord, LLMTelemetry
+from backend.model_router import MODEL_MINI, MODEL_THINKING
+from tests.llm_fakes import FakeStream, make_client
+
+
+class StatusError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+def usage(prompt, completion):
+    return SimpleNamespace(prompt_tokens=prompt, completion_tokens=completion)
+
+
+def reply(text, prompt=12, completion=5):
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=text))],
+        usage=usage(prompt, completion),
+    )
+
+
+def chunk(text):
+    return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=text))], usage=None)
+
+
+class FakeCompletions:
+    """Raises the queued errors first, then replies; streams end with a usage-only chunk."""
+
+    def __init__(self, *errors):
+        self.errors = list(errors)
+        self.calls = []
+
+    def create(self, **kwargs):
+        self.calls.append(kwargs)
+        if self.errors:
+            raise self.errors.pop(0)
+        if kwargs.get("stream"):
+            return FakeStream([chunk("Hel"), chunk("lo"), SimpleNamespace(choices=[], usage=usage(20, 2))])
+        return reply(f"answer {len(self.calls)}")
+
+
+class AsyncFakeCompletions(FakeCompletions):
+    async def create(self, **kwargs):
+        return FakeCompletions.create(self, **kwargs)
+
+
+
+class TestRecorder(unittest.TestCase):
+
+    def test_ring_is_bounded_and_rollups_keep_totals(self):
+        telemetry = LLMTelemetry(max_records=3)
+        for i in range(5):
+            call = telemetry.start("system", f"cmd-{i % 2}", MODEL_MINI)
+            call.add_usage({"prompt_tokens": 10, "completion_tokens": 2})
+            telemetry.finish(call, "ok" if i else "timeout")
+
+        stats = telemetry.stats()
+        self.assertEqual(stats["buffered"], 3)
+        self.assertEqual(stats["calls"], 5)
+        self.assertEqual(stats["total_tokens"], 60)
+        self.assertEqual(stats["outcomes"], {"timeout": 1, "ok": 4})
+        self.assertEqual(stats["by_model"][f"system/{MODEL_MINI}"]["calls"], 5)
+        self.assertEqual(stats["by_command"]["cmd-0"]["calls"], 3)
+        self.assertEqual([r["command"] for r in telemetry.recent(10, command="cmd-0")], ["cmd-0", "cmd-0"])
+
+    def test_record_serializes_with_total_tokens(self):
+        record = LLMCallRecord(channel="persona", command="persona", model=MODEL_THINKING)
+        self.assertIsNone(record.to_dict()["total_tokens"])
+        record.prompt_tokens, record.completion_tokens = 3, 4
+        self.assertEqual(record.to_dict()["total_tokens"], 7)
+
+
+class TestClientTelemetry(unittest.TestCase):
+
+    def test_call_records_tokens_retries_and_cache_status(self):
+        client = make_client(
+            LLMClient,
+            FakeCompletions(StatusError(503)),
+            resilience=LLMResilience(backoff_base=0.001),
+            response_cache=LLMResponseCache(":memory:"),
+        )
+        client.complete_system(system="Extract topics", user="Learn Docker", command="domain-extract-topics", cache=True)
+        client.complete_system(system="Extract topics", user="Learn Docker", command="domain-extract-topics", cache=True)
+
+        hit, miss = client.telemetry.recent(2)
+        self.assertEqual((miss["cache"], miss["outcome"], miss["retries"]), ("miss", "ok", 1))
+        self.assertEqual((miss["prompt_tokens"], miss["completion_tokens"]), (12, 5))
+        self.assertEqual((hit["cache"], hit["total_tokens"]), ("hit", None))
+        rollup = client.telemetry_stats()["by_command"]["domain-extract-topics"]
+        self.assertEqual((rollup["cache_hits"], rollup["cache_misses"], rollup["total_tokens"]), (1, 1, 17))
+
+    def test_stream_records_ttft_and_usage(self):
+        client = make_client(LLMClient, FakeCompletions())
+        self.assertEqual(list(client.stream_complete_system(system="s", user="u")), ["Hel", "lo"])
+        record = client.telemetry.recent(1)[0]
+        self.assertTrue(record["streaming"])
+        self.assertIsNotNone(record["ttft_ms"])
+        self.assertLessEqual(record["ttft_ms"], record["latency_ms"])
+        self.assertEqual(record["total_tokens"], 22)
+        self.assertTrue(client.client.chat.completions.calls[0]["stream_options"]["include_usage"])
+
+        stream = client.stream_complete_system(system="s", user="u")
+        next(stream)
+        stream.close()
+        self.assertEqual(client.telemetry.recent(1)[0]["outcome"], "cancelled")
+        self.assertEqual(client.governor.stats()["in_flight"], 0)
+
+    def test_failures_are_recorded_with_outcome(self):
+        client = make_client(LLMClient, FakeCompletions())
+        for _ in range(10):
+            client.resilience.record_failure(MODEL_THINKING, StatusError(503))
+        with self.assertRaises(LLMCircuitOpenError):
+            client.complete_persona(system="You are Nova", user="hi")
+        record = client.telemetry.recent(1)[0]
+        self.assertEqual((record["channel"], record["outcome"]), ("persona", "circuit_open"))
+        self.assertIn("LLMCircuitOpenError", record["error"])
+
+    def test_async_client_records_calls(self):
+        client = make_client(AsyncLLMClient, AsyncFakeCompletions())
+        asyncio.run(client.complete_system(system="s", user="u", command="classify"))
+        record = client.telemetry.recent(1)[0]
+        self.assertEqual((record["command"], record["model"], record["total_tokens"]), ("classify", MODEL_MINI, 17))
+
+
+class TestLLMStatsCommand(unittest.TestCase):
+
+    def test_reports_rollups_and_recent_calls(self):
+        from kernel.syscommands import SYS_HANDLERS
+
+        telemetry = LLMTelemetry()
+        call = telemetry.start("system", "quest-compose", MODEL_THINKING)
+        call.add_usage(usage(100, 40))
+        telemetry.finish(call)
+
+        with mock.patch("backend.llm_telemetry.get_telemetry", return_value=telemetry):
+            response = SYS_HANDLERS["handle_llm_stats"]("llm-stats", {"limit": "5"}, "s1", {}, None, {})
+        self.assertIn(f"system/{MODEL_THINKING}", response.summary)
+        self.assertIn("quest-compose", response.summary)
+        self.assertEqual(response.data["total_tokens"], 140)
+        self.assertEqual(len(response.data["recent"]), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# tests/test_ltm_context_cache.py
+"""
+LTM Context Cache — Test Suite
+
+build_ltm_context_for_persona() serves the rendered block from
+MemoryManager.ltm_cache while the store version is unchanged; stores,
+updates, deletes and decay writes bump the version and invalidate it.
+
+Run with: python -m pytest tests/test_ltm_context_cache.py -v
+Or standalone: python tests/test_ltm_context_cache.py
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import unittest
+
+from system.config import Config
+from kernel.memory import memory_helpers
+from kernel.memory.memory_manager import MemoryManager
+from kernel.memory.ltm_context_cache import LTMContextCache, LTMContextEntry
+
+
+class TestLTMContextCache(unittest.TestCase):
+
+    def test_version_mismatch_is_stale(self):
+        cache = LTMContextCache()
+        cache.put(("s1", "", ""), LTMContextEntry(1, "block", [1]))
+        self.assertEqual(cache.get(("s1", "", ""), 1).context, "block")
+        self.assertIsNone(cache.get(("s1", "", ""), 2))
+        self.assertIsNone(cache.get(("s1", "", ""), 1))
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["stale"], stats["misses"]), (1, 1, 1))
+
+    def test_lru_bound(self):
+        cache = LTMContextCache(max_entries=2)
+        for i in range(3):
+            cache.put((f"s{i}", "", ""), LTMContextEntry(0, str(i)))
+        self.assertIsNone(cache.get(("s0", "", ""), 0))
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+
+class TestPersonaLTMContext(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.manager = MemoryManager(Config(data_dir=Path(self.tmp.name)))
+        patcher = mock.patch.object(memory_helpers, "_check_embeddings_available", return_value=False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.manager.flush()
+        self.tmp.cleanup()
+
+    def build(self, session_id="s1"):
+        return memory_helpers.build_ltm_context_for_persona(
+            self.manager, user_text="hello", session_id=session_id,
+        )
+
+    def test_unchanged_store_hits_cache(self):
+        item = self.manager.store(payload="User's name is Sam", tags=["profile:identity"], salience=0.9)
+        first = self.build()
+        self.assertIn("User's name is Sam", first)
+        with mock.patch.object(memory_helpers, "get_profile_memories") as recall:
+            self.assertEqual(self.build(), first)
+            recall.assert_not_called()
+        self.assertEqual(self.manager.ltm_cache.stats()["hits"], 1)
+        self.assertIsNotNone(self.manager.trace(item.id)["last_used_at"])
+
+    def test_writes_invalidate(self):
+        item = self.manager.store(payload="User's name is Sam", tags=["profile:identity"], salience=0.9)
+        self.build()
+
+        self.manager.update_many([{"id": item.id, "payload": "User's name is Alex"}])
+        self.assertIn("Alex", self.build())
+
+        self.manager.store(payload="User likes tea", tags=["profile:preference"], salience=0.9)
+        self.assertIn("User likes tea", self.build())
+
+        self.manager.delete_many([item.id])
+        self.assertNotIn("Alex", self.build())
+        self.assertEqual(self.manager.ltm_cache.stats()["stale"], 3)
+
+    def test_touch_keeps_version(self):
+        item = self.manager.store(payload="User likes tea", tags=["profile:preference"], salience=0.9)
+        version = self.manager.store_version
+        self.manager.touch([item.id])
+        self.assertEqual(self.manager.store_version, version)
+
+
+if __name__ == "__main__":
+    unittest.main()
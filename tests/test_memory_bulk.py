@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# tests/test_memory_bulk.py
+"""
+Memory Bulk Operations — Test Suite
+
+MemoryEngine.store_many / update_many / delete_many persist a whole batch
+with one write (one journal record on the JSON backend) and apply the
+index changes together. update_many validates every patch before
+changing anything and skips values that are already current. Both
+storage backends must end up in the same state.
+
+Run with: python -m pytest tests/test_memory_bulk.py -v
+Or standalone: python tests/test_memory_bulk.py
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import unittest
+
+from kernel.memory.memory_engine import MemoryEngine
+
+ENTRIES = [
+    {"payload": "Docker uses layers", "tags": ["docker"]},
+    {"payload": "Pods run containers", "tags": ["k8s"], "mem_type": "procedural"},
+    {"payload": "Helm packages charts", "tags": ["k8s"], "salience": 0.9},
+]
+
+
+class BulkOpsMixin:
+    backend = "json"
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.data_dir = Path(self.tmp.name)
+        self.engine = MemoryEngine(self.data_dir, backend=self.backend)
+
+    def tearDown(self):
+        self.engine.shutdown()
+        self.tmp.cleanup()
+
+    def reopen(self):
+        self.engine.flush()
+        return MemoryEngine(self.data_dir, backend=self.backend)
+
+    def payloads(self, engine, **filters):
+        return sorted(item.payload for item in engine.recall(touch=False, **filters))
+
+    def test_store_many_assigns_ids_and_indexes_in_order(self):
+        items = self.engine.store_many(ENTRIES, session_id="s1")
+        self.assertEqual([item.id for item in items], [1, 2, 3])
+        self.assertEqual([item.type for item in items], ["semantic", "procedural", "semantic"])
+        self.assertEqual(self.payloads(self.engine, tags=["k8s"]), ["Helm packages charts", "Pods run containers"])
+        self.assertEqual(len(self.engine.working.get(session_id="s1")), 3)
+        self.assertEqual(self.engine.store("Later memory").id, 4)
+        self.assertEqual(self.engine.store_many([]), [])
+
+    def test_rejected_entries_are_skipped(self):
+        self.engine.pre_store_hook = lambda item, meta: "docker" not in item.tags
+        items = self.engine.store_many(ENTRIES)
+        self.assertEqual([item.payload for item in items], ["Pods run containers", "Helm packages charts"])
+        self.assertEqual(self.payloads(self.reopen()), ["Helm packages charts", "Pods run containers"])
+
+    def test_update_many_changes_and_reindexes(self):
+        first, second, third = self.engine.store_many(ENTRIES)
+        version = self.engine.store_version
+        count = self.engine.update_many([
+            {"id": first.id, "status": "archived"},
+            {"id": second.id, "salience": 7, "tags": ["k8s", "ops"]},
+            {"id": third.id, "salience": 0.9},  # unchanged
+            {"id": 999, "status": "stale"},  # unknown id
+        ])
+        self.assertEqual(count, 2)
+        self.assertGreater(self.engine.store_version, version)
+
+        for engine in (self.engine, self.reopen()):
+            self.assertEqual(self.payloads(engine, status="archived"), ["Docker uses layers"])
+            self.assertEqual(self.payloads(engine, tags=["ops"]), ["Pods run containers"])
+            self.assertEqual(engine.index.get(second.id).salience, 1.0)  # clamped
+        self.assertEqual(self.engine.update_many([{"id": third.id, "salience": 0.9}]), 0)
+
+    def test_update_many_rejects_unknown_fields_before_changing_anything(self):
+        first, second, _ = self.engine.store_many(ENTRIES)
+        with self.assertRaises(ValueError):
+            self.engine.update_many([
+                {"id": first.id, "status": "archived"},
+                {"id": second.id, "timestamp": "2020-01-01T00:00:00+00:00"},
+            ])
+        self.assertEqual(self.engine.index.get(first.id).status, "active")
+        self.assertEqual(self.payloads(self.engine, status="archived"), [])
+
+    def test_delete_many(self):
+        first, second, third = self.engine.store_many(ENTRIES)
+        self.assertEqual(self.engine.delete_many([first.id, first.id, 999, third.id]), 2)
+        self.assertEqual(self.engine.delete_many([]), 0)
+        self.assertEqual(self.payloads(self.engine), ["Pods run containers"])
+        self.assertEqual(self.payloads(self.reopen()), ["Pods run containers"])
+        self.assertEqual(self.engine.forget(tags=["k8s"]), 1)
+        self.assertEqual(self.payloads(self.engine), [])
+
+
+class TestBulkOpsJson(BulkOpsMixin, unittest.TestCase):
+    backend = "json"
+
+    def journal_records(self):
+        return self.engine.get_storage_stats()["journal_records"]
+
+    def test_each_batch_is_one_journal_record(self):
+        items = self.engine.store_many(ENTRIES)
+        self.assertEqual(self.journal_records(), 1)
+        self.engine.update_many([{"id": item.id, "status": "stale"} for item in items])
+        self.assertEqual(self.journal_records(), 2)
+        self.engine.delete_many([item.id for item in items])
+        self.assertEqual(self.journal_records(), 3)
+
+
+class TestBulkOpsSQLite(BulkOpsMixin, unittest.TestCase):
+    backend = "sqlite"
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+# tests/test_memory_embeddings.py
+"""
+Memory Embeddings — Test Suite
+
+EmbeddingIndex grows its vector matrix as memories are added, saves it as
+a generation of .npy files (dropping tombstones) committed by a manifest
+rename, and memory-maps them on reload; top-k
+search applies type and id filters as masks. EmbeddingService batches
+concurrent requests into one model call, serves repeats from its RAM and
+disk caches, and on shutdown() finishes queued work before stopping.
+MemoryEngine submits stored payloads to the shared EmbeddingService and
+returns without waiting; vectors land in the EmbeddingIndex when the
+service's batch completes, and semantic_search() backfills unindexed
+memories off the request thread.
+
+Uses a fake sentence-transformers model, so no model download is needed.
+
+Run with: python -m pytest tests/test_memory_embeddings.py -v
+Or standalone: python tests/test_memory_embeddings.py
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+import zlib
+from pathlib import Path
+from unittest import mock
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import unittest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from kernel.memory.embedding_index import EmbeddingIndex
+from kernel.memory.memory_engine import LongTermMemory, MemoryEngine
+from kernel.utils.embedding_service import EmbeddingService, normalize_text
+
+DIM = 384
+
+
+def vector(text):
+    """What FakeModel returns for `text` (the service normalizes it first)."""
+    row = np.zeros(DIM, dtype=np.float32)
+    row[zlib.crc32(normalize_text(text).encode("utf-8")) % DIM] = 1.0
+    return row
+
+
+def random_vector(seed):
+    return np.random.default_rng(seed).standard_normal(DIM).astype(np.float32)
+
+
+class FakeModel:
+    """Deterministic text -> vector model; encode() blocks while `gate` is clear."""
+
+    def __init__(self):
+        self.gate = threading.Event()
+        self.gate.set()
+        self.calls = []
+
+    def get_sentence_embedding_dimension(self):
+        return DIM
+
+    def encode(self, texts, **kwargs):
+        self.gate.wait(5)
+        self.calls.append((list(texts), threading.current_thread().name))
+        return np.stack([vector(text) for text in texts])
+
+
+class FakeService(EmbeddingService):
+    def __init__(self, model, **kwargs):
+        super().__init__(**kwargs)
+        self._available = True
+        self._model = model
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestEmbeddingIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.memory_dir = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def fill(self, index, ids, mem_type="semantic"):
+        index.add_many((i, mem_type, random_vector(i)) for i in ids)
+
+    def top(self, index, query, **filters):
+        return [(i, round(score, 4)) for i, score in index.search(query, **filters)]
+
+    def test_capacity_grows_geometrically(self):
+        index = EmbeddingIndex(self.memory_dir)
+        self.fill(index, range(1, 65))
+        self.assertEqual(len(index._vectors), 64)
+        self.fill(index, [65])
+        self.assertEqual(len(index._vectors), 128)
+        self.fill(index, range(66, 300))
+        self.assertEqual((len(index), index.stats()["rows"]), (299, 299))
+        self.assertEqual(self.top(index, random_vector(65), k=1)[0][0], 65)
+
+    def test_save_and_memory_mapped_reload(self):
+        index = EmbeddingIndex(self.memory_dir)
+        self.fill(index, range(1, 11))
+        self.fill(index, [11, 12], mem_type="procedural")
+        self.assertEqual(index.remove([3, 99]), 1)
+        self.assertTrue(index.save())
+        self.assertFalse(index.save())  # nothing changed since
+
+        reloaded = EmbeddingIndex(self.memory_dir)
+        self.assertTrue(reloaded.stats()["memory_mapped"])
+        self.assertIsInstance(reloaded._vectors, np.memmap)
+        self.assertEqual(reloaded.indexed_ids(), set(range(1, 13)) - {3})
+        self.assertEqual(reloaded.stats()["rows"], 11)  # tombstone dropped on save
+        self.assertEqual(self.top(reloaded, random_vector(7), k=1), [(7, 1.0)])
+        self.assertEqual([i for i, _ in reloaded.search(random_vector(11), k=5, mem_type="procedural")], [11, 12])
+
+        # The first write copies the rows out of the read-only map
+        self.fill(reloaded, [13])
+        self.assertFalse(reloaded.stats()["memory_mapped"])
+        reloaded.add(4, "semantic", random_vector(1000))
+        self.assertEqual(self.top(reloaded, random_vector(1000), k=1), [(4, 1.0)])
+        reloaded.save()
+        again = EmbeddingIndex(self.memory_dir)
+        self.assertEqual(len(again), 12)
+        self.assertEqual(self.top(again, random_vector(1000), k=1), [(4, 1.0)])
+
+    def test_search_filters(self):
+        index = EmbeddingIndex(self.memory_dir)
+        self.fill(index, range(1, 6))
+        query = random_vector(2)
+        self.assertEqual({i for i, _ in index.search(query, k=3, allowed_ids={4, 5})}, {4, 5})
+        self.assertEqual([i for i, _ in index.search(query, k=3, allowed_ids={2, 4}, min_score=0.5)], [2])
+        self.assertEqual(index.search(query, k=3, mem_type="episodic"), [])
+        self.assertEqual(index.search(np.zeros(DIM), k=3), [])
+
+    def test_inconsistent_files_are_ignored(self):
+        index = EmbeddingIndex(self.memory_dir)
+        self.fill(index, range(1, 4))
+        index.save()
+        _, ids_file, _ = index.generation_files(1)
+        np.save(ids_file, np.arange(2, dtype=np.int64))
+        with self.assertLogs("nova.memory.embeddings", level="WARNING"):
+            self.assertEqual(len(EmbeddingIndex(self.memory_dir)), 0)  # left for the backfill
+
+    def test_crash_before_the_manifest_keeps_the_previous_generation(self):
+        index = EmbeddingIndex(self.memory_dir)
+        self.fill(index, range(1, 4))
+        index.save()
+        index.remove([1])
+        self.fill(index, [4])
+
+        real_replace = os.replace
+
+        def crash(src, dst):
+            if Path(dst) == index.manifest_file:
+                raise OSError("killed mid-save")
+            real_replace(src, dst)
+
+        with mock.patch("kernel.memory.embedding_index.os.replace", crash):
+            with self.assertRaises(OSError):
+                index.save()
+        self.assertTrue(index.dirty)  # retried by the next save
+
+        reloaded = EmbeddingIndex(self.memory_dir)
+        self.assertEqual(reloaded.indexed_ids(), {1, 2, 3})
+        self.assertEqual(self.top(reloaded, random_vector(2), k=1), [(2, 1.0)])
+
+        self.assertTrue(index.save())
+        again = EmbeddingIndex(self.memory_dir)
+        self.assertEqual(again.indexed_ids(), {2, 3, 4})
+        self.assertEqual(self.top(again, random_vector(4), k=1), [(4, 1.0)])
+        self.assertEqual(sorted(p.name for p in self.memory_dir.glob("*.npy")),
+                         ["embedding_ids.2.npy", "embedding_types.2.npy", "embeddings.2.npy"])
+
+    def test_concurrent_saves_stay_aligned(self):
+        index = EmbeddingIndex(self.memory_dir)
+        errors = []
+
+        def writer(offset):
+            try:
+                for i in range(20):
+                    self.fill(index, [offset + i])
+                    index.save()
+            except Exception as e:  # pragma: no cover - reported below
+                errors.append(e)
+
+        threads = [threading.Thread(target=writer, args=(offset,)) for offset in (1, 1001, 2001)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+        index.save()
+
+        self.assertEqual(errors, [])
+        reloaded = EmbeddingIndex(self.memory_dir)
+        self.assertEqual(len(reloaded), 60)
+        for item_id in (1, 1020, 2005):
+            self.assertEqual(self.top(reloaded, random_vector(item_id), k=1), [(item_id, 1.0)])
+
+    def test_pre_manifest_files_load_and_are_replaced(self):
+        vectors_file, ids_file, types_file = EmbeddingIndex(self.memory_dir).generation_files(0)
+        np.save(vectors_file, np.stack([random_vector(i) for i in (1, 2)]))
+        np.save(ids_file, np.array([1, 2], dtype=np.int64))
+        np.save(types_file, np.zeros(2, dtype=np.int8))
+
+        index = EmbeddingIndex(self.memory_dir)
+        self.assertEqual(index.indexed_ids(), {1, 2})
+        self.fill(index, [3])
+        index.save()
+        self.assertFalse(vectors_file.exists())
+        self.assertEqual(EmbeddingIndex(self.memory_dir).indexed_ids(), {1, 2, 3})
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestEmbeddingService(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.model = FakeModel()
+        self.service = FakeService(self.model, cache_dir=Path(self.tmp.name), batch_window_ms=50)
+
+    def tearDown(self):
+        self.model.gate.set()
+        self.service.shutdown()
+        self.tmp.cleanup()
+
+    def test_concurrent_requests_share_one_batch(self):
+        results = {}
+
+        def encode(text):
+            results[text] = self.service.encode([text, "shared text"])
+
+        threads = [threading.Thread(target=encode, args=(f"text {i}",)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(len(self.model.calls), 1)
+        self.assertEqual(len(self.model.calls[0][0]), 9)  # "shared text" encoded once
+        self.assertEqual(self.service.stats()["batches"], 1)
+        for text, matrix in results.items():
+            self.assertEqual(matrix.shape, (2, DIM))
+            self.assertTrue(np.array_equal(matrix[0], vector(text)))
+
+    def test_batches_are_capped_at_max_batch(self):
+        service = FakeService(self.model, max_batch=4)
+        service.encode([f"text {i}" for i in range(10)])
+        self.assertEqual([len(texts) for texts, _ in self.model.calls], [10])  # one request is never split
+        futures = [service.encode_async([f"more {i}"]) for i in range(6)]
+        for future in futures:
+            future.result(5)
+        self.assertTrue(all(len(texts) <= 4 for texts, _ in self.model.calls[1:]))
+        service.shutdown()
+
+    def test_repeats_come_from_ram_then_disk(self):
+        self.service.encode(["Docker  Layers"])
+        self.service.encode(["docker layers"])  # same normalized text
+        self.assertEqual(len(self.model.calls), 1)
+        self.assertEqual(self.service.stats()["lru_hits"], 1)
+        self.service.shutdown()
+
+        fresh = FakeService(self.model, cache_dir=Path(self.tmp.name))
+        self.assertTrue(np.array_equal(fresh.encode(["DOCKER layers"])[0], vector("docker layers")))
+        self.assertEqual(len(self.model.calls), 1)
+        self.assertEqual(fresh.stats()["disk_hits"], 1)
+        fresh.shutdown()
+
+    def test_shutdown_finishes_queued_requests(self):
+        self.model.gate.clear()
+        futures = [self.service.encode_async([f"queued {i}"]) for i in range(3)]
+        threading.Timer(0.05, self.model.gate.set).start()
+        self.service.shutdown()
+
+        self.assertTrue(all(future.done() for future in futures))
+        self.assertTrue(np.array_equal(futures[2].result()[0], vector("queued 2")))
+        self.assertFalse(self.service.stats()["disk_cache"])
+        # Still usable afterwards (RAM cache only)
+        self.assertEqual(self.service.encode(["after shutdown"]).shape, (1, DIM))
+
+    def test_unavailable_service_returns_none(self):
+        service = EmbeddingService()
+        service._available = False
+        self.assertIsNone(service.encode(["anything"]))
+        self.assertIsNone(service.encode_async(["anything"]).result(0))
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestEngineEmbedding(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.data_dir = Path(self.tmp.name)
+        self.model = FakeModel()
+        self.service = FakeService(self.model)
+        patcher = mock.patch("kernel.utils.embedding_service.get_embedding_service", return_value=self.service)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.engine = MemoryEngine(self.data_dir)
+
+    def tearDown(self):
+        self.model.gate.set()
+        self.engine.flush()
+        self.tmp.cleanup()
+
+    def test_store_returns_before_the_vector_is_encoded(self):
+        self.model.gate.clear()
+        item = self.engine.store("Docker images are built from layers", tags=["docker"])
+        index = self.engine.get_embedding_index()
+        self.assertNotIn(item.id, index)
+
+        self.model.gate.set()
+        self.assertTrue(wait_for(lambda: item.id in index))
+        hits = self.engine.semantic_search(vector("Docker images are built from layers"), limit=1)
+        self.assertEqual([(hit.id, round(score, 3)) for hit, score in hits], [(item.id, 1.0)])
+
+    def test_memory_deleted_before_encoding_is_not_indexed(self):
+        self.model.gate.clear()
+        item = self.engine.store("Temporary note", tags=["misc"])
+        kept = self.engine.store("Kubernetes runs pods", tags=["k8s"])
+        self.engine.delete_many([item.id])
+
+        self.model.gate.set()
+        index = self.engine.get_embedding_index()
+        self.assertTrue(wait_for(lambda: kept.id in index))
+        self.assertNotIn(item.id, index)
+
+    def test_backfill_runs_off_the_request_thread(self):
+        ltm = LongTermMemory(self.data_dir)
+        for i in range(3):
+            ltm.store(self.engine._build_item(i + 1, f"Old memory {i}"))
+        ltm.compact()
+        engine = MemoryEngine(self.data_dir)
+
+        self.model.gate.clear()
+        started = time.perf_counter()
+        self.assertEqual(engine.semantic_search(vector("Old memory 0"), limit=3), [])
+        self.assertLess(time.perf_counter() - started, 1.0)
+
+        self.model.gate.set()
+        index = engine.get_embedding_index()
+        self.assertTrue(wait_for(lambda: len(index) == 3))
+        self.assertTrue(all(name == "nova-embedding-batcher" for _, name in self.model.calls))
+        hits = engine.semantic_search(vector("Old memory 0"), limit=1)
+        self.assertEqual(hits[0][0].payload, "Old memory 0")
+
+
+if __name__ == "__main__":
+    unittest.main()
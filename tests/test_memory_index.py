@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# tests/test_memory_index.py
+"""
+Memory Index Salience Buckets — Test Suite
+
+MemoryIndex keeps each (status, type) bucket sorted by (-salience,
+timestamp, id) and query() walks the buckets until it has `limit` items,
+so its results must match a full filter-and-sort over every item. Items
+mutated in place and passed to update() leave their old buckets, tag,
+module and status sets behind.
+
+Run with: python -m pytest tests/test_memory_index.py -v
+Or standalone: python tests/test_memory_index.py
+"""
+
+import random
+import sys
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import unittest
+
+from kernel.memory.memory_engine import MemoryIndex, MemoryItem
+
+TYPES = ["semantic", "procedural", "episodic"]
+STATUSES = ["active", "stale", "archived"]
+TAGS = ["docker", "k8s", "python", "cooking", "travel"]
+
+
+def item(item_id, mem_type="semantic", tags=("general",), salience=0.5, status="active",
+         timestamp="2026-01-01T00:00:00+00:00", **fields):
+    return MemoryItem(id=item_id, type=mem_type, tags=list(tags), payload=f"memory {item_id}",
+                      timestamp=timestamp, salience=salience, status=status, **fields)
+
+
+def random_items(count, seed=7):
+    rng = random.Random(seed)
+    return [
+        item(
+            item_id,
+            mem_type=rng.choice(TYPES),
+            tags=rng.sample(TAGS, rng.randint(1, 2)),
+            salience=round(rng.random(), 1),  # plenty of ties
+            status=rng.choice(STATUSES),
+            timestamp=f"2026-01-{rng.randint(1, 28):02d}T00:00:00+00:00",
+            module_tag=rng.choice([None, "work", "home"]),
+        )
+        for item_id in range(1, count + 1)
+    ]
+
+
+def full_scan(items, mem_type=None, tags=None, module_tag=None, status=None, min_salience=None, limit=50):
+    """Reference query: filter every item, then sort."""
+    matches = [
+        i for i in items
+        if (not mem_type or i.type == mem_type)
+        and (not tags or set(tags) & set(i.tags))
+        and (not module_tag or i.module_tag == module_tag)
+        and (not status or i.status == status)
+        and (min_salience is None or i.salience >= min_salience)
+    ]
+    matches.sort(key=lambda i: (-i.salience, i.timestamp, i.id))
+    return [i.id for i in matches[:limit]]
+
+
+class TestSalienceBuckets(unittest.TestCase):
+
+    def setUp(self):
+        self.items = random_items(400)
+        self.index = MemoryIndex()
+        self.index.rebuild(self.items)
+
+    def assert_matches_full_scan(self, items):
+        for filters in (
+            {},
+            {"limit": 5},
+            {"status": "active"},
+            {"mem_type": "procedural", "limit": 10},
+            {"status": "stale", "mem_type": "episodic"},
+            {"min_salience": 0.7},
+            {"status": "active", "min_salience": 0.5, "limit": 500},
+            {"tags": ["docker"]},
+            {"tags": ["cooking", "travel"], "status": "active"},
+            {"module_tag": "work", "mem_type": "semantic"},
+            {"tags": ["k8s"], "module_tag": "home", "min_salience": 0.3},
+            {"tags": ["missing"]},
+            {"limit": 0},
+        ):
+            with self.subTest(filters=filters):
+                self.assertEqual([i.id for i in self.index.query(**filters)], full_scan(items, **filters))
+
+    def test_query_matches_a_full_scan(self):
+        self.assert_matches_full_scan(self.items)
+
+    def test_selective_tag_filter_sorts_its_ids_directly(self):
+        rare = item(1000, tags=["rare"], salience=0.2)
+        self.index.add(rare)
+        self.assertEqual([i.id for i in self.index.query(tags=["rare"])], [1000])
+        self.assertEqual(self.index.query(tags=["rare"], min_salience=0.5), [])
+
+    def test_updates_move_items_between_buckets(self):
+        rng = random.Random(11)
+        for changed in rng.sample(self.items, 120):
+            changed.salience = round(rng.random(), 1)
+            changed.status = rng.choice(STATUSES)
+            changed.type = rng.choice(TYPES)
+            changed.tags = rng.sample(TAGS, 1)
+            changed.module_tag = rng.choice([None, "work"])
+            self.index.update(changed)  # mutated in place: the index must use its own record
+        removed = {i.id for i in self.items[:50]}
+        self.index.remove_many(list(removed))
+        self.index.remove(9999)
+
+        remaining = [i for i in self.items if i.id not in removed]
+        self.assert_matches_full_scan(remaining)
+        bucket_ids = [key[2] for bucket in self.index.by_salience.values() for key in bucket]
+        self.assertEqual(sorted(bucket_ids), sorted(i.id for i in remaining))
+
+    def test_status_change_leaves_the_old_set(self):
+        stored = item(1, tags=["docker"], module_tag="work")
+        self.index.rebuild([stored])
+        stored.status = "archived"
+        stored.tags = ["k8s"]
+        stored.module_tag = None
+        self.index.update(stored)
+
+        self.assertEqual(self.index.ids_by_status("active"), set())
+        self.assertEqual(self.index.ids_by_status("archived"), {1})
+        self.assertEqual(self.index.ids_by_tag("docker"), set())
+        self.assertEqual(self.index.ids_by_module("work"), set())
+        self.assertEqual(self.index.query(status="active"), [])
+        self.assertEqual([i.id for i in self.index.query(status="archived", tags=["k8s"])], [1])
+
+    def test_ties_break_on_timestamp_then_id(self):
+        self.index.rebuild([
+            item(3, timestamp="2026-01-02T00:00:00+00:00"),
+            item(2, timestamp="2026-01-01T00:00:00+00:00"),
+            item(1, timestamp="2026-01-02T00:00:00+00:00"),
+            item(4, salience=0.9, timestamp="2026-01-03T00:00:00+00:00"),
+        ])
+        self.assertEqual([i.id for i in self.index.query()], [4, 2, 1, 3])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+# tests/test_memory_journal.py
+"""
+Long-Term Memory Journal — Test Suite
+
+LongTermMemory appends mutations to memory_journal.jsonl, replays it on
+top of the snapshot files at load (trimming a record torn by a crash),
+and compacts it into the snapshots once it passes its size or age
+threshold — including when the process goes idle — and at shutdown
+(one exit hook, holding the live engines weakly).
+
+Run with: python -m pytest tests/test_memory_journal.py -v
+Or standalone: python tests/test_memory_journal.py
+"""
+
+import gc
+import json
+import os
+import sys
+import tempfile
+import time
+import weakref
+from pathlib import Path
+from unittest import mock
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import unittest
+
+from kernel.memory import memory_engine
+from kernel.memory.memory_engine import LongTermMemory, MemoryEngine, MemoryItem
+
+
+def item(item_id, payload="Docker uses layers", **fields):
+    return MemoryItem(id=item_id, type="semantic", tags=["docker"], payload=payload,
+                      timestamp="2026-01-01T00:00:00+00:00", **fields)
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+class TestJournalReplay(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.data_dir = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def reopen(self):
+        return LongTermMemory(self.data_dir)
+
+    def test_mutations_append_instead_of_rewriting_snapshots(self):
+        ltm = LongTermMemory(self.data_dir)
+        ltm.store(item(1))
+        ltm.store_many([item(2, "Pods run containers"), item(3, "Helm packages charts")])
+        ltm.update(item(1, "Docker images have layers"))
+        ltm.delete(3)
+
+        self.assertFalse(ltm.files["semantic"].exists())
+        lines = ltm.journal_file.read_text(encoding="utf-8").splitlines()
+        self.assertEqual([json.loads(line)["op"] for line in lines], ["put", "put", "update", "delete"])
+        self.assertEqual(ltm.journal_stats()["journal_records"], 4)
+
+    def test_replay_restores_state_and_next_id(self):
+        ltm = LongTermMemory(self.data_dir)
+        for item_id in ltm.get_next_ids(3):
+            ltm.store(item(item_id, f"memory {item_id}"))
+        ltm.update(item(2, "memory 2 edited"))
+        ltm.delete_many([1])
+
+        reloaded = self.reopen()
+        self.assertEqual({i.id: i.payload for i in reloaded.get_all()}, {2: "memory 2 edited", 3: "memory 3"})
+        self.assertEqual(reloaded.get(2).version, 2)
+        self.assertEqual(reloaded.get_next_id(), 4)
+        self.assertEqual(reloaded.journal_stats()["journal_records"], 5)
+
+    def test_replay_applies_journal_on_top_of_snapshot(self):
+        ltm = LongTermMemory(self.data_dir)
+        ltm.store_many([item(1, "old"), item(2, "kept")])
+        ltm.compact()
+        ltm.update(item(1, "new"))
+        ltm.store(item(3, "after compaction"))
+
+        reloaded = self.reopen()
+        self.assertEqual({i.id: i.payload for i in reloaded.get_all()}, {1: "new", 2: "kept", 3: "after compaction"})
+
+    def test_crash_truncated_tail_is_skipped(self):
+        ltm = LongTermMemory(self.data_dir)
+        ltm.store(item(1, "complete record"))
+        ltm.store(item(2, "torn record"))
+        ltm._close_journal_unlocked()
+        data = ltm.journal_file.read_bytes()
+        ltm.journal_file.write_bytes(data[: len(data) - 20])  # crash mid-append
+
+        reloaded = self.reopen()
+        self.assertEqual([i.payload for i in reloaded.get_all()], ["complete record"])
+        reloaded.store(item(3, "written after recovery"))
+        self.assertEqual(sorted(i.id for i in self.reopen().get_all()), [1, 3])
+
+    def test_interrupted_compaction_segment_is_replayed(self):
+        ltm = LongTermMemory(self.data_dir)
+        ltm.store(item(1, "in the rotated segment"))
+        ltm._close_journal_unlocked()
+        os.replace(ltm.journal_file, ltm.compacting_file)  # crashed before the snapshot was written
+        ltm = self.reopen()
+        ltm.store(item(2, "in the live journal"))
+
+        reloaded = self.reopen()
+        self.assertEqual(sorted(i.payload for i in reloaded.get_all()), ["in the live journal", "in the rotated segment"])
+        self.assertTrue(reloaded.compact())
+        self.assertFalse(reloaded.compacting_file.exists())
+        self.assertEqual(len(self.reopen().get_all()), 2)
+
+
+class TestJournalCompaction(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.data_dir = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_compaction_folds_journal_into_snapshots(self):
+        ltm = LongTermMemory(self.data_dir)
+        ltm.store_many([item(1), item(2, "Pods run containers")])
+        ltm.delete(2)
+
+        self.assertTrue(ltm.compact())
+        self.assertFalse(ltm.journal_file.exists())
+        snapshot = json.loads(ltm.files["semantic"].read_text(encoding="utf-8"))
+        self.assertEqual([i["id"] for i in snapshot["items"]], [1])
+        stats = ltm.journal_stats()
+        self.assertEqual((stats["journal_records"], stats["journal_bytes"], stats["compactions"]), (0, 0, 1))
+        self.assertFalse(ltm.compact())  # nothing left to fold
+
+    def test_size_threshold_compacts_in_background(self):
+        ltm = LongTermMemory(self.data_dir, journal_max_bytes=2048)
+        for item_id in range(1, 30):
+            ltm.store(item(item_id, "x" * 100))
+
+        self.assertTrue(wait_for(lambda: ltm.journal_stats()["compactions"] >= 1))
+        self.assertTrue(wait_for(lambda: not ltm.journal_stats()["compaction_pending"]))
+        self.assertEqual(len(LongTermMemory(self.data_dir).get_all()), 29)
+
+    def test_idle_journal_compacts_after_max_age(self):
+        ltm = LongTermMemory(self.data_dir, journal_max_age=0.1)
+        ltm.store(item(1))
+        self.assertEqual(ltm.journal_stats()["compactions"], 0)
+
+        # No further appends: the age timer alone must trigger the compaction
+        self.assertTrue(wait_for(lambda: ltm.journal_stats()["compactions"] == 1))
+        self.assertFalse(ltm.journal_file.exists())
+        self.assertIn("Docker uses layers", ltm.files["semantic"].read_text(encoding="utf-8"))
+
+    def test_age_timer_rearms_for_a_restarted_journal(self):
+        ltm = LongTermMemory(self.data_dir, journal_max_age=0.2)
+        ltm.store(item(1))
+        ltm.compact()
+        time.sleep(0.1)
+        ltm.store(item(2))  # journal restarted halfway through the first timer
+
+        self.assertTrue(wait_for(lambda: ltm.journal_stats()["compactions"] == 2))
+        self.assertEqual(ltm.journal_stats()["journal_records"], 0)
+
+    def test_engine_shutdown_compacts_pending_journal(self):
+        engine = MemoryEngine(self.data_dir)
+        engine.store("Kubernetes schedules pods", mem_type="semantic", tags=["k8s"])
+        self.assertGreater(engine.get_storage_stats()["journal_records"], 0)
+
+        engine.shutdown()
+        self.assertFalse(engine.long_term.journal_file.exists())
+        reloaded = LongTermMemory(self.data_dir)
+        self.assertEqual([i.payload for i in reloaded.get_all()], ["Kubernetes schedules pods"])
+        self.assertEqual(reloaded.journal_stats()["journal_records"], 0)
+
+    @mock.patch.object(memory_engine, "_live_engines", weakref.WeakSet())  # only this test's engine
+    def test_exit_hook_holds_engines_weakly(self):
+        engine = MemoryEngine(self.data_dir)
+        engine.store("Kubernetes schedules pods", mem_type="semantic", tags=["k8s"])
+        ref = weakref.ref(engine)
+        self.assertIn(engine, memory_engine._live_engines)
+
+        memory_engine._shutdown_live_engines()  # what runs at interpreter exit
+        self.assertFalse(engine.long_term.journal_file.exists())
+        self.assertNotIn(engine, memory_engine._live_engines)
+
+        del engine
+        gc.collect()
+        self.assertIsNone(ref())  # not pinned until exit
+
+    def test_shutdown_of_unloaded_store_does_nothing(self):
+        ltm = LongTermMemory(self.data_dir)
+        ltm.shutdown()
+        self.assertFalse(ltm.meta_file.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
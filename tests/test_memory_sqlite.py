@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+# tests/test_memory_sqlite.py
+"""
+SQLite Memory Backend — Test Suite
+
+SQLiteLongTermMemory / SQLiteMemoryIndex keep the LongTermMemory and
+MemoryIndex contracts (ids, versions, tag filters, recall order) as SQL;
+keyword search goes through the FTS5 index (kept in step by triggers) or
+LIKE scans without FTS5; MemoryEngine(backend="sqlite") runs on them.
+migrate_json_store() copies the JSON backend (snapshot files, journal and
+trace side store) into SQLite and leaves the JSON files exactly as they
+were.
+
+Run with: python -m pytest tests/test_memory_sqlite.py -v
+Or standalone: python tests/test_memory_sqlite.py
+"""
+
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import unittest
+
+from kernel.memory.memory_engine import LongTermMemory, MemoryEngine, MemoryIndex, MemoryItem
+from kernel.memory.memory_sqlite import SQLiteLongTermMemory, SQLiteMemoryIndex, migrate_json_store
+
+
+def item(item_id, payload, mem_type="semantic", tags=("general",), **fields):
+    return MemoryItem(id=item_id, type=mem_type, tags=list(tags), payload=payload,
+                      timestamp="2026-01-01T00:00:00+00:00", **fields)
+
+
+def file_bytes(memory_dir):
+    return {path.name: path.read_bytes() for path in sorted(memory_dir.iterdir()) if path.is_file()}
+
+
+class TestSQLiteStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.data_dir = Path(self.tmp.name)
+        self.store = SQLiteLongTermMemory(self.data_dir)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_round_trip_and_versions(self):
+        ids = self.store.get_next_ids(2)
+        self.assertEqual(ids, [1, 2])
+        self.store.store_many([
+            item(1, "Docker uses layers", tags=["docker", "containers"], trace={"source_turn": 3}),
+            item(2, "Pods run containers", tags=["k8s"], module_tag="infra"),
+        ])
+        self.store.update(item(1, "Docker images use layers", tags=["docker"], trace={"source_turn": 3}))
+
+        reopened = SQLiteLongTermMemory(self.data_dir)
+        first = reopened.get(1)
+        self.assertEqual((first.payload, first.tags, first.version, first.trace), ("Docker images use layers", ["docker"], 2, {"source_turn": 3}))
+        self.assertEqual(reopened.get_next_id(), 3)
+        self.assertEqual(reopened.ids_by_tag("containers"), set())
+        self.assertFalse(reopened.update(item(9, "missing")))
+
+        self.assertEqual(reopened.delete_many([2, 9]), 1)
+        self.assertEqual(reopened.ids_by_tag("k8s"), set())  # tag rows cascade
+        self.assertEqual(reopened.counts()["total"], 1)
+
+    def test_query_matches_the_json_index(self):
+        items = [
+            item(1, "a", tags=["x"], salience=0.9),
+            item(2, "b", tags=["y"], salience=0.4, module_tag="work"),
+            item(3, "c", mem_type="procedural", tags=["x", "y"], salience=0.7, module_tag="work"),
+            item(4, "d", tags=["x"], salience=0.7, status="stale"),
+            item(5, "e", mem_type="episodic", tags=["z"], salience=0.2),
+        ]
+        self.store.store_many(items)
+        sql_index, ram_index = SQLiteMemoryIndex(self.store), MemoryIndex()
+        ram_index.rebuild([MemoryItem.from_dict(i.to_dict()) for i in items])
+
+        for filters in (
+            {},
+            {"tags": ["x"]},
+            {"tags": ["x", "y"], "min_salience": 0.5},
+            {"module_tag": "work"},
+            {"mem_type": "semantic", "status": "active"},
+            {"limit": 2},
+        ):
+            with self.subTest(filters=filters):
+                self.assertEqual(
+                    [i.id for i in sql_index.query(**filters)],
+                    [i.id for i in ram_index.query(**filters)],
+                )
+        self.assertEqual(sql_index.stats()["by_type"], ram_index.stats()["by_type"])
+
+
+class TestKeywordSearch(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = SQLiteLongTermMemory(Path(self.tmp.name))
+        self.store.store_many([
+            item(1, "docker compose starts docker containers"),
+            item(2, "kubernetes schedules containers onto nodes"),
+            item(3, "bake sourdough bread", mem_type="procedural"),
+        ])
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def search(self, *terms, **filters):
+        return [hit.id for hit, _ in self.store.keyword_search(list(terms), **filters)]
+
+    def test_fts_ranks_and_filters(self):
+        self.assertTrue(self.store.fts_enabled)
+        self.assertEqual(self.search("docker"), [1])
+        self.assertEqual(self.search("containers", "docker"), [1, 2])
+        self.assertEqual(self.search("bread", mem_type="semantic"), [])
+
+    def test_triggers_keep_fts_in_step(self):
+        self.store.update(item(2, "kubernetes schedules pods"))
+        self.store.delete(1)
+        self.assertEqual(self.search("containers"), [])
+        self.assertEqual(self.search("pods"), [2])
+
+    def test_like_fallback_without_fts(self):
+        self.store.fts_enabled = False
+        self.assertEqual(self.search("containers", "docker"), [1, 2])
+        self.assertEqual(self.search("sourdough"), [3])
+
+
+class TestSQLiteEngine(unittest.TestCase):
+
+    def test_engine_runs_on_sqlite(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = MemoryEngine(Path(tmp), backend="sqlite")
+            kept = engine.store("Terraform plans infrastructure", tags=["iac"], salience=0.8)
+            gone = engine.store("Ansible runs playbooks", tags=["iac"])
+            engine.delete_many([gone.id])
+
+            self.assertEqual([i.id for i in engine.recall(tags=["iac"])], [kept.id])
+            self.assertEqual([i.id for i, _ in engine.keyword_search("terraform infrastructure")], [kept.id])
+            engine.flush()
+            self.assertIsNotNone(engine.long_term.get(kept.id).last_used_at)
+            self.assertEqual(engine.get_storage_stats()["backend"], "sqlite")
+            engine.shutdown()
+
+        with self.assertRaises(ValueError):
+            MemoryEngine(Path("."), backend="redis")
+
+
+class TestMigrateJsonStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.data_dir = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_json_files_are_left_untouched(self):
+        memory_dir = self.data_dir / "memory"
+        memory_dir.mkdir()
+        # Pre-v0.12 snapshot: heavy trace field inline, plus a pending journal record
+        snapshot = {"version": "0.5.4", "items": [
+            item(1, "Sprint retro", mem_type="episodic", tags=["wm-snapshot"],
+                 trace={"wm_snapshot": {"topic": "Sprint retro"}}).to_dict(),
+        ]}
+        (memory_dir / "episodic_memory.json").write_text(json.dumps(snapshot), encoding="utf-8")
+        (memory_dir / "memory_meta.json").write_text(json.dumps({"version": "0.5.4", "next_id": 2}), encoding="utf-8")
+        record = {"op": "put", "item": item(2, "Docker uses layers").to_dict(), "next_id": 3}
+        (memory_dir / "memory_journal.jsonl").write_text(json.dumps(record) + "\n", encoding="utf-8")
+        before = file_bytes(memory_dir)
+
+        db = SQLiteLongTermMemory(self.data_dir, db_path=self.data_dir / "m.db")  # opens empty, migrates
+        self.assertEqual(db.counts()["total"], 2)
+        self.assertEqual(migrate_json_store(self.data_dir, store=db), 0)  # not empty any more
+        self.assertEqual(migrate_json_store(self.data_dir, store=db, force=True), 2)
+        time.sleep(0.1)  # a background compaction would have rewritten the files by now
+        self.assertEqual(file_bytes(memory_dir), before)
+
+        self.assertEqual(db.load_trace(db.get(1))["wm_snapshot"], {"topic": "Sprint retro"})
+        self.assertEqual(db.get(2).payload, "Docker uses layers")
+
+    def test_legacy_file_is_migrated(self):
+        legacy = {"version": "0.5.4", "next_id": 8, "items": [item(7, "from memory.json").to_dict()]}
+        (self.data_dir / "memory.json").write_text(json.dumps(legacy), encoding="utf-8")
+
+        db = SQLiteLongTermMemory(self.data_dir)
+        self.assertEqual([i.payload for i in db.get_all()], ["from memory.json"])
+        self.assertEqual(db.get_next_id(), 8)
+        self.assertFalse((self.data_dir / "memory" / "semantic_memory.json").exists())
+
+    def test_empty_json_store_migrates_nothing(self):
+        self.assertEqual(migrate_json_store(self.data_dir), 0)
+
+    def test_read_only_store_refuses_writes(self):
+        ltm = LongTermMemory(self.data_dir, read_only=True)
+        with self.assertRaises(RuntimeError):
+            ltm.store(item(1, "Kubernetes schedules pods"))
+        self.assertFalse(ltm.compact())
+
+
+if __name__ == "__main__":
+    unittest.main()
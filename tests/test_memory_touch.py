@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# tests/test_memory_touch.py
+"""
+Memory Touch Buffering — Test Suite
+
+MemoryEngine updates last_used_at of recalled memories in RAM at once and
+persists the touches as one batched journal record: on a timer, on
+flush(), or at shutdown. touch="sync" writes straight away and
+touch=False leaves the items alone.
+
+Run with: python -m pytest tests/test_memory_touch.py -v
+Or standalone: python tests/test_memory_touch.py
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest import mock
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import unittest
+
+from kernel.memory import memory_engine
+from kernel.memory.memory_engine import LongTermMemory, MemoryEngine
+
+
+class TestTouchBuffer(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.data_dir = Path(self.tmp.name)
+        self.engine = MemoryEngine(self.data_dir)
+        self.ids = [self.engine.store(f"fact {i}", tags=["facts"]).id for i in range(5)]
+
+    def tearDown(self):
+        self.engine.flush()
+        self.tmp.cleanup()
+
+    def journal_records(self):
+        return self.engine.get_storage_stats()["journal_records"]
+
+    def persisted(self):
+        return {item.id: item.last_used_at for item in LongTermMemory(self.data_dir).get_all()}
+
+    def test_recall_touches_in_memory_and_defers_the_write(self):
+        records, version = self.journal_records(), self.engine.store_version
+        items = self.engine.recall(tags=["facts"], limit=3)
+
+        self.assertTrue(all(item.last_used_at for item in items))
+        self.assertEqual(self.journal_records(), records)
+        self.assertEqual(self.engine.store_version, version)  # touches never bump it
+        self.assertEqual(self.engine.get_storage_stats()["pending_touches"], 3)
+        self.assertEqual(set(self.persisted().values()), {None})
+
+    def test_flush_writes_all_touches_as_one_record(self):
+        records = self.journal_records()
+        self.engine.recall(tags=["facts"], limit=2)
+        self.engine.recall(tags=["facts"], limit=5)
+        self.engine.touch(self.ids[:1])
+
+        self.assertEqual(self.engine.flush(), 5)
+        self.assertEqual(self.journal_records(), records + 1)
+        stats = self.engine.get_storage_stats()
+        self.assertEqual((stats["pending_touches"], stats["touch_flushes"]), (0, 1))
+        self.assertEqual(self.persisted(), {item.id: item.last_used_at for item in self.engine.recall(touch=False)})
+        self.assertEqual(self.engine.flush(), 0)
+
+    def test_timer_flushes_without_a_call(self):
+        with mock.patch.object(memory_engine, "TOUCH_FLUSH_INTERVAL", 0.05):
+            self.engine.touch(self.ids)
+        deadline = time.monotonic() + 5
+        while self.engine.get_storage_stats()["touch_flushes"] == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(self.engine.get_storage_stats()["touch_flushes"], 1)
+        self.assertNotIn(None, self.persisted().values())
+
+    def test_sync_touch_persists_now_and_clears_the_buffer(self):
+        self.engine.touch(self.ids[:2])
+        records = self.journal_records()
+        self.engine.recall(tags=["facts"], limit=5, touch="sync")
+
+        self.assertEqual(self.journal_records(), records + 1)
+        self.assertEqual(self.engine.get_storage_stats()["pending_touches"], 0)
+        self.assertNotIn(None, self.persisted().values())
+
+    def test_touch_false_leaves_items_alone(self):
+        self.engine.recall(tags=["facts"], touch=False)
+        self.assertEqual(self.engine.get_storage_stats()["pending_touches"], 0)
+        self.assertEqual({item.last_used_at for item in self.engine.recall(touch=False)}, {None})
+
+    def test_shutdown_persists_buffered_touches(self):
+        self.engine.touch(self.ids)
+        self.engine.shutdown()
+        self.assertNotIn(None, self.persisted().values())
+
+
+if __name__ == "__main__":
+    unittest.main()
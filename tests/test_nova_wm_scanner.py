@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+# tests/test_nova_wm_scanner.py
+"""
+NovaWM Pattern Scanner — Test Suite
+
+Golden outputs of the NovaWorkingMemory extractors (captured from the
+per-pattern re.finditer/re.search implementation) plus a randomized
+equivalence check of the pre-filtered scanners against per-pattern scans.
+
+Run with: python -m pytest tests/test_nova_wm_scanner.py -v
+Or standalone: python tests/test_nova_wm_scanner.py
+"""
+
+import sys
+import random
+import re
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import unittest
+
+
+def _empty(**overrides):
+    expected = {
+        "entities": [],
+        "topics": [],
+        "goals": [],
+        "tone": "neutral",
+        "tangent": None,
+        "return": None,
+        "meta": None,
+    }
+    expected.update(overrides)
+    return expected
+
+
+GOLDEN = [
+    ("I talked to Sarah yesterday about the Nova project and she seemed stressed.", _empty(
+        entities=[("Sarah", "person", "communicated with"), ("and", "project", "named project"),
+                  ("yesterday", "time", None)],
+        topics=["the Nova project and she seemed stressed"],
+        tone="stressed",
+    )),
+    ("Side note: my brother Steven wants to start a side business next month.", _empty(
+        entities=[("Steven", "person", "took action"), ("my brother", "person", "relation"),
+                  ("next month", "time", None)],
+        tangent=("side_note", "my brother steven wants to start a side business n"),
+    )),
+    ("Steven and Sarah both think the startup is doing great, but I'm not sure.", _empty(
+        entities=[("both", "person", "took action"), ("startup", "person", "being described"),
+                  ("startup", "project", "venture")],
+        tone="positive",
+    )),
+    ("I need to figure out how to pay rent by Friday at 5pm.", _empty(
+        entities=[("Friday", "time", None), ("5pm", "time", None)],
+        goals=["how to pay rent by Friday at 5pm"],
+    )),
+    ("I'm trying to decide whether to move in 3 weeks. This is frustrating.", _empty(
+        entities=[("3 ", "time", None), ("in 3 weeks", "time", None)],
+        goals=["decide whether to move in 3 weeks"],
+    )),
+    ("Called with Mike, texted Jen, Jen's dog was sick, met with Ana.", _empty(
+        entities=[("Mike", "person", "communicated with"), ("Jen", "person", "communicated with"),
+                  ("Ana", "person", "communicated with"), ("dog", "person", "being described")],
+    )),
+    ("honestly this guy at work keeps emailing me about project Falcon, so annoying", _empty(
+        entities=[("this guy", "person", "informal reference"), ("about", "project", "named project"),
+                  ("Falcon", "project", "named project")],
+        topics=["project Falcon"],
+    )),
+    ("at 10:30 AM or 7pm in 2025, last week and next year", _empty(
+        entities=[("last week", "time", None), ("next year", "time", None), ("10:30 AM", "time", None),
+                  ("7pm", "time", None), ("2025", "time", None)],
+    )),
+    ("discussing the merger regarding Q3, about the plan.", _empty(
+        topics=["the plan", "the merger regarding Q3"],
+    )),
+    ("Quick tangent — the woman named Alice is my coworker", _empty(
+        entities=[("Alice", "person", "being described"), ("my coworker", "person", "relation"),
+                  ("the woman", "person", "informal reference")],
+        tangent=("quick_tangent", "— the woman named alice is my coworker"),
+    )),
+    ("Anyway, back to the budget", _empty(**{"return": ("anyway_back", None)})),
+    ("back to the house hacking plan", _empty(
+        entities=[("house hacking", "project", "strategy")],
+        **{"return": ("back_to", "house")},
+    )),
+    ("where were we again?", _empty(**{"return": ("where_were_we", None)})),
+    ("What were we talking about?", _empty(meta=("topic_recall", None))),
+    ("Can you remind me what Tom said about the budget?", _empty(
+        entities=[("Tom", "person", "took action")],
+        topics=["the budget"],
+        meta=("event_recall_said", "tom"),
+    )),
+    ("remind me who Kim is", _empty(
+        entities=[("Kim", "person", "being described")],
+        meta=("reminder", "kim"),
+    )),
+    ("What did Sarah suggest?", _empty(
+        entities=[("Sarah", "person", "took action")],
+        meta=("event_recall_suggested", "sarah"),
+    )),
+    ("who are they again?", _empty(meta=("group_recall", None))),
+    ("catch me up", _empty(meta=("context_recall", None))),
+    ("dunno, idk. feeling lost and I don't understand", _empty(tone="confused")),
+    ("ok", _empty()),
+    ("", _empty()),
+]
+
+
+def _extract(message):
+    from kernel.memory.nova_wm import NovaWorkingMemory
+
+    wm = NovaWorkingMemory("golden")
+    tangent = wm._check_tangent_patterns(message)
+    topic_return = wm._check_return_patterns(message)
+    meta = wm.check_meta_question(message)
+    return {
+        "entities": [(e.name, e.entity_type.value, e.description) for e in wm._extract_entities(message)],
+        "topics": [t.name for t in wm._extract_topics(message)],
+        "goals": [g.description for g in wm._extract_goals(message)],
+        "tone": wm._detect_emotional_tone(message).value,
+        "tangent": tangent and (tangent["trigger"], tangent["tangent_topic"]),
+        "return": topic_return and (topic_return["trigger"], topic_return["target_topic"]),
+        "meta": meta and (meta["type"], meta.get("entity_mentioned")),
+    }
+
+
+class TestGoldenExtraction(unittest.TestCase):
+    """Extractor output matches the pre-scanner implementation."""
+
+    def test_golden_messages(self):
+        for message, expected in GOLDEN:
+            with self.subTest(message=message):
+                self.assertEqual(_extract(message), expected)
+
+    def test_update_uses_scanner_results(self):
+        from kernel.memory.nova_wm import NovaWorkingMemory
+
+        wm = NovaWorkingMemory("golden-update")
+        result = wm.update("I talked to Sarah yesterday and she seemed stressed.")
+        self.assertEqual(result["entities_extracted"], ["Sarah", "yesterday"])
+        self.assertEqual(result["emotional_tone"], "stressed")
+
+
+class TestScannerEquivalence(unittest.TestCase):
+    """Pre-filtered scanner == running every pattern on its own."""
+
+    WORDS = (
+        "I you my the this with talked to met said is was project side business startup Sarah "
+        "Tom Bob's about regarding discussing trying need figure out decide planning 5pm 10:30 "
+        "2024 in 3 days yesterday Monday stressed happy maybe idk quick tangent back anyway "
+        "where were we who what did say remind me catch up context , . ? ! — Nova house hack "
+        "İstanbul ſide"
+    ).split()
+
+    def _corpus(self, count=1500):
+        rng = random.Random(7)
+        corpus = [message for message, _ in GOLDEN]
+        for _ in range(count):
+            message = " ".join(rng.choice(self.WORDS) for _ in range(rng.randint(1, 16)))
+            if rng.random() < 0.3:
+                message = message.capitalize()
+            if rng.random() < 0.1:
+                message = "  " + message.upper() + " "
+            corpus.append(message)
+        return corpus
+
+    @staticmethod
+    def _per_pattern(scanner, text):
+        target = text.lower().strip() if scanner.lowercase else text
+        hits = []
+        for rule in scanner.rules:
+            found = [(m.start(), m.end(), m.group(0), m.groups()) for m in re.finditer(rule.pattern, target, rule.flags)]
+            if found:
+                hits.append((rule.family, rule.pattern, found))
+        return hits
+
+    @staticmethod
+    def _scanned(scanner, text):
+        result = scanner.scan(text)
+        hits = []
+        for family in dict.fromkeys(rule.family for rule in scanner.rules):
+            for rule, matches in result.matches(family):
+                found = [(m.start(), m.end(), m.group(0), m.groups()) for m in matches]
+                hits.append((rule.family, rule.pattern, found))
+        return hits
+
+    def test_scanners_match_per_pattern_scans(self):
+        from kernel.memory.nova_wm import MESSAGE_SCANNER, LOWERED_SCANNER
+
+        for scanner in (MESSAGE_SCANNER, LOWERED_SCANNER):
+            for message in self._corpus():
+                with self.subTest(message=message, lowercase=scanner.lowercase):
+                    self.assertEqual(self._scanned(scanner, message), self._per_pattern(scanner, message))
+
+    def test_prefilter_skips_most_rules_on_short_messages(self):
+        from kernel.memory.nova_wm import NovaWorkingMemory, MESSAGE_SCANNER
+
+        before = MESSAGE_SCANNER.stats()
+        NovaWorkingMemory("prefilter").update("ok thanks")
+        after = MESSAGE_SCANNER.stats()
+        self.assertEqual(after["rules_run"], before["rules_run"])
+        self.assertEqual(after["scans"], before["scans"] + 1)
+
+
+class TestPatternScanner(unittest.TestCase):
+    """Scanner mechanics on a small rule set."""
+
+    def _scanner(self):
+        from kernel.memory.nova_wm_scanner import PatternScanner, ScanRule
+
+        return PatternScanner([
+            ScanRule("name", "is", r"\b([A-Z][a-z]+)\s+is\b", re.IGNORECASE, ("is",)),
+            ScanRule("name", "with", r"\bwith\s+([A-Z][a-z]+)\b", re.IGNORECASE, ("with",)),
+            ScanRule("word", None, r"\bok\b", 0, ()),
+        ])
+
+    def test_overlapping_rules_all_reported(self):
+        result = self._scanner().scan("with Sam is here, with Kim")
+        hits = [(rule.label, [m.group(1) for m in matches]) for rule, matches in result.matches("name")]
+        self.assertEqual(hits, [("is", ["Sam"]), ("with", ["Sam", "Kim"])])
+
+    def test_first_and_lastindex(self):
+        scanner = self._scanner()
+        rule, match = scanner.scan("ok then").first("word")
+        self.assertEqual(match.group(0), "ok")
+        self.assertIsNone(match.lastindex)
+        self.assertIsNone(scanner.scan("nothing here").first("name"))
+
+    def test_prefilter_skips_families_and_rules(self):
+        scanner = self._scanner()
+        result = scanner.scan("plain words")
+        self.assertEqual(list(result.matches("name")), [])
+        stats = scanner.stats()
+        self.assertEqual((stats["families_skipped"], stats["rules_skipped"]), (1, 2))
+
+        result = scanner.scan("Sam is here")
+        self.assertEqual([rule.label for rule, _ in result.matches("name")], ["is"])
+        self.assertEqual(scanner.stats()["rules_skipped"], 3)  # "with" rule
+
+    def test_rules_run_lazily(self):
+        scanner = self._scanner()
+        result = scanner.scan("ok, with Sam")
+        self.assertEqual(scanner.stats()["rules_run"], 0)
+        result.first("word")
+        self.assertEqual(scanner.stats()["rules_run"], 1)
+
+    def test_last_scan_is_reused(self):
+        scanner = self._scanner()
+        first = scanner.scan("with Sam")
+        self.assertIs(scanner.scan("with Sam"), first)
+        self.assertEqual(scanner.stats()["memo_hits"], 1)
+
+    def test_non_ascii_bypasses_prefilter(self):
+        from kernel.memory.nova_wm_scanner import PatternScanner, ScanRule
+
+        scanner = PatternScanner([ScanRule("x", None, r"\bside\b", re.IGNORECASE, ("side",))])
+        self.assertIsNotNone(scanner.scan("\u017fide").first("x"))  # long s folds to "s"
+
+
+if __name__ == "__main__":
+    unittest.main()
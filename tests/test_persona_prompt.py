@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# tests/test_persona_prompt.py
+"""
+Persona Prompt Compiler — Test Suite
+
+PersonaEngine serves styles and system prompts from precompiled
+(intent, wants_structure) variants, recompiles when traits or preferences
+change, and appends volatile context after a byte-stable prefix.
+
+Run with: python -m pytest tests/test_persona_prompt.py -v
+Or standalone: python tests/test_persona_prompt.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import unittest
+
+from persona.nova_persona import (
+    PRIMARY_INTENTS, ResponseStyle, TraitAxis,
+    apply_config_overrides, make_default_nova_persona_engine,
+)
+
+
+class TestPersonaPromptCompiler(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = make_default_nova_persona_engine()
+
+    def test_variants_match_uncached_render(self):
+        basis = self.engine.style_basis()
+        for intent in PRIMARY_INTENTS:
+            for wants_structure in (False, True):
+                variant = self.engine.prompts.variant(intent, wants_structure)
+                expected = self.engine._derive_style(basis, intent, wants_structure)
+                self.assertEqual(variant.style, expected)
+                self.assertEqual(variant.system_prompt, self.engine._render_system_prompt(expected))
+        self.assertEqual(self.engine.prompts.stats()["compiles"], 1)
+
+    def test_turns_reuse_the_same_prompt(self):
+        first = self.engine.build_system_prompt(self.engine.compute_style("I'm exhausted"))
+        second = self.engine.build_system_prompt(self.engine.compute_style("so tired today"))
+        self.assertIs(first, second)
+        self.assertIn("Keep this response brief", first)
+
+    def test_compute_style_returns_a_copy(self):
+        style = self.engine.compute_style("hello")
+        style.warmth = 0.0
+        self.assertNotEqual(self.engine.compute_style("hello").warmth, 0.0)
+
+        analysis = self.engine.analyze_message("hello")
+        analysis["primary_intent"] = "distress"
+        self.assertEqual(self.engine.analyze_message("hello")["primary_intent"], "connection")
+
+    def test_recent_context_after_stable_prefix(self):
+        style = self.engine.compute_style("how do I fix this bug")
+        prefix = self.engine.build_system_prompt(style)
+        with_context = self.engine.build_system_prompt(style, recent_summary="We talked about the API.")
+        self.assertTrue(with_context.startswith(prefix))
+        self.assertTrue(with_context.endswith("[RECENT CONTEXT]\nWe talked about the API."))
+
+    def test_overrides_recompile(self):
+        before = self.engine.compute_style("tell me something")
+        apply_config_overrides(self.engine, {"traits": {"analytical_depth": 0.4}})
+        after = self.engine.compute_style("tell me something")
+        self.assertNotEqual(before.analytical_depth, after.analytical_depth)
+        self.assertEqual(after.analytical_depth, self.engine.traits.get_score(TraitAxis.ANALYTICAL_DEPTH))
+        self.assertIn(f"Analytical depth: {after.analytical_depth:.2f}", self.engine.build_system_prompt(after))
+        self.assertEqual(self.engine.prompts.stats()["compiles"], 2)
+
+    def test_custom_style_rendered_once(self):
+        style = ResponseStyle(warmth=0.61, response_length="long")
+        self.assertIs(self.engine.build_system_prompt(style), self.engine.build_system_prompt(style))
+        self.assertIn("Warmth: 0.61", self.engine.build_system_prompt(style))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# tests/test_persona_streaming.py
+"""
+Persona Streaming — Test Suite
+
+StreamingRewriter catches tone/policy patterns split across chunks,
+NovaPersona.stream_response() yields the same text generate_response()
+plus post_llm would, and stream_user_message() emits tokens before the
+completion with time-to-first-token in its meta.
+
+Run with: python -m pytest tests/test_persona_streaming.py -v
+Or standalone: python tests/test_persona_streaming.py
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import unittest
+
+from system.config import Config
+from kernel.policy_engine import PolicyEngine
+from kernel.context_assembly import AssembledContext
+from persona.nova_persona import NovaPersona, StreamingRewriter, enforce_tone
+
+FILLER = "The light over the harbor was soft this evening and the water stayed calm. " * 4
+REPLY = FILLER + "As an AI language model I'll run the status command for you!!! " + FILLER
+
+
+def chunked(text, size):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+class FakeLLM:
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    def complete(self, **kwargs):
+        return {"text": "".join(self.chunks), "model": "fake"}
+
+    def stream_complete_persona(self, **kwargs):
+        yield from self.chunks
+
+
+class TestStreamingRewriter(unittest.TestCase):
+
+    def setUp(self):
+        self.policy = PolicyEngine(Config(data_dir=Path(tempfile.gettempdir())))
+
+    def rewrite(self, text):
+        return self.policy.post_llm(enforce_tone(text)[0])
+
+    def test_split_patterns_match_whole_text_rewrite(self):
+        expected = self.rewrite(REPLY)
+        self.assertIn("as Nova, I do have some limits", expected)
+        for size in (1, 3, 7, 40, 500):
+            rewriter = StreamingRewriter(self.rewrite)
+            out = [rewriter.feed(chunk) for chunk in chunked(REPLY, size)]
+            out.append(rewriter.finish())
+            self.assertEqual("".join(out), expected, f"chunk size {size}")
+
+    def test_releases_text_before_the_end(self):
+        rewriter = StreamingRewriter(self.rewrite)
+        released = "".join(rewriter.feed(chunk) for chunk in chunked(REPLY, 10))
+        self.assertTrue(released)
+        self.assertLessEqual(len(REPLY) - len(released), rewriter.window + 40)
+
+
+class TestPersonaStream(unittest.TestCase):
+
+    def test_stream_matches_generate_response(self):
+        chunks = ["  "] + chunked(REPLY, 9) + ["  "]
+        policy = PolicyEngine(Config(data_dir=Path(tempfile.gettempdir())))
+        persona = NovaPersona(FakeLLM(chunks))
+
+        streamed = list(persona.stream_response("hi", "s1", post_process=policy.post_llm))
+        self.assertGreater(len(streamed), 1)
+        self.assertEqual("".join(streamed), policy.post_llm(persona.generate_response("hi", "s1")))
+
+    def test_empty_reply_falls_back(self):
+        persona = NovaPersona(FakeLLM(["", "  "]))
+        self.assertEqual(list(persona.stream_response("hi", "s1")), ["(persona-empty) I heard: hi"])
+
+
+class FakeKernel:
+    memory_manager = None
+
+    def __init__(self):
+        self.policy_engine = PolicyEngine(Config(data_dir=Path(tempfile.gettempdir())))
+
+    def assemble_persona_context(self, session_id, text, current_module=None):
+        return AssembledContext(
+            values={"wm": {"direct_answer": None, "wm_result": {}, "wm_context": ""}, "ltm": ""},
+            status={"wm": "ok", "ltm": "ok"},
+        )
+
+
+class TestStreamUserMessage(unittest.TestCase):
+
+    def test_tokens_then_complete(self):
+        from core.mode_router import stream_user_message
+        from core.nova_state import NovaState
+
+        state = NovaState(session_id="stream-test")
+        state.disable_novaos()
+        persona = NovaPersona(FakeLLM(chunked(REPLY, 12)))
+
+        events = list(stream_user_message("tell me about the harbor", state, FakeKernel(), persona))
+        kinds = [kind for kind, _ in events]
+        self.assertEqual(kinds[-1], "complete")
+        self.assertGreater(kinds.count("token"), 1)
+
+        result = events[-1][1]
+        self.assertEqual(result["handled_by"], "persona")
+        self.assertEqual(result["text"], "".join(p["text"] for k, p in events if k == "token"))
+        self.assertNotIn("AI language model", result["text"])
+        self.assertIsNotNone(result["meta"]["ttft_ms"])
+        self.assertLessEqual(result["meta"]["ttft_ms"], result["meta"]["total_ms"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+# tests/test_session_registry.py
+"""
+Session Registry — Test Suite
+
+LRU / idle-TTL / memory-budget eviction with spill-to-disk and transparent
+rehydration, plus to_dict(full=True)/from_dict round trips for the objects
+the registries hold (NovaWorkingMemory, WMBehaviorEngine, EpisodicIndex).
+
+Run with: python -m pytest tests/test_session_registry.py -v
+Or standalone: python tests/test_session_registry.py
+"""
+
+import sys
+import json
+import tempfile
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import unittest
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class Counter:
+    """Tiny session object with the to_dict/from_dict shape the registry expects."""
+
+    def __init__(self, session_id, value=0):
+        self.session_id = session_id
+        self.value = value
+
+    def to_dict(self):
+        return {"session_id": self.session_id, "value": self.value}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["session_id"], data["value"])
+
+
+MESSAGES = [
+    "I talked to Sarah yesterday about the Nova project and she seemed stressed.",
+    "Side note: my brother Steven wants to start a side business next month.",
+    "back to the Nova project",
+    "I need to figure out how to pay rent by Friday. Should I ask him?",
+    "What did Sarah say?",
+]
+
+
+def _normalized(data):
+    return json.loads(json.dumps(data))
+
+
+class TestSessionRegistry(unittest.TestCase):
+    """Eviction, spill and rehydration."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.clock = FakeClock()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _registry(self, **limits):
+        from kernel.memory.session_registry import SessionRegistry
+
+        limits.setdefault("memory_budget", None)
+        return SessionRegistry(
+            "test",
+            factory=Counter,
+            dump=Counter.to_dict,
+            load=Counter.from_dict,
+            spill_dir=Path(self.tmp.name),
+            clock=self.clock,
+            **limits,
+        )
+
+    def test_lru_eviction_spills_and_rehydrates(self):
+        registry = self._registry(max_sessions=2)
+        registry.get("a").value = 1
+        registry.get("b").value = 2
+        registry.get("a")            # b is now least recently used
+        registry.get("c").value = 3
+
+        self.assertEqual(len(registry), 2)
+        self.assertIn("b", registry)  # spilled, not forgotten
+        self.assertEqual(registry.get("b").value, 2)
+
+        stats = registry.stats()
+        self.assertEqual(stats["evicted_lru"], 2)  # b, then a (for b's return)
+        self.assertEqual(stats["rehydrations"], 1)
+        self.assertEqual(stats["created"], 3)
+        self.assertEqual(registry.get("a").value, 1)
+
+    def test_idle_sessions_are_evicted(self):
+        registry = self._registry(idle_ttl=60)
+        registry.get("old").value = 5
+        self.clock.now += 120
+        registry.get("new")          # admission sweeps idle sessions
+
+        stats = registry.stats()
+        self.assertEqual((stats["live_sessions"], stats["spilled_sessions"]), (1, 1))
+        self.assertEqual(stats["evicted_idle"], 1)
+        self.assertEqual(registry.get("old").value, 5)
+
+    def test_memory_budget_evicts_lru(self):
+        registry = self._registry(memory_budget=120)  # ~2 Counter dicts
+        for name in ("a", "b", "c", "d"):
+            registry.get(name)
+        stats = registry.stats()
+        self.assertLessEqual(stats["estimated_bytes"], 120)
+        self.assertGreater(stats["evicted_budget"], 0)
+        self.assertIn("d", registry._live)
+
+    def test_peek_does_not_create(self):
+        registry = self._registry()
+        self.assertIsNone(registry.peek("missing"))
+        self.assertEqual(registry.stats()["created"], 0)
+
+    def test_discard_removes_spill(self):
+        registry = self._registry(max_sessions=1)
+        registry.get("a").value = 7
+        registry.get("b")
+        self.assertIn("a", registry)
+        registry.discard("a")
+        self.assertNotIn("a", registry)
+        self.assertEqual(registry.get("a").value, 0)
+
+    def test_rehydrated_spill_file_is_removed(self):
+        registry = self._registry(max_sessions=1)
+        registry.get("a")
+        registry.get("b")
+        self.assertEqual(registry.stats()["spilled_sessions"], 1)
+        registry.get("a")
+        self.assertEqual(registry.stats()["spilled_sessions"], 1)  # now b
+
+    def test_corrupt_spill_starts_fresh(self):
+        registry = self._registry(max_sessions=1)
+        registry.get("a").value = 9
+        registry.get("b")
+        registry._spill_path("a").write_text("{not json", encoding="utf-8")
+        self.assertEqual(registry.get("a").value, 0)
+
+    def test_configure_applies_to_later_registries(self):
+        from kernel.memory import session_registry as sr
+
+        saved_registries, saved_config = dict(sr._registries), dict(sr._configured)
+        try:
+            sr.configure_session_registries(spill_dir=self.tmp.name, max_sessions=3)
+            registry = sr.register_session_registry(self._registry())
+            self.assertEqual(registry.max_sessions, 3)
+            self.assertIn("test", sr.session_stats())
+        finally:
+            sr._registries.clear()
+            sr._registries.update(saved_registries)
+            sr._configured.clear()
+            sr._configured.update(saved_config)
+
+
+class TestStateRoundTrips(unittest.TestCase):
+    """to_dict(full=True) -> from_dict() rebuilds equivalent objects."""
+
+    def _conversation(self):
+        from kernel.memory.nova_wm import NovaWorkingMemory
+        from kernel.memory.nova_wm_behavior import WMBehaviorEngine
+
+        wm = NovaWorkingMemory("round-trip")
+        engine = WMBehaviorEngine("round-trip")
+        for message in MESSAGES:
+            wm.update(message, module="work")
+            engine.update(message, wm.get_context_bundle(), module="work")
+            wm.record_nova_response("Do you want to talk to Steven about it?")
+            engine.after_response("Do you want to talk to Steven about it? Should we plan it?")
+        return wm, engine
+
+    def test_working_memory(self):
+        from kernel.memory.nova_wm import NovaWorkingMemory
+
+        wm, _ = self._conversation()
+        data = _normalized(wm.to_dict(full=True))
+        restored = NovaWorkingMemory.from_dict(data)
+
+        self.assertEqual(_normalized(restored.to_dict(full=True)), data)
+        self.assertEqual(restored.build_persona_context_string(), wm.build_persona_context_string())
+        for message in ("what about him?", "anyway, where were we"):
+            self.assertEqual(restored.update(message), wm.update(message))
+
+    def test_behavior_engine(self):
+        from kernel.memory.nova_wm_behavior import WMBehaviorEngine
+
+        _, engine = self._conversation()
+        data = _normalized(engine.to_dict(full=True))
+        restored = WMBehaviorEngine.from_dict(data)
+
+        self.assertEqual(_normalized(restored.to_dict(full=True)), data)
+        self.assertEqual(restored.build_context_string(), engine.build_context_string())
+
+    def test_episodic_index(self):
+        from kernel.memory.nova_wm_episodic import EpisodicIndex
+
+        index = EpisodicIndex("round-trip")
+        index.mark_saved("budget", "42")
+        index.mark_module_rehydrated("work")
+        restored = EpisodicIndex.from_dict(_normalized(index.to_dict()))
+        self.assertEqual(restored.to_dict(), index.to_dict())
+
+    def test_default_to_dict_unchanged(self):
+        wm, engine = self._conversation()
+        self.assertNotIn("turn_history", wm.to_dict())
+        self.assertNotIn("counters", engine.to_dict())
+
+
+class TestManagers(unittest.TestCase):
+    """NovaWMManager / BehaviorEngineManager go through a registry."""
+
+    def test_wm_manager_rehydrates_evicted_session(self):
+        from kernel.memory.nova_wm import NovaWMManager
+
+        with tempfile.TemporaryDirectory() as tmp:
+            manager = NovaWMManager()
+            manager._instances.configure(spill_dir=tmp, max_sessions=1)
+            manager.get("s1").update(MESSAGES[0])
+            manager.get("s2")
+            self.assertEqual(manager.stats()["spilled_sessions"], 1)
+
+            wm = manager.get("s1")
+            self.assertEqual(wm.turn_count, 1)
+            self.assertIn("Sarah", [e.name for e in wm.entities.values()])
+            self.assertEqual(manager.stats()["rehydrations"], 1)
+
+            manager.clear("s2")  # spilled: rehydrated, then cleared
+            manager.delete("s1")
+            self.assertEqual(manager.get("s1").turn_count, 0)
+
+    def test_behavior_manager_rehydrates_evicted_session(self):
+        from kernel.memory.nova_wm_behavior import BehaviorEngineManager
+
+        with tempfile.TemporaryDirectory() as tmp:
+            manager = BehaviorEngineManager()
+            manager._instances.configure(spill_dir=tmp, max_sessions=1)
+            manager.get("s1").set_mode("minimal")
+            manager.get("s2")
+            self.assertEqual(manager.get("s1").get_mode(), "minimal")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+# tests/test_session_state_store.py
+"""
+Session State Store — Test Suite
+
+Memory / SQLite / KV backends with per-key idle TTL, the per-request
+identity map that writes mutated objects back to shared backends, and the
+wizard/mode registries migrated onto it.
+
+Run with: python -m pytest tests/test_session_state_store.py -v
+Or standalone: python tests/test_session_state_store.py
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import unittest
+
+from kernel.utils import session_state_store as sss
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeKV:
+    """Dict-backed stand-in for KVStore's get_json/set_json/delete."""
+
+    def __init__(self):
+        self.data = {}
+        self.ttls = {}
+
+    def get_json(self, key):
+        return self.data.get(key)
+
+    def set_json(self, key, value, ttl_seconds=None):
+        self.data[key] = dict(value)
+        self.ttls[key] = ttl_seconds
+        return True
+
+    def delete(self, key):
+        return self.data.pop(key, None) is not None
+
+
+class Counter:
+    def __init__(self, value=0):
+        self.value = value
+
+    def to_dict(self):
+        return {"value": self.value}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["value"])
+
+
+def _store(ttl=None):
+    return sss.SessionStateStore("test", dump=Counter.to_dict, load=Counter.from_dict, ttl=ttl)
+
+
+class _BackendCase(unittest.TestCase):
+    """Installs a backend for the test and restores the previous one."""
+
+    def setUp(self):
+        self._saved = (sss._backend, sss._default_ttl)
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        backend = sss._backend
+        sss._backend, sss._default_ttl = self._saved
+        sss._scope.entries = {}
+        if backend is not None and backend is not self._saved[0]:
+            backend.close()
+        self.tmp.cleanup()
+
+    def use(self, backend):
+        sss._backend = backend
+        sss._scope.entries = {}
+        return backend
+
+
+class TestMemoryBackend(_BackendCase):
+
+    def test_returns_live_objects(self):
+        self.use(sss.MemoryStateBackend())
+        store = _store()
+        counter = store.get_or_create("a", Counter)
+        counter.value = 5
+        self.assertIs(store.get("a"), counter)
+        self.assertIn("a", store)
+        store.delete("a")
+        self.assertIsNone(store.get("a"))
+
+    def test_idle_ttl_slides_on_read(self):
+        clock = FakeClock()
+        self.use(sss.MemoryStateBackend(clock=clock))
+        store = _store(ttl=10)
+        store.set("a", Counter(1))
+        clock.now += 8
+        self.assertIsNotNone(store.get("a"))
+        clock.now += 8
+        self.assertIsNotNone(store.get("a"))
+        clock.now += 11
+        self.assertIsNone(store.get("a"))
+
+
+class TestSharedBackends(_BackendCase):
+
+    def _sqlite(self, clock=None):
+        path = Path(self.tmp.name) / "state.db"
+        if clock is None:
+            return sss.SQLiteStateBackend(path)
+        return sss.SQLiteStateBackend(path, clock=clock)
+
+    def test_mutations_written_back_at_scope_exit(self):
+        self.use(self._sqlite())
+        store = _store()
+        with sss.session_state_scope():
+            store.get_or_create("a", Counter).value = 3
+            self.assertEqual(store.get("a").value, 3)  # same object within scope
+        with sss.session_state_scope():
+            self.assertEqual(store.get("a").value, 3)
+
+    def test_second_worker_sees_state(self):
+        worker1 = self._sqlite()
+        worker2 = self._sqlite()
+        store = _store()
+        self.use(worker1)
+        with sss.session_state_scope():
+            store.set("a", Counter(1))
+            store.get("a").value = 2
+        self.use(worker2)
+        with sss.session_state_scope():
+            self.assertEqual(store.get("a").value, 2)
+            store.delete("a")
+        self.use(worker1)
+        with sss.session_state_scope():
+            self.assertIsNone(store.get("a"))
+        worker2.close()
+
+    def test_unchanged_objects_only_touched(self):
+        kv = FakeKV()
+        self.use(sss.KVStateBackend(kv))
+        store = _store(ttl=60)
+        with sss.session_state_scope():
+            store.set("a", Counter(1))
+        with sss.session_state_scope():
+            store.get("a")
+            self.assertEqual(sss.flush_session_states(), 0)
+        self.assertEqual(kv.data["session:test:a"], {"value": 1})
+        self.assertEqual(kv.ttls["session:test:a"], 60)
+
+    def test_sqlite_ttl_expires(self):
+        clock = FakeClock()
+        self.use(self._sqlite(clock))
+        store = _store(ttl=10)
+        with sss.session_state_scope():
+            store.set("a", Counter(1))
+        clock.now += 11
+        with sss.session_state_scope():
+            self.assertIsNone(store.get("a"))
+
+    def test_reads_outside_a_scope_are_not_cached(self):
+        worker1 = self._sqlite()
+        worker2 = self._sqlite()
+        store = _store()
+        self.use(worker1)
+        store.set("a", Counter(1))
+        self.assertEqual(store.get("a").value, 1)
+        self.use(worker2)
+        store.set("a", Counter(2))
+        self.use(worker1)
+        self.assertEqual(store.get("a").value, 2)  # not a stale identity-map copy
+        self.assertEqual(sss._scope.entries, {})
+        worker2.close()
+
+    def test_unreadable_state_is_a_miss(self):
+        kv = FakeKV()
+        self.use(sss.KVStateBackend(kv))
+        kv.data["session:test:a"] = {"unexpected": True}
+        with sss.session_state_scope():
+            self.assertIsNone(_store().get("a"))
+
+
+class TestMigratedRegistries(_BackendCase):
+    """The wizard/mode accessors keep their behavior on a shared backend."""
+
+    def setUp(self):
+        super().setUp()
+        self.use(sss.SQLiteStateBackend(Path(self.tmp.name) / "state.db"))
+
+    def test_quest_lock_state(self):
+        from kernel.quests import quest_lock_mode as qlm
+
+        with sss.session_state_scope():
+            qlm.activate_quest_lock("s1", "q1", "Quest", "run", 0, "step-0", "Intro", "Go", ["a"])
+            qlm.update_quest_lock_step("s1", 1, "step-1", "Next", "Go on", [])
+        with sss.session_state_scope():
+            self.assertTrue(qlm.is_quest_active("s1"))
+            self.assertEqual(qlm.get_quest_lock_state("s1").current_step_id, "step-1")
+            qlm.deactivate_quest_lock("s1")
+        with sss.session_state_scope():
+            self.assertFalse(qlm.is_quest_active("s1"))
+
+    def test_nova_state_mode(self):
+        from core.mode_router import get_or_create_state, get_state, clear_state
+
+        with sss.session_state_scope():
+            get_or_create_state("s1").disable_novaos()
+        with sss.session_state_scope():
+            self.assertEqual(get_state("s1").mode_name, "Persona")
+            clear_state("s1")
+        with sss.session_state_scope():
+            self.assertIsNone(get_state("s1"))
+
+    def test_dataclass_codec(self):
+        from kernel.quests.quest_delete_wizard import QuestDeleteSession
+
+        dump, load = sss.dataclass_codec(QuestDeleteSession)
+        session = QuestDeleteSession(stage="confirm_single", pending_delete_id="q1")
+        self.assertEqual(load(dict(dump(session), legacy_field=1)), session)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# tests/test_trace_store.py
+"""
+Memory Trace Store — Test Suite
+
+MemoryItem is a slotted dataclass whose to_dict()/from_dict() round-trip
+every field (older dicts get defaults). The JSON backend keeps heavy trace
+fields (WM snapshots, cached embeddings) in TraceStore, leaves a
+side_fields marker on the resident item, and merges them back through
+load_trace(), exports and MemoryEngine.trace(); deletes and imports keep
+the side store in step, and older snapshots are externalized on load.
+
+Run with: python -m pytest tests/test_trace_store.py -v
+Or standalone: python tests/test_trace_store.py
+"""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import unittest
+
+from kernel.memory.memory_engine import LongTermMemory, MemoryEngine, MemoryItem
+from kernel.memory.trace_store import SIDE_FIELDS_KEY, TraceStore, split_trace
+
+SNAPSHOT = {"topic": "Sprint retro", "entities": ["alice", "bob"], "turns": 12}
+
+
+def item(item_id, payload="Sprint retro notes", trace=None, **fields):
+    return MemoryItem(id=item_id, type="episodic", tags=["wm-snapshot"], payload=payload,
+                      timestamp="2026-01-01T00:00:00+00:00", trace=trace or {}, **fields)
+
+
+class TestMemoryItem(unittest.TestCase):
+
+    def test_round_trip_keeps_every_field(self):
+        original = item(7, trace={"source_turn": 3}, cluster_id=2, source="inference", salience=0.8,
+                        status="stale", confidence=0.6, last_used_at="2026-02-01T00:00:00+00:00",
+                        module_tag="work", version=4)
+        data = original.to_dict()
+        self.assertEqual(MemoryItem.from_dict(json.loads(json.dumps(data))), original)
+        self.assertEqual(set(data), set(MemoryItem.__slots__))
+
+    def test_slotted_and_interned(self):
+        loaded = MemoryItem.from_dict({"id": 1, "type": "semantic", "tags": ["docker"], "payload": "x",
+                                       "status": "".join(["act", "ive"])})
+        self.assertFalse(hasattr(loaded, "__dict__"))
+        with self.assertRaises(AttributeError):
+            loaded.extra = True
+        self.assertIs(loaded.status, "active")
+        self.assertIs(loaded.tags[0], sys.intern("docker"))
+
+    def test_legacy_dict_gets_defaults(self):
+        loaded = MemoryItem.from_dict({"id": "3", "type": "episodic", "payload": "old"})
+        self.assertEqual((loaded.id, loaded.tags, loaded.trace), (3, ["general"], {}))
+        self.assertEqual((loaded.salience, loaded.status, loaded.version), (0.4, "active", 1))
+
+
+class TestTraceStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = TraceStore(Path(self.tmp.name) / "traces.db")
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def test_put_get_delete(self):
+        self.assertEqual(self.store.put_many({1: {"wm_snapshot": SNAPSHOT, "embedding": [0.1, 0.2]}, 2: {"embedding": [1.0]}}), 3)
+        self.assertEqual(self.store.get(1), {"wm_snapshot": SNAPSHOT, "embedding": [0.1, 0.2]})
+        self.assertEqual(self.store.get_many([1, 2, 3], keys=["embedding"]), {1: {"embedding": [0.1, 0.2]}, 2: {"embedding": [1.0]}})
+        self.assertEqual(self.store.get(3), {})
+
+        self.store.put_many({1: {"embedding": [0.3]}})  # upsert
+        self.assertEqual(self.store.get(1, keys=["embedding"]), {"embedding": [0.3]})
+        self.assertEqual(self.store.delete_many([1, 1, 3]), 2)
+        self.assertEqual((self.store.stats()["trace_rows"], self.store.stats()["trace_memories"]), (1, 1))
+
+    def test_large_batches_are_chunked(self):
+        self.store.put_many({i: {"embedding": [float(i)]} for i in range(1, 1201)})
+        found = self.store.get_many(list(range(1, 1201)))
+        self.assertEqual(len(found), 1200)
+        self.assertEqual(found[1200], {"embedding": [1200.0]})
+        self.assertEqual(self.store.delete_many(list(range(1, 1101))), 1100)
+
+    def test_corrupt_row_is_skipped(self):
+        self.store.put_many({1: {"embedding": [1.0], "wm_snapshot": SNAPSHOT}})
+        with self.store._conn:
+            self.store._conn.execute("UPDATE trace_fields SET value = '{broken' WHERE key = 'embedding'")
+        with self.assertLogs("nova.memory.traces", level="WARNING"):
+            self.assertEqual(self.store.get(1), {"wm_snapshot": SNAPSHOT})
+
+    def test_split_trace(self):
+        trace = {"source_turn": 3, "wm_snapshot": SNAPSHOT, SIDE_FIELDS_KEY: ["embedding"]}
+        self.assertEqual(split_trace(trace), {"wm_snapshot": SNAPSHOT})
+        self.assertEqual(trace, {"source_turn": 3, SIDE_FIELDS_KEY: ["embedding", "wm_snapshot"]})
+        self.assertIsNone(split_trace({"source_turn": 3}))
+
+
+class TestSideStoredTraces(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.data_dir = Path(self.tmp.name)
+        self.ltm = LongTermMemory(self.data_dir)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_heavy_fields_leave_the_resident_item(self):
+        trace = {"source_turn": 3, "wm_snapshot": SNAPSHOT}
+        self.ltm.store(item(1, trace=trace))
+        self.assertEqual(trace, {"source_turn": 3, "wm_snapshot": SNAPSHOT})  # caller's dict untouched
+
+        resident = self.ltm.get(1)
+        self.assertEqual(resident.trace, {"source_turn": 3, SIDE_FIELDS_KEY: ["wm_snapshot"]})
+        record = json.loads(self.ltm.journal_file.read_text(encoding="utf-8"))
+        self.assertEqual(record["item"]["trace"], resident.trace)
+        for store in (self.ltm, LongTermMemory(self.data_dir)):
+            self.assertEqual(store.load_trace(store.get(1)), {"source_turn": 3, "wm_snapshot": SNAPSHOT})
+
+    def test_export_import_and_delete(self):
+        self.ltm.store_many([item(1, trace={"wm_snapshot": SNAPSHOT}), item(2, trace={"source_turn": 1})])
+        state = self.ltm.export_state()
+        self.assertEqual(state["items"][0]["trace"], {"wm_snapshot": SNAPSHOT})
+
+        other = LongTermMemory(Path(self.tmp.name) / "other")
+        other.import_state(json.loads(json.dumps(state)))
+        self.assertEqual(other.load_traces(other.get_all()), [{"wm_snapshot": SNAPSHOT}, {"source_turn": 1}])
+
+        self.ltm.delete(1)
+        self.assertEqual(self.ltm.trace_stats()["trace_rows"], 0)
+
+    def test_older_snapshot_is_externalized_on_load(self):
+        memory_dir = self.data_dir / "old" / "memory"
+        memory_dir.mkdir(parents=True)
+        snapshot = {"version": "0.5.4", "items": [item(1, trace={"wm_snapshot": SNAPSHOT}).to_dict()]}
+        (memory_dir / "episodic_memory.json").write_text(json.dumps(snapshot), encoding="utf-8")
+
+        ltm = LongTermMemory(self.data_dir / "old")
+        self.assertEqual(ltm.get(1).trace, {SIDE_FIELDS_KEY: ["wm_snapshot"]})
+        self.assertEqual(ltm.trace_stats()["trace_rows"], 1)
+        self.assertEqual(ltm.load_trace(ltm.get(1)), {"wm_snapshot": SNAPSHOT})
+
+    def test_engine_trace_reads_through(self):
+        engine = MemoryEngine(self.data_dir / "engine")
+        stored = engine.store("Sprint retro notes", mem_type="episodic", trace={"wm_snapshot": SNAPSHOT})
+        self.assertEqual(engine.trace(stored.id)["trace"], {"wm_snapshot": SNAPSHOT})
+        engine.shutdown()
+
+
+if __name__ == "__main__":
+    unittest.main()